@@ -311,6 +311,15 @@ def _get_redis():
         return redis.Redis(host='localhost', port=6379, db=0)
 
 
+def _get_truth_series(symbol: str, source: str = "raw"):
+    """Parsed truth tick series from the shared read model (None if unavailable)."""
+    try:
+        from app.market_data.truth_tick_read_model import get_truth_tick_read_model
+        return get_truth_tick_read_model().get(symbol, source)
+    except Exception:
+        return None
+
+
 def _get_fabric():
     """Get DataFabric instance."""
     try:
@@ -402,22 +411,16 @@ def _tool_symbol_detail(params: Dict) -> Dict:
         pass
     
     # Add latest truth tick from canonical source: tt:ticks:{symbol}
-    try:
-        raw = redis_client.get(f"tt:ticks:{symbol}")
-        if raw:
-            ticks = json.loads(raw.decode() if isinstance(raw, bytes) else raw)
-            if ticks and isinstance(ticks, list) and len(ticks) > 0:
-                # Get the last tick
-                last_tick = ticks[-1]
-                result["truth_tick"] = {
-                    "price": last_tick.get("price"),
-                    "venue": last_tick.get("exch") or last_tick.get("venue"),
-                    "size": last_tick.get("size"),
-                    "age_sec": round(time.time() - float(last_tick.get("ts", 0))) if last_tick.get("ts") else None,
-                }
-                result["truth_tick_count"] = len(ticks)
-    except Exception:
-        pass
+    series = _get_truth_series(symbol)
+    last_tick = series.last_tick() if series is not None else None
+    if last_tick:
+        result["truth_tick"] = {
+            "price": last_tick["price"],
+            "venue": last_tick["exch"],
+            "size": last_tick["size"],
+            "age_sec": round(time.time() - last_tick["ts"]) if last_tick["ts"] else None,
+        }
+        result["truth_tick_count"] = len(series)
     
     return result
 
@@ -426,29 +429,26 @@ def _tool_truth_tick_history(params: Dict) -> Dict:
     """Truth tick history with volav analysis."""
     symbol = params.get("symbol", "")
     last_n = min(params.get("last_n", 20), 50)
-    redis_client = _get_redis()
-    
     result = {"symbol": symbol, "ticks": [], "volav": None, "temporal": None}
     
     try:
         # Get truth tick inspect data (canonical key: truth_ticks:inspect:{symbol})
-        raw = redis_client.get(f"truth_ticks:inspect:{symbol}")
-        if raw:
-            data = json.loads(raw.decode() if isinstance(raw, bytes) else raw)
+        series = _get_truth_series(symbol, "inspect")
+        if series is not None:
+            data = series.data
             
             # Path dataset (tick history)
-            path = data.get("path_dataset", [])
-            recent = path[-last_n:] if path else []
+            recent = series.to_dicts(last=last_n)
             result["ticks"] = [
                 {
-                    "time": datetime.fromtimestamp(t.get("timestamp", 0)).strftime("%H:%M:%S") if t.get("timestamp") else "?",
-                    "price": round(t.get("price", 0), 2),
-                    "size": t.get("size", 0),
-                    "venue": t.get("venue", "?"),
+                    "time": datetime.fromtimestamp(t["ts"]).strftime("%H:%M:%S") if t["ts"] else "?",
+                    "price": round(t["price"], 2),
+                    "size": t["size"],
+                    "venue": t["exch"],
                 }
                 for t in recent
             ]
-            result["total_ticks"] = len(path)
+            result["total_ticks"] = len(series)
             
             # Volav summary (market microstructure state)
             summary = data.get("summary", {})
@@ -469,42 +469,29 @@ def _tool_truth_tick_history(params: Dict) -> Dict:
         result["error"] = str(e)
     
     # Fallback: if inspect data was empty, try canonical tt:ticks:{symbol}
-    if not result["ticks"]:
-        try:
-            raw = redis_client.get(f"tt:ticks:{symbol}")
-            if raw:
-                ticks = json.loads(raw.decode() if isinstance(raw, bytes) else raw)
-                if ticks and isinstance(ticks, list):
-                    recent = ticks[-last_n:]
-                    result["ticks"] = [
-                        {
-                            "time": datetime.fromtimestamp(t.get("ts", 0)).strftime("%H:%M:%S") if t.get("ts") else "?",
-                            "price": round(t.get("price", 0), 2),
-                            "size": t.get("size", 0),
-                            "venue": t.get("exch") or t.get("venue", "?"),
-                        }
-                        for t in recent
-                    ]
-                    result["total_ticks"] = len(ticks)
-                    result["source"] = "tt:ticks (canonical)"
-        except Exception:
-            pass
+    raw_series = _get_truth_series(symbol)
+    if not result["ticks"] and raw_series is not None and len(raw_series):
+        result["ticks"] = [
+            {
+                "time": datetime.fromtimestamp(t["ts"]).strftime("%H:%M:%S") if t["ts"] else "?",
+                "price": round(t["price"], 2),
+                "size": t["size"],
+                "venue": t["exch"],
+            }
+            for t in raw_series.to_dicts(last=last_n)
+        ]
+        result["total_ticks"] = len(raw_series)
+        result["source"] = "tt:ticks (canonical)"
     
     # Also add latest single truth tick from canonical source
-    try:
-        raw = redis_client.get(f"tt:ticks:{symbol}")
-        if raw:
-            ticks = json.loads(raw.decode() if isinstance(raw, bytes) else raw)
-            if ticks and isinstance(ticks, list) and len(ticks) > 0:
-                last_tick = ticks[-1]
-                result["latest"] = {
-                    "price": last_tick.get("price"),
-                    "venue": last_tick.get("exch") or last_tick.get("venue"),
-                    "size": last_tick.get("size"),
-                    "age_sec": round(time.time() - float(last_tick.get("ts", 0))) if last_tick.get("ts") else None,
-                }
-    except Exception:
-        pass
+    last_tick = raw_series.last_tick() if raw_series is not None else None
+    if last_tick:
+        result["latest"] = {
+            "price": last_tick["price"],
+            "venue": last_tick["exch"],
+            "size": last_tick["size"],
+            "age_sec": round(time.time() - last_tick["ts"]) if last_tick["ts"] else None,
+        }
     
     return result
 
@@ -967,14 +954,10 @@ def _tool_order_fill_analysis(params: Dict) -> Dict:
         bid = None
         ask = None
         spread = None
-        try:
-            tt_raw = redis_client.get(f"tt:ticks:{sym}")
-            if tt_raw:
-                ticks = json.loads(tt_raw.decode() if isinstance(tt_raw, bytes) else tt_raw)
-                if ticks and isinstance(ticks, list):
-                    tt_price = float(ticks[-1].get('price', 0))
-        except Exception:
-            pass
+        tt_series = _get_truth_series(sym)
+        tt_last = tt_series.last_tick() if tt_series is not None else None
+        if tt_last:
+            tt_price = tt_last['price']
         
         # Get L1 for bid/ask
         if fabric and fabric.is_ready():
@@ -1082,14 +1065,10 @@ def _tool_order_fill_analysis(params: Dict) -> Dict:
         
         # Get current truth tick for unrealized PnL
         tt_now = None
-        try:
-            tt_raw = redis_client.get(f"tt:ticks:{sym}")
-            if tt_raw:
-                ticks = json.loads(tt_raw.decode() if isinstance(tt_raw, bytes) else tt_raw)
-                if ticks and isinstance(ticks, list):
-                    tt_now = float(ticks[-1].get('price', 0))
-        except Exception:
-            pass
+        tt_series = _get_truth_series(sym)
+        tt_last = tt_series.last_tick() if tt_series is not None else None
+        if tt_last:
+            tt_now = tt_last['price']
         
         # Compute unrealized PnL
         unrealized_pnl_cents = None
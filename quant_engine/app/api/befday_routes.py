@@ -28,6 +28,8 @@ async def refresh_befday_redis(account_id: str = Query(..., description="IBKR_PE
             raise HTTPException(status_code=503, detail="Redis not available")
         key = f"psfalgo:befday:positions:{account_id}"
         redis.delete(key)
+        from app.psfalgo.position_snapshot_api import notify_befday_write
+        notify_befday_write(account_id)
         logger.info(f"[BEFDAY] Redis key deleted: {key}. Next load will use CSV and repopulate.")
         return {"success": True, "message": f"BEFDAY Redis cleared for {account_id}. Reload positions to refresh from CSV."}
     except HTTPException:
@@ -667,6 +669,9 @@ async def capture_befday(account: str, force: bool = False):
                     date_key = f"psfalgo:befday:date:{redis_account}"
                     redis.set(date_key, get_today_str(), ex=86400)
                     
+                    from app.psfalgo.position_snapshot_api import notify_befday_write
+                    notify_befday_write(redis_account)
+                    
                     logger.info(f"[BEFDAY] ✅ Redis written: {len(befday_list)} entries for {account} + date key (sacred, first & only write)")
             except Exception as redis_err:
                 logger.warning(f"[BEFDAY] Redis write failed: {redis_err}")
@@ -1609,6 +1609,26 @@ async def start_l1_feed_listener():
         
         data_fabric = get_data_fabric()
         
+        from app.config.settings import settings
+        incremental_scores = settings.FAST_SCORES_INCREMENTAL_GROUPS
+        if incremental_scores:
+            from app.core.fast_score_calculator import compute_dirty_fast_scores
+        
+        # Incremental FAST scores run off the event loop, one run at a time.
+        # Batches arriving during a run only set scores_pending: the dirty set
+        # accumulates in DataFabric and the next run picks all of it up.
+        scores_task = None  # In-flight run_dirty_scores task
+        scores_pending = False
+        
+        async def run_dirty_scores():
+            nonlocal scores_pending
+            while scores_pending:
+                scores_pending = False
+                try:
+                    await asyncio.to_thread(compute_dirty_fast_scores, include_group_metrics=True)
+                except Exception as e:
+                    logger.error(f"Error in incremental FAST scores: {e}", exc_info=True)
+        
         # Get async client
         async_redis = await redis_client.async_client()
         pubsub = async_redis.pubsub()
@@ -1625,6 +1645,12 @@ async def start_l1_feed_listener():
                         # Batch update DataFabric
                         data_fabric.update_live_batch(updates)
                         
+                        # Incremental FAST scores: dirty symbols + their groups only
+                        if incremental_scores:
+                            scores_pending = True
+                            if scores_task is None or scores_task.done():
+                                scores_task = asyncio.create_task(run_dirty_scores())
+                        
             except asyncio.TimeoutError:
                 continue
             except Exception as e:
@@ -1652,7 +1678,14 @@ async def shutdown_event():
             logger.info("✅ Hammer client disconnected")
     except Exception as e:
         logger.warning(f"Error disconnecting Hammer: {e}")
-    
+
+    # Flush pending live:{symbol} writes
+    try:
+        from app.market_data.l1_publisher import get_l1_publisher
+        get_l1_publisher().stop(flush=True)
+    except Exception as e:
+        logger.warning(f"Error flushing L1 publisher: {e}")
+
     # Disconnect IBKR connections via DualConnectionManager
     try:
         from app.psfalgo.dual_connection_manager import get_dual_connection_manager
@@ -869,33 +869,26 @@ def update_market_data_cache(symbol: str, data: Dict[str, Any]):
     with _market_data_cache_lock:
         market_data_cache[symbol] = data
     
-    # NEW: Write to Redis for external workers (e.g. QeBench Benchmark Worker)
+    # Write to Redis live:{symbol} for external workers (QeBench Benchmark Worker, BenchmarkPriceFetcher)
+    # Write-behind: only queues in memory here, L1RedisPublisher flushes coalesced batches in one pipeline
     try:
-        from app.core.redis_client import redis_client
-        if redis_client:
-            # Filter None values (Redis doesn't like them)
-            redis_data = {k: str(v) for k, v in data.items() if v is not None}
-            if redis_data:
-                redis_client.hset(f"live:{symbol}", mapping=redis_data)
-                # Set TTL to avoid stale data if feed stops (e.g. 5 mins)
-                redis_client.expire(f"live:{symbol}", 300)
+        from app.market_data.l1_publisher import get_l1_publisher
+        get_l1_publisher().publish(symbol, data)
     except Exception as e:
-        # Don't block main flow if Redis fails
-        pass
+        # Don't block main flow if Redis publishing fails
+        logger.debug(f"Failed to queue live:{symbol} for Redis: {e}")
     
-    # EVENT-DRIVEN: For preferred stocks, send update immediately (bypass broadcast loop)
-    # This restores the old "instant fill" behavior where each L1Update triggers immediate UI update
+    # EVENT-DRIVEN: For preferred stocks, publish the row to the WebSocket fan-out
+    # The fan-out coalesces dirty symbols into one delta frame every WS_FRAME_INTERVAL_MS
+    # (memory only here - no event loop access from the Hammer feed thread)
     # ETFs will still use the broadcast loop (they can be batched)
     global _dirty_symbols  # Declare global at the start
     
     if symbol not in ETF_TICKERS:
-        # Preferred stock - send immediately via WebSocket (event-driven)
-        # Use thread-safe asyncio to send from sync context (Hammer feed thread) to async context
         try:
             from app.api.websocket_routes import get_connection_manager
             connection_manager = get_connection_manager()
             if connection_manager and connection_manager.active_connections:
-                # Build update message for this single symbol
                 # Calculate spread if not provided (ask - bid)
                 spread = data.get('spread')
                 if spread is None:
@@ -928,27 +921,10 @@ def update_market_data_cache(symbol: str, data: Dict[str, Any]):
                     # Non-critical - metrics may not be computed yet
                     logger.debug(f"Could not get Janall metrics for {symbol} in WebSocket update: {e}")
                 
-                # Thread-safe async call: schedule broadcast on main event loop
-                # This works even if called from Hammer feed thread
-                import asyncio
-                try:
-                    # Get the main event loop (FastAPI's loop)
-                    # Use get_event_loop() which works from any thread
-                    loop = asyncio.get_event_loop()
-                    # Schedule broadcast on the main event loop (thread-safe)
-                    asyncio.run_coroutine_threadsafe(
-                        connection_manager.broadcast({
-                            "type": "market_data_update",
-                            "data": [update_message]  # Single symbol update
-                        }),
-                        loop
-                    )
-                except (RuntimeError, AttributeError):
-                    # No event loop available - mark as dirty for broadcast loop fallback
-                    _dirty_symbols.add(symbol)
+                connection_manager.publish_market_data(symbol, update_message)
         except Exception as e:
             # Non-critical - if WebSocket fails, broadcast loop will catch it
-            logger.debug(f"Immediate broadcast failed for {symbol}, using dirty queue: {e}")
+            logger.debug(f"WebSocket publish failed for {symbol}, using dirty queue: {e}")
             _dirty_symbols.add(symbol)
     else:
         # ETF - mark as dirty for broadcast loop (batched updates are OK for ETFs)
@@ -974,24 +950,6 @@ def update_market_data_cache(symbol: str, data: Dict[str, Any]):
     except Exception as e:
         logger.error(f"Failed to update DataFabric for {symbol}: {e}")
 
-    # 🟢 NEW: Write to Redis "live:{symbol}" for QeBench/Benchmark Engine
-    # BenchmarkPriceFetcher needs this to calculate group averages
-    try:
-        from app.core.redis_client import get_redis_client
-        redis_client = get_redis_client()
-        # Use .sync to access the underlying redis connection
-        redis_sync = redis_client.sync
-        
-        if redis_sync:
-            # Ensure values are strings for Redis
-            redis_data = {k: str(v) for k, v in data.items() if v is not None}
-            if redis_data:
-                redis_sync.hset(f"live:{symbol}", mapping=redis_data)
-                # Set TTL to 60 minutes (keep data fresh but allow expiration if feed dies)
-                redis_sync.expire(f"live:{symbol}", 3600) 
-    except Exception as e:
-        logger.error(f"Failed to write live:{symbol} to Redis: {e}")
-
     # Log first few cache updates to verify BID/ASK are being stored
     if not hasattr(update_market_data_cache, '_cache_log_count'):
         update_market_data_cache._cache_log_count = 0
@@ -1252,6 +1210,89 @@ async def get_live_view_stats():
         }
 
 
+@router.get("/l1-publisher-stats")
+async def get_l1_publisher_stats():
+    """
+    Get write-behind live:{symbol} publisher statistics.
+    
+    Returns:
+        Dict with queue depth, flush latency and coalesced/dropped counts
+    """
+    try:
+        from app.market_data.l1_publisher import get_l1_publisher
+        return {
+            "success": True,
+            "stats": get_l1_publisher().get_stats()
+        }
+    except Exception as e:
+        logger.error(f"Error getting L1 publisher stats: {e}")
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+@router.get("/market-epoch")
+async def get_market_epoch(symbol: Optional[str] = None, epoch_id: Optional[int] = None):
+    """
+    Get the current (or a recent) read-only market epoch.
+    
+    Args:
+        symbol: Also return this symbol's snapshot from the epoch
+        epoch_id: Look up a recent epoch instead of the current one
+    
+    Returns:
+        Dict with epoch info, store stats and optional symbol snapshot
+    """
+    try:
+        from app.core.market_epoch import get_market_epoch_store
+        store = get_market_epoch_store()
+        epoch = store.get_epoch(epoch_id) if epoch_id is not None else store.current
+        if epoch is None:
+            return {
+                "success": False,
+                "error": f"Epoch {epoch_id} not available" if epoch_id is not None else "No epoch published yet",
+                "stats": store.get_stats()
+            }
+        response = {
+            "success": True,
+            "epoch": epoch.describe(),
+            "stats": store.get_stats()
+        }
+        if symbol:
+            snapshot = epoch.get(symbol)
+            response["snapshot"] = dict(snapshot) if snapshot is not None else None
+        return response
+    except Exception as e:
+        logger.error(f"Error getting market epoch: {e}")
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+@router.get("/ws-fanout-stats")
+async def get_ws_fanout_stats():
+    """
+    Get WebSocket fan-out statistics.
+    
+    Returns:
+        Dict with frame counts, pending symbols and per-client queue/drop counts
+    """
+    try:
+        from app.api.websocket_routes import get_connection_manager
+        return {
+            "success": True,
+            "stats": get_connection_manager().get_stats()
+        }
+    except Exception as e:
+        logger.error(f"Error getting WebSocket fan-out stats: {e}")
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
 @router.get("/merged")
 async def get_merged_market_data():
     """
@@ -2864,6 +2905,7 @@ async def get_l1_diagnostic():
     - Which symbols are receiving L1Update
     - Which symbols have live data in cache
     - Which symbols are missing live data
+    - Hammer consumer dispatch stats (per-consumer latency, queue high-water marks)
     """
     try:
         from app.core.data_fabric import get_data_fabric
@@ -2886,6 +2928,8 @@ async def get_l1_diagnostic():
             diagnostic["hammer_connected"] = hammer_client.is_connected()
             diagnostic["hammer_authenticated"] = getattr(hammer_client, 'authenticated', False)
             diagnostic["l1update_count"] = getattr(hammer_client, '_l1_msg_count', 0)
+            if hasattr(hammer_client, 'get_dispatch_stats'):
+                diagnostic["hammer_dispatch"] = hammer_client.get_dispatch_stats()
         
         # Check HammerFeed
         hammer_feed = get_hammer_feed()
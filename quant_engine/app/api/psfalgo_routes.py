@@ -2162,6 +2162,7 @@ async def connect_hammer() -> Dict[str, Any]:
                     
                     befday_tracked = False
                     if needs_befday:
+                        from app.psfalgo.position_snapshot_api import notify_befday_write
                         # Redis stale veriyi temizle (SADECE yeni gün için, ve SADECE kayıt yoksa)
                         try:
                             from app.core.redis_client import get_redis_client
@@ -2176,6 +2177,7 @@ async def connect_hammer() -> Dict[str, Any]:
                                     # Ama redis_befday_exists = True olsaydı buraya girmezdik
                                     # Yani burada Redis stale → temizleyebiliriz
                                     r.sync.delete("psfalgo:befday:positions:HAMPRO")
+                                    notify_befday_write("HAMPRO")
                                     logger.info("[HAMMER_API] Stale Redis BEFDAY temizlendi (yeni gün)")
                         except Exception:
                             pass
@@ -2203,6 +2205,7 @@ async def connect_hammer() -> Dict[str, Any]:
                                                           "avg_cost": bp.get('avg_cost', 0)} for bp in befday_positions if bp.get('symbol')]
                                     r3.sync.set("psfalgo:befday:positions:HAMPRO", _json.dumps(befday_redis_list), ex=86400)
                                     r3.sync.set("psfalgo:befday:date:HAMPRO", date_cls.today().strftime("%Y%m%d"), ex=86400)
+                                    notify_befday_write("HAMPRO")
                                     logger.info(f"[HAMMER_API] ✅ BEFDAY Redis written: {len(befday_redis_list)} entries + date key (first & only write of the day)")
                             except Exception as re3:
                                 logger.warning(f"[HAMMER_API] Redis BEFDAY write failed: {re3}")
@@ -2246,6 +2249,7 @@ async def connect_hammer() -> Dict[str, Any]:
                                                         "avg_cost": bp.get('avg_cost', 0)} for bp in befday_positions if bp.get('symbol')]
                                         r2.set("psfalgo:befday:positions:HAMPRO", _json.dumps(befday_list), ex=86400)
                                         r2.set("psfalgo:befday:date:HAMPRO", date_cls.today().strftime("%Y%m%d"), ex=86400)
+                                        notify_befday_write("HAMPRO")
                                         logger.info(f"[HAMMER_API] ✅ FALLBACK Redis BEFDAY written: {len(befday_list)} entries + date key")
                                 except Exception as re2:
                                     logger.warning(f"[HAMMER_API] Redis fallback write failed: {re2}")
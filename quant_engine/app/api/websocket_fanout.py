@@ -0,0 +1,275 @@
+"""
+WebSocket Fan-out
+=================
+
+🟢 FAST PATH COMPONENT
+
+Preferred L1 tick'lerini browser client'larına coalesce edilmiş
+frame'lerle dağıtır; yavaş bir client diğerlerini bekletmez.
+
+1. Hammer thread'i sadece publish() çağırır: sembolün en son satırı bir
+   dirty map'e yazılır (threading.Lock, asyncio yok).
+2. Event loop üzerindeki flush task'ı her WS_FRAME_INTERVAL_MS'de dirty
+   map'i swap eder ve son gönderilene göre SADECE değişen alanları
+   (PREF_IBKR + delta) tek bir market_data_update frame'inde toplar.
+3. Her client'ın kendi bounded send queue'su ve sender task'ı var.
+   Queue doluysa en eski frame düşürülür; düşen frame'deki semboller
+   client'a bir sonraki frame'de tam satır olarak tekrar gönderilir
+   (delta'lar kaybolmaz).
+4. Client'lar subscribe mesajıyla sembol/panel filtresi ve opsiyonel
+   msgpack (binary) format seçebilir. Filtresiz JSON client'lar aynı
+   encode edilmiş frame'i paylaşır.
+
+Client → server mesajları (JSON):
+    {"type": "subscribe", "symbols": [...], "panels": [...], "format": "json"|"msgpack"}
+    {"type": "unsubscribe", "symbols": [...], "panels": [...]}
+    {"type": "ping"}  → {"type": "pong"}
+"""
+
+import asyncio
+import json
+import threading
+import time
+from typing import Dict, Any, Optional, Set, List, Iterable
+
+try:
+    import msgpack
+    HAS_MSGPACK = True
+except ImportError:
+    msgpack = None
+    HAS_MSGPACK = False
+
+
+MARKET_DATA_TYPE = "market_data_update"
+SYMBOL_KEY = "PREF_IBKR"
+
+# Message type → panel name used in subscriptions (unknown types go to every client)
+PANEL_BY_TYPE = {
+    MARKET_DATA_TYPE: "market_data",
+    "etf_update": "etf",
+    "jfin_update": "jfin",
+    "ticker_alert": "alerts",
+}
+
+_MISSING = object()
+
+
+def sanitize_value(value: Any) -> Any:
+    """NaN / Infinity → None (JSON safe)"""
+    if isinstance(value, float) and (value != value or value in (float('inf'), float('-inf'))):
+        return None
+    return value
+
+
+def sanitize_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    return {k: sanitize_value(v) for k, v in row.items()}
+
+
+class Frame:
+    """One outgoing message, encoded lazily once per format"""
+
+    __slots__ = ('message', 'symbols', '_encoded')
+
+    def __init__(self, message: Dict[str, Any], symbols: Iterable[str] = ()):
+        self.message = message
+        self.symbols = frozenset(symbols)  # Market data symbols carried (resync on drop)
+        self._encoded: Dict[str, Any] = {}
+
+    def encode(self, fmt: str):
+        data = self._encoded.get(fmt)
+        if data is None:
+            if fmt == "msgpack":
+                data = msgpack.packb(self.message, use_bin_type=True)
+            else:
+                data = json.dumps(self.message, allow_nan=False)
+            self._encoded[fmt] = data
+        return data
+
+
+class ClientSession:
+    """Per-client subscription, bounded send queue and sender task"""
+
+    def __init__(self, websocket, max_frames: int):
+        self.websocket = websocket
+        self.symbols: Optional[Set[str]] = None  # None = all symbols
+        self.panels: Optional[Set[str]] = None  # None = all panels
+        self.format = "json"
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_frames)
+        self.resync: Set[str] = set()  # Symbols needing a full row (dropped frame / new subscription)
+        self.sender: Optional[asyncio.Task] = None
+        self.frames_sent = 0
+        self.frames_dropped = 0
+
+    @property
+    def unfiltered(self) -> bool:
+        return self.symbols is None and not self.resync
+
+    def wants_panel(self, message_type: Optional[str]) -> bool:
+        panel = PANEL_BY_TYPE.get(message_type)
+        return panel is None or self.panels is None or panel in self.panels
+
+    def wants_symbol(self, symbol: str) -> bool:
+        return self.symbols is None or symbol in self.symbols
+
+    def enqueue(self, frame: Frame) -> None:
+        """Queue frame; under backpressure drop the oldest queued frame"""
+        while True:
+            try:
+                self.queue.put_nowait(frame)
+                return
+            except asyncio.QueueFull:
+                try:
+                    stale = self.queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    continue
+                self.frames_dropped += 1
+                self.resync.update(stale.symbols)
+
+    def apply_subscription(self, message: Dict[str, Any], subscribe: bool) -> Set[str]:
+        """
+        Update filters from a subscribe/unsubscribe message.
+
+        Returns:
+            Newly subscribed symbols (need a full row)
+        """
+        added: Set[str] = set()
+        symbols = message.get("symbols")
+        panels = message.get("panels")
+
+        if subscribe:
+            if symbols is not None:
+                symbols = set(symbols)
+                added = symbols - (self.symbols or set()) if self.symbols is not None else symbols
+                self.symbols = symbols if self.symbols is None else self.symbols | symbols
+            if panels is not None:
+                self.panels = set(panels) if self.panels is None else self.panels | set(panels)
+            fmt = message.get("format")
+            if fmt == "msgpack" and HAS_MSGPACK:
+                self.format = "msgpack"
+            elif fmt == "json":
+                self.format = "json"
+        else:
+            if symbols is not None and self.symbols is not None:
+                self.symbols -= set(symbols)
+            if panels is not None and self.panels is not None:
+                self.panels -= set(panels)
+        return added
+
+    async def send(self, payload) -> None:
+        if isinstance(payload, bytes):
+            await self.websocket.send_bytes(payload)
+        else:
+            await self.websocket.send_text(payload)
+
+
+class MarketDataFanout:
+    """
+    Thread-safe dirty-symbol map + per-frame delta builder.
+
+    publish() may be called from any thread; build_frames() runs on the event loop.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._dirty: Dict[str, Dict[str, Any]] = {}
+        self._last_sent: Dict[str, Dict[str, Any]] = {}  # Latest full row per symbol (delta base / resync)
+        self.stats = {
+            'published': 0,
+            'coalesced': 0,
+            'frames': 0,
+            'rows_sent': 0,
+            'fields_sent': 0,
+            'last_frame_ms': 0.0,
+        }
+
+    def publish(self, symbol: str, row: Dict[str, Any]) -> None:
+        """Record the latest row for symbol (memory only)"""
+        with self._lock:
+            pending = self._dirty.get(symbol)
+            if pending is not None:
+                self.stats['coalesced'] += 1
+                pending.update(row)
+            else:
+                self._dirty[symbol] = dict(row)
+            self.stats['published'] += 1
+
+    def pending(self) -> int:
+        return len(self._dirty)
+
+    def take_deltas(self) -> Dict[str, Dict[str, Any]]:
+        """Swap dirty rows and return {symbol: changed fields (incl. PREF_IBKR)}"""
+        with self._lock:
+            if not self._dirty:
+                return {}
+            dirty = self._dirty
+            self._dirty = {}
+
+        deltas = {}
+        for symbol, row in dirty.items():
+            row = sanitize_row(row)
+            last = self._last_sent.get(symbol)
+            if last is None:
+                delta = row
+                self._last_sent[symbol] = dict(row)
+            else:
+                delta = {k: v for k, v in row.items() if last.get(k, _MISSING) != v}
+                if not delta:
+                    continue
+                last.update(delta)
+            delta[SYMBOL_KEY] = symbol
+            deltas[symbol] = delta
+        return deltas
+
+    def known_symbols(self) -> List[str]:
+        """Symbols with a full row (seed a new client's resync)"""
+        return list(self._last_sent)
+
+    def full_row(self, symbol: str) -> Optional[Dict[str, Any]]:
+        row = self._last_sent.get(symbol)
+        if row is None:
+            return None
+        return dict(row, **{SYMBOL_KEY: symbol})
+
+    def dispatch(self, clients: List[ClientSession]) -> int:
+        """
+        Build one market data frame per distinct client view and enqueue it.
+
+        Returns:
+            Number of clients a frame was queued for
+        """
+        started = time.perf_counter()
+        deltas = self.take_deltas()
+        queued = 0
+        shared: Optional[Frame] = None
+
+        for client in clients:
+            if not client.wants_panel(MARKET_DATA_TYPE):
+                client.resync.clear()
+                continue
+            if client.unfiltered:
+                if not deltas:
+                    continue
+                if shared is None:
+                    shared = Frame({"type": MARKET_DATA_TYPE, "data": list(deltas.values())}, deltas)
+                client.enqueue(shared)
+                queued += 1
+                continue
+
+            rows = {s: d for s, d in deltas.items() if client.wants_symbol(s)}
+            if client.resync:
+                for symbol in client.resync:
+                    if client.wants_symbol(symbol):
+                        full = self.full_row(symbol)
+                        if full is not None:
+                            rows[symbol] = full
+                client.resync.clear()
+            if rows:
+                client.enqueue(Frame({"type": MARKET_DATA_TYPE, "data": list(rows.values())}, rows))
+                queued += 1
+
+        if deltas:
+            self.stats['frames'] += 1
+            self.stats['rows_sent'] += len(deltas)
+            self.stats['fields_sent'] += sum(len(d) for d in deltas.values())
+        self.stats['last_frame_ms'] = (time.perf_counter() - started) * 1000.0
+        return queued
@@ -10,75 +10,174 @@ from typing import Set, Optional, Dict, Any
 import asyncio
 import json
 
+from app.config.settings import settings
 from app.core.logger import logger
+from app.api.websocket_fanout import ClientSession, Frame, MarketDataFanout, sanitize_row, HAS_MSGPACK
 from app.market_data.static_data_store import get_static_store as _get_static_store
 
 
 router = APIRouter(prefix="/ws", tags=["WebSocket"])
 
 
+def _current_task() -> Optional[asyncio.Task]:
+    try:
+        return asyncio.current_task()
+    except RuntimeError:
+        return None
+
+
 class ConnectionManager:
-    """Manages WebSocket connections and broadcasts"""
+    """
+    Manages WebSocket connections and broadcasts.
+
+    Sends never happen inline: every client has its own bounded queue and
+    sender task (see websocket_fanout), so one slow client cannot stall others.
+    """
+    
+    SEND_TIMEOUT_SEC = 10.0  # A client whose send blocks longer than this is dropped
     
     def __init__(self):
         self.active_connections: Set[WebSocket] = set()
+        self._clients: Dict[WebSocket, ClientSession] = {}
         self._broadcast_task: Optional[asyncio.Task] = None
+        self._fanout_task: Optional[asyncio.Task] = None
+        self.fanout = MarketDataFanout()
+        self.frame_interval = max(settings.WS_FRAME_INTERVAL_MS, 10) / 1000.0
+        self.client_queue_frames = max(settings.WS_CLIENT_QUEUE_FRAMES, 1)
     
     async def connect(self, websocket: WebSocket):
         """Accept a new WebSocket connection"""
         await websocket.accept()
+        client = ClientSession(websocket, self.client_queue_frames)
+        # Late joiner: full latest rows first, deltas afterwards
+        client.resync.update(self.fanout.known_symbols())
+        client.sender = asyncio.create_task(self._sender(client))
+        self._clients[websocket] = client
         self.active_connections.add(websocket)
         logger.info(f"📡 WebSocket connected. Total connections: {len(self.active_connections)}")
         
         # Start broadcast loop if not already running
         if self._broadcast_task is None or self._broadcast_task.done():
             self._broadcast_task = asyncio.create_task(self._broadcast_loop())
+        # Start market data frame loop if not already running
+        if self._fanout_task is None or self._fanout_task.done():
+            self._fanout_task = asyncio.create_task(self._fanout_loop())
     
     def disconnect(self, websocket: WebSocket):
         """Remove a WebSocket connection"""
         self.active_connections.discard(websocket)
+        client = self._clients.pop(websocket, None)
+        if client and client.sender and not client.sender.done() and client.sender is not _current_task():
+            client.sender.cancel()
         logger.info(f"📡 WebSocket disconnected. Total connections: {len(self.active_connections)}")
     
+    # ═══════════════════════════════════════════════════════════════════════
+    # FAN-OUT
+    # ═══════════════════════════════════════════════════════════════════════
+    
+    def publish_market_data(self, symbol: str, row: Dict[str, Any]):
+        """
+        Queue a market data row for the next frame.
+        
+        Thread-safe and non-blocking (called from the Hammer feed thread).
+        """
+        self.fanout.publish(symbol, row)
+    
+    async def handle_client_message(self, websocket: WebSocket, text: str):
+        """Handle ping / subscribe / unsubscribe messages from a client"""
+        if text == "ping":
+            await websocket.send_text("pong")
+            return
+        try:
+            message = json.loads(text)
+        except (ValueError, TypeError):
+            return
+        if not isinstance(message, dict):
+            return
+        
+        msg_type = message.get("type")
+        client = self._clients.get(websocket)
+        if msg_type == "ping":
+            if client:
+                client.enqueue(Frame({"type": "pong"}))
+        elif msg_type in ("subscribe", "unsubscribe") and client:
+            added = client.apply_subscription(message, msg_type == "subscribe")
+            # New symbols get their full latest row in the next frame
+            client.resync.update(added)
+    
+    async def _sender(self, client: ClientSession):
+        """Drain one client's queue (runs as its own task)"""
+        try:
+            while True:
+                frame = await client.queue.get()
+                try:
+                    payload = frame.encode(client.format)
+                except Exception as e:
+                    # Unserializable row: skip the frame, keep the client
+                    logger.error(f"Error serializing WebSocket {frame.message.get('type')} frame: {e}")
+                    continue
+                await asyncio.wait_for(client.send(payload), timeout=self.SEND_TIMEOUT_SEC)
+                client.frames_sent += 1
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.warning(f"Error sending to WebSocket client: {e}")
+            self.disconnect(client.websocket)
+    
+    async def _fanout_loop(self):
+        """Coalesce dirty symbols into one market data frame every frame_interval"""
+        try:
+            while self.active_connections:
+                try:
+                    self.fanout.dispatch(list(self._clients.values()))
+                except Exception as e:
+                    logger.error(f"Error in market data fan-out: {e}", exc_info=True)
+                await asyncio.sleep(self.frame_interval)
+        except asyncio.CancelledError:
+            logger.info("📡 Fan-out loop cancelled")
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Fan-out and per-client queue statistics"""
+        return {
+            **self.fanout.stats,
+            'pending_symbols': self.fanout.pending(),
+            'frame_interval_ms': self.frame_interval * 1000.0,
+            'msgpack_available': HAS_MSGPACK,
+            'clients': [
+                {
+                    'format': c.format,
+                    'symbols': None if c.symbols is None else len(c.symbols),
+                    'panels': None if c.panels is None else sorted(c.panels),
+                    'queued': c.queue.qsize(),
+                    'frames_sent': c.frames_sent,
+                    'frames_dropped': c.frames_dropped,
+                }
+                for c in self._clients.values()
+            ],
+        }
+    
     async def broadcast(self, message: Dict[str, Any]):
-        """Broadcast message to all connected clients"""
+        """Queue message for every connected client subscribed to its panel"""
         if not self.active_connections:
             return
         
         try:
-            # Safely serialize message (handle None, NaN, etc.)
-            def safe_serialize(obj):
-                """Safely serialize values for JSON"""
-                if obj is None:
-                    return None
-                if isinstance(obj, float):
-                    # Check for NaN or Infinity
-                    if obj != obj or obj == float('inf') or obj == float('-inf'):
-                        return None
-                    return obj
-                return obj
-            
-            # Clean message data before serialization
-            clean_message = {
-                "type": message.get("type"),
-                "data": [
-                    {k: safe_serialize(v) for k, v in item.items()}
-                    for item in message.get("data", [])
+            # Clean message data once (NaN / Infinity → None)
+            clean_message = dict(message)
+            data = message.get("data")
+            if isinstance(data, list):
+                clean_message["data"] = [
+                    sanitize_row(item) if isinstance(item, dict) else item
+                    for item in data
                 ]
-            }
-            
-            message_json = json.dumps(clean_message, allow_nan=False)
-            disconnected = set()
-            
-            for connection in set(self.active_connections):
-                try:
-                    await connection.send_text(message_json)
-                except Exception as e:
-                    logger.warning(f"Error broadcasting to client: {e}")
-                    disconnected.add(connection)
+            elif isinstance(data, dict):
+                clean_message["data"] = sanitize_row(data)
             
-            # Remove disconnected clients
-            for conn in disconnected:
-                self.disconnect(conn)
+            frame = Frame(clean_message)
+            msg_type = message.get("type")
+            for client in list(self._clients.values()):
+                if client.wants_panel(msg_type):
+                    client.enqueue(frame)
         except Exception as e:
             logger.error(f"Error in broadcast: {e}", exc_info=True)
     
@@ -118,8 +217,8 @@ class ConnectionManager:
                     # Import market_data_cache inside loop to get latest reference
                     from app.api.market_data_routes import ETF_TICKERS, get_etf_market_data
                     
-                    # IMPORTANT: Preferred stocks are now sent IMMEDIATELY in update_market_data_cache()
-                    # (event-driven, bypassing this loop). This loop only handles ETFs.
+                    # IMPORTANT: Preferred stocks are published by update_market_data_cache() and sent
+                    # as coalesced delta frames by _fanout_loop(). This loop only handles ETFs.
                     
                     # Get ETF symbols from dirty queue OR all ETFs if no dirty symbols (initial load)
                     etf_symbols = {s for s in dirty_symbols if s in ETF_TICKERS} if dirty_symbols else set()
@@ -181,7 +280,7 @@ class ConnectionManager:
                         except Exception as e:
                             logger.error(f"Error broadcasting ETF updates: {e}", exc_info=True)
                     
-                    # Clear dirty symbols after broadcast (only ETFs remain, preferred are sent immediately)
+                    # Clear dirty symbols after broadcast (only ETFs remain, preferred go through the fan-out)
                     try:
                         clear_dirty_symbols()
                     except Exception as e:
@@ -231,11 +330,9 @@ async def websocket_market_data(websocket: WebSocket):
     
     try:
         while True:
-            # Keep connection alive and handle incoming messages
+            # Keep connection alive and handle incoming messages (ping, subscribe, unsubscribe)
             data = await websocket.receive_text()
-            # Echo back for ping/pong
-            if data == "ping":
-                await websocket.send_text("pong")
+            await manager.handle_client_message(websocket, data)
     except WebSocketDisconnect:
         manager.disconnect(websocket)
         logger.info("📡 Client disconnected")
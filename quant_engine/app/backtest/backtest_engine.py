@@ -2,10 +2,18 @@
 
 Core backtest engine - main backtest loop.
 Replays historical data and processes through strategy.
+
+Default replay is columnar: each symbol's data becomes NumPy columns, all
+symbols are merged once by timestamp (TickColumns) and ticks reach the
+strategy as compact Tick objects with float prices. columnar=False keeps
+the legacy iterrows / dict tick path.
+
+Metrics are streamed (BacktestReport.stream): results and the summary no
+longer rebuild an equity DataFrame, and get_live_metrics() works mid-run.
 """
 
 import time
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable
 from datetime import datetime
 
 from app.core.logger import logger
@@ -19,6 +27,9 @@ from app.backtest.data_reader import DataReader
 from app.backtest.replay_engine import ReplayEngine, ReplayMode, ReplaySpeed
 from app.backtest.execution_simulator import ExecutionSimulator as LegacyExecutionSimulator
 from app.backtest.backtest_report import BacktestReport
+from app.backtest.streaming_metrics import StreamingMetrics
+from app.backtest.shared_market_data import SharedMarketData
+from app.backtest.tick_columns import TickColumns
 from app.portfolio.portfolio_manager import PortfolioManager
 from app.portfolio.portfolio_risk import PortfolioRiskManager
 from app.execution.execution_simulator import ExecutionSimulator, FillReport
@@ -43,7 +54,11 @@ class BacktestEngine:
         replay_speed: ReplaySpeed = ReplaySpeed.INSTANT,
         slippage: float = 0.01,
         commission_per_share: float = 0.005,
-        commission_min: float = 1.0
+        commission_min: float = 1.0,
+        save_reports: bool = True,
+        equity_guard: Optional[Callable[[float], bool]] = None,
+        columnar: bool = True,
+        keep_equity_curve: bool = True
     ):
         """
         Initialize backtest engine.
@@ -54,14 +69,25 @@ class BacktestEngine:
             data_dir: Directory containing historical data
             replay_mode: TICK or CANDLE replay mode
             replay_speed: Replay speed (INSTANT, REALTIME, etc.)
+            save_reports: Write report files and print the summary after run()
+                (optimizer evaluations turn this off)
+            equity_guard: Called with portfolio equity after every tick; returning
+                True abandons the run (replay stops, self.abandoned = True)
+            columnar: Columnar replay (NumPy columns → Tick); False = legacy dict ticks
+            keep_equity_curve: Store every equity point; False keeps only the
+                streaming metrics (no equity_curve.csv / HTML chart)
         """
         self.strategy = strategy
         self.initial_capital = initial_capital
+        self.save_reports = save_reports
+        self.equity_guard = equity_guard
+        self.columnar = columnar
+        self.abandoned = False
         self.data_reader = DataReader(data_dir)
         self.replay_engine = ReplayEngine(mode=replay_mode, speed=replay_speed)
         
         # Portfolio management
-        self.portfolio_manager = PortfolioManager(initial_capital=initial_capital)
+        self.portfolio_manager = PortfolioManager(initial_cash=initial_capital)
         self.portfolio_risk_manager = PortfolioRiskManager()
         
         # Components (same as live engine) - kept for per-symbol position tracking
@@ -111,7 +137,10 @@ class BacktestEngine:
         )
         
         # Reporting
-        self.report = BacktestReport()
+        self.report = BacktestReport(
+            keep_equity_curve=keep_equity_curve,
+            stream=StreamingMetrics(initial_capital)
+        )
         
         # Statistics
         self.tick_count = 0
@@ -129,7 +158,8 @@ class BacktestEngine:
         symbols: List[str],
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
-        data_format: str = "auto"
+        data_format: str = "auto",
+        market_data: Optional[SharedMarketData] = None
     ):
         """
         Run backtest for symbols (single or multiple).
@@ -139,6 +169,8 @@ class BacktestEngine:
             start_date: Start date (YYYY-MM-DD) or None
             end_date: End date (YYYY-MM-DD) or None
             data_format: "csv", "parquet", or "auto"
+            market_data: Pre-loaded SharedMarketData; ticks are sliced from it
+                instead of reading and converting the files again
         """
         # Handle single symbol (backward compatibility)
         if isinstance(symbols, str):
@@ -153,39 +185,53 @@ class BacktestEngine:
         self.start_time = time.time()
         
         try:
+            if self.columnar:
+                columns = self._load_columns(symbols, start_date, end_date, data_format, market_data)
+                if len(columns) == 0:
+                    logger.error("No data loaded for any symbol")
+                    return
+                self.replay_engine.replay_columnar(columns, self._on_tick_multi)
+                return
+            
             # Load historical data for all symbols
             symbol_data = {}
             symbol_ticks = {}
             
-            for symbol in symbols:
-                df = self.data_reader.read_data(symbol, data_format, start_date, end_date)
+            if market_data is not None:
+                symbol_ticks = market_data.symbol_ticks(symbols, start_date, end_date)
+                for symbol in symbols:
+                    if symbol not in symbol_ticks:
+                        logger.warning(f"No data found for {symbol}, skipping")
+            else:
+                for symbol in symbols:
+                    df = self.data_reader.read_data(symbol, data_format, start_date, end_date)
                 
-                if len(df) == 0:
-                    logger.warning(f"No data found for {symbol}, skipping")
-                    continue
+                    if len(df) == 0:
+                        logger.warning(f"No data found for {symbol}, skipping")
+                        continue
                 
-                logger.info(f"Loaded {len(df):,} rows for {symbol}")
-                symbol_data[symbol] = df
+                    logger.info(f"Loaded {len(df):,} rows for {symbol}")
+                    symbol_data[symbol] = df
                 
-                # Convert to ticks
-                if self.replay_engine.mode == ReplayMode.TICK:
-                    ticks = self.data_reader.convert_to_ticks(df)
-                    symbol_ticks[symbol] = ticks  # List of ticks
-                else:
-                    # Convert candles to ticks
-                    candles = self.data_reader.convert_to_candles(df)
-                    ticks = []
-                    for candle in candles:
-                        tick = {
-                            'symbol': candle['symbol'],
-                            'last': str(candle['close']),
-                            'bid': str(candle['close'] - 0.01),
-                            'ask': str(candle['close'] + 0.01),
-                            'volume': int(candle['volume']),
-                            'ts': int(candle['timestamp'] * 1000)
-                        }
-                        ticks.append(tick)
-                    symbol_ticks[symbol] = ticks  # List of ticks
+                    # Convert to ticks
+                    if self.replay_engine.mode == ReplayMode.TICK:
+                        ticks = self.data_reader.convert_to_ticks(df)
+                        symbol_ticks[symbol] = ticks  # List of ticks
+                    else:
+                        # Convert candles to ticks
+                        candles = self.data_reader.convert_to_candles(df)
+                        ticks = []
+                        for candle in candles:
+                            tick = {
+                                'symbol': candle['symbol'],
+                                'last': str(candle['close']),
+                                'bid': str(candle['close'] - 0.01),
+                                'ask': str(candle['close'] + 0.01),
+                                'volume': int(candle['volume']),
+                                'ts': int(candle['timestamp'] * 1000)
+                            }
+                            ticks.append(tick)
+                        symbol_ticks[symbol] = ticks  # List of ticks
             
             if not symbol_ticks:
                 logger.error("No data loaded for any symbol")
@@ -206,23 +252,48 @@ class BacktestEngine:
         finally:
             self.end_time = time.time()
             
-            # Save all reports
-            output_dir = f"backtest_results/{self.strategy.name}_{int(time.time())}"
-            self.report.save_all(output_dir)
-            
-            # Print summary
-            self._print_summary(output_dir)
+            if self.save_reports:
+                # Save all reports
+                output_dir = f"backtest_results/{self.strategy.name}_{int(time.time())}"
+                self.report.save_all(output_dir)
+                
+                # Print summary
+                self._print_summary(output_dir)
             
             # Return results for HTML report
             return self._get_backtest_result()
     
+    def _load_columns(
+        self,
+        symbols: List[str],
+        start_date: Optional[str],
+        end_date: Optional[str],
+        data_format: str,
+        market_data: Optional[SharedMarketData]
+    ) -> TickColumns:
+        """Merged tick columns for symbols (from market_data or the data files)"""
+        if market_data is not None:
+            columns = market_data.tick_columns(symbols, start_date, end_date)
+        else:
+            per_symbol = {}
+            for symbol in symbols:
+                df = self.data_reader.read_data(symbol, data_format, start_date, end_date)
+                cols = self.data_reader.convert_to_columns(df, self.replay_engine.mode) if len(df) else None
+                if cols is None or len(cols['ts_ns']) == 0:
+                    continue
+                logger.info(f"Loaded {len(df):,} rows for {symbol}")
+                per_symbol[symbol] = cols
+            columns = TickColumns.merge(per_symbol)
+        
+        for symbol in symbols:
+            if symbol not in columns.symbols:
+                logger.warning(f"No data found for {symbol}, skipping")
+        return columns
+    
     def _get_backtest_result(self) -> Dict[str, Any]:
         """Get backtest result dictionary for HTML report"""
-        import pandas as pd
-        
-        equity_df = pd.DataFrame(self.report.equity_curve) if self.report.equity_curve else pd.DataFrame()
-        metrics = self.report.compute_metrics(equity_df) if len(equity_df) > 0 else {}
-        trade_stats = self.report.compute_trade_metrics()
+        metrics = self.report.stream.equity_metrics()
+        trade_stats = self.report.stream.trade_metrics()
         
         # Convert trades to list of dicts
         trades = [t.__dict__ for t in self.report.trades]
@@ -345,6 +416,12 @@ class BacktestEngine:
             # Add equity point
             self.report.add_equity_point(tick_ts, current_equity)
             
+            if self.equity_guard is not None and self.equity_guard(current_equity):
+                # Dominated run (e.g. optimizer pruning) - stop the replay
+                self.abandoned = True
+                self.replay_engine.stop()
+                return
+            
             # Update strategy's candle manager and position manager for this symbol
             if hasattr(self.strategy, 'candle_manager'):
                 self.strategy.candle_manager = candle_mgr
@@ -419,22 +496,18 @@ class BacktestEngine:
         """Print backtest summary"""
         elapsed = self.end_time - self.start_time if self.start_time and self.end_time else 0
         
-        # Load equity curve for metrics
-        import pandas as pd
-        equity_df = pd.DataFrame(self.report.equity_curve)
-        
-        if len(equity_df) > 0:
-            metrics = self.report.compute_metrics(equity_df)
-            trade_stats = self.report.compute_trade_metrics()
+        stream = self.report.stream
+        if stream.points > 0:
+            metrics = stream.equity_metrics()
+            trade_stats = stream.trade_metrics()
             
             print("\n" + "="*60)
             print("BACKTEST SUMMARY")
             print("="*60)
             print(f"Initial capital:     ${self.initial_capital:,.2f}")
-            if len(equity_df) > 0:
-                final_equity = equity_df['equity'].iloc[-1]
-                print(f"Final equity:         ${final_equity:,.2f}")
-                print(f"Total return:          {((final_equity - self.initial_capital) / self.initial_capital * 100):.2f}%")
+            final_equity = stream.last_equity
+            print(f"Final equity:         ${final_equity:,.2f}")
+            print(f"Total return:          {((final_equity - self.initial_capital) / self.initial_capital * 100):.2f}%")
             
             print(f"\nTotal trades:          {trade_stats.get('num_trades', 0)}")
             print(f"Win rate:              {trade_stats.get('win_rate', 0) * 100:.2f}%")
@@ -445,6 +518,7 @@ class BacktestEngine:
             print(f"CAGR:                  {metrics.get('CAGR', 0) * 100:.2f}%")
         
         print(f"\nTicks processed:      {self.tick_count:,}")
+        print(f"Replay rate:          {self.replay_engine.get_stats()['tick_rate']:,.0f} ticks/sec")
         print(f"Signals generated:    {self.signal_count:,}")
         print(f"Orders placed:        {self.order_count:,}")
         print(f"Executions:           {self.execution_count:,}")
@@ -457,19 +531,21 @@ class BacktestEngine:
         print("="*60)
         print(f"\nReports saved to: {output_dir}")
     
+    def get_live_metrics(self) -> Dict[str, Any]:
+        """Intermediate metrics (callable from strategy / guard callbacks mid-run)"""
+        return self.report.live_metrics()
+    
     def get_results(self) -> Dict[str, Any]:
         """Get backtest results"""
-        import pandas as pd
-        
-        equity_df = pd.DataFrame(self.report.equity_curve) if self.report.equity_curve else pd.DataFrame()
-        metrics = self.report.compute_metrics(equity_df) if len(equity_df) > 0 else {}
-        trade_stats = self.report.compute_trade_metrics()
+        metrics = self.report.stream.equity_metrics()
+        trade_stats = self.report.stream.trade_metrics()
         positions = self.position_manager.get_all_positions()
         
         return {
             **metrics,
             **trade_stats,
             'tick_count': self.tick_count,
+            'ticks_per_second': self.replay_engine.get_stats()['tick_rate'],
             'signal_count': self.signal_count,
             'order_count': self.order_count,
             'execution_count': self.execution_count,
@@ -1,6 +1,11 @@
 """app/backtest/backtest_report.py
 
 Backtest reporting module - generates trade logs, equity curves, and metrics.
+
+Every equity point and trade also updates a StreamingMetrics accumulator, so
+metrics are available mid-run (live_metrics()) and at the end without
+rebuilding a DataFrame. keep_equity_curve=False stops storing the points
+(O(1) memory for long runs / optimizer evaluations).
 """
 
 import pandas as pd
@@ -10,6 +15,8 @@ from typing import List, Dict, Optional
 import json
 import os
 
+from app.backtest.streaming_metrics import StreamingMetrics
+
 
 @dataclass
 class Trade:
@@ -36,20 +43,36 @@ class BacktestReport:
     """Backtest report generator"""
     trades: List[Trade] = field(default_factory=list)
     equity_curve: List[Dict] = field(default_factory=list)
+    keep_equity_curve: bool = True
+    stream: StreamingMetrics = field(default_factory=StreamingMetrics)
     
     # ------------------------------------------------------------
     # ADD TRADE
     # ------------------------------------------------------------
     def add_trade(self, **kwargs):
         """Add completed trade"""
-        self.trades.append(Trade(**kwargs))
+        trade = Trade(**kwargs)
+        self.trades.append(trade)
+        self.stream.add_trade(
+            trade.pnl,
+            entry_time=trade.entry_time,
+            exit_time=trade.exit_time,
+            commission=trade.entry_commission + trade.exit_commission,
+            duration_s=trade.duration_s
+        )
     
     # ------------------------------------------------------------
     # ADD EQUITY POINT
     # ------------------------------------------------------------
     def add_equity_point(self, timestamp: float, equity: float):
         """Add equity curve point"""
-        self.equity_curve.append({"timestamp": timestamp, "equity": equity})
+        self.stream.add_equity_point(timestamp, equity)
+        if self.keep_equity_curve:
+            self.equity_curve.append({"timestamp": timestamp, "equity": equity})
+    
+    def live_metrics(self) -> Dict:
+        """Metrics so far (callable mid-run)"""
+        return self.stream.snapshot()
     
     # ------------------------------------------------------------
     # EXPORT TRADE LOG
@@ -149,10 +172,10 @@ class BacktestReport:
     # ------------------------------------------------------------
     # EXPORT ALL METRICS
     # ------------------------------------------------------------
-    def save_metrics(self, path: str, equity_df: pd.DataFrame):
-        """Save all metrics to JSON"""
-        metrics = self.compute_metrics(equity_df)
-        trade_stats = self.compute_trade_metrics()
+    def save_metrics(self, path: str, equity_df: Optional[pd.DataFrame] = None):
+        """Save all metrics to JSON (streaming metrics; equity_df is not needed)"""
+        metrics = self.stream.equity_metrics()
+        trade_stats = self.stream.trade_metrics()
         
         full = {
             "equity_metrics": metrics,
@@ -174,8 +197,8 @@ class BacktestReport:
         trade_df = self.save_trade_log(f"{output_dir}/trade_log.csv")
         equity_df = self.save_equity_curve(f"{output_dir}/equity_curve.csv")
         
-        if equity_df is not None:
-            self.save_metrics(f"{output_dir}/metrics.json", equity_df)
+        if self.stream.points:
+            self.save_metrics(f"{output_dir}/metrics.json")
         
         return {
             "trade_log": trade_df,
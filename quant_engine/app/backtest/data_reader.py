@@ -2,8 +2,12 @@
 
 Historical data reader - supports CSV and Parquet formats.
 Reads tick or candle data for backtesting.
+
+convert_to_columns() is the vectorized alternative to convert_to_ticks()
+(iterrows + string prices) used by columnar replay.
 """
 
+import numpy as np
 import pandas as pd
 import os
 from pathlib import Path
@@ -11,6 +15,8 @@ from typing import List, Dict, Any, Optional, Iterator
 from datetime import datetime
 
 from app.core.logger import logger
+from app.backtest.replay_engine import ReplayMode
+from app.backtest.tick_columns import frame_to_columns
 
 
 class DataReader:
@@ -225,6 +231,24 @@ class DataReader:
             
             yield tick
     
+    def convert_to_columns(
+        self,
+        df: pd.DataFrame,
+        replay_mode: ReplayMode = ReplayMode.TICK
+    ) -> Optional[Dict[str, np.ndarray]]:
+        """
+        Convert DataFrame to sorted NumPy tick columns (columnar replay).
+        
+        Args:
+            df: DataFrame with market data
+            replay_mode: TICK (tick fields) or CANDLE (close ± 0.01 as bid/ask)
+            
+        Returns:
+            {ts_ns, last, bid, ask, volume} arrays, or None if df has no
+            timestamp / price column
+        """
+        return frame_to_columns(df, replay_mode)
+    
     def convert_to_candles(self, df: pd.DataFrame) -> Iterator[Dict[str, Any]]:
         """
         Convert DataFrame to candle format iterator.
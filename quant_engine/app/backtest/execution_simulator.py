@@ -1,12 +1,16 @@
 """app/backtest/execution_simulator.py
 
 Historical Execution Simulator - realistic order fill model for backtesting.
+
+Pending orders are kept in per-symbol price ladders, so a tick only touches
+the limit orders that actually cross (no full scan of resting orders).
 """
 
 import time
-import uuid
+from bisect import bisect_left, bisect_right, insort
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Deque, Any
 
 
 @dataclass
@@ -22,6 +26,92 @@ class PendingOrder:
     type: str  # "MARKET" or "LIMIT"
     status: str = "OPEN"
     fills: List[dict] = field(default_factory=list)
+    seq: int = 0  # Arrival sequence (time priority, deterministic ordering)
+
+
+class PriceLadder:
+    """
+    Resting limit orders of one side, indexed by limit price.
+    
+    prices is kept sorted; each level is a FIFO deque (time priority).
+    """
+    
+    def __init__(self):
+        self.prices: List[float] = []
+        self.levels: Dict[float, Deque[PendingOrder]] = {}
+    
+    def __len__(self) -> int:
+        return sum(len(level) for level in self.levels.values())
+    
+    def add(self, pend: PendingOrder):
+        level = self.levels.get(pend.price)
+        if level is None:
+            level = self.levels[pend.price] = deque()
+            insort(self.prices, pend.price)
+        level.append(pend)
+    
+    def remove(self, pend: PendingOrder) -> bool:
+        level = self.levels.get(pend.price)
+        if level is None or pend not in level:
+            return False
+        level.remove(pend)
+        if not level:
+            self.drop_level(pend.price)
+        return True
+    
+    def drop_level(self, price: float):
+        del self.levels[price]
+        del self.prices[bisect_left(self.prices, price)]
+    
+    def crossing_prices(self, side: str, threshold: float) -> List[float]:
+        """
+        Levels that cross, best price first.
+        
+        BUY: limit >= threshold (highest first); SELL: limit <= threshold (lowest first)
+        """
+        prices = self.prices
+        if side == "BUY":
+            return prices[bisect_left(prices, threshold):][::-1]
+        return prices[:bisect_right(prices, threshold)]
+    
+    def orders(self) -> List[PendingOrder]:
+        return [pend for level in self.levels.values() for pend in level]
+
+
+class SymbolBook:
+    """Pending orders of one symbol: market FIFO + bid / ask ladders"""
+    
+    def __init__(self):
+        self.market: Deque[PendingOrder] = deque()
+        self.bids = PriceLadder()  # BUY limits
+        self.asks = PriceLadder()  # SELL limits
+    
+    def __len__(self) -> int:
+        return len(self.market) + len(self.bids) + len(self.asks)
+    
+    def ladder(self, side: str) -> PriceLadder:
+        return self.bids if side == "BUY" else self.asks
+    
+    def add(self, pend: PendingOrder):
+        if pend.type == "MARKET":
+            self.market.append(pend)
+        else:
+            self.ladder(pend.side).add(pend)
+    
+    def remove(self, pend: PendingOrder) -> bool:
+        if pend.type == "MARKET":
+            if pend in self.market:
+                self.market.remove(pend)
+                return True
+            return False
+        return self.ladder(pend.side).remove(pend)
+    
+    def orders(self) -> List[PendingOrder]:
+        """All pending orders in arrival order"""
+        return sorted(
+            list(self.market) + self.bids.orders() + self.asks.orders(),
+            key=lambda pend: pend.seq
+        )
 
 
 class ExecutionSimulator:
@@ -37,6 +127,22 @@ class ExecutionSimulator:
     - Commission calculation
     - Order/fill latency simulation
     - Pending order queue
+    
+    Pending orders live in per-symbol price-indexed books (SymbolBook):
+    market orders in a FIFO, limit orders in sorted bid / ask ladders keyed
+    by limit price. A tick walks only the levels that cross
+    (BUY limit >= min(last, ask), SELL limit <= max(last, bid)), best price
+    first, FIFO within a level - resting orders far from the market are
+    never touched.
+    
+    Volume model (shared_volume=True): the tick volume is a budget per side,
+    consumed in price-time priority; an order that gets only part of it
+    keeps its queue position for the next tick. shared_volume=False gives
+    every crossing order min(volume, remaining) as before. Market orders fill
+    in full at ask / bid and do not consume the budget.
+    
+    Order and exec ids are sequential, so identical inputs give identical
+    fills.
     """
     
     def __init__(
@@ -46,6 +152,7 @@ class ExecutionSimulator:
         commission_min: float = 0.0,
         order_latency_ms: int = 0,
         fill_latency_ms: int = 0,
+        shared_volume: bool = True,
     ):
         """
         Initialize execution simulator.
@@ -56,14 +163,30 @@ class ExecutionSimulator:
             commission_min: Minimum commission
             order_latency_ms: Order processing latency in milliseconds
             fill_latency_ms: Fill processing latency in milliseconds
+            shared_volume: Crossing limit orders share the tick volume in
+                price-time priority (False = each order may fill up to it)
         """
         self.slippage = slippage
         self.commission_per_share = commission_per_share
         self.commission_min = commission_min
         self.order_latency_ms = order_latency_ms
         self.fill_latency_ms = fill_latency_ms
+        self.shared_volume = shared_volume
         
-        self.pending_orders: Dict[str, List[PendingOrder]] = {}
+        self.books: Dict[str, SymbolBook] = {}
+        self._orders: Dict[str, PendingOrder] = {}  # order_id → open order
+        self._seq = 0
+        self._exec_seq = 0
+        self.stats = {
+            'ticks': 0,
+            'orders_touched': 0,
+            'fills': 0,
+        }
+    
+    @property
+    def pending_orders(self) -> Dict[str, List[PendingOrder]]:
+        """{symbol: open orders in arrival order} (read-only view)"""
+        return {symbol: book.orders() for symbol, book in self.books.items() if len(book)}
     
     # ------------------------------------------------------------
     # PUBLIC API
@@ -78,7 +201,8 @@ class ExecutionSimulator:
         Returns:
             Order ID
         """
-        order_id = str(uuid.uuid4())
+        self._seq += 1
+        order_id = f"BT-{self._seq:08d}"
         pend = PendingOrder(
             order_id=order_id,
             symbol=order["symbol"],
@@ -88,12 +212,14 @@ class ExecutionSimulator:
             price=order.get("limit_price"),
             timestamp=time.time(),
             type="LIMIT" if order.get("limit_price") else "MARKET",
+            seq=self._seq,
         )
         
-        if pend.symbol not in self.pending_orders:
-            self.pending_orders[pend.symbol] = []
-        
-        self.pending_orders[pend.symbol].append(pend)
+        book = self.books.get(pend.symbol)
+        if book is None:
+            book = self.books[pend.symbol] = SymbolBook()
+        book.add(pend)
+        self._orders[order_id] = pend
         
         # Order latency
         if self.order_latency_ms > 0:
@@ -112,36 +238,81 @@ class ExecutionSimulator:
             tick: Tick dict with keys: symbol, last, bid, ask, volume, timestamp
             
         Returns:
-            List of execution (fill) dicts
+            List of execution (fill) dicts: market orders first, then BUY
+            limits, then SELL limits, each in price-time priority
         """
         symbol = tick["symbol"]
-        if symbol not in self.pending_orders:
+        book = self.books.get(symbol)
+        if book is None or not len(book):
             return []
         
+        self.stats['ticks'] += 1
         fills = []
         
-        # Make a copy to avoid modification during iteration
-        for pend in list(self.pending_orders[symbol]):
-            if pend.status != "OPEN":
-                continue
-            
-            if pend.type == "MARKET":
-                execs = self._fill_market_order(pend, tick)
-            else:
-                execs = self._fill_limit_order(pend, tick)
-            
-            for e in execs:
-                fills.append(e)
-                pend.fills.append(e)
-                pend.remaining -= e["fill_qty"]
-            
-            # If fully filled
-            if pend.remaining <= 0:
-                pend.status = "FILLED"
-                self.pending_orders[symbol].remove(pend)
+        while book.market:
+            pend = book.market[0]
+            self.stats['orders_touched'] += 1
+            self._apply(pend, self._fill_market_order(pend, tick), fills)
+            book.market.popleft()
+        
+        if not book.bids.prices and not book.asks.prices:
+            return fills
+        
+        last = float(tick["last"])
+        bid = float(tick.get("bid", last))
+        ask = float(tick.get("ask", last))
+        volume = tick.get("volume")
+        budget = float(volume) if volume is not None else None
         
+        self._fill_ladder(book.bids, "BUY", min(last, ask), tick, budget, fills)
+        self._fill_ladder(book.asks, "SELL", max(last, bid), tick, budget, fills)
         return fills
     
+    def _fill_ladder(
+        self,
+        ladder: PriceLadder,
+        side: str,
+        threshold: float,
+        tick: dict,
+        budget: Optional[float],
+        fills: List[dict]
+    ):
+        """Fill crossing levels of one side in price-time priority"""
+        for price in ladder.crossing_prices(side, threshold):
+            level = ladder.levels[price]
+            for pend in list(level):
+                if budget is not None and budget <= 0:
+                    break
+                self.stats['orders_touched'] += 1
+                execs = self._fill_limit_order(pend, tick, budget)
+                if not execs:
+                    continue
+                if self.shared_volume and budget is not None:
+                    budget -= execs[0]["fill_qty"]
+                self._apply(pend, execs, fills)
+                if pend.status == "FILLED":
+                    level.remove(pend)
+            if not level:
+                ladder.drop_level(price)
+            if budget is not None and budget <= 0:
+                return
+    
+    def _apply(self, pend: PendingOrder, execs: List[dict], fills: List[dict]):
+        for e in execs:
+            fills.append(e)
+            pend.fills.append(e)
+            pend.remaining -= e["fill_qty"]
+            self.stats['fills'] += 1
+        
+        # If fully filled
+        if pend.remaining <= 0:
+            pend.status = "FILLED"
+            self._orders.pop(pend.order_id, None)
+    
+    def _next_exec_id(self) -> str:
+        self._exec_seq += 1
+        return f"BTX-{self._exec_seq:08d}"
+    
     # ------------------------------------------------------------
     # MARKET ORDER
     # ------------------------------------------------------------
@@ -162,7 +333,7 @@ class ExecutionSimulator:
         return [
             {
                 "order_id": pend.order_id,
-                "exec_id": str(uuid.uuid4()),
+                "exec_id": self._next_exec_id(),
                 "symbol": pend.symbol,
                 "side": pend.side,
                 "fill_qty": fill_qty,
@@ -177,12 +348,12 @@ class ExecutionSimulator:
     # ------------------------------------------------------------
     # LIMIT ORDER
     # ------------------------------------------------------------
-    def _fill_limit_order(self, pend: PendingOrder, tick: dict) -> List[dict]:
-        """Fill limit order if price touches limit"""
+    def _fill_limit_order(self, pend: PendingOrder, tick: dict, budget: Optional[float] = None) -> List[dict]:
+        """Fill limit order if price touches limit (budget: volume left for this side)"""
         last = float(tick["last"])
         bid = float(tick.get("bid", last))
         ask = float(tick.get("ask", last))
-        vol = float(tick.get("volume", pend.remaining))
+        vol = float(tick.get("volume", pend.remaining)) if budget is None else budget
         
         # BUY LIMIT → price must be >= last or ask
         if pend.side == "BUY":
@@ -214,7 +385,7 @@ class ExecutionSimulator:
         return [
             {
                 "order_id": pend.order_id,
-                "exec_id": str(uuid.uuid4()),
+                "exec_id": self._next_exec_id(),
                 "symbol": pend.symbol,
                 "side": pend.side,
                 "fill_qty": fill_qty,
@@ -235,27 +406,26 @@ class ExecutionSimulator:
         return max(c, self.commission_min)
     
     def get_pending_orders(self, symbol: Optional[str] = None) -> List[PendingOrder]:
-        """Get pending orders (all symbols or specific symbol)"""
+        """Get pending orders (all symbols or specific symbol), in arrival order"""
         if symbol:
-            return self.pending_orders.get(symbol, [])
+            book = self.books.get(symbol)
+            return book.orders() if book else []
         else:
-            all_orders = []
-            for orders in self.pending_orders.values():
-                all_orders.extend(orders)
-            return all_orders
+            return sorted(self._orders.values(), key=lambda pend: pend.seq)
     
     def cancel_order(self, order_id: str) -> bool:
         """Cancel pending order"""
-        for symbol, orders in self.pending_orders.items():
-            for order in orders:
-                if order.order_id == order_id:
-                    order.status = "CANCELLED"
-                    self.pending_orders[symbol].remove(order)
-                    return True
-        return False
-
-
-
-
-
-
+        order = self._orders.pop(order_id, None)
+        if order is None:
+            return False
+        order.status = "CANCELLED"
+        self.books[order.symbol].remove(order)
+        return True
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Tick / touched order / fill counters and resting order counts"""
+        return {
+            **self.stats,
+            'open_orders': len(self._orders),
+            'price_levels': sum(len(b.bids.prices) + len(b.asks.prices) for b in self.books.values()),
+        }
@@ -2,15 +2,23 @@
 
 Replay engine - replays historical data tick-by-tick or candle-by-candle.
 Supports speed control, deterministic event ordering, and multi-symbol replay.
+
+replay_columnar() is the fast path: a TickColumns set (all symbols merged
+once by timestamp) is walked row by row and each row is handed to the
+callback as a compact Tick. In INSTANT mode the completion log and
+get_stats() report ticks/second.
 """
 
 import time
 import heapq
-from typing import Iterator, Dict, Any, Optional, Callable, List, Tuple
+from typing import Iterator, Iterable, Dict, Any, Optional, Callable, List, Tuple, TYPE_CHECKING
 from enum import Enum
 
 from app.core.logger import logger
 
+if TYPE_CHECKING:
+    from app.backtest.tick_columns import TickColumns, Tick
+
 
 class ReplayMode(Enum):
     """Replay mode"""
@@ -35,8 +43,11 @@ class ReplayEngine:
     - Speed control (instant, real-time, slow, fast)
     - Deterministic event order
     - Strategy callback support
+    - Columnar replay (TickColumns → Tick)
     """
     
+    COLUMNAR_PROGRESS_EVERY = 100000  # Columnar progress log interval (ticks)
+    
     def __init__(
         self,
         mode: ReplayMode = ReplayMode.TICK,
@@ -55,6 +66,7 @@ class ReplayEngine:
         self.tick_count = 0
         self.candle_count = 0
         self.start_time: Optional[float] = None
+        self.end_time: Optional[float] = None
         self.last_timestamp: Optional[float] = None
     
     def replay_ticks(
@@ -71,6 +83,7 @@ class ReplayEngine:
         """
         self.running = True
         self.start_time = time.time()
+        self.end_time = None
         self.last_timestamp = None
         
         logger.info(f"Starting tick replay (speed: {self.speed.value})")
@@ -84,21 +97,8 @@ class ReplayEngine:
                 tick_ts = float(tick.get('ts', 0)) / 1000.0  # Convert ms to seconds
                 
                 # Handle speed control
-                if self.speed != ReplaySpeed.INSTANT and self.last_timestamp is not None:
-                    time_diff = tick_ts - self.last_timestamp
-                    
-                    # Adjust for speed
-                    if self.speed == ReplaySpeed.REALTIME:
-                        delay = time_diff
-                    elif self.speed == ReplaySpeed.SLOW:
-                        delay = time_diff * 10  # 0.1x speed
-                    elif self.speed == ReplaySpeed.FAST:
-                        delay = time_diff / 10  # 10x speed
-                    else:
-                        delay = 0
-                    
-                    if delay > 0:
-                        time.sleep(delay)
+                if self.speed != ReplaySpeed.INSTANT:
+                    self._pace(tick_ts)
                 
                 # Call callback
                 on_tick(tick)
@@ -116,9 +116,99 @@ class ReplayEngine:
             logger.error(f"Error in tick replay: {e}", exc_info=True)
         finally:
             self.running = False
+            self.end_time = time.time()
             elapsed = time.time() - self.start_time if self.start_time else 0
             logger.info(f"Tick replay completed: {self.tick_count:,} ticks in {elapsed:.2f}s")
     
+    def replay_multi_symbol_ticks(
+        self,
+        symbol_ticks: Dict[str, Iterable[Dict[str, Any]]],
+        on_tick: Callable[[str, Dict[str, Any]], None]
+    ):
+        """
+        Replay several symbols' dict ticks merged by timestamp (heap merge).
+        
+        Args:
+            symbol_ticks: {symbol: ticks sorted by ts}
+            on_tick: Callback function called as on_tick(symbol, tick)
+        """
+        def stream(order: int, symbol: str, ticks: Iterable[Dict[str, Any]]):
+            for tick in ticks:
+                yield float(tick.get('ts', 0)), order, symbol, tick
+        
+        streams = [stream(order, symbol, ticks) for order, (symbol, ticks) in enumerate(symbol_ticks.items())]
+        merged = heapq.merge(*streams, key=lambda item: (item[0], item[1]))
+        self.replay_ticks(
+            ({'symbol': symbol, 'tick': tick, 'ts': ts} for ts, _, symbol, tick in merged),
+            lambda item: on_tick(item['symbol'], item['tick'])
+        )
+    
+    def replay_columnar(
+        self,
+        columns: 'TickColumns',
+        on_tick: Callable[[str, 'Tick'], None]
+    ):
+        """
+        Replay merged columnar ticks.
+        
+        Args:
+            columns: TickColumns (all symbols, time ordered)
+            on_tick: Callback function called as on_tick(symbol, tick)
+        """
+        self.running = True
+        self.start_time = time.time()
+        self.end_time = None
+        self.last_timestamp = None
+        instant = self.speed == ReplaySpeed.INSTANT
+        progress_every = self.COLUMNAR_PROGRESS_EVERY
+        
+        logger.info(f"Starting columnar replay: {len(columns):,} ticks, {len(columns.symbols)} symbols (speed: {self.speed.value})")
+        
+        try:
+            for symbol, tick in columns.iter_ticks():
+                if not self.running:
+                    break
+                
+                if not instant:
+                    tick_ts = tick.ts / 1000.0
+                    self._pace(tick_ts)
+                    self.last_timestamp = tick_ts
+                
+                on_tick(symbol, tick)
+                
+                self.tick_count += 1
+                if self.tick_count % progress_every == 0:
+                    elapsed = time.time() - self.start_time
+                    rate = self.tick_count / elapsed if elapsed > 0 else 0
+                    logger.info(f"Replayed {self.tick_count:,} ticks ({rate:,.0f} ticks/sec)")
+        
+        except Exception as e:
+            logger.error(f"Error in columnar replay: {e}", exc_info=True)
+        finally:
+            self.running = False
+            self.end_time = time.time()
+            elapsed = self.end_time - self.start_time
+            rate = self.tick_count / elapsed if elapsed > 0 else 0
+            logger.info(f"Columnar replay completed: {self.tick_count:,} ticks in {elapsed:.2f}s ({rate:,.0f} ticks/sec)")
+    
+    def _pace(self, ts: float):
+        """Sleep so that event time ts (seconds) is reached at the replay speed"""
+        if self.last_timestamp is not None:
+            time_diff = ts - self.last_timestamp
+            
+            # Adjust for speed
+            if self.speed == ReplaySpeed.REALTIME:
+                delay = time_diff
+            elif self.speed == ReplaySpeed.SLOW:
+                delay = time_diff * 10  # 0.1x speed
+            elif self.speed == ReplaySpeed.FAST:
+                delay = time_diff / 10  # 10x speed
+            else:
+                delay = 0
+            
+            if delay > 0:
+                time.sleep(delay)
+    
     def replay_candles(
         self,
         candles: Iterator[Dict[str, Any]],
@@ -133,6 +223,7 @@ class ReplayEngine:
         """
         self.running = True
         self.start_time = time.time()
+        self.end_time = None
         self.last_timestamp = None
         
         logger.info(f"Starting candle replay (speed: {self.speed.value})")
@@ -178,6 +269,7 @@ class ReplayEngine:
             logger.error(f"Error in candle replay: {e}", exc_info=True)
         finally:
             self.running = False
+            self.end_time = time.time()
             elapsed = time.time() - self.start_time if self.start_time else 0
             logger.info(f"Candle replay completed: {self.candle_count:,} candles in {elapsed:.2f}s")
     
@@ -188,7 +280,7 @@ class ReplayEngine:
     
     def get_stats(self) -> Dict[str, Any]:
         """Get replay statistics"""
-        elapsed = time.time() - self.start_time if self.start_time else 0
+        elapsed = (self.end_time or time.time()) - self.start_time if self.start_time else 0
         return {
             'mode': self.mode.value,
             'speed': self.speed.value,
@@ -0,0 +1,186 @@
+"""app/backtest/shared_market_data.py
+
+Historical data loaded and converted once, shared across backtests.
+
+SharedMarketData.load() veriyi bir kere okur, sembol başına kolonlara
+(ts_ns, last, bid, ask, volume) çevirir ve .npy dosyaları olarak diske
+yazar. Process pool worker'ları dosyaları np.load(mmap_mode='r') ile açar:
+sayfalar OS page cache üzerinden paylaşılır, kopya yoktur. Pickle edilen
+obje sadece dizin yolunu ve sembol listesini taşır.
+
+Tarih aralığı (walk-forward pencereleri) sıralı ts_ns üzerinde
+np.searchsorted ile kesilir; DataReader filtresiyle aynı sınırlar
+(start <= ts <= end). ticks() BacktestEngine'in beklediği legacy tick
+dict'lerini üretir (convert_to_ticks ile aynı alanlar); tick_columns()
+columnar replay için kolonları kopyalamadan (mmap slice) birleştirir.
+"""
+
+import os
+import shutil
+import tempfile
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.core.logger import logger
+from app.backtest.data_reader import DataReader
+from app.backtest.replay_engine import ReplayMode
+from app.backtest.tick_columns import COLUMNS, TickColumns, frame_to_columns
+
+
+def _to_ns(date: Optional[str]) -> Optional[int]:
+    if date is None:
+        return None
+    return int(pd.Timestamp(date).as_unit('ns').value)
+
+
+class SharedMarketData:
+    """
+    Memory-mapped tick columns for a set of symbols.
+
+    Create with load(); pass the object (cheap to pickle) to worker processes;
+    call close() (or use as a context manager) to delete the files.
+    """
+
+    def __init__(self, root: str, symbols: List[str], replay_mode: ReplayMode = ReplayMode.TICK, owner: bool = False):
+        self.root = root
+        self.symbols = list(symbols)
+        self.replay_mode = replay_mode
+        self._owner = owner
+        self._columns: Dict[str, Dict[str, np.ndarray]] = {}
+
+    @classmethod
+    def load(
+        cls,
+        data_dir: str,
+        symbols: List[str],
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        data_format: str = "auto",
+        replay_mode: ReplayMode = ReplayMode.TICK,
+        cache_dir: Optional[str] = None
+    ) -> 'SharedMarketData':
+        """
+        Read each symbol once and write its columns as .npy files.
+
+        Args:
+            data_dir: DataReader data directory
+            symbols: Symbols to load (missing files are logged and skipped)
+            start_date / end_date: Outer date range (e.g. whole walk-forward span)
+            cache_dir: Parent directory for the files (default: system temp)
+        """
+        if isinstance(symbols, str):
+            symbols = [symbols]
+        reader = DataReader(data_dir)
+        root = tempfile.mkdtemp(prefix="qe_market_", dir=cache_dir)
+        loaded = []
+        try:
+            for symbol in symbols:
+                try:
+                    df = reader.read_data(symbol, data_format, start_date, end_date)
+                except FileNotFoundError as e:
+                    logger.warning(f"[SHARED_DATA] {symbol} skipped: {e}")
+                    continue
+                columns = frame_to_columns(df, replay_mode)
+                if columns is None or len(columns['ts_ns']) == 0:
+                    logger.warning(f"[SHARED_DATA] No usable rows for {symbol}, skipping")
+                    continue
+                symbol_dir = os.path.join(root, f"{len(loaded):04d}")
+                os.makedirs(symbol_dir)
+                for name in COLUMNS:
+                    np.save(os.path.join(symbol_dir, f"{name}.npy"), columns[name])
+                loaded.append(symbol)
+                logger.info(f"[SHARED_DATA] {symbol}: {len(columns['ts_ns']):,} rows")
+        except Exception:
+            shutil.rmtree(root, ignore_errors=True)
+            raise
+        return cls(root, loaded, replay_mode, owner=True)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Workers re-open the memory maps; never ship arrays or ownership
+        return {'root': self.root, 'symbols': self.symbols, 'replay_mode': self.replay_mode}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(state['root'], state['symbols'], state['replay_mode'], owner=False)
+
+    def __enter__(self) -> 'SharedMarketData':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Drop the maps; the creating process also deletes the files"""
+        self._columns.clear()
+        if self._owner:
+            shutil.rmtree(self.root, ignore_errors=True)
+            self._owner = False
+
+    def columns(self, symbol: str) -> Optional[Dict[str, np.ndarray]]:
+        """Read-only memory-mapped columns for symbol (None if not loaded)"""
+        cols = self._columns.get(symbol)
+        if cols is None:
+            if symbol not in self.symbols:
+                return None
+            symbol_dir = os.path.join(self.root, f"{self.symbols.index(symbol):04d}")
+            cols = {name: np.load(os.path.join(symbol_dir, f"{name}.npy"), mmap_mode='r') for name in COLUMNS}
+            self._columns[symbol] = cols
+        return cols
+
+    def bounds(self, symbol: str, start_date: Optional[str] = None, end_date: Optional[str] = None) -> Tuple[int, int]:
+        """Row range [lo, hi) with start_date <= ts <= end_date (DataReader semantics)"""
+        cols = self.columns(symbol)
+        if cols is None:
+            return 0, 0
+        ts_ns = cols['ts_ns']
+        start_ns = _to_ns(start_date)
+        end_ns = _to_ns(end_date)
+        lo = int(np.searchsorted(ts_ns, start_ns, side='left')) if start_ns is not None else 0
+        hi = int(np.searchsorted(ts_ns, end_ns, side='right')) if end_ns is not None else len(ts_ns)
+        return lo, max(lo, hi)
+
+    def ticks(self, symbol: str, start_date: Optional[str] = None, end_date: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Legacy tick dicts {symbol, last, bid, ask, volume, ts} for the date range"""
+        lo, hi = self.bounds(symbol, start_date, end_date)
+        if hi <= lo:
+            return []
+        cols = self.columns(symbol)
+        ts_ms = (np.asarray(cols['ts_ns'][lo:hi]) // 1_000_000).tolist()
+        last = cols['last'][lo:hi].tolist()
+        bid = cols['bid'][lo:hi].tolist()
+        ask = cols['ask'][lo:hi].tolist()
+        volume = cols['volume'][lo:hi].tolist()
+        return [
+            {'symbol': symbol, 'last': str(l), 'bid': str(b), 'ask': str(a), 'volume': v, 'ts': t}
+            for l, b, a, v, t in zip(last, bid, ask, volume, ts_ms)
+        ]
+
+    def tick_columns(
+        self,
+        symbols: List[str],
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None
+    ) -> TickColumns:
+        """Columnar replay input for the date range (slices of the memory maps)"""
+        per_symbol = {}
+        for symbol in symbols:
+            lo, hi = self.bounds(symbol, start_date, end_date)
+            if hi > lo:
+                cols = self.columns(symbol)
+                per_symbol[symbol] = {name: cols[name][lo:hi] for name in COLUMNS}
+        return TickColumns.merge(per_symbol)
+
+    def symbol_ticks(
+        self,
+        symbols: List[str],
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """{symbol: ticks} for symbols with data in the range"""
+        result = {}
+        for symbol in symbols:
+            ticks = self.ticks(symbol, start_date, end_date)
+            if ticks:
+                result[symbol] = ticks
+        return result
@@ -0,0 +1,254 @@
+"""app/backtest/streaming_metrics.py
+
+Online (streaming) backtest metrics.
+
+StreamingMetrics equity noktalarını ve trade'leri listelerde tutmaz; her
+nokta / trade geldikçe O(1) state günceller:
+- Getiri momentleri (Welford: count, mean, M2) ve negatif getiriler için
+  ayrı momentler + kareler toplamı (downside deviation)
+- Running peak, max drawdown (mutlak, %, oran)
+- İlk / son timestamp ve equity (CAGR, exposure süresi)
+- Trade istatistikleri: win/loss sayıları, gross profit/loss, en büyük
+  kazanç/kayıp, komisyon, süre toplamları
+
+snapshot() / equity_metrics() / trade_metrics() run ortasında çağrılabilir
+(ara metrikler, optimizer pruning). Formüller BacktestReport.compute_metrics
+/ compute_trade_metrics ve MetricsCalculator.calculate_metrics ile aynıdır.
+"""
+
+import math
+from typing import Dict, Any, Optional
+
+import numpy as np
+
+
+ANNUALIZATION = 252
+
+
+class RunningMoments:
+    """Count / mean / population variance of a stream (Welford)"""
+
+    __slots__ = ('count', 'mean', 'm2')
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, x: float) -> None:
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / self.count if self.count else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(max(self.variance, 0.0))
+
+    @property
+    def sum_sq(self) -> float:
+        return self.m2 + self.count * self.mean * self.mean
+
+    def with_zero(self) -> 'RunningMoments':
+        """Copy with one extra 0.0 observation prepended (pct_change().fillna(0))"""
+        merged = RunningMoments()
+        merged.count = self.count + 1
+        merged.mean = self.mean * self.count / merged.count
+        merged.m2 = self.m2 + self.mean * self.mean * self.count / merged.count
+        return merged
+
+
+class StreamingMetrics:
+    """O(1)-memory equity curve and trade metrics accumulator"""
+
+    def __init__(self, initial_capital: float = 100000.0):
+        self.initial_capital = initial_capital
+
+        # Equity curve
+        self.points = 0
+        self.first_ts: Optional[float] = None
+        self.last_ts: Optional[float] = None
+        self.first_equity: Optional[float] = None
+        self.last_equity: Optional[float] = None
+        self.returns = RunningMoments()
+        self.downside = RunningMoments()
+        self.peak: Optional[float] = None
+        self.max_drawdown = 0.0  # Absolute (peak - equity)
+        self.max_drawdown_pct = 0.0  # % of peak at the max absolute drawdown
+        self.max_drawdown_frac = 0.0  # min((equity - peak) / peak), <= 0
+
+        # Trades
+        self.num_trades = 0
+        self.wins = 0
+        self.losses = 0
+        self.gross_profit = 0.0
+        self.gross_loss = 0.0  # Sum of losing pnl (<= 0)
+        self.largest_win = 0.0
+        self.largest_loss = 0.0
+        self.max_pnl = 0.0  # Extremes over all trades (incl. breakeven)
+        self.min_pnl = 0.0
+        self.total_commission = 0.0
+        self.duration_sum_s = 0.0
+        self.duration_count = 0
+        self.exposure_s = 0.0  # Sum of exit - entry (trades with both times)
+        self.exposure_count = 0
+
+    # ------------------------------------------------------------
+    # UPDATES
+    # ------------------------------------------------------------
+    def add_equity_point(self, timestamp: float, equity: float) -> None:
+        if self.points == 0:
+            self.first_ts = timestamp
+            self.first_equity = equity
+            self.peak = equity
+        else:
+            prev = self.last_equity
+            if prev > 0:
+                ret = (equity - prev) / prev
+                self.returns.add(ret)
+                if ret < 0:
+                    self.downside.add(ret)
+        self.points += 1
+        self.last_ts = timestamp
+        self.last_equity = equity
+
+        if equity > self.peak:
+            self.peak = equity
+        peak = self.peak
+        drawdown = peak - equity
+        if drawdown > self.max_drawdown:
+            self.max_drawdown = drawdown
+            self.max_drawdown_pct = drawdown / peak * 100 if peak > 0 else 0
+        if peak > 0:
+            frac = (equity - peak) / peak
+            if frac < self.max_drawdown_frac:
+                self.max_drawdown_frac = frac
+
+    def add_trade(
+        self,
+        pnl: float,
+        entry_time: Optional[float] = None,
+        exit_time: Optional[float] = None,
+        commission: float = 0.0,
+        duration_s: Optional[float] = None
+    ) -> None:
+        self.num_trades += 1
+        self.total_commission += commission
+        if pnl > 0:
+            self.wins += 1
+            self.gross_profit += pnl
+            if pnl > self.largest_win:
+                self.largest_win = pnl
+        elif pnl < 0:
+            self.losses += 1
+            self.gross_loss += pnl
+            if pnl < self.largest_loss:
+                self.largest_loss = pnl
+        if self.num_trades == 1:
+            self.max_pnl = self.min_pnl = pnl
+        else:
+            self.max_pnl = max(self.max_pnl, pnl)
+            self.min_pnl = min(self.min_pnl, pnl)
+        if entry_time is not None and exit_time is not None:
+            self.exposure_s += exit_time - entry_time
+            self.exposure_count += 1
+            if duration_s is None:
+                duration_s = exit_time - entry_time
+        if duration_s is not None:
+            self.duration_sum_s += duration_s
+            self.duration_count += 1
+
+    # ------------------------------------------------------------
+    # METRICS (callable mid-run)
+    # ------------------------------------------------------------
+    @property
+    def total_pnl(self) -> float:
+        return self.gross_profit + self.gross_loss
+
+    @property
+    def span_s(self) -> float:
+        return (self.last_ts - self.first_ts) if self.points else 0.0
+
+    def equity_metrics(self) -> Dict[str, Any]:
+        """BacktestReport.compute_metrics equivalent ({} before the first point)"""
+        if not self.points:
+            return {}
+        with np.errstate(all='ignore'):
+            years = max(self.span_s / (60 * 60 * 24) / 365, 1e-9)
+            cagr = float(np.float64(self.last_equity / self.first_equity) ** (1 / years) - 1)
+            volatility = self.returns.with_zero().std * math.sqrt(ANNUALIZATION)
+            sharpe = float(np.float64(cagr) / volatility) if volatility > 0 else 0
+            if self.downside.count:
+                sortino = float(np.float64(cagr) / np.float64(self.downside.std * math.sqrt(ANNUALIZATION)))
+            else:
+                sortino = 0
+        return {
+            'CAGR': cagr,
+            'volatility': volatility,
+            'sharpe': sharpe,
+            'sortino': sortino,
+            'max_drawdown': self.max_drawdown_frac,
+        }
+
+    def trade_metrics(self) -> Dict[str, Any]:
+        """BacktestReport.compute_trade_metrics equivalent ({} without trades)"""
+        n = self.num_trades
+        if not n:
+            return {}
+        return {
+            'num_trades': n,
+            'win_rate': self.wins / n,
+            'avg_win': self.gross_profit / self.wins if self.wins else 0,
+            'avg_loss': self.gross_loss / self.losses if self.losses else 0,
+            'profit_factor': self.gross_profit / abs(self.gross_loss) if self.losses else float('inf'),
+            'max_win': self.max_pnl,
+            'max_loss': self.min_pnl,
+            'gross_profit': self.gross_profit,
+            'gross_loss': self.gross_loss,
+            'total_pnl': self.total_pnl,
+            'avg_duration_s': self.duration_sum_s / self.duration_count if self.duration_count else float('nan'),
+        }
+
+    def sharpe_ratio(self) -> float:
+        """Mean / std of per-point returns, annualized (MetricsCalculator definition)"""
+        std = self.returns.std
+        if not self.returns.count or std == 0:
+            return 0.0
+        return self.returns.mean / std * math.sqrt(ANNUALIZATION)
+
+    def sortino_ratio(self) -> float:
+        """Mean return / downside RMS, annualized (MetricsCalculator definition)"""
+        if not self.returns.count:
+            return 0.0
+        avg = self.returns.mean
+        if not self.downside.count:
+            return float('inf') if avg > 0 else 0.0
+        downside_std = math.sqrt(self.downside.sum_sq / self.downside.count)
+        if downside_std == 0:
+            return 0.0
+        return avg / downside_std * math.sqrt(ANNUALIZATION)
+
+    def exposure_time_pct(self) -> float:
+        span = self.span_s
+        return self.exposure_s / span * 100 if self.num_trades and span > 0 else 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Intermediate metrics at this point of the run"""
+        return {
+            'points': self.points,
+            'last_timestamp': self.last_ts,
+            'equity': self.last_equity,
+            'peak': self.peak,
+            'drawdown': (self.peak - self.last_equity) if self.points else 0.0,
+            'max_drawdown': self.max_drawdown,
+            'max_drawdown_pct': self.max_drawdown_pct,
+            'sharpe_ratio': self.sharpe_ratio(),
+            'sortino_ratio': self.sortino_ratio(),
+            'exposure_time_pct': self.exposure_time_pct(),
+            'equity_metrics': self.equity_metrics(),
+            'trade_metrics': self.trade_metrics(),
+        }
@@ -0,0 +1,202 @@
+"""app/backtest/tick_columns.py
+
+Columnar tick data for backtest replay.
+
+- frame_to_columns: DataFrame → sembol başına NumPy kolonları
+  (ts_ns, last, bid, ask, volume), vektörel, tek seferde.
+- TickColumns.merge: tüm semboller bir kere np.argsort(ts, stable) ile
+  zaman sırasına dizilir (heap yok). Tek sembolde kolonlar kopyalanmadan
+  (mmap slice dahil) kullanılır.
+- Tick: __slots__'lu kompakt tick; dict API'si (get / [] / in) ile legacy
+  dict tick yerine geçer, fiyatlar zaten float.
+- iter_ticks chunk'lar halinde tolist() ile Python scalar'a çevirir;
+  satır başına NumPy scalar erişimi yok.
+"""
+
+from typing import Dict, Any, List, Optional, Iterator, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.backtest.replay_engine import ReplayMode
+
+
+COLUMNS = ('ts_ns', 'last', 'bid', 'ask', 'volume')
+CANDLE_SPREAD = 0.01  # Candle close → synthetic bid/ask (same as BacktestEngine)
+TICK_FIELDS = ('symbol', 'last', 'bid', 'ask', 'volume', 'ts')
+
+
+def frame_to_columns(df: pd.DataFrame, replay_mode: ReplayMode = ReplayMode.TICK) -> Optional[Dict[str, np.ndarray]]:
+    """
+    DataReader DataFrame → sorted tick columns.
+
+    Same field rules as DataReader.convert_to_ticks (TICK) and the candle → tick
+    conversion in BacktestEngine.run (CANDLE). None if the frame has no
+    timestamp or price column.
+    """
+    if 'timestamp' in df.columns:
+        stamps = pd.to_datetime(df['timestamp'])
+    elif 'ts' in df.columns:
+        stamps = df['ts'] if pd.api.types.is_datetime64_any_dtype(df['ts']) else pd.to_datetime(df['ts'], unit='ms')
+    else:
+        return None
+    ts_ns = stamps.astype('datetime64[ns]').to_numpy().view(np.int64)
+
+    has_ohlc = all(col in df.columns for col in ('open', 'high', 'low', 'close'))
+    if replay_mode == ReplayMode.CANDLE:
+        price_col = 'close' if has_ohlc else ('last' if 'last' in df.columns else 'close')
+    else:
+        price_col = 'last' if 'last' in df.columns else 'close'
+    if price_col not in df.columns:
+        return None
+
+    last = df[price_col].to_numpy(dtype=np.float64)
+    if replay_mode == ReplayMode.TICK and price_col == 'last':
+        bid = df['bid'].to_numpy(dtype=np.float64) if 'bid' in df.columns else last
+        ask = df['ask'].to_numpy(dtype=np.float64) if 'ask' in df.columns else last
+    else:
+        bid = last - CANDLE_SPREAD
+        ask = last + CANDLE_SPREAD
+    if 'volume' in df.columns:
+        volume = df['volume'].fillna(0).to_numpy(dtype=np.float64).astype(np.int64)
+    else:
+        volume = np.zeros(len(df), dtype=np.int64)
+
+    order = np.argsort(ts_ns, kind='stable')
+    return {
+        'ts_ns': ts_ns[order],
+        'last': last[order],
+        'bid': bid[order],
+        'ask': ask[order],
+        'volume': volume[order],
+    }
+
+
+class Tick:
+    """
+    Compact tick passed to strategies in columnar replay.
+
+    Reads like the legacy dict tick (get / [] / in / keys / items) but holds
+    floats instead of price strings. Unknown keys set by consumers go to a
+    small side dict.
+    """
+
+    __slots__ = TICK_FIELDS + ('_extra',)
+
+    def __init__(self, symbol: str, last: float, bid: float, ask: float, volume: int, ts: int):
+        self.symbol = symbol
+        self.last = last
+        self.bid = bid
+        self.ask = ask
+        self.volume = volume
+        self.ts = ts
+        self._extra: Optional[Dict[str, Any]] = None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in TICK_FIELDS:
+            return getattr(self, key)
+        if self._extra is not None:
+            return self._extra.get(key, default)
+        return default
+
+    def __getitem__(self, key: str) -> Any:
+        if key in TICK_FIELDS:
+            return getattr(self, key)
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key in TICK_FIELDS:
+            setattr(self, key, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __contains__(self, key: object) -> bool:
+        return key in TICK_FIELDS or (self._extra is not None and key in self._extra)
+
+    def keys(self) -> List[str]:
+        return list(TICK_FIELDS) + (list(self._extra) if self._extra else [])
+
+    def items(self) -> List[Tuple[str, Any]]:
+        return [(key, self[key]) for key in self.keys()]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self.items())
+
+    def __repr__(self) -> str:
+        return f"Tick({self.to_dict()!r})"
+
+
+class TickColumns:
+    """All symbols' ticks merged into one time-ordered set of columns"""
+
+    CHUNK_ROWS = 65536  # Rows converted to Python scalars at a time
+
+    def __init__(
+        self,
+        symbols: List[str],
+        symbol_idx: np.ndarray,
+        ts_ns: np.ndarray,
+        last: np.ndarray,
+        bid: np.ndarray,
+        ask: np.ndarray,
+        volume: np.ndarray
+    ):
+        self.symbols = symbols
+        self.symbol_idx = symbol_idx
+        self.ts_ns = ts_ns
+        self.last = last
+        self.bid = bid
+        self.ask = ask
+        self.volume = volume
+
+    @classmethod
+    def merge(cls, per_symbol: Dict[str, Dict[str, np.ndarray]]) -> 'TickColumns':
+        """
+        Merge per-symbol columns (each sorted by ts_ns) by timestamp.
+
+        Equal timestamps keep symbol order, then row order (stable sort).
+        A single symbol is used as-is (no copy).
+        """
+        symbols = [symbol for symbol, cols in per_symbol.items() if len(cols['ts_ns'])]
+        if not symbols:
+            empty_f = np.empty(0, dtype=np.float64)
+            empty_i = np.empty(0, dtype=np.int64)
+            return cls([], np.empty(0, dtype=np.int32), empty_i, empty_f, empty_f, empty_f, empty_i)
+        if len(symbols) == 1:
+            cols = per_symbol[symbols[0]]
+            return cls(
+                symbols, np.zeros(len(cols['ts_ns']), dtype=np.int32),
+                *(cols[name] for name in COLUMNS)
+            )
+
+        parts = [per_symbol[symbol] for symbol in symbols]
+        symbol_idx = np.concatenate([
+            np.full(len(cols['ts_ns']), i, dtype=np.int32) for i, cols in enumerate(parts)
+        ])
+        merged = {name: np.concatenate([cols[name] for cols in parts]) for name in COLUMNS}
+        order = np.argsort(merged['ts_ns'], kind='stable')
+        return cls(symbols, symbol_idx[order], *(merged[name][order] for name in COLUMNS))
+
+    def __len__(self) -> int:
+        return len(self.ts_ns)
+
+    def iter_ticks(self, start: int = 0) -> Iterator[Tuple[str, Tick]]:
+        """(symbol, Tick) in time order, from row start"""
+        symbols = self.symbols
+        for lo in range(start, len(self.ts_ns), self.CHUNK_ROWS):
+            hi = lo + self.CHUNK_ROWS
+            rows = zip(
+                self.symbol_idx[lo:hi].tolist(),
+                self.last[lo:hi].tolist(),
+                self.bid[lo:hi].tolist(),
+                self.ask[lo:hi].tolist(),
+                self.volume[lo:hi].tolist(),
+                (np.asarray(self.ts_ns[lo:hi]) // 1_000_000).tolist(),
+            )
+            for idx, last, bid, ask, volume, ts in rows:
+                symbol = symbols[idx]
+                yield symbol, Tick(symbol, last, bid, ask, volume, ts)
@@ -53,6 +53,42 @@ class Settings(BaseSettings):
 
     # Global Execution Mode: True = Real Orders, False = Shadow Mode
     LIVE_MODE: bool = Field(default=True, env="LIVE_MODE")
+
+    # DataFabric L1 storage: True = NumPy column store (symbol → row), False = dict per symbol
+    DATA_FABRIC_COLUMNAR_L1: bool = Field(default=False, env="DATA_FABRIC_COLUMNAR_L1")
+    
+    # FastScoreCalculator.compute_all_fast_scores: True = NumPy batch engine, False = per-symbol loop
+    FAST_SCORES_VECTORIZED: bool = Field(default=True, env="FAST_SCORES_VECTORIZED")
+    
+    # Recompute dirty FAST scores + touched group metrics on every L1 batch (instead of on a timer)
+    FAST_SCORES_INCREMENTAL_GROUPS: bool = Field(default=False, env="FAST_SCORES_INCREMENTAL_GROUPS")
+    
+    # live:{symbol} Redis writes: True = coalesced write-behind flusher thread, False = inline pipeline per L1Update
+    L1_WRITE_BEHIND: bool = Field(default=True, env="L1_WRITE_BEHIND")
+    
+    # Write-behind flush period for live:{symbol} (ms)
+    L1_PUBLISH_FLUSH_MS: int = Field(default=50, env="L1_PUBLISH_FLUSH_MS")
+    
+    # WebSocket market data frames: dirty symbols are coalesced into one delta frame per interval (ms)
+    WS_FRAME_INTERVAL_MS: int = Field(default=150, env="WS_FRAME_INTERVAL_MS")
+    
+    # Per-client WebSocket send queue (frames); oldest frame is dropped when full
+    WS_CLIENT_QUEUE_FRAMES: int = Field(default=8, env="WS_CLIENT_QUEUE_FRAMES")
+    
+    # HammerClient consumers: True = per-consumer worker threads (receive thread only parses/routes), False = inline
+    HAMMER_DISPATCH_ASYNC: bool = Field(default=True, env="HAMMER_DISPATCH_ASYNC")
+    
+    # Fast-score pipeline publishes a versioned, read-only MarketEpoch; RUNALL/XNL read it instead of re-merging market_data_cache
+    MARKET_EPOCH_ENABLED: bool = Field(default=True, env="MARKET_EPOCH_ENABLED")
+    
+    # RUNALL cycle prep re-publishes the epoch from DataFabric when the current one is older than this (seconds)
+    MARKET_EPOCH_MAX_AGE_SEC: float = Field(default=2.0, env="MARKET_EPOCH_MAX_AGE_SEC")
+    
+    # RUNALL engines: True = independent engines run concurrently in worker threads (own event loop each), False = on the main loop
+    RUNALL_ENGINE_OFFLOAD: bool = Field(default=True, env="RUNALL_ENGINE_OFFLOAD")
+    
+    # Worker threads for offloaded RUNALL engines
+    RUNALL_ENGINE_WORKERS: int = Field(default=4, env="RUNALL_ENGINE_WORKERS")
     
     # Pydantic v2 compatibility
     model_config = {
@@ -45,6 +45,12 @@ LAYERS:
 2. L1Cache: Hammer L1 data (bid/ask/last) - FAST PATH
 3. FastScores: L1 + CSV'den hesaplanan skorlar - FAST PATH
 4. TickByTickStore: GOD/ROD/GRPAN - SLOW PATH (lazy)
+
+L1 STORAGE MODES:
+- dict (default): _live_data = {symbol: {bid, ask, ...}}
+- columnar (DATA_FABRIC_COLUMNAR_L1=true): _live_data = L1ColumnStore
+  NumPy kolonları + static universe'den kurulan symbol → row map.
+  Aynı Mapping arayüzü, tick başına dict/datetime allocation yok.
 """
 
 import threading
@@ -56,6 +62,8 @@ from pathlib import Path
 from enum import Enum
 
 from app.core.logger import logger
+from app.core.l1_column_store import L1ColumnStore, build_l1_column_store
+from app.core.live_prefetcher import LivePrefetcher
 
 
 class DataStatus(Enum):
@@ -77,6 +85,11 @@ class DataFabricStats:
     static_load_time_ms: float = 0.0
     last_static_load: Optional[datetime] = None
     live_updates_count: int = 0
+    l1_columnar: bool = False
+    live_hits: int = 0  # get_live served from RAM
+    live_misses: int = 0  # get_live scheduled a Redis prefetch
+    live_negative_hits: int = 0  # get_live skipped (negative cache)
+    live_prefetch_loaded: int = 0  # Symbols loaded by the prefetcher
     derived_computes_count: int = 0
     snapshot_requests_count: int = 0
 
@@ -107,7 +120,8 @@ class DataFabric:
         
         # Data stores (in-memory)
         self._static_data: Dict[str, Dict[str, Any]] = {}  # CSV data
-        self._live_data: Dict[str, Dict[str, Any]] = {}    # Hammer data
+        self._live_data: Dict[str, Dict[str, Any]] = {}    # Hammer data (dict or L1ColumnStore)
+        self._l1_store: Optional[L1ColumnStore] = None      # Set when columnar L1 is enabled
         self._derived_data: Dict[str, Dict[str, Any]] = {} # Calculated metrics
         self._snapshot_data: Dict[str, Dict[str, Any]] = {} # Combined snapshots
         
@@ -129,8 +143,13 @@ class DataFabric:
         # Statistics
         self._stats = DataFabricStats()
         
+        # Non-blocking Redis fallback for get_live misses
+        self._live_prefetcher = LivePrefetcher(self._apply_redis_live, self._stats)
+        
         # Dirty tracking (symbols that need recalculation)
         self._dirty_symbols: Set[str] = set()
+        # Per-consumer dirty sets (drained independently, see drain_dirty)
+        self._dirty_consumers: Dict[str, Set[str]] = {}
         
         # Thread safety
         self._data_lock = threading.RLock()
@@ -138,6 +157,7 @@ class DataFabric:
         # Timestamps
         self._static_load_time: Optional[datetime] = None
         self._last_live_update: Optional[datetime] = None
+        self._last_live_ts: float = 0.0  # Columnar mode (epoch, no datetime per tick)
         
         self._initialized = True
         logger.info("🏗️ DataFabric initialized (singleton)")
@@ -240,7 +260,7 @@ class DataFabric:
                                 if symbol not in self._live_data:
                                     self._live_data[symbol] = {}
                                 self._live_data[symbol].update(l1_update)
-                                self._dirty_symbols.add(symbol)
+                                self._mark_dirty(symbol)
                                 loaded_count += 1
 
                     # 🛡️ VALIDATION & FALLBACK (New Logic)
@@ -310,7 +330,7 @@ class DataFabric:
                                     'volume': 0, # Synthetic start
                                     'timestamp': time.time() # Synthetic: use NOW to pass freshness checks
                                 })
-                                self._dirty_symbols.add(sym)
+                                self._mark_dirty(sym)
                                 syn_count += 1
                                 
                         logger.info(f"🧪 Generated SYNTHETIC start data for {syn_count} symbols (Base: PrevClose)")
@@ -426,7 +446,7 @@ class DataFabric:
                         import time
                         data['timestamp'] = time.time() 
                         
-                    self._dirty_symbols.add(symbol)
+                    self._mark_dirty(symbol)
                     count += 1
                 except Exception as e:
                     # logger.warning(f"Error shuffling {symbol}: {e}")
@@ -556,6 +576,15 @@ class DataFabric:
                     f"✅ Static data loaded: {len(self._static_data)} symbols "
                     f"in {load_time_ms:.1f}ms"
                 )
+                
+                # 🟢 Columnar L1 (optional) - row map follows the static universe
+                try:
+                    from app.config.settings import settings
+                    if settings.DATA_FABRIC_COLUMNAR_L1 or self._l1_store is not None:
+                        self.enable_columnar_l1()
+                except Exception as e:
+                    logger.warning(f"⚠️ Could not enable columnar L1 store: {e}")
+                
                 return True
                 
             except Exception as e:
@@ -631,16 +660,21 @@ class DataFabric:
             # But we double-check here for safety
             symbol = str(symbol).strip()
             
-            # Merge with existing data (don't overwrite completely)
-            if symbol not in self._live_data:
-                self._live_data[symbol] = {}
-            
-            # Update only provided fields
-            self._live_data[symbol].update(data)
-            self._live_data[symbol]['_last_update'] = datetime.now()
+            if self._l1_store is not None:
+                # 🟢 Columnar: write into arrays, epoch timestamp (no datetime alloc)
+                self._last_live_ts = time.time()
+                self._l1_store.write(symbol, data, now=self._last_live_ts)
+            else:
+                # Merge with existing data (don't overwrite completely)
+                if symbol not in self._live_data:
+                    self._live_data[symbol] = {}
+                
+                # Update only provided fields
+                self._live_data[symbol].update(data)
+                self._live_data[symbol]['_last_update'] = datetime.now()
             
             # Mark as dirty (needs derived recalculation)
-            self._dirty_symbols.add(symbol)
+            self._mark_dirty(symbol)
             
             # 🔍 DEBUG: Log key consistency (first few updates only)
             if self._stats.live_updates_count < 5:
@@ -654,7 +688,8 @@ class DataFabric:
             self._stats.live_updates_count += 1
             self._stats.live_symbols = len(self._live_data)
             
-            self._last_live_update = datetime.now()
+            if self._l1_store is None:
+                self._last_live_update = datetime.now()
     
     def update_live_batch(self, updates: Dict[str, Dict[str, Any]]) -> None:
         """
@@ -668,26 +703,34 @@ class DataFabric:
             if self._lifeless_mode:
                 return
 
-            now = datetime.now()
-            for symbol, data in updates.items():
-                if symbol not in self._live_data:
-                    self._live_data[symbol] = {}
-                self._live_data[symbol].update(data)
-                self._live_data[symbol]['_last_update'] = now
-                self._dirty_symbols.add(symbol)
+            if self._l1_store is not None:
+                # 🟢 Columnar: one shared epoch stamp for the whole batch
+                self._last_live_ts = time.time()
+                self._l1_store.write_batch(updates, now=self._last_live_ts)
+                self._mark_dirty_many(updates.keys())
+            else:
+                now = datetime.now()
+                for symbol, data in updates.items():
+                    if symbol not in self._live_data:
+                        self._live_data[symbol] = {}
+                    self._live_data[symbol].update(data)
+                    self._live_data[symbol]['_last_update'] = now
+                    self._mark_dirty(symbol)
+                self._last_live_update = now
             
             self._stats.live_updates_count += len(updates)
             self._stats.live_symbols = len(self._live_data)
-            self._last_live_update = now
     
     def get_live(self, symbol: str) -> Optional[Dict[str, Any]]:
         """
-        Get live market data for symbol (from RAM, with Redis fallback).
+        Get live market data for symbol (from RAM, never blocks on Redis).
         
         🔄 FALLBACK LOGIC:
-        1. First check in-memory _live_data (fastest)
-        2. If missing, try Redis live:{symbol} (recent data)
-        3. If still missing, try Redis market_data:snapshot:{symbol} (last snapshot)
+        1. In-memory _live_data with bid/ask → returned (hit)
+        2. Missing or incomplete → symbol is queued for the background
+           LivePrefetcher (pipelined MGET of live:, market:l1:,
+           market_data:snapshot:) and whatever is in RAM is returned now.
+           Symbols not found in Redis sit in a negative cache (TTL).
         
         Args:
             symbol: PREF_IBKR symbol
@@ -695,99 +738,26 @@ class DataFabric:
         Returns:
             Live data dict or None
         """
-        # 1. Check in-memory first (fastest)
         live = self._live_data.get(symbol)
         if live and live.get('bid') is not None and live.get('ask') is not None:
+            self._stats.live_hits += 1
             return live
         
-        # 2. FALLBACK: Try Redis if in-memory is missing or incomplete
-        # This helps when Hammer feed hasn't updated yet or symbol wasn't subscribed
-        try:
-            from app.core.redis_client import get_redis_client
-            import json
-            
-            redis_client = get_redis_client()
-            if redis_client and redis_client.sync:
-                # Try live:{symbol} first (most recent)
-                live_key = f"live:{symbol}"
-                live_json = redis_client.sync.get(live_key)
-                
-                if live_json:
-                    try:
-                        redis_live = json.loads(live_json)
-                        # Validate it has bid/ask
-                        if redis_live.get('bid') is not None and redis_live.get('ask') is not None:
-                            # Update in-memory cache for next time
-                            with self._data_lock:
-                                if symbol not in self._live_data:
-                                    self._live_data[symbol] = {}
-                                self._live_data[symbol].update(redis_live)
-                                self._live_data[symbol]['_last_update'] = datetime.now()
-                            logger.debug(f"🔄 [REDIS_FALLBACK] Loaded {symbol} from Redis live:{symbol}")
-                            return self._live_data[symbol]
-                    except (json.JSONDecodeError, Exception) as e:
-                        logger.debug(f"Failed to parse Redis live:{symbol}: {e}")
-                
-                # Try market:l1:{symbol} (L1Feed Terminal streaming data — 2s refresh, 120s TTL)
-                l1_key = f"market:l1:{symbol}"
-                l1_json = redis_client.sync.get(l1_key)
-                
-                if l1_json:
-                    try:
-                        l1_data = json.loads(l1_json)
-                        bid = l1_data.get('bid')
-                        ask = l1_data.get('ask')
-                        if bid is not None and ask is not None and float(bid) > 0 and float(ask) > 0:
-                            redis_live = {
-                                'bid': float(bid),
-                                'ask': float(ask),
-                                'last': float(l1_data.get('last', 0)),
-                                'timestamp': l1_data.get('ts'),
-                            }
-                            with self._data_lock:
-                                if symbol not in self._live_data:
-                                    self._live_data[symbol] = {}
-                                self._live_data[symbol].update(redis_live)
-                                self._live_data[symbol]['_last_update'] = datetime.now()
-                            logger.debug(f"🔄 [REDIS_FALLBACK] Loaded {symbol} from Redis market:l1:{symbol}")
-                            return self._live_data[symbol]
-                    except (json.JSONDecodeError, Exception) as e:
-                        logger.debug(f"Failed to parse Redis market:l1:{symbol}: {e}")
-                
-                # Try market_data:snapshot:{symbol} as third fallback
-                snapshot_key = f"market_data:snapshot:{symbol}"
-                snapshot_json = redis_client.sync.get(snapshot_key)
-                
-                if snapshot_json:
-                    try:
-                        snapshot = json.loads(snapshot_json)
-                        # Extract L1 data
-                        redis_live = {
-                            'bid': snapshot.get('bid'),
-                            'ask': snapshot.get('ask'),
-                            'last': snapshot.get('last'),
-                            'volume': snapshot.get('volume'),
-                            'prev_close': snapshot.get('prev_close'),
-                            'timestamp': snapshot.get('timestamp')
-                        }
-                        # Validate it has bid/ask
-                        if redis_live.get('bid') is not None and redis_live.get('ask') is not None:
-                            # Update in-memory cache
-                            with self._data_lock:
-                                if symbol not in self._live_data:
-                                    self._live_data[symbol] = {}
-                                self._live_data[symbol].update(redis_live)
-                                self._live_data[symbol]['_last_update'] = datetime.now()
-                            logger.debug(f"🔄 [REDIS_FALLBACK] Loaded {symbol} from Redis snapshot")
-                            return self._live_data[symbol]
-                    except (json.JSONDecodeError, Exception) as e:
-                        logger.debug(f"Failed to parse Redis snapshot:{symbol}: {e}")
-        except Exception as e:
-            # Non-critical - Redis fallback failed, continue with None
-            logger.debug(f"Redis fallback failed for {symbol}: {e}")
-        
-        # Return None if nothing found
-        return self._live_data.get(symbol) if symbol in self._live_data else None
+        self._live_prefetcher.request(symbol)
+        return live if live else None
+    
+    def _apply_redis_live(self, symbol: str, redis_live: Dict[str, Any]) -> None:
+        """Merge Redis fallback data into RAM (prefetcher callback)"""
+        with self._data_lock:
+            existing = self._live_data.get(symbol)
+            if existing and existing.get('bid') is not None and existing.get('ask') is not None:
+                return  # Feed was faster - keep fresher data
+            if symbol not in self._live_data:
+                self._live_data[symbol] = {}
+            self._live_data[symbol].update(redis_live)
+            self._live_data[symbol]['_last_update'] = datetime.now()
+            self._mark_dirty(symbol)
+            self._stats.live_symbols = len(self._live_data)
     
     def get_live_symbols_count(self) -> int:
         """Get count of symbols with live data"""
@@ -797,81 +767,84 @@ class DataFabric:
         """Get all symbols with live data"""
         return list(self._live_data.keys())
     
+    # =========================================================================
+    # COLUMNAR L1 (optional NumPy store)
+    # =========================================================================
+    
+    def enable_columnar_l1(self, universe: Optional[List[str]] = None) -> L1ColumnStore:
+        """
+        Switch live L1 storage to the columnar store.
+        
+        Row map = static CSV universe (stable order). Existing live entries
+        are migrated, so this is safe to call at any time (also on reload).
+        
+        Args:
+            universe: Symbols for the row map (default: static symbols)
+            
+        Returns:
+            The active L1ColumnStore
+        """
+        with self._data_lock:
+            if universe is None:
+                universe = list(self._static_data.keys())
+            existing = self._live_data
+            if isinstance(existing, L1ColumnStore):
+                existing = existing.to_dict()
+            
+            store = build_l1_column_store(universe, existing)
+            self._l1_store = store
+            self._live_data = store
+            self._stats.l1_columnar = True
+            self._stats.live_symbols = len(store)
+            
+            logger.info(
+                f"🟢 Columnar L1 store enabled: {store.universe_size} universe rows, "
+                f"{len(store)} live symbols migrated"
+            )
+            return store
+    
+    def is_columnar_l1(self) -> bool:
+        """Check if live L1 is stored in NumPy columns"""
+        return self._l1_store is not None
+    
+    def get_l1_columns(self, fields: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Get consistent copy of L1 columns for vectorized consumers.
+        
+        Returns:
+            {'symbols': [...], 'bid': ndarray, 'ask': ndarray, ..., 'present': ndarray}
+            or None if columnar L1 is not enabled.
+            Missing values are NaN. '_last_update' is epoch seconds.
+        """
+        if self._l1_store is None:
+            return None
+        with self._data_lock:
+            columns = self._l1_store.snapshot_columns(fields or ('bid', 'ask', 'last', 'size', 'volume', 'timestamp', '_last_update'))
+            columns['symbols'] = self._l1_store.symbols
+            return columns
+    
     def load_live_from_redis(self) -> int:
         """
         Load live market data from Redis (fallback when Hammer feed hasn't started).
         
-        Tries two Redis keys:
-        1. live:{symbol} - Most recent live data
-        2. market_data:snapshot:{symbol} - Last snapshot
+        Same key order as get_live (live:, market:l1:, market_data:snapshot:),
+        fetched for all incomplete symbols with pipelined MGET.
         
         Returns:
             Number of symbols loaded
         """
         try:
-            from app.core.redis_client import get_redis_client
-            import json
-            
-            redis_client = get_redis_client()
-            if not redis_client or not redis_client.sync:
-                logger.debug("Redis not available for live data fallback")
-                return 0
-            
-            symbols = self.get_all_static_symbols()
-            loaded_count = 0
-            
-            for symbol in symbols:
+            missing = []
+            for symbol in self.get_all_static_symbols():
                 # Skip if already in memory with valid data
-                existing = self._live_data.get(symbol, {})
-                if existing.get('bid') is not None and existing.get('ask') is not None:
-                    continue
-                
-                # Try live:{symbol} first
-                live_key = f"live:{symbol}"
-                live_json = redis_client.sync.get(live_key)
-                
-                if live_json:
-                    try:
-                        redis_live = json.loads(live_json)
-                        if redis_live.get('bid') is not None and redis_live.get('ask') is not None:
-                            with self._data_lock:
-                                if symbol not in self._live_data:
-                                    self._live_data[symbol] = {}
-                                self._live_data[symbol].update(redis_live)
-                                self._live_data[symbol]['_last_update'] = datetime.now()
-                            loaded_count += 1
-                            continue
-                    except (json.JSONDecodeError, Exception):
-                        pass
-                
-                # Try market_data:snapshot:{symbol} as fallback
-                snapshot_key = f"market_data:snapshot:{symbol}"
-                snapshot_json = redis_client.sync.get(snapshot_key)
-                
-                if snapshot_json:
-                    try:
-                        snapshot = json.loads(snapshot_json)
-                        redis_live = {
-                            'bid': snapshot.get('bid'),
-                            'ask': snapshot.get('ask'),
-                            'last': snapshot.get('last'),
-                            'volume': snapshot.get('volume'),
-                            'prev_close': snapshot.get('prev_close'),
-                            'timestamp': snapshot.get('timestamp')
-                        }
-                        if redis_live.get('bid') is not None and redis_live.get('ask') is not None:
-                            with self._data_lock:
-                                if symbol not in self._live_data:
-                                    self._live_data[symbol] = {}
-                                self._live_data[symbol].update(redis_live)
-                                self._live_data[symbol]['_last_update'] = datetime.now()
-                            loaded_count += 1
-                    except (json.JSONDecodeError, Exception):
-                        pass
+                existing = self._live_data.get(symbol) or {}
+                if existing.get('bid') is None or existing.get('ask') is None:
+                    missing.append(symbol)
+            
+            loaded_count = self._live_prefetcher.fetch_now(missing)
             
             if loaded_count > 0:
                 logger.info(f"🔄 [REDIS_FALLBACK] Loaded {loaded_count} symbols from Redis (live data fallback)")
-                self._stats.live_symbols = len(self._live_data)
             
             return loaded_count
             
@@ -890,7 +863,7 @@ class DataFabric:
             self._etf_live[etf_symbol]['_last_update'] = datetime.now()
             
             # Mark all symbols as dirty (benchmark changed)
-            self._dirty_symbols.update(self._static_data.keys())
+            self._mark_dirty_many(self._static_data.keys())
     
     def set_etf_prev_close(self, etf_symbol: str, prev_close: float) -> None:
         """Set ETF previous close"""
@@ -960,6 +933,41 @@ class DataFabric:
         """Clear dirty flag for symbol"""
         self._dirty_symbols.discard(symbol)
     
+    def _mark_dirty(self, symbol: str) -> None:
+        """Mark symbol dirty (global set + every registered consumer)"""
+        self._dirty_symbols.add(symbol)
+        for pending in self._dirty_consumers.values():
+            pending.add(symbol)
+    
+    def _mark_dirty_many(self, symbols) -> None:
+        """Mark several symbols dirty"""
+        symbols = list(symbols)
+        self._dirty_symbols.update(symbols)
+        for pending in self._dirty_consumers.values():
+            pending.update(symbols)
+    
+    def drain_dirty(self, consumer: str) -> Set[str]:
+        """
+        Return and reset the dirty set of one consumer.
+        
+        The global dirty set is owned by the WebSocket broadcast, so
+        incremental recomputes keep their own set. On first call the
+        consumer is registered and gets the whole static universe.
+        
+        Args:
+            consumer: Consumer name (e.g. 'fast_scores_groups')
+            
+        Returns:
+            Symbols marked dirty since the previous drain
+        """
+        with self._data_lock:
+            pending = self._dirty_consumers.get(consumer)
+            if pending is None:
+                self._dirty_consumers[consumer] = set()
+                return set(self._static_data.keys())
+            self._dirty_consumers[consumer] = set()
+            return pending
+    
     # =========================================================================
     # SNAPSHOT (combined view for algo)
     # =========================================================================
@@ -1078,9 +1086,16 @@ class DataFabric:
             'etf_symbols': len(self._etf_live),
             'dirty_symbols': len(self._dirty_symbols),
             'static_load_time': self._static_load_time.isoformat() if self._static_load_time else None,
-            'last_live_update': self._last_live_update.isoformat() if self._last_live_update else None,
+            'last_live_update': self._get_last_live_update().isoformat() if self._get_last_live_update() else None,
+            'l1_columnar': self._l1_store is not None,
         }
     
+    def _get_last_live_update(self) -> Optional[datetime]:
+        """Last live update time (datetime in dict mode, epoch in columnar mode)"""
+        if self._l1_store is not None and self._last_live_ts:
+            return datetime.fromtimestamp(self._last_live_ts)
+        return self._last_live_update
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get performance statistics"""
         return {
@@ -1092,6 +1107,13 @@ class DataFabric:
             'live_updates_count': self._stats.live_updates_count,
             'derived_computes_count': self._stats.derived_computes_count,
             'snapshot_requests_count': self._stats.snapshot_requests_count,
+            'l1_columnar': self._stats.l1_columnar,
+            'live_hits': self._stats.live_hits,
+            'live_misses': self._stats.live_misses,
+            'live_negative_hits': self._stats.live_negative_hits,
+            'live_prefetch_loaded': self._stats.live_prefetch_loaded,
+            'live_prefetch_pending': self._live_prefetcher.pending_count(),
+            'live_negative_cached': self._live_prefetcher.negative_count(),
         }
     
     def is_ready(self) -> bool:
@@ -1178,7 +1200,6 @@ class DataFabric:
             if not static and not live:
                 return None
             
-            # Build FAST snapshot (only fast fields)
             # Convert datetime to ISO string for JSON serialization
             last_update = live.get('_last_update')
             if last_update and hasattr(last_update, 'isoformat'):
@@ -1188,92 +1209,110 @@ class DataFabric:
             if timestamp and hasattr(timestamp, 'isoformat'):
                 timestamp = timestamp.isoformat()
             
-            fast_snapshot = {
-                # Identity
-                '_symbol': symbol,
-                
-                # L1 Market Data (FAST - from Hammer)
-                'bid': live.get('bid'),
-                'ask': live.get('ask'),
-                'last': live.get('last'),
-                'volume': live.get('volume'),
-                'timestamp': timestamp,
-                '_last_update': last_update,
-                
-                # Static Data (from CSV - loaded once)
-                'prev_close': static.get('prev_close'),
-                'AVG_ADV': static.get('AVG_ADV'),
-                'FINAL_THG': static.get('FINAL_THG'),
-                'SHORT_FINAL': static.get('SHORT_FINAL'),
-                'GROUP': static.get('GROUP'),
-                'CMON': static.get('CMON') or static.get('cmon'),  # Company name
-                'CGRUP': static.get('CGRUP') or static.get('cgrup'),
-                # Calculate MAXALW = AVG_ADV / 10 (static data)
-                'MAXALW': self._calculate_maxalw(static.get('AVG_ADV')),
-                'SMA63 chg': static.get('SMA63 chg'),
-                'SMA246 chg': static.get('SMA246 chg'),
-                # Frontend compatibility aliases
-                'SMA63chg': static.get('SMA63 chg'),  # Frontend expects SMA63chg
-                'SMA246chg': static.get('SMA246 chg'),  # Frontend expects SMA246chg
-                # Frontend compatibility aliases
-                'SMA63chg': static.get('SMA63 chg'),  # Frontend expects SMA63chg
-                'SMA246chg': static.get('SMA246 chg'),  # Frontend expects SMA246chg
-                
-                # FAST Derived Scores (calculated from L1 + CSV - Janall format)
-                # Final Scores (800 katsayısı ile)
-                'Final_BB_skor': derived.get('Final_BB_skor'),
-                'Final_FB_skor': derived.get('Final_FB_skor'),
-                'Final_AB_skor': derived.get('Final_AB_skor'),
-                'Final_AS_skor': derived.get('Final_AS_skor'),
-                'Final_FS_skor': derived.get('Final_FS_skor'),
-                'Final_BS_skor': derived.get('Final_BS_skor'),
-                'Final_SAS_skor': derived.get('Final_SAS_skor'),
-                'Final_SFS_skor': derived.get('Final_SFS_skor'),
-                'Final_SBS_skor': derived.get('Final_SBS_skor'),
-                
-                # Group-based metrics
-                'Fbtot': derived.get('Fbtot'),
-                'SFStot': derived.get('SFStot'),
-                'GORT': derived.get('GORT'),
-                
-                # Ucuzluk/Pahalılık scores (Janall format)
-                'Bid_buy_ucuzluk_skoru': derived.get('Bid_buy_ucuzluk_skoru'),
-                'Front_buy_ucuzluk_skoru': derived.get('Front_buy_ucuzluk_skoru'),
-                'Ask_buy_ucuzluk_skoru': derived.get('Ask_buy_ucuzluk_skoru'),
-                'Ask_sell_pahalilik_skoru': derived.get('Ask_sell_pahalilik_skoru'),
-                'Front_sell_pahalilik_skoru': derived.get('Front_sell_pahalilik_skoru'),
-                'Bid_sell_pahalilik_skoru': derived.get('Bid_sell_pahalilik_skoru'),
-                
-                # Legacy aliases
-                'bid_buy_ucuzluk': derived.get('bid_buy_ucuzluk'),
-                'front_buy_ucuzluk': derived.get('front_buy_ucuzluk'),
-                'ask_buy_ucuzluk': derived.get('ask_buy_ucuzluk'),
-                'ask_sell_pahalilik': derived.get('ask_sell_pahalilik'),
-                'front_sell_pahalilik': derived.get('front_sell_pahalilik'),
-                'bid_sell_pahalilik': derived.get('bid_sell_pahalilik'),
-                
-                # Benchmark
-                'Benchmark_Type': derived.get('Benchmark_Type') or derived.get('benchmark_type'),
-                'Benchmark_Chg': derived.get('Benchmark_Chg') or derived.get('benchmark_chg'),
-                'benchmark_type': derived.get('benchmark_type'),
-                'benchmark_chg': derived.get('benchmark_chg'),
-                # NEW: Group-based benchmark
-                'bench_chg': derived.get('bench_chg'),  # Group average daily change
-                'bench_source': derived.get('bench_source'),  # Source description
-                'daily_chg': derived.get('daily_chg'),  # Stock's own daily change (cents)
-                
-                # Other metrics
-                'daily_change': derived.get('daily_change'),
-                'Spread': derived.get('Spread') or derived.get('spread'),
-                'spread': derived.get('spread'),
-                
-                # Status flags
-                '_has_static': bool(static),
-                '_has_live': bool(live),
-                '_has_derived': bool(derived),
-            }
+            return self._build_fast_snapshot(
+                symbol, static, derived,
+                live.get('bid'), live.get('ask'), live.get('last'), live.get('volume'),
+                timestamp, last_update, bool(live)
+            )
+    
+    def _build_fast_snapshot(
+        self,
+        symbol: str,
+        static: Dict[str, Any],
+        derived: Dict[str, Any],
+        bid: Any,
+        ask: Any,
+        last: Any,
+        volume: Any,
+        timestamp: Any,
+        last_update: Any,
+        has_live: bool
+    ) -> Dict[str, Any]:
+        """Build FAST snapshot dict (only fast fields) from already-resolved L1 values"""
+        return {
+            # Identity
+            '_symbol': symbol,
+            
+            # L1 Market Data (FAST - from Hammer)
+            'bid': bid,
+            'ask': ask,
+            'last': last,
+            'volume': volume,
+            'timestamp': timestamp,
+            '_last_update': last_update,
+            
+            # Static Data (from CSV - loaded once)
+            'prev_close': static.get('prev_close'),
+            'AVG_ADV': static.get('AVG_ADV'),
+            'FINAL_THG': static.get('FINAL_THG'),
+            'SHORT_FINAL': static.get('SHORT_FINAL'),
+            'GROUP': static.get('GROUP'),
+            'CMON': static.get('CMON') or static.get('cmon'),  # Company name
+            'CGRUP': static.get('CGRUP') or static.get('cgrup'),
+            # Calculate MAXALW = AVG_ADV / 10 (static data)
+            'MAXALW': self._calculate_maxalw(static.get('AVG_ADV')),
+            'SMA63 chg': static.get('SMA63 chg'),
+            'SMA246 chg': static.get('SMA246 chg'),
+            # Frontend compatibility aliases
+            'SMA63chg': static.get('SMA63 chg'),  # Frontend expects SMA63chg
+            'SMA246chg': static.get('SMA246 chg'),  # Frontend expects SMA246chg
+            # Frontend compatibility aliases
+            'SMA63chg': static.get('SMA63 chg'),  # Frontend expects SMA63chg
+            'SMA246chg': static.get('SMA246 chg'),  # Frontend expects SMA246chg
+            
+            # FAST Derived Scores (calculated from L1 + CSV - Janall format)
+            # Final Scores (800 katsayısı ile)
+            'Final_BB_skor': derived.get('Final_BB_skor'),
+            'Final_FB_skor': derived.get('Final_FB_skor'),
+            'Final_AB_skor': derived.get('Final_AB_skor'),
+            'Final_AS_skor': derived.get('Final_AS_skor'),
+            'Final_FS_skor': derived.get('Final_FS_skor'),
+            'Final_BS_skor': derived.get('Final_BS_skor'),
+            'Final_SAS_skor': derived.get('Final_SAS_skor'),
+            'Final_SFS_skor': derived.get('Final_SFS_skor'),
+            'Final_SBS_skor': derived.get('Final_SBS_skor'),
+            
+            # Group-based metrics
+            'Fbtot': derived.get('Fbtot'),
+            'SFStot': derived.get('SFStot'),
+            'GORT': derived.get('GORT'),
+            
+            # Ucuzluk/Pahalılık scores (Janall format)
+            'Bid_buy_ucuzluk_skoru': derived.get('Bid_buy_ucuzluk_skoru'),
+            'Front_buy_ucuzluk_skoru': derived.get('Front_buy_ucuzluk_skoru'),
+            'Ask_buy_ucuzluk_skoru': derived.get('Ask_buy_ucuzluk_skoru'),
+            'Ask_sell_pahalilik_skoru': derived.get('Ask_sell_pahalilik_skoru'),
+            'Front_sell_pahalilik_skoru': derived.get('Front_sell_pahalilik_skoru'),
+            'Bid_sell_pahalilik_skoru': derived.get('Bid_sell_pahalilik_skoru'),
+            
+            # Legacy aliases
+            'bid_buy_ucuzluk': derived.get('bid_buy_ucuzluk'),
+            'front_buy_ucuzluk': derived.get('front_buy_ucuzluk'),
+            'ask_buy_ucuzluk': derived.get('ask_buy_ucuzluk'),
+            'ask_sell_pahalilik': derived.get('ask_sell_pahalilik'),
+            'front_sell_pahalilik': derived.get('front_sell_pahalilik'),
+            'bid_sell_pahalilik': derived.get('bid_sell_pahalilik'),
+            
+            # Benchmark
+            'Benchmark_Type': derived.get('Benchmark_Type') or derived.get('benchmark_type'),
+            'Benchmark_Chg': derived.get('Benchmark_Chg') or derived.get('benchmark_chg'),
+            'benchmark_type': derived.get('benchmark_type'),
+            'benchmark_chg': derived.get('benchmark_chg'),
+            # NEW: Group-based benchmark
+            'bench_chg': derived.get('bench_chg'),  # Group average daily change
+            'bench_source': derived.get('bench_source'),  # Source description
+            'daily_chg': derived.get('daily_chg'),  # Stock's own daily change (cents)
             
-            return fast_snapshot
+            # Other metrics
+            'daily_change': derived.get('daily_change'),
+            'Spread': derived.get('Spread') or derived.get('spread'),
+            'spread': derived.get('spread'),
+            
+            # Status flags
+            '_has_static': bool(static),
+            '_has_live': has_live,
+            '_has_derived': bool(derived),
+        }
     
     def get_all_fast_snapshots(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -1284,6 +1323,9 @@ class DataFabric:
         ⚠️ IMPORTANT: Only returns symbols from _static_data (janalldata.csv).
         ETFs are NOT included here - they have their own ETF Strip panel.
         """
+        if self._l1_store is not None:
+            return self._get_all_fast_snapshots_columnar()
+        
         with self._data_lock:
             # Only return symbols from static data (preferred stocks from CSV)
             # DO NOT include live-only symbols (like ETFs) - they have separate UI
@@ -1294,6 +1336,57 @@ class DataFabric:
                     result[symbol] = snap
             return result
     
+    def _get_all_fast_snapshots_columnar(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Columnar variant of get_all_fast_snapshots.
+        
+        Copies the L1 columns once under the lock, then builds snapshots
+        from plain floats - no per-symbol live dict / lock re-entry.
+        """
+        store = self._l1_store
+        with self._data_lock:
+            cols = store.snapshot_columns(('bid', 'ask', 'last', 'volume', 'timestamp', '_last_update'))
+            index = {sym: store.row_of(sym) for sym in self._static_data.keys()}
+            extras = {row: store.extras_at(row) for row in index.values() if row is not None and store.extras_at(row)}
+            static_items = list(self._static_data.items())
+            derived_data = self._derived_data
+        
+        bid_col = cols['bid'].tolist()
+        ask_col = cols['ask'].tolist()
+        last_col = cols['last'].tolist()
+        volume_col = cols['volume'].tolist()
+        ts_col = cols['timestamp'].tolist()
+        update_col = cols['_last_update'].tolist()
+        present = cols['present'].tolist()
+        
+        def _val(column: List[float], row: int) -> Optional[float]:
+            value = column[row]
+            return None if value != value else value
+        
+        result = {}
+        for symbol, static in static_items:
+            derived = derived_data.get(symbol, {})
+            row = index.get(symbol)
+            if row is None or row >= len(present) or not present[row]:
+                result[symbol] = self._build_fast_snapshot(
+                    symbol, static, derived, None, None, None, None, None, None, False
+                )
+                continue
+            
+            timestamp = _val(ts_col, row)
+            if timestamp is None and row in extras:
+                timestamp = extras[row].get('timestamp')
+            last_update = _val(update_col, row)
+            if last_update is not None:
+                last_update = datetime.fromtimestamp(last_update).isoformat()
+            
+            result[symbol] = self._build_fast_snapshot(
+                symbol, static, derived,
+                _val(bid_col, row), _val(ask_col, row), _val(last_col, row), _val(volume_col, row),
+                timestamp, last_update, True
+            )
+        return result
+    
     # =========================================================================
     # 🔵 SLOW PATH - Tick-by-Tick Data (for Deeper Analysis ONLY)
     # =========================================================================
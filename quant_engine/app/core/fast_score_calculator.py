@@ -29,9 +29,10 @@ PERFORMANCE:
 - Event-driven: only recalculates when L1 changes
 - Batch compute: can process all symbols in <50ms
 - No disk I/O: all data from RAM
+- Every compute publishes a read-only MarketEpoch (see market_epoch.py)
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple, Iterable
 from datetime import datetime
 import threading
 
@@ -42,14 +43,110 @@ from app.core.data_fabric import get_data_fabric
 # Group-based metrics (Fbtot, SFStot, GORT) are calculated by JanallMetricsEngine
 # We import it lazily to avoid circular imports
 def _get_janall_metrics_engine():
-    """Lazy import JanallMetricsEngine"""
+    """Lazy import JanallMetricsEngine (singleton - holds incremental group state)"""
     try:
-        from app.market_data.janall_metrics_engine import JanallMetricsEngine
-        return JanallMetricsEngine()
+        from app.market_data.janall_metrics_engine import get_janall_metrics_engine
+        return get_janall_metrics_engine()
     except ImportError:
         return None
 
 
+def _build_fast_score_result(
+    daily_change: float,
+    spread: float,
+    spread_percent: float,
+    bid_buy_ucuzluk: float,
+    front_buy_ucuzluk: float,
+    ask_buy_ucuzluk: float,
+    ask_sell_pahalilik: float,
+    front_sell_pahalilik: float,
+    bid_sell_pahalilik: float,
+    benchmark_type: str,
+    benchmark_chg: float,
+    final_scores: Tuple[float, ...],
+    computed_at: datetime
+) -> Dict[str, Any]:
+    """
+    Build FAST score result dict (Janall format - EXACT COPY).
+    
+    Shared by the scalar path (compute_fast_scores) and the vectorized
+    batch path (VectorizedScoreEngine) so both emit identical keys/rounding.
+    
+    Args:
+        final_scores: (BB, FB, AB, AS, FS, BS, SAS, SFS, SBS) unrounded
+    """
+    (final_bb_skor, final_fb_skor, final_ab_skor, final_as_skor, final_fs_skor,
+     final_bs_skor, final_sas_skor, final_sfs_skor, final_sbs_skor) = final_scores
+    
+    # Build result (Janall format - EXACT COPY)
+    return {
+        # Basic metrics
+        'daily_change': daily_change,
+        'spread': spread,
+        'spread_percent': spread_percent,
+        
+        # Ucuzluk/Pahalilik scores (Janall format)
+        'Bid_buy_ucuzluk_skoru': round(bid_buy_ucuzluk, 2),
+        'Front_buy_ucuzluk_skoru': round(front_buy_ucuzluk, 2),
+        'Ask_buy_ucuzluk_skoru': round(ask_buy_ucuzluk, 2),
+        'Ask_sell_pahalilik_skoru': round(ask_sell_pahalilik, 2),
+        'Front_sell_pahalilik_skoru': round(front_sell_pahalilik, 2),
+        'Bid_sell_pahalilik_skoru': round(bid_sell_pahalilik, 2),
+        
+        # Legacy aliases (for compatibility)
+        'bid_buy_ucuzluk': bid_buy_ucuzluk,
+        'front_buy_ucuzluk': front_buy_ucuzluk,
+        'ask_buy_ucuzluk': ask_buy_ucuzluk,
+        'ask_sell_pahalilik': ask_sell_pahalilik,
+        'front_sell_pahalilik': front_sell_pahalilik,
+        'bid_sell_pahalilik': bid_sell_pahalilik,
+        
+        # Benchmark
+        'Benchmark_Type': benchmark_type,  # Frontend expects Benchmark_Type
+        'benchmark_type': benchmark_type,  # Legacy
+        'Benchmark_Chg': round(benchmark_chg, 4),  # Frontend expects Benchmark_Chg
+        'benchmark_chg': benchmark_chg,  # Legacy
+        
+        # Final Scores (Janall format - 800 katsayısı)
+        'Final_BB_skor': round(final_bb_skor, 2),
+        'Final_FB_skor': round(final_fb_skor, 2),
+        'Final_AB_skor': round(final_ab_skor, 2),
+        'Final_AS_skor': round(final_as_skor, 2),
+        'Final_FS_skor': round(final_fs_skor, 2),
+        'Final_BS_skor': round(final_bs_skor, 2),
+        'Final_SAS_skor': round(final_sas_skor, 2),
+        'Final_SFS_skor': round(final_sfs_skor, 2),
+        'Final_SBS_skor': round(final_sbs_skor, 2),
+        
+        # Spread (Janall format)
+        'Spread': round(spread, 4),
+        
+        # Metadata
+        '_computed_at': computed_at,
+        '_is_fast_path': True,
+    }
+
+
+def _group_overlay_fields(metrics: Dict[str, Any]) -> Dict[str, Any]:
+    """Map JanallMetricsEngine group overlay output → FAST score keys"""
+    return {
+        'Fbtot': metrics.get('fbtot'),
+        'SFStot': metrics.get('sfstot'),
+        'GORT': metrics.get('gort'),
+        # NEW: Group-based benchmark and recalculated scores
+        'bench_chg': metrics.get('bench_chg'),
+        'benchmark_chg': metrics.get('bench_chg'),  # Alias for data_fabric
+        'bench_source': metrics.get('bench_source'),
+        'bid_buy_ucuzluk': metrics.get('bid_buy_ucuzluk'),
+        'front_buy_ucuzluk': metrics.get('front_buy_ucuzluk'),
+        'ask_buy_ucuzluk': metrics.get('ask_buy_ucuzluk'),
+        'ask_sell_pahalilik': metrics.get('ask_sell_pahalilik'),
+        'front_sell_pahalilik': metrics.get('front_sell_pahalilik'),
+        'bid_sell_pahalilik': metrics.get('bid_sell_pahalilik'),
+        'daily_chg': metrics.get('daily_chg'),
+    }
+
+
 class FastScoreCalculator:
     """
     Fast Score Calculator - calculates FAST PATH scores from L1 + CSV.
@@ -63,6 +160,9 @@ class FastScoreCalculator:
     # Default ETF for benchmark (SPY for US equities)
     DEFAULT_BENCHMARK_ETF = 'SPY'
     
+    # DataFabric dirty consumer for incremental group metrics
+    GROUP_DIRTY_CONSUMER = 'fast_scores_groups'
+    
     def __new__(cls):
         """Singleton pattern"""
         if cls._instance is None:
@@ -79,6 +179,9 @@ class FastScoreCalculator:
         self._benchmark_etf = self.DEFAULT_BENCHMARK_ETF
         self._last_compute_time: Optional[datetime] = None
         self._compute_count = 0
+        self._vector_engine = None  # Lazy VectorizedScoreEngine (batch mode)
+        self._group_static_version: Optional[str] = None  # Static load seen by incremental group state
+        self._incremental_count = 0
         self._initialized = True
         logger.info("🚀 FastScoreCalculator initialized (FAST PATH)")
     
@@ -217,69 +320,32 @@ class FastScoreCalculator:
             """Final skor hesaplama - 1000 katsayısı ile (Janall - BIREBIR)"""
             return final_thg - 1000 * skor
         
-        final_bb_skor = final_skor(final_thg, bid_buy_ucuzluk)
-        final_fb_skor = final_skor(final_thg, front_buy_ucuzluk)
-        final_ab_skor = final_skor(final_thg, ask_buy_ucuzluk)
-        final_as_skor = final_skor(final_thg, ask_sell_pahalilik)
-        final_fs_skor = final_skor(final_thg, front_sell_pahalilik)
-        final_bs_skor = final_skor(final_thg, bid_sell_pahalilik)
-        
-        # Short Final skorları (SHORT_FINAL kullanarak - çıkarma formülü - 1000 katsayısı JANALL ile aynı)
-        final_sas_skor = short_final - 1000 * ask_sell_pahalilik if short_final > 0 else 0.0
-        final_sfs_skor = short_final - 1000 * front_sell_pahalilik if short_final > 0 else 0.0
-        final_sbs_skor = short_final - 1000 * bid_sell_pahalilik if short_final > 0 else 0.0
-        
-        # Build result (Janall format - EXACT COPY)
-        result = {
-            # Basic metrics
-            'daily_change': daily_change,
-            'spread': spread,
-            'spread_percent': spread_percent,
-            
-            # Ucuzluk/Pahalilik scores (Janall format)
-            'Bid_buy_ucuzluk_skoru': round(bid_buy_ucuzluk, 2),
-            'Front_buy_ucuzluk_skoru': round(front_buy_ucuzluk, 2),
-            'Ask_buy_ucuzluk_skoru': round(ask_buy_ucuzluk, 2),
-            'Ask_sell_pahalilik_skoru': round(ask_sell_pahalilik, 2),
-            'Front_sell_pahalilik_skoru': round(front_sell_pahalilik, 2),
-            'Bid_sell_pahalilik_skoru': round(bid_sell_pahalilik, 2),
-            
-            # Legacy aliases (for compatibility)
-            'bid_buy_ucuzluk': bid_buy_ucuzluk,
-            'front_buy_ucuzluk': front_buy_ucuzluk,
-            'ask_buy_ucuzluk': ask_buy_ucuzluk,
-            'ask_sell_pahalilik': ask_sell_pahalilik,
-            'front_sell_pahalilik': front_sell_pahalilik,
-            'bid_sell_pahalilik': bid_sell_pahalilik,
-            
-            # Benchmark
-            'Benchmark_Type': benchmark_type,  # Frontend expects Benchmark_Type
-            'benchmark_type': benchmark_type,  # Legacy
-            'Benchmark_Chg': round(benchmark_chg, 4),  # Frontend expects Benchmark_Chg
-            'benchmark_chg': benchmark_chg,  # Legacy
-            
-            # Final Scores (Janall format - 800 katsayısı)
-            'Final_BB_skor': round(final_bb_skor, 2),
-            'Final_FB_skor': round(final_fb_skor, 2),
-            'Final_AB_skor': round(final_ab_skor, 2),
-            'Final_AS_skor': round(final_as_skor, 2),
-            'Final_FS_skor': round(final_fs_skor, 2),
-            'Final_BS_skor': round(final_bs_skor, 2),
-            'Final_SAS_skor': round(final_sas_skor, 2),
-            'Final_SFS_skor': round(final_sfs_skor, 2),
-            'Final_SBS_skor': round(final_sbs_skor, 2),
-            
-            # Spread (Janall format)
-            'Spread': round(spread, 4),
-            
-            # Metadata
-            '_computed_at': datetime.now(),
-            '_is_fast_path': True,
-        }
+        final_scores = (
+            final_skor(final_thg, bid_buy_ucuzluk),       # Final_BB
+            final_skor(final_thg, front_buy_ucuzluk),     # Final_FB
+            final_skor(final_thg, ask_buy_ucuzluk),       # Final_AB
+            final_skor(final_thg, ask_sell_pahalilik),    # Final_AS
+            final_skor(final_thg, front_sell_pahalilik),  # Final_FS
+            final_skor(final_thg, bid_sell_pahalilik),    # Final_BS
+            # Short Final skorları (SHORT_FINAL kullanarak - çıkarma formülü - 1000 katsayısı JANALL ile aynı)
+            short_final - 1000 * ask_sell_pahalilik if short_final > 0 else 0.0,    # Final_SAS
+            short_final - 1000 * front_sell_pahalilik if short_final > 0 else 0.0,  # Final_SFS
+            short_final - 1000 * bid_sell_pahalilik if short_final > 0 else 0.0,    # Final_SBS
+        )
         
-        return result
+        return _build_fast_score_result(
+            daily_change, spread, spread_percent,
+            bid_buy_ucuzluk, front_buy_ucuzluk, ask_buy_ucuzluk,
+            ask_sell_pahalilik, front_sell_pahalilik, bid_sell_pahalilik,
+            benchmark_type, benchmark_chg, final_scores,
+            datetime.now()
+        )
     
-    def compute_all_fast_scores(self, include_group_metrics: bool = True) -> Dict[str, Dict[str, Any]]:
+    def compute_all_fast_scores(
+        self,
+        include_group_metrics: bool = True,
+        vectorized: Optional[bool] = None
+    ) -> Dict[str, Dict[str, Any]]:
         """
         Compute FAST PATH scores for ALL symbols.
         
@@ -287,6 +353,9 @@ class FastScoreCalculator:
         
         Args:
             include_group_metrics: If True, also compute Fbtot/SFStot/GORT via JanallMetricsEngine
+            vectorized: Use the NumPy batch engine (same numbers, one pass).
+                None = settings.FAST_SCORES_VECTORIZED. Falls back to the
+                scalar loop if the batch engine fails.
         
         Returns:
             Dict of {symbol: scores}
@@ -294,6 +363,19 @@ class FastScoreCalculator:
         fabric = get_data_fabric()
         start_time = datetime.now()
         
+        if vectorized is None:
+            try:
+                from app.config.settings import settings
+                vectorized = settings.FAST_SCORES_VECTORIZED
+            except Exception:
+                vectorized = False
+        
+        if vectorized:
+            try:
+                return self._compute_all_fast_scores_vectorized(include_group_metrics, start_time)
+            except Exception as e:
+                logger.error(f"[FAST_SCORES] Vectorized batch failed, falling back to scalar: {e}", exc_info=True)
+        
         # Get all symbols with static data
         all_symbols = fabric.get_all_static_symbols()
         
@@ -320,27 +402,15 @@ class FastScoreCalculator:
             # Merge group metrics into results
             for symbol, metrics in group_metrics.items():
                 if symbol in results:
-                    results[symbol].update({
-                        'Fbtot': metrics.get('fbtot'),
-                        'SFStot': metrics.get('sfstot'),
-                        'GORT': metrics.get('gort'),
-                        # NEW: Group-based benchmark and recalculated scores
-                        'bench_chg': metrics.get('bench_chg'),
-                        'benchmark_chg': metrics.get('bench_chg'),  # Alias for data_fabric
-                        'bench_source': metrics.get('bench_source'),
-                        'bid_buy_ucuzluk': metrics.get('bid_buy_ucuzluk'),
-                        'front_buy_ucuzluk': metrics.get('front_buy_ucuzluk'),
-                        'ask_buy_ucuzluk': metrics.get('ask_buy_ucuzluk'),
-                        'ask_sell_pahalilik': metrics.get('ask_sell_pahalilik'),
-                        'front_sell_pahalilik': metrics.get('front_sell_pahalilik'),
-                        'bid_sell_pahalilik': metrics.get('bid_sell_pahalilik'),
-                        'daily_chg': metrics.get('daily_chg'),
-                    })
+                    results[symbol].update(_group_overlay_fields(metrics))
         
         # Phase 3: Update DataFabric with all computed scores
         for symbol, scores in results.items():
             fabric.update_derived(symbol, scores)
         
+        # Phase 4: Publish read-only market epoch (L1 + static + scores)
+        self._publish_epoch(None, "fast_scores_batch")
+        
         elapsed_ms = (datetime.now() - start_time).total_seconds() * 1000
         self._last_compute_time = datetime.now()
         self._compute_count += 1
@@ -352,6 +422,34 @@ class FastScoreCalculator:
         
         return results
     
+    def _compute_all_fast_scores_vectorized(
+        self,
+        include_group_metrics: bool,
+        start_time: datetime
+    ) -> Dict[str, Dict[str, Any]]:
+        """Batch mode: whole universe in one NumPy pass (see VectorizedScoreEngine)"""
+        if self._vector_engine is None:
+            from app.core.vectorized_score_engine import VectorizedScoreEngine
+            self._vector_engine = VectorizedScoreEngine(self)
+        
+        fabric = get_data_fabric()
+        results, computed, skipped = self._vector_engine.compute(include_group_metrics)
+        
+        for symbol, scores in results.items():
+            fabric.update_derived(symbol, scores)
+        self._publish_epoch(None, "fast_scores_vectorized")
+        
+        elapsed_ms = (datetime.now() - start_time).total_seconds() * 1000
+        self._last_compute_time = datetime.now()
+        self._compute_count += 1
+        
+        logger.info(
+            f"🚀 [FAST_SCORES] Vectorized batch: {computed} symbols in {elapsed_ms:.1f}ms "
+            f"(skipped: {skipped}, group_metrics: {include_group_metrics})"
+        )
+        
+        return results
+    
     def _compute_group_based_metrics(
         self, 
         all_symbols: List[str], 
@@ -467,16 +565,28 @@ class FastScoreCalculator:
         
         return results
     
-    def compute_dirty_symbols(self) -> Dict[str, Dict[str, Any]]:
+    def compute_dirty_symbols(self, include_group_metrics: bool = False) -> Dict[str, Dict[str, Any]]:
         """
         Compute FAST scores only for dirty (changed) symbols.
         
         🟢 FAST PATH - Event-driven, only recalculate what changed.
         
+        Args:
+            include_group_metrics: Also refresh Fbtot/SFStot/GORT/bench_chg
+                incrementally: dirty symbols update their group's running
+                aggregates and only the touched groups are re-ranked
+                (see JanallMetricsEngine.update_group_inputs).
+        
         Returns:
             Dict of {symbol: scores} for dirty symbols
         """
         fabric = get_data_fabric()
+        if include_group_metrics:
+            janall_engine = _get_janall_metrics_engine()
+            if janall_engine:
+                return self._compute_dirty_incremental(fabric, janall_engine)
+            logger.warning("JanallMetricsEngine not available for group metrics")
+        
         dirty_symbols = fabric.get_dirty_symbols()
         
         if not dirty_symbols:
@@ -491,6 +601,9 @@ class FastScoreCalculator:
                 results[symbol] = scores
                 fabric.update_derived(symbol, scores)
         
+        if results:
+            self._publish_epoch(results.keys(), "fast_scores_dirty")
+        
         elapsed_ms = (datetime.now() - start_time).total_seconds() * 1000
         
         if results:
@@ -500,6 +613,101 @@ class FastScoreCalculator:
         
         return results
     
+    def _compute_dirty_incremental(self, fabric, janall_engine) -> Dict[str, Dict[str, Any]]:
+        """Dirty scores + incremental group overlays (only touched groups re-ranked)"""
+        static_version = fabric.get_status().get('static_load_time')
+        dirty_symbols = fabric.drain_dirty(self.GROUP_DIRTY_CONSUMER)
+        if static_version != self._group_static_version or not janall_engine.has_group_aggregates():
+            # Static reload (group keys may move) → rebuild from the whole universe
+            janall_engine.reset_group_aggregates()
+            dirty_symbols = set(fabric.get_all_static_symbols())
+            self._group_static_version = static_version
+        
+        if not dirty_symbols:
+            return {}
+        
+        start_time = datetime.now()
+        results = {}
+        group_inputs = {}
+        
+        for symbol in dirty_symbols:
+            scores = self.compute_fast_scores(symbol)
+            if scores:
+                results[symbol] = scores
+            group_inputs[symbol] = self._group_inputs_for_symbol(fabric, symbol, scores)
+        
+        touched_groups = janall_engine.update_group_inputs(group_inputs)
+        overlays = janall_engine.compute_group_overlays_incremental(touched_groups)
+        
+        # Dirty symbols without a group still get the (empty) overlay, like the batch
+        for symbol, inputs in group_inputs.items():
+            if inputs is not None and symbol not in overlays:
+                overlays[symbol] = {'fbtot': None, 'sfstot': None, 'gort': None,
+                                    'daily_chg': inputs.get('daily_chg')}
+        
+        changed = set(results)
+        for symbol, metrics in overlays.items():
+            if symbol in results:
+                results[symbol].update(_group_overlay_fields(metrics))
+            elif symbol not in dirty_symbols and (janall_engine.get_group_inputs(symbol) or {}).get('has_scores'):
+                # Clean member of a re-ranked group: refresh overlay fields only
+                fabric.update_derived(symbol, _group_overlay_fields(metrics))
+                changed.add(symbol)
+        
+        for symbol, scores in results.items():
+            fabric.update_derived(symbol, scores)
+        if changed:
+            self._publish_epoch(changed, "fast_scores_incremental")
+        
+        elapsed_ms = (datetime.now() - start_time).total_seconds() * 1000
+        self._incremental_count += 1
+        
+        logger.debug(
+            f"🚀 [FAST_SCORES] Incremental compute: {len(results)} dirty symbols, "
+            f"{len(touched_groups)} groups re-ranked ({len(overlays)} overlays) in {elapsed_ms:.1f}ms"
+        )
+        
+        return results
+    
+    def _publish_epoch(self, symbols: Optional[Iterable[str]], source: str) -> None:
+        """Publish a MarketEpoch after derived scores were written (None = whole universe)"""
+        try:
+            from app.config.settings import settings
+            if not settings.MARKET_EPOCH_ENABLED:
+                return
+            from app.core.market_epoch import get_market_epoch_store
+            get_market_epoch_store().publish_from_fabric(get_data_fabric(), symbols, source=source)
+        except Exception as e:
+            logger.warning(f"[FAST_SCORES] Market epoch publish failed: {e}")
+    
+    def _group_inputs_for_symbol(
+        self,
+        fabric,
+        symbol: str,
+        scores: Optional[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """Group aggregate inputs for one symbol (same fields as _compute_group_based_metrics)"""
+        static = fabric.get_static(symbol)
+        live = fabric.get_live(symbol)
+        if not static or not live:
+            return None
+        
+        prev_close = static.get('prev_close')
+        last_price = live.get('last')
+        daily_chg = None
+        if prev_close and prev_close > 0 and last_price and last_price > 0:
+            daily_chg = last_price - prev_close  # IN CENTS, NOT PERCENTAGE
+        
+        return {
+            'group_key': self._resolve_group_key_for_symbol(static),
+            'final_fb': scores.get('Final_FB_skor') if scores else None,
+            'final_sfs': scores.get('Final_SFS_skor') if scores else None,
+            'daily_chg': daily_chg,
+            'sma63chg': static.get('SMA63 chg'),
+            'sma246chg': static.get('SMA246 chg'),
+            'has_scores': scores is not None,
+        }
+    
     def _get_benchmark_type(self, cgrup: Optional[str]) -> str:
         """
         Get benchmark type from CGRUP (Janall logic).
@@ -551,7 +759,20 @@ class FastScoreCalculator:
             Benchmark change as decimal (e.g., 0.01 = 1%)
         """
         try:
-            from app.market_data.benchmark_engine import BenchmarkEngine
+            formula = self._get_benchmark_formula(benchmark_type, static)
+            return self._apply_benchmark_formula(fabric, formula)
+        except Exception as e:
+            logger.warning(f"Error calculating benchmark change: {e}")
+            return 0.0
+    
+    def _get_benchmark_formula(self, benchmark_type: str = 'DEFAULT', static: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, float]]:
+        """
+        Resolve benchmark formula (ETF weights) for a symbol - Janall logic.
+        
+        Depends only on static data (CGRUP / primary group), so the batch
+        path can cache it per symbol for the whole trading day.
+        """
+        try:
             from app.market_data.grouping import resolve_primary_group, resolve_secondary_group
             
             # Get BenchmarkEngine instance
@@ -574,12 +795,23 @@ class FastScoreCalculator:
                 secondary_group = benchmark_type.lower()  # e.g., "C525" -> "c525"
             
             # Get benchmark formula (ETF weights) based on two-tier grouping
-            formula = benchmark_engine.get_benchmark_formula(
+            return benchmark_engine.get_benchmark_formula(
                 static_data=static,
                 primary_group=primary_group,
                 secondary_group=secondary_group
             )
-            
+        except Exception as e:
+            logger.warning(f"Error resolving benchmark formula: {e}")
+            return None
+    
+    def _apply_benchmark_formula(self, fabric, formula: Optional[Dict[str, float]]) -> float:
+        """
+        Calculate weighted benchmark change from ETF live data.
+        
+        Returns:
+            Benchmark change as decimal, rounded to 4 decimals (Janall logic)
+        """
+        try:
             if not formula:
                 return 0.0
             
@@ -620,6 +852,7 @@ class FastScoreCalculator:
             'benchmark_etf': self._benchmark_etf,
             'last_compute_time': self._last_compute_time.isoformat() if self._last_compute_time else None,
             'compute_count': self._compute_count,
+            'incremental_count': self._incremental_count,
         }
     
     def update_security_contexts(
@@ -751,12 +984,15 @@ def compute_fast_scores_for_symbol(symbol: str) -> Optional[Dict[str, Any]]:
     return get_fast_score_calculator().compute_fast_scores(symbol)
 
 
-def compute_all_fast_scores(include_group_metrics: bool = True) -> Dict[str, Dict[str, Any]]:
+def compute_all_fast_scores(include_group_metrics: bool = True, vectorized: Optional[bool] = None) -> Dict[str, Dict[str, Any]]:
     """Convenience function to compute FAST scores for all symbols"""
-    return get_fast_score_calculator().compute_all_fast_scores(include_group_metrics=include_group_metrics)
+    return get_fast_score_calculator().compute_all_fast_scores(
+        include_group_metrics=include_group_metrics,
+        vectorized=vectorized
+    )
 
 
-def compute_dirty_fast_scores() -> Dict[str, Dict[str, Any]]:
+def compute_dirty_fast_scores(include_group_metrics: bool = False) -> Dict[str, Dict[str, Any]]:
     """Convenience function to compute FAST scores for dirty symbols"""
-    return get_fast_score_calculator().compute_dirty_symbols()
+    return get_fast_score_calculator().compute_dirty_symbols(include_group_metrics=include_group_metrics)
 
@@ -0,0 +1,390 @@
+"""
+L1 COLUMN STORE - Array-backed L1 cache for DataFabric
+======================================================
+
+🟢 FAST PATH COMPONENT
+
+DataFabric._live_data klasik modda {symbol: {bid, ask, ...}} dict'idir.
+Her Hammer tick'inde dict.update() + datetime.now() yapılır; açılış
+burst'ünde bu hem lock contention hem de GC churn üretir.
+
+Columnar modda L1 değerleri NumPy kolonlarında tutulur:
+- bid / ask / last / size / volume / timestamp : float64 (NaN = yok)
+- _ts (son update zamanı, epoch float)      : float64
+- Satır indeksi: static CSV universe'ünden kurulan sabit symbol → row map
+  (universe dışı semboller sona eklenir, kolonlar büyür)
+
+Uyumluluk:
+- L1ColumnStore bir MutableMapping gibi davranır → mevcut
+  `_live_data.get(sym)`, `_live_data[sym] = {}`, `.update(...)` kodları
+  değişmeden çalışır.
+- Satır erişimi `L1RowView` döner (kopya değil, kolonlara yazan view).
+- '_last_update' okununca datetime'a lazy çevrilir (XNL freshness check).
+
+⚠️ THREAD SAFETY:
+Store kendi lock'unu tutmaz - DataFabric._data_lock altında yazılır.
+Okuyucular tek bir float okur; torn read riski yoktur.
+"""
+
+import time
+from collections.abc import MutableMapping
+from datetime import datetime
+from typing import Dict, Any, Optional, List, Iterable, Iterator
+
+import numpy as np
+
+
+# Numeric L1 fields stored as columns (everything else goes to per-row extras)
+L1_COLUMNS = ('bid', 'ask', 'last', 'size', 'volume', 'timestamp')
+
+# Internal column for last update time (epoch seconds)
+_TS_COLUMN = '_ts'
+
+_INITIAL_OVERFLOW = 64
+
+
+def _to_float(value: Any) -> Optional[float]:
+    """Convert value to float, None if not numeric"""
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+class L1RowView(MutableMapping):
+    """
+    Dict-like view over one row of L1ColumnStore.
+
+    Reads/writes go straight to the column arrays (no copy).
+    NaN cells are treated as missing keys, so `.get('bid')` returns None
+    exactly like the dict-based store did for unset fields.
+    """
+
+    __slots__ = ('_store', '_row')
+
+    def __init__(self, store: 'L1ColumnStore', row: int):
+        self._store = store
+        self._row = row
+
+    def __getitem__(self, key: str) -> Any:
+        store = self._store
+        col = store._columns.get(key)
+        if col is not None:
+            value = col[self._row]
+            if value == value:  # not NaN
+                return float(value)
+        elif key == '_last_update':
+            ts = store._columns[_TS_COLUMN][self._row]
+            if ts == ts:
+                return datetime.fromtimestamp(ts)
+        extras = store._extras[self._row]
+        if extras and key in extras:
+            return extras[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._store._set_field(self._row, key, value)
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self:
+            raise KeyError(key)
+        self._store._set_field(self._row, key, None)
+        extras = self._store._extras[self._row]
+        if extras:
+            extras.pop(key, None)
+
+    def __iter__(self) -> Iterator[str]:
+        store = self._store
+        row = self._row
+        for name in L1_COLUMNS:
+            value = store._columns[name][row]
+            if value == value:
+                yield name
+        ts = store._columns[_TS_COLUMN][row]
+        if ts == ts:
+            yield '_last_update'
+        extras = store._extras[row]
+        if extras:
+            yield from list(extras.keys())
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def update(self, other: Any = (), **kwargs: Any) -> None:
+        """Fast path update (avoids MutableMapping per-key overhead)"""
+        if other:
+            self._store._write_row(self._row, other, touch=False)
+        if kwargs:
+            self._store._write_row(self._row, kwargs, touch=False)
+
+    def copy(self) -> Dict[str, Any]:
+        """Materialize row as a plain dict"""
+        return dict(self.items())
+
+    def __repr__(self) -> str:
+        return f"L1RowView({self._store.symbol_at(self._row)!r}, {self.copy()!r})"
+
+
+class L1ColumnStore(MutableMapping):
+    """
+    Columnar L1 store: NumPy arrays indexed by a stable symbol → row map.
+
+    Mapping semantics mirror the old `Dict[str, Dict[str, Any]]`:
+    a symbol is "present" once any L1 field was written for it.
+    """
+
+    def __init__(self, universe: Iterable[str]):
+        symbols = []
+        seen = set()
+        for sym in universe:
+            sym = str(sym).strip()
+            if sym and sym not in seen:
+                seen.add(sym)
+                symbols.append(sym)
+
+        self._symbols: List[str] = symbols
+        self._index: Dict[str, int] = {sym: i for i, sym in enumerate(symbols)}
+        self._universe_size = len(symbols)
+
+        capacity = max(self._universe_size + _INITIAL_OVERFLOW, _INITIAL_OVERFLOW)
+        self._capacity = capacity
+        self._columns: Dict[str, np.ndarray] = {
+            name: np.full(capacity, np.nan, dtype=np.float64)
+            for name in (*L1_COLUMNS, _TS_COLUMN)
+        }
+        self._present = np.zeros(capacity, dtype=bool)
+        self._extras: List[Optional[Dict[str, Any]]] = [None] * capacity
+        self._present_count = 0
+
+    # =========================================================================
+    # ROW INDEX
+    # =========================================================================
+
+    def row_of(self, symbol: str) -> Optional[int]:
+        """Get row for symbol (None if never indexed)"""
+        return self._index.get(symbol)
+
+    def symbol_at(self, row: int) -> str:
+        return self._symbols[row]
+
+    @property
+    def symbols(self) -> List[str]:
+        """All indexed symbols in row order"""
+        return list(self._symbols)
+
+    @property
+    def universe_size(self) -> int:
+        """Number of rows reserved for the static CSV universe"""
+        return self._universe_size
+
+    def _ensure_row(self, symbol: str) -> int:
+        """Get row for symbol, appending an overflow row if unknown"""
+        row = self._index.get(symbol)
+        if row is not None:
+            return row
+
+        row = len(self._symbols)
+        if row >= self._capacity:
+            self._grow(max(self._capacity * 2, row + 1))
+        self._symbols.append(symbol)
+        self._index[symbol] = row
+        return row
+
+    def _grow(self, capacity: int) -> None:
+        for name, col in self._columns.items():
+            new_col = np.full(capacity, np.nan, dtype=np.float64)
+            new_col[:self._capacity] = col
+            self._columns[name] = new_col
+        present = np.zeros(capacity, dtype=bool)
+        present[:self._capacity] = self._present
+        self._present = present
+        self._extras.extend([None] * (capacity - self._capacity))
+        self._capacity = capacity
+
+    # =========================================================================
+    # WRITE PATH
+    # =========================================================================
+
+    def _mark_present(self, row: int) -> None:
+        if not self._present[row]:
+            self._present[row] = True
+            self._present_count += 1
+
+    def _set_field(self, row: int, key: str, value: Any) -> None:
+        col = self._columns.get(key)
+        if col is not None:
+            fval = _to_float(value)
+            if fval is None:
+                col[row] = np.nan
+                if value is not None:
+                    # Non-numeric (e.g. ISO timestamp string) - keep as extra
+                    self._set_extra(row, key, value)
+                    return
+            else:
+                col[row] = fval
+            extras = self._extras[row]
+            if extras:
+                extras.pop(key, None)
+        elif key == '_last_update':
+            if isinstance(value, datetime):
+                self._columns[_TS_COLUMN][row] = value.timestamp()
+            else:
+                fval = _to_float(value)
+                self._columns[_TS_COLUMN][row] = np.nan if fval is None else fval
+        else:
+            self._set_extra(row, key, value)
+        self._mark_present(row)
+
+    def _set_extra(self, row: int, key: str, value: Any) -> None:
+        extras = self._extras[row]
+        if extras is None:
+            extras = {}
+            self._extras[row] = extras
+        extras[key] = value
+        self._mark_present(row)
+
+    def _write_row(self, row: int, data: Any, touch: bool, now: Optional[float] = None) -> None:
+        items = data.items() if hasattr(data, 'items') else data
+        columns = self._columns
+        for key, value in items:
+            col = columns.get(key)
+            if col is not None and (value is None or type(value) is float or type(value) is int):
+                # Hot path: plain numeric / None
+                col[row] = np.nan if value is None else value
+                extras = self._extras[row]
+                if extras:
+                    extras.pop(key, None)
+            else:
+                self._set_field(row, key, value)
+        if touch:
+            columns[_TS_COLUMN][row] = time.time() if now is None else now
+        self._mark_present(row)
+
+    def write(self, symbol: str, data: Dict[str, Any], now: Optional[float] = None) -> int:
+        """
+        Merge L1 fields for symbol (like dict.update) and stamp update time.
+
+        Args:
+            symbol: PREF_IBKR symbol
+            data: {bid, ask, last, size, volume, timestamp, ...}
+            now: Update time (epoch). Defaults to time.time().
+
+        Returns:
+            Row index
+        """
+        row = self._ensure_row(symbol)
+        self._write_row(row, data, touch=True, now=now)
+        return row
+
+    def write_batch(self, updates: Dict[str, Dict[str, Any]], now: Optional[float] = None) -> int:
+        """Merge many symbols with one shared update timestamp"""
+        if now is None:
+            now = time.time()
+        for symbol, data in updates.items():
+            row = self._ensure_row(symbol)
+            self._write_row(row, data, touch=True, now=now)
+        return len(updates)
+
+    # =========================================================================
+    # READ PATH
+    # =========================================================================
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        Read-only view of a column over all indexed rows.
+
+        ⚠️ View, not copy - take `.copy()` under DataFabric lock if you need
+        a consistent multi-column snapshot.
+        """
+        if name == '_last_update':
+            name = _TS_COLUMN
+        view = self._columns[name][:len(self._symbols)]
+        view.flags.writeable = False
+        return view
+
+    def snapshot_columns(self, names: Iterable[str] = L1_COLUMNS) -> Dict[str, np.ndarray]:
+        """Copy selected columns (plus 'present' mask) for all indexed rows"""
+        n = len(self._symbols)
+        out = {name: self._columns[_TS_COLUMN if name == '_last_update' else name][:n].copy() for name in names}
+        out['present'] = self._present[:n].copy()
+        return out
+
+    def extras_at(self, row: int) -> Optional[Dict[str, Any]]:
+        """Non-columnar fields for row (venue, prev_close, ...)"""
+        return self._extras[row]
+
+    # =========================================================================
+    # MAPPING INTERFACE (backward compatible with Dict[str, Dict])
+    # =========================================================================
+
+    def __getitem__(self, symbol: str) -> L1RowView:
+        row = self._index.get(symbol)
+        if row is None or not self._present[row]:
+            raise KeyError(symbol)
+        return L1RowView(self, row)
+
+    def get(self, symbol: str, default: Any = None) -> Any:
+        row = self._index.get(symbol)
+        if row is None or not self._present[row]:
+            return default
+        return L1RowView(self, row)
+
+    def __setitem__(self, symbol: str, data: Dict[str, Any]) -> None:
+        row = self._ensure_row(symbol)
+        self._clear_row(row)
+        self._write_row(row, data, touch=False)
+
+    def __delitem__(self, symbol: str) -> None:
+        row = self._index.get(symbol)
+        if row is None or not self._present[row]:
+            raise KeyError(symbol)
+        self._clear_row(row)
+        self._present[row] = False
+        self._present_count -= 1
+
+    def _clear_row(self, row: int) -> None:
+        for col in self._columns.values():
+            col[row] = np.nan
+        self._extras[row] = None
+
+    def __contains__(self, symbol: object) -> bool:
+        row = self._index.get(symbol)
+        return row is not None and bool(self._present[row])
+
+    def __iter__(self) -> Iterator[str]:
+        present = self._present
+        symbols = self._symbols
+        return iter([symbols[i] for i in np.flatnonzero(present[:len(symbols)])])
+
+    def __len__(self) -> int:
+        return self._present_count
+
+    def clear(self) -> None:
+        for col in self._columns.values():
+            col[:] = np.nan
+        self._present[:] = False
+        self._extras = [None] * self._capacity
+        self._present_count = 0
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Materialize full store as plain dicts (debug / migration)"""
+        return {sym: self[sym].copy() for sym in self}
+
+
+def build_l1_column_store(universe: Iterable[str],
+                          existing: Optional[Dict[str, Dict[str, Any]]] = None) -> L1ColumnStore:
+    """
+    Build column store for universe and migrate any existing dict-based L1.
+
+    Args:
+        universe: Static CSV symbols (stable row order)
+        existing: Old `_live_data` dict to carry over
+    """
+    store = L1ColumnStore(universe)
+    if existing:
+        for symbol, data in existing.items():
+            if data:
+                store[symbol] = data
+    return store
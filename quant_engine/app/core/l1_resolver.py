@@ -0,0 +1,410 @@
+"""
+L1 RESOLVER - Batch bid/ask/last lookup with freshness metadata
+===============================================================
+
+🟢 FAST PATH COMPONENT
+
+XNLEngine, OrderLifecycleTracker ve DailyFillsStore'un L1 lookup'ları.
+resolve_l1(symbols) tek çağrıda bütün cycle'ı çözer:
+1. DataFabric in-memory (fresh: son update < max_age_sec)
+2. Redis market:l1:{variant} - çözülemeyen TÜM semboller × formatlar için TEK MGET
+   (async path: redis.asyncio, sync path: redis.sync)
+3. Redis live:{variant} hash (L1RedisPublisher HSET) - market:l1'de de
+   bulunamayanlar için TEK pipeline HMGET bid ask last
+4. market_data_cache (Hammer L1Update handler, _market_data_cache_lock altında)
+5. DataFabric stale data (son çare)
+
+Format varyantları (raw, Hammer "CIM-B", display "CIM PRB") SymbolMapper ile
+bir kez hesaplanıp cache'lenir.
+
+Her sonuç: {'bid', 'ask', 'last', 'source', 'age_sec', 'fresh'}
+"""
+
+import json
+import time
+from datetime import datetime
+from typing import Dict, Any, Optional, List, Tuple, Iterable
+
+from app.core.logger import logger
+
+
+L1_FRESH_MAX_AGE_SEC = 120.0  # DataFabric data older than this is "stale"
+
+
+class L1Resolver:
+    """
+    Batch L1 resolver shared by XNL, order lifecycle tracking and fill logging.
+    """
+
+    def __init__(self):
+        # {symbol: (symbol, hammer, display) deduplicated} - formats never change
+        self._variant_cache: Dict[str, Tuple[str, ...]] = {}
+        self._stats = {
+            'calls': 0,
+            'symbols': 0,
+            'fabric_hits': 0,
+            'redis_hits': 0,
+            'live_hash_hits': 0,
+            'cache_hits': 0,
+            'stale_hits': 0,
+            'misses': 0,
+            'redis_round_trips': 0,
+        }
+
+    # =========================================================================
+    # PUBLIC API
+    # =========================================================================
+
+    async def resolve_l1(
+        self,
+        symbols: Iterable[str],
+        max_age_sec: float = L1_FRESH_MAX_AGE_SEC
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Resolve L1 for a batch of symbols (one async Redis round trip).
+
+        Args:
+            symbols: Symbols in any format (raw / Hammer / display)
+            max_age_sec: DataFabric freshness limit
+
+        Returns:
+            {symbol: l1 dict or None}, keyed by the symbols as passed in
+        """
+        results, pending = self._resolve_local(symbols, max_age_sec)
+        if pending:
+            keys = self._redis_keys(pending)
+            quotes = self._from_redis_batch(pending, keys, await self._mget_async(keys))
+            live_keys = self._live_keys(s for s in pending if s not in quotes)
+            live_values = await self._hmget_live_async(live_keys) if live_keys else []
+            self._finish(results, pending, quotes, dict(zip(live_keys, live_values)))
+        return results
+
+    def resolve_l1_sync(
+        self,
+        symbols: Iterable[str],
+        max_age_sec: float = L1_FRESH_MAX_AGE_SEC
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Same as resolve_l1 for sync callers (one sync Redis MGET)"""
+        results, pending = self._resolve_local(symbols, max_age_sec)
+        if pending:
+            keys = self._redis_keys(pending)
+            quotes = self._from_redis_batch(pending, keys, self._mget_sync(keys))
+            live_keys = self._live_keys(s for s in pending if s not in quotes)
+            live_values = self._hmget_live_sync(live_keys) if live_keys else []
+            self._finish(results, pending, quotes, dict(zip(live_keys, live_values)))
+        return results
+
+    def get_variants(self, symbol: str) -> Tuple[str, ...]:
+        """Symbol format variants (raw, Hammer, display), deduplicated and cached"""
+        variants = self._variant_cache.get(symbol)
+        if variants is None:
+            try:
+                from app.live.symbol_mapper import SymbolMapper
+                variants = tuple(dict.fromkeys([
+                    symbol,
+                    SymbolMapper.to_hammer_symbol(symbol),
+                    SymbolMapper.to_display_symbol(symbol),
+                ]))
+            except Exception:
+                variants = (symbol,)
+            self._variant_cache[symbol] = variants
+        return variants
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Resolver counters (per layer)"""
+        return dict(self._stats, variant_cache_size=len(self._variant_cache))
+
+    # =========================================================================
+    # LAYERS
+    # =========================================================================
+
+    def _resolve_local(
+        self,
+        symbols: Iterable[str],
+        max_age_sec: float
+    ) -> Tuple[Dict[str, Optional[Dict[str, Any]]], Dict[str, Optional[Dict[str, Any]]]]:
+        """Layer 1: fresh DataFabric. Returns (results, pending {symbol: stale_data})"""
+        results: Dict[str, Optional[Dict[str, Any]]] = {}
+        pending: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._stats['calls'] += 1
+
+        try:
+            from app.core.data_fabric import get_data_fabric
+            live_data = get_data_fabric()._live_data
+        except Exception:
+            live_data = {}
+
+        now = datetime.now()
+        for symbol in dict.fromkeys(symbols):
+            self._stats['symbols'] += 1
+            stale = None
+            for variant in self.get_variants(symbol):
+                quote = self._from_fabric(live_data.get(variant), now)
+                if quote is None:
+                    continue
+                if quote['age_sec'] is None or quote['age_sec'] < max_age_sec:
+                    results[symbol] = quote
+                    self._stats['fabric_hits'] += 1
+                    break
+                if stale is None:
+                    stale = quote
+            else:
+                pending[symbol] = stale
+        return results, pending
+
+    @staticmethod
+    def _from_fabric(live: Optional[Dict[str, Any]], now: datetime) -> Optional[Dict[str, Any]]:
+        if not live:
+            return None
+        bid = live.get('bid')
+        ask = live.get('ask')
+        if bid is None or ask is None or not (bid > 0 and ask > 0):
+            return None
+        age_sec = None
+        last_update = live.get('_last_update')
+        if last_update:
+            try:
+                age_sec = (now - last_update).total_seconds()
+            except Exception:
+                age_sec = None  # Can't check → treat as fresh
+        return {
+            'bid': bid,
+            'ask': ask,
+            'last': live.get('last', 0),
+            'source': 'fabric',
+            'age_sec': age_sec,
+            'fresh': True,
+        }
+
+    def _redis_keys(self, pending: Dict[str, Any]) -> List[str]:
+        return [f"market:l1:{v}" for symbol in pending for v in self.get_variants(symbol)]
+
+    async def _mget_async(self, keys: List[str]) -> List[Any]:
+        """Layer 2 (async): one MGET for every pending symbol × format"""
+        try:
+            from app.core.redis_client import get_redis_client
+            redis_client = get_redis_client()
+            if not redis_client:
+                return []
+            async_client = await redis_client.async_client() if hasattr(redis_client, 'async_client') else None
+            if async_client is None:
+                return self._mget_sync(keys)
+            self._stats['redis_round_trips'] += 1
+            return await async_client.mget(keys)
+        except Exception as e:
+            logger.debug(f"[L1_RESOLVER] Async Redis MGET failed: {e}")
+            return []
+
+    def _mget_sync(self, keys: List[str]) -> List[Any]:
+        """Layer 2 (sync): one MGET for every pending symbol × format"""
+        try:
+            from app.core.redis_client import get_redis_client
+            redis_client = get_redis_client()
+            if not redis_client:
+                return []
+            r = redis_client.sync if hasattr(redis_client, 'sync') else redis_client
+            if not r:
+                return []
+            self._stats['redis_round_trips'] += 1
+            return r.mget(keys)
+        except Exception as e:
+            logger.debug(f"[L1_RESOLVER] Redis MGET failed: {e}")
+            return []
+
+    def _live_keys(self, symbols: Iterable[str]) -> List[str]:
+        return [f"live:{v}" for symbol in symbols for v in self.get_variants(symbol)]
+
+    @staticmethod
+    def _hmget_pipeline(r, keys: List[str]):
+        pipe = r.pipeline(transaction=False)
+        for key in keys:
+            pipe.hmget(key, 'bid', 'ask', 'last')
+        return pipe
+
+    async def _hmget_live_async(self, keys: List[str]) -> List[Any]:
+        """Layer 3 (async): one pipelined HMGET per live:{variant} hash"""
+        try:
+            from app.core.redis_client import get_redis_client
+            redis_client = get_redis_client()
+            if not redis_client:
+                return []
+            async_client = await redis_client.async_client() if hasattr(redis_client, 'async_client') else None
+            if async_client is None:
+                return self._hmget_live_sync(keys)
+            self._stats['redis_round_trips'] += 1
+            return await self._hmget_pipeline(async_client, keys).execute()
+        except Exception as e:
+            logger.debug(f"[L1_RESOLVER] Async Redis live HMGET failed: {e}")
+            return []
+
+    def _hmget_live_sync(self, keys: List[str]) -> List[Any]:
+        """Layer 3 (sync): one pipelined HMGET per live:{variant} hash"""
+        try:
+            from app.core.redis_client import get_redis_client
+            redis_client = get_redis_client()
+            if not redis_client:
+                return []
+            r = redis_client.sync if hasattr(redis_client, 'sync') else redis_client
+            if not r:
+                return []
+            self._stats['redis_round_trips'] += 1
+            return self._hmget_pipeline(r, keys).execute()
+        except Exception as e:
+            logger.debug(f"[L1_RESOLVER] Redis live HMGET failed: {e}")
+            return []
+
+    def _from_redis_batch(
+        self,
+        pending: Dict[str, Optional[Dict[str, Any]]],
+        keys: List[str],
+        values: List[Any]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Layer 2: {symbol: quote} for pending symbols found in market:l1"""
+        redis_values = dict(zip(keys, values)) if values else {}
+        quotes: Dict[str, Dict[str, Any]] = {}
+        if not redis_values:
+            return quotes
+        for symbol in pending:
+            for variant in self.get_variants(symbol):
+                quote = self._from_redis_l1(redis_values.get(f"market:l1:{variant}"))
+                if quote:
+                    quotes[symbol] = quote
+                    break
+        return quotes
+
+    def _market_data_cache_rows(self, symbols: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """market_data_cache rows for every variant of symbols (one lock acquisition)"""
+        try:
+            from app.api.market_data_routes import market_data_cache, _market_data_cache_lock
+        except Exception:
+            return {}
+        variants = [v for symbol in symbols for v in self.get_variants(symbol)]
+        with _market_data_cache_lock:
+            return {v: dict(market_data_cache[v]) for v in variants if market_data_cache.get(v)}
+
+    def _finish(
+        self,
+        results: Dict[str, Optional[Dict[str, Any]]],
+        pending: Dict[str, Optional[Dict[str, Any]]],
+        redis_quotes: Dict[str, Dict[str, Any]],
+        live_values: Dict[str, Any]
+    ) -> None:
+        """Layers 2-5 for pending symbols"""
+        cache_rows = self._market_data_cache_rows(s for s in pending if s not in redis_quotes)
+
+        for symbol, stale in pending.items():
+            variants = self.get_variants(symbol)
+            quote = redis_quotes.get(symbol)
+            if quote:
+                self._stats['redis_hits'] += 1
+            if quote is None and live_values:
+                for variant in variants:
+                    quote = self._from_live_hash(live_values.get(f"live:{variant}"))
+                    if quote:
+                        self._stats['live_hash_hits'] += 1
+                        break
+            if quote is None and cache_rows:
+                for variant in variants:
+                    quote = self._from_market_data_cache(cache_rows.get(variant))
+                    if quote:
+                        self._stats['cache_hits'] += 1
+                        break
+            if quote is None and stale is not None:
+                quote = dict(stale, source='fabric_stale', fresh=False)
+                self._stats['stale_hits'] += 1
+            if quote is None:
+                self._stats['misses'] += 1
+            results[symbol] = quote
+
+    @staticmethod
+    def _from_redis_l1(val: Any) -> Optional[Dict[str, Any]]:
+        if not val:
+            return None
+        try:
+            l1 = json.loads(val if isinstance(val, str) else val.decode('utf-8'))
+            bid = l1.get('bid')
+            ask = l1.get('ask')
+            if bid and ask and float(bid) > 0 and float(ask) > 0:
+                ts = l1.get('ts')
+                age_sec = None
+                if isinstance(ts, (int, float)) and ts > 0:
+                    age_sec = max(0.0, time.time() - (ts / 1000.0 if ts > 1e12 else ts))
+                return {
+                    'bid': float(bid),
+                    'ask': float(ask),
+                    'last': float(l1.get('last', 0) or 0),
+                    'source': 'redis_l1',
+                    'age_sec': age_sec,
+                    'fresh': True,
+                }
+        except Exception:
+            pass
+        return None
+
+    @staticmethod
+    def _from_live_hash(values: Any) -> Optional[Dict[str, Any]]:
+        """HMGET live:{symbol} bid ask last → quote (values are str / bytes / None)"""
+        if not values:
+            return None
+        try:
+            bid, ask, last = (
+                float(v.decode('utf-8') if isinstance(v, bytes) else v) if v else 0.0
+                for v in values
+            )
+            if bid > 0 and ask > 0:
+                return {
+                    'bid': bid,
+                    'ask': ask,
+                    'last': last,
+                    'source': 'redis_live',
+                    'age_sec': None,
+                    'fresh': True,
+                }
+        except Exception:
+            pass
+        return None
+
+    @staticmethod
+    def _from_market_data_cache(cached: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        if not cached:
+            return None
+        try:
+            bid = cached.get('bid')
+            ask = cached.get('ask')
+            if bid is not None and ask is not None and float(bid) > 0 and float(ask) > 0:
+                return {
+                    'bid': float(bid),
+                    'ask': float(ask),
+                    'last': float(cached.get('last', 0) or 0),
+                    'source': 'market_data_cache',
+                    'age_sec': None,
+                    'fresh': True,
+                }
+        except Exception:
+            pass
+        return None
+
+
+# =============================================================================
+# GLOBAL INSTANCE
+# =============================================================================
+
+_l1_resolver: Optional[L1Resolver] = None
+
+
+def get_l1_resolver() -> L1Resolver:
+    """Get global L1Resolver instance (singleton)"""
+    global _l1_resolver
+    if _l1_resolver is None:
+        _l1_resolver = L1Resolver()
+    return _l1_resolver
+
+
+async def resolve_l1(symbols: Iterable[str], max_age_sec: float = L1_FRESH_MAX_AGE_SEC) -> Dict[str, Optional[Dict[str, Any]]]:
+    """Convenience function: batch-resolve L1 (async)"""
+    return await get_l1_resolver().resolve_l1(symbols, max_age_sec)
+
+
+def resolve_l1_sync(symbols: Iterable[str], max_age_sec: float = L1_FRESH_MAX_AGE_SEC) -> Dict[str, Optional[Dict[str, Any]]]:
+    """Convenience function: batch-resolve L1 (sync)"""
+    return get_l1_resolver().resolve_l1_sync(symbols, max_age_sec)
@@ -0,0 +1,208 @@
+"""
+LIVE PREFETCHER - Non-blocking Redis fallback for DataFabric.get_live
+=====================================================================
+
+🟢 FAST PATH COMPONENT
+
+DataFabric.get_live RAM'de bid/ask yoksa Redis'e bloklamadan gider:
+
+1. get_live miss → sembol pending kuyruğuna eklenir, anında döner (None / eksik dict)
+2. Arka plan thread'i pending sembolleri toplar, tek pipeline'da MGET ile
+   üç key'i birden çeker, JSON parse eder, DataFabric'e yazar
+3. Redis'te de olmayan semboller negative cache'e girer (TTL boyunca tekrar sorulmaz)
+
+Key öncelik sırası: live: > market:l1: > market_data:snapshot:
+"""
+
+import json
+import threading
+import time
+from typing import Dict, Any, Optional, List, Iterable
+
+from app.core.logger import logger
+
+
+# Redis key prefixes, in fallback priority order
+LIVE_KEY_PREFIXES = ('live:', 'market:l1:', 'market_data:snapshot:')
+
+
+def parse_redis_live(prefix: str, raw: Any) -> Optional[Dict[str, Any]]:
+    """
+    Parse one Redis fallback payload into a live dict.
+
+    Args:
+        prefix: One of LIVE_KEY_PREFIXES
+        raw: Raw JSON value (str/bytes) or None
+
+    Returns:
+        Live dict with bid/ask, or None if missing/invalid
+    """
+    if not raw:
+        return None
+    try:
+        data = json.loads(raw)
+        if prefix == 'live:':
+            redis_live = data
+        elif prefix == 'market:l1:':
+            # L1Feed Terminal streaming data — 2s refresh, 120s TTL
+            bid = data.get('bid')
+            ask = data.get('ask')
+            if bid is None or ask is None or float(bid) <= 0 or float(ask) <= 0:
+                return None
+            redis_live = {
+                'bid': float(bid),
+                'ask': float(ask),
+                'last': float(data.get('last', 0)),
+                'timestamp': data.get('ts'),
+            }
+        else:
+            redis_live = {
+                'bid': data.get('bid'),
+                'ask': data.get('ask'),
+                'last': data.get('last'),
+                'volume': data.get('volume'),
+                'prev_close': data.get('prev_close'),
+                'timestamp': data.get('timestamp')
+            }
+        if redis_live.get('bid') is None or redis_live.get('ask') is None:
+            return None
+        return redis_live
+    except Exception:
+        return None
+
+
+class LivePrefetcher:
+    """
+    Background bulk loader for symbols missing from the in-memory L1 cache.
+
+    Thread-safe. The worker thread is started lazily on the first miss.
+    """
+
+    NEGATIVE_TTL_SEC = 30.0  # Not in Redis → don't ask again for this long
+    MAX_BATCH = 500  # Symbols per prefetch round (3 keys each)
+    MGET_CHUNK = 300  # Keys per MGET inside the pipeline
+
+    def __init__(self, apply_fn, stats):
+        """
+        Args:
+            apply_fn: Callable(symbol, live_dict) that merges data into DataFabric
+            stats: DataFabricStats (live_miss/neg counters are written here)
+        """
+        self._apply = apply_fn
+        self._stats = stats
+        self._pending: Dict[str, None] = {}  # Insertion-ordered set
+        self._negative: Dict[str, float] = {}  # {symbol: expires_at (monotonic)}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+    def request(self, symbol: str) -> None:
+        """Schedule symbol for prefetch (non-blocking). Counts miss / negative hit."""
+        now = time.monotonic()
+        with self._lock:
+            expires_at = self._negative.get(symbol)
+            if expires_at is not None:
+                if expires_at > now:
+                    self._stats.live_negative_hits += 1
+                    return
+                del self._negative[symbol]
+            self._stats.live_misses += 1
+            if symbol in self._pending:
+                return
+            self._pending[symbol] = None
+            self._ensure_started()
+        self._wake.set()
+
+    def fetch_now(self, symbols: Iterable[str]) -> int:
+        """
+        Synchronous bulk load (startup path). Same pipelined MGET as the worker.
+
+        Returns:
+            Number of symbols loaded
+        """
+        symbols = list(symbols)
+        loaded = 0
+        for i in range(0, len(symbols), self.MAX_BATCH):
+            loaded += self._fetch(symbols[i:i + self.MAX_BATCH])
+        return loaded
+
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def negative_count(self) -> int:
+        return len(self._negative)
+
+    def stop(self) -> None:
+        """Stop worker thread"""
+        self._running = False
+        self._wake.set()
+
+    def _ensure_started(self) -> None:
+        # Caller holds self._lock
+        if self._thread is None or not self._thread.is_alive():
+            self._running = True
+            self._thread = threading.Thread(
+                target=self._run, name="LivePrefetcher", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while self._running:
+            self._wake.wait(timeout=1.0)
+            self._wake.clear()
+            while True:
+                with self._lock:
+                    batch = list(self._pending)[:self.MAX_BATCH]
+                    for symbol in batch:
+                        del self._pending[symbol]
+                if not batch:
+                    break
+                try:
+                    self._fetch(batch)
+                except Exception as e:
+                    logger.debug(f"[LIVE_PREFETCH] Batch failed: {e}")
+                    self._mark_negative(batch)
+
+    def _mark_negative(self, symbols: List[str]) -> None:
+        expires_at = time.monotonic() + self.NEGATIVE_TTL_SEC
+        with self._lock:
+            for symbol in symbols:
+                self._negative[symbol] = expires_at
+
+    def _fetch(self, symbols: List[str]) -> int:
+        """One pipelined round trip for all fallback keys of symbols"""
+        from app.core.redis_client import get_redis_client
+
+        redis_client = get_redis_client()
+        client = redis_client.sync if redis_client else None
+        if not client or not symbols:
+            self._mark_negative(symbols)
+            return 0
+
+        keys = [f"{prefix}{symbol}" for symbol in symbols for prefix in LIVE_KEY_PREFIXES]
+        pipe = client.pipeline(transaction=False)
+        for i in range(0, len(keys), self.MGET_CHUNK):
+            pipe.mget(keys[i:i + self.MGET_CHUNK])
+        values = [v for chunk in pipe.execute() for v in chunk]
+
+        loaded = 0
+        missing = []
+        width = len(LIVE_KEY_PREFIXES)
+        for i, symbol in enumerate(symbols):
+            redis_live = None
+            for j, prefix in enumerate(LIVE_KEY_PREFIXES):
+                redis_live = parse_redis_live(prefix, values[i * width + j])
+                if redis_live:
+                    break
+            if redis_live:
+                self._apply(symbol, redis_live)
+                loaded += 1
+            else:
+                missing.append(symbol)
+
+        self._mark_negative(missing)
+        self._stats.live_prefetch_loaded += loaded
+        if loaded:
+            logger.debug(f"🔄 [LIVE_PREFETCH] Loaded {loaded}/{len(symbols)} symbols from Redis")
+        return loaded
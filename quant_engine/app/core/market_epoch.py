@@ -0,0 +1,278 @@
+"""
+MARKET EPOCH - Versioned, read-only market snapshots
+====================================================
+
+🟢 FAST PATH COMPONENT
+
+Fast-score pipeline (FastScoreCalculator batch / incremental) her
+hesaplamadan sonra tek bir MarketEpoch yayınlar:
+- epoch_id: monoton artan versiyon + created_at
+- symbol → read-only fast snapshot (L1 + static + FAST skorlar)
+- Copy-on-write: incremental publish sadece değişen sembollerin snapshot'ını
+  yeniler, diğer semboller önceki epoch ile aynı (paylaşılan) objelerdir.
+- Yayın atomik referans değişimidir; okuyucular lock almaz ve yayınlanmış bir
+  epoch asla değişmez.
+
+RUNALL / XNL (prepare_cycle_request) → KARBOTU, ADDNEWPOS, MM aynı epoch'u
+referansla okur; DecisionRequest.epoch_id ile her karar hangi epoch'u
+kullandığını loglar. Son EPOCH_HISTORY epoch get_epoch(epoch_id) ile
+saklanır (kararları aynı veriyle yeniden üretmek için).
+"""
+
+import threading
+import time
+from collections import deque
+from collections.abc import Mapping
+from datetime import datetime
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Iterable, Iterator
+
+from app.core.logger import logger
+
+
+L1_FIELDS = ('bid', 'ask', 'last')
+
+
+def _l1_row(snapshot: Mapping) -> Optional[Dict[str, Any]]:
+    """
+    Legacy DecisionRequest.l1_data row (None → 0), only for symbols with live data.
+
+    Plain dict on purpose: MM engines check isinstance(l1, dict). Rows are
+    shared between epochs and requests - treat as read-only.
+    """
+    if not snapshot.get('_has_live'):
+        return None
+    return {field: snapshot.get(field) or 0 for field in L1_FIELDS}
+
+
+class MarketEpoch(Mapping):
+    """
+    One published market version: symbol → read-only fast snapshot.
+
+    Behaves like a read-only market_data_cache (get / [] / in / iteration),
+    so it can be passed anywhere a {symbol: market_data} dict is read.
+    """
+
+    __slots__ = ('epoch_id', 'created_at', 'source', '_snapshots', '_l1', '_created_mono')
+
+    def __init__(
+        self,
+        epoch_id: int,
+        snapshots: Dict[str, Mapping],
+        l1: Dict[str, Dict[str, Any]],
+        source: str
+    ):
+        self.epoch_id = epoch_id
+        self.created_at = datetime.now()
+        self.source = source
+        self._snapshots = snapshots  # Owned by this epoch - never mutated after publish
+        self._l1 = l1
+        self._created_mono = time.monotonic()
+
+    def __getitem__(self, symbol: str) -> Mapping:
+        return self._snapshots[symbol]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._snapshots)
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
+
+    def __contains__(self, symbol: object) -> bool:
+        return symbol in self._snapshots
+
+    def get(self, symbol: str, default: Any = None) -> Any:
+        return self._snapshots.get(symbol, default)
+
+    @property
+    def age_sec(self) -> float:
+        return time.monotonic() - self._created_mono
+
+    def l1(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """{bid, ask, last} row (None → 0) or None if the symbol has no live data"""
+        return self._l1.get(symbol)
+
+    def l1_data(self, symbols: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """DecisionRequest.l1_data for symbols (rows are shared, not copied)"""
+        l1 = self._l1
+        return {symbol: l1[symbol] for symbol in symbols if symbol in l1}
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            'epoch_id': self.epoch_id,
+            'created_at': self.created_at.isoformat(),
+            'age_ms': round(self.age_sec * 1000.0, 1),
+            'source': self.source,
+            'symbols': len(self._snapshots),
+            'live_symbols': len(self._l1),
+        }
+
+    def __repr__(self) -> str:
+        return f"MarketEpoch(id={self.epoch_id}, symbols={len(self._snapshots)}, source={self.source!r})"
+
+
+class MarketEpochStore:
+    """
+    Holds the current MarketEpoch and publishes new ones.
+
+    Publishers are serialized by a lock; readers just read `current`
+    (a single reference, swapped atomically).
+    """
+
+    EPOCH_HISTORY = 8  # Recent epochs kept for get_epoch() (reproducing a decision)
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._current: Optional[MarketEpoch] = None
+        self._history: deque = deque(maxlen=self.EPOCH_HISTORY)
+        self._next_id = 1
+        self._stats = {
+            'published': 0,
+            'full': 0,
+            'incremental': 0,
+            'symbols_replaced': 0,
+            'last_publish_ms': 0.0,
+            'max_publish_ms': 0.0,
+        }
+
+    @property
+    def current(self) -> Optional[MarketEpoch]:
+        return self._current
+
+    def publish(
+        self,
+        snapshots: Dict[str, Optional[Dict[str, Any]]],
+        source: str,
+        full: bool = True
+    ) -> MarketEpoch:
+        """
+        Publish a new epoch.
+
+        Args:
+            snapshots: {symbol: fast snapshot}; the dicts are taken over (not copied).
+                None removes the symbol (incremental only).
+            source: Publisher name (logged / reported)
+            full: True = snapshots is the whole universe; False = copy-on-write
+                on top of the current epoch (only these symbols change)
+        """
+        started = time.perf_counter()
+        with self._lock:
+            base = self._current
+            if full or base is None:
+                frozen: Dict[str, Mapping] = {}
+                l1: Dict[str, Dict[str, Any]] = {}
+            else:
+                # Shallow copies: unchanged symbols keep the previous epoch's objects
+                frozen = dict(base._snapshots)
+                l1 = dict(base._l1)
+
+            for symbol, snapshot in snapshots.items():
+                if snapshot is None:
+                    frozen.pop(symbol, None)
+                    l1.pop(symbol, None)
+                    continue
+                view = MappingProxyType(snapshot)
+                frozen[symbol] = view
+                row = _l1_row(view)
+                if row is not None:
+                    l1[symbol] = row
+                else:
+                    l1.pop(symbol, None)
+
+            epoch = MarketEpoch(self._next_id, frozen, l1, source)
+            self._next_id += 1
+            self._history.append(epoch)
+            self._current = epoch
+
+            elapsed_ms = (time.perf_counter() - started) * 1000.0
+            stats = self._stats
+            stats['published'] += 1
+            stats['full' if full or base is None else 'incremental'] += 1
+            stats['symbols_replaced'] += len(snapshots)
+            stats['last_publish_ms'] = elapsed_ms
+            stats['max_publish_ms'] = max(stats['max_publish_ms'], elapsed_ms)
+        return epoch
+
+    def publish_from_fabric(
+        self,
+        fabric,
+        symbols: Optional[Iterable[str]] = None,
+        source: str = "data_fabric"
+    ) -> MarketEpoch:
+        """
+        Publish DataFabric fast snapshots.
+
+        Args:
+            fabric: DataFabric
+            symbols: Changed symbols (copy-on-write), None = whole static universe
+        """
+        if symbols is None or self._current is None:
+            return self.publish(fabric.get_all_fast_snapshots(), source, full=True)
+
+        changed = {}
+        for symbol in symbols:
+            snapshot = fabric.get_fast_snapshot(symbol)
+            # Same universe as get_all_fast_snapshots (static symbols only)
+            changed[symbol] = snapshot if snapshot and snapshot.get('_has_static') else None
+        return self.publish(changed, source, full=False)
+
+    def get_epoch(self, epoch_id: int) -> Optional[MarketEpoch]:
+        """Recent epoch by id (None if it fell out of EPOCH_HISTORY)"""
+        for epoch in reversed(self._history):
+            if epoch.epoch_id == epoch_id:
+                return epoch
+        return None
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            history = [epoch.epoch_id for epoch in self._history]
+        current = self._current
+        stats['current'] = current.describe() if current else None
+        stats['history'] = history
+        return stats
+
+
+# Global instance
+_market_epoch_store: Optional[MarketEpochStore] = None
+_market_epoch_store_lock = threading.Lock()
+
+
+def get_market_epoch_store() -> MarketEpochStore:
+    """Get global MarketEpochStore instance (singleton)"""
+    global _market_epoch_store
+    if _market_epoch_store is None:
+        with _market_epoch_store_lock:
+            if _market_epoch_store is None:
+                _market_epoch_store = MarketEpochStore()
+    return _market_epoch_store
+
+
+def get_current_epoch() -> Optional[MarketEpoch]:
+    """Current MarketEpoch (None until the first publish)"""
+    return get_market_epoch_store().current
+
+
+def get_fresh_epoch(max_age_sec: Optional[float] = None, source: str = "on_demand") -> Optional[MarketEpoch]:
+    """
+    Current epoch if younger than max_age_sec, else publish one from DataFabric now.
+
+    Args:
+        max_age_sec: Default settings.MARKET_EPOCH_MAX_AGE_SEC
+    """
+    if max_age_sec is None:
+        from app.config.settings import settings
+        max_age_sec = settings.MARKET_EPOCH_MAX_AGE_SEC
+
+    store = get_market_epoch_store()
+    epoch = store.current
+    if epoch is not None and epoch.age_sec <= max_age_sec:
+        return epoch
+
+    from app.core.data_fabric import get_data_fabric
+    fabric = get_data_fabric()
+    if fabric is None:
+        return epoch
+    epoch = store.publish_from_fabric(fabric, None, source=source)
+    logger.debug(f"[MARKET_EPOCH] Published epoch {epoch.epoch_id} on demand ({len(epoch)} symbols, source={source})")
+    return epoch
@@ -98,12 +98,21 @@ class RedisKeys:
     # BEFDAY positions for an account (JSON list)
     # Key pattern: psfalgo:befday:positions:{account_id}
     # Writers: befday_tracker.track_positions(), main.py startup
-    # Readers: befday_data_service, revnbookcheck
+    # Readers: befday_data_service, revnbookcheck, position_snapshot_api (cached per date/version)
     # TTL: 86400 seconds (1 day)
     @staticmethod
     def befday_positions(account_id: str) -> str:
         return f"psfalgo:befday:positions:{account_id}"
 
+    # BEFDAY write counter for an account (INCR on every BEFDAY write / invalidation)
+    # Key pattern: psfalgo:befday:ver:{account_id}
+    # Writers: position_snapshot_api.notify_befday_write() (befday_routes, psfalgo_routes, ibkr_connector)
+    # Readers: PositionSnapshotAPI._load_befday_map() (one GET per call; the map reloads only on change)
+    # TTL: 172800 seconds (2 days)
+    @staticmethod
+    def befday_version(account_id: str) -> str:
+        return f"psfalgo:befday:ver:{account_id}"
+
     # =========================================================================
     # MARKET DATA
     # =========================================================================
@@ -116,10 +125,10 @@ class RedisKeys:
     def market_l1(symbol: str) -> str:
         return f"market:l1:{symbol}"
 
-    # Live market data for a symbol (JSON: {bid, ask, last, volume, timestamp})
+    # Live market data for a symbol (hash: bid, ask, last, volume, timestamp - values as strings)
     # Key pattern: live:{symbol}
-    # Writers: hammer_feed, truth_ticks_worker
-    # Readers: data_fabric.get_live() (Redis fallback)
+    # Writers: hammer_feed (via l1_publisher write-behind HSET, TTL 3600s), truth_ticks_worker
+    # Readers: data_fabric.get_live() (Redis fallback), l1_resolver (HMGET bid ask last)
     @staticmethod
     def live(symbol: str) -> str:
         return f"live:{symbol}"
@@ -170,23 +179,57 @@ class RedisKeys:
 
     # Raw truth tick array (JSON list of {ts, price, size, exch})
     # Key pattern: tt:ticks:{symbol}
-    # Writers: TruthTicksEngine.persist_to_redis()
-    # Readers: MetricsCollector, Frontlama, XNL Engine, GemEngine (fallback)
+    # Writers: TruthTicksEngine.persist_to_redis() / TruthTickPersister (symbols with new ticks only)
+    # Readers: TruthTickReadModel (XNL Engine, OrderLifecycleTracker, TruthShift, qagentt),
+    #          MetricsCollector, Frontlama, GemEngine (fallback)
     # TTL: 12 days (covers 2 weekends + buffer)
     # *** CANONICAL SOURCE — always available ***
     @staticmethod
     def tt_ticks(symbol: str) -> str:
         return f"tt:ticks:{symbol}"
 
+    # Version counter of tt:ticks:{symbol} (INCR on every blob rewrite)
+    # Key pattern: tt:ver:{symbol}
+    # Writers: TruthTickPersister (same pipeline as the blob)
+    # Readers: TruthTickReadModel (pipelined MGET, re-reads the blob only on change)
+    # TTL: 12 days (same as the blob)
+    # NOT under tt:ticks:* so that scans of the blob keyspace don't pick it up
+    @staticmethod
+    def tt_ticks_version(symbol: str) -> str:
+        return f"tt:ver:{symbol}"
+
+    # Append-only truth tick log (Redis LIST of JSON [ts, price, size, exch], oldest first)
+    # Key pattern: tt:ticks:log:{symbol}
+    # Writers: TruthTickPersister (only ticks added since the last flush, RPUSH + LTRIM)
+    # Readers: TruthTicksEngine.restore_from_redis() (pipelined LRANGE)
+    # TTL: 12 days
+    @staticmethod
+    def tt_ticks_log(symbol: str) -> str:
+        return f"tt:ticks:log:{symbol}"
+
+    # Symbols that have a truth tick log (Redis SET)
+    # Writers: TruthTickPersister
+    # Readers: TruthTicksEngine.restore_from_redis()
+    TT_TICKS_SYMBOLS = "tt:ticks:symbols"
+
     # Rich truth tick analysis data (JSON: {success, symbol, data: {path_dataset, volav_levels, temporal_analysis, ...}})
     # Key pattern: truth_ticks:inspect:{symbol}
     # Writers: TruthTicksWorker.process_job()
-    # Readers: GemEngine._get_truth_price_raw(), GenObs, GreatestMM
+    # Readers: TruthTickReadModel (GreatestMM, NewCLMM, qagentt), GemEngine, GenObs
     # TTL: 3600s (1 hour) — EXPIRES when worker not running
     @staticmethod
     def truth_ticks_inspect(symbol: str) -> str:
         return f"truth_ticks:inspect:{symbol}"
 
+    # Version counter of truth_ticks:inspect:{symbol} (INCR on every rewrite)
+    # Key pattern: truth_ticks:inspect:ver:{symbol}
+    # Writers: TruthTicksWorker.process_job()
+    # Readers: TruthTickReadModel
+    # TTL: 3600s (same as the blob)
+    @staticmethod
+    def truth_ticks_inspect_version(symbol: str) -> str:
+        return f"truth_ticks:inspect:ver:{symbol}"
+
     # Latest truth tick snapshot (JSON: {price, ts, updated_at, size, venue, exch})
     # Key pattern: truthtick:latest:{symbol}
     # Writers: TruthTicksWorker.process_job()
@@ -0,0 +1,389 @@
+"""
+VECTORIZED SCORE ENGINE - Whole-universe FAST score batch
+=========================================================
+
+🟢 FAST PATH COMPONENT
+
+FastScoreCalculator.compute_all_fast_scores'un batch modu.
+
+Scalar path (compute_fast_scores) her sembol için:
+- get_live() + static dict okur
+- benchmark formülünü (grouping + BenchmarkEngine) yeniden çözer
+- resolve_group_key'i iki kez çağırır
+- _compute_group_based_metrics için metrics dict listesi kurar
+
+Bu engine aynı sayıları tek geçişte üretir:
+1. Static kolonlar (prev_close, FINAL_THG, SHORT_FINAL, SMA, group_key,
+   benchmark formülü) günde bir kez cache'lenir (static reload'da yenilenir)
+2. L1 bid/ask/last kolon olarak okunur (columnar DataFabric varsa direkt array)
+3. pf_* / ucuzluk / pahalilik / Final_* skorları NumPy ile hesaplanır
+4. Fbtot / SFStot / GORT / bench_chg: JanallMetricsEngine.compute_group_overlays_columnar
+   (DOS group key ile factorize + searchsorted rank)
+
+⚠️ PARITY:
+Çıktı scalar path ile birebir aynıdır (tests/unit/test_vectorized_score_parity.py).
+Yuvarlama Python round() ile yapılır (np.round bazı .5 sınırlarında farklı).
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Any, Optional, List, Tuple
+
+import numpy as np
+
+from app.core.logger import logger
+
+
+@dataclass
+class _StaticColumns:
+    """Per-symbol static inputs (immutable for the trading day)"""
+    version: Tuple[Any, ...]
+    symbols: List[str]
+    has_static: np.ndarray
+    static_ok: np.ndarray          # static exists and FINAL_THG/SHORT_FINAL/prev_close convertible
+    prev_close: np.ndarray         # NaN if missing
+    prev_close_present: np.ndarray
+    final_thg: np.ndarray
+    short_final: np.ndarray
+    sma63: np.ndarray
+    sma63_present: np.ndarray
+    sma246: np.ndarray
+    sma246_present: np.ndarray
+    group_keys: List[Optional[str]]
+    benchmark_types: List[str]
+    formula_ids: np.ndarray        # index into formulas (-1 = no formula)
+    formulas: List[Dict[str, float]]
+
+
+def _float_or_nan(value: Any) -> Tuple[float, bool]:
+    """Convert to float → (value, ok). None → (NaN, True)."""
+    if value is None:
+        return np.nan, True
+    try:
+        return float(value), True
+    except (ValueError, TypeError):
+        return np.nan, False
+
+
+class VectorizedScoreEngine:
+    """
+    Vectorized FAST score engine for the whole static universe.
+
+    Uses FastScoreCalculator helpers for group key / benchmark resolution so
+    Janall logic stays in one place.
+    """
+
+    def __init__(self, calculator):
+        self._calculator = calculator
+        self._static: Optional[_StaticColumns] = None
+
+    def invalidate(self) -> None:
+        """Drop cached static columns (e.g. after benchmark config reload)"""
+        self._static = None
+
+    # =========================================================================
+    # STATIC COLUMNS (cached)
+    # =========================================================================
+
+    def _get_static_columns(self, fabric) -> _StaticColumns:
+        symbols = fabric.get_all_static_symbols()
+        version = (fabric.get_status().get('static_load_time'), len(symbols))
+        if self._static is not None and self._static.version == version:
+            return self._static
+
+        calc = self._calculator
+        n = len(symbols)
+        has_static = np.zeros(n, dtype=bool)
+        static_ok = np.zeros(n, dtype=bool)
+        prev_close = np.full(n, np.nan)
+        prev_close_present = np.zeros(n, dtype=bool)
+        final_thg = np.zeros(n)
+        short_final = np.zeros(n)
+        sma63 = np.full(n, np.nan)
+        sma63_present = np.zeros(n, dtype=bool)
+        sma246 = np.full(n, np.nan)
+        sma246_present = np.zeros(n, dtype=bool)
+        group_keys: List[Optional[str]] = [None] * n
+        benchmark_types: List[str] = ['DEFAULT'] * n
+        formula_ids = np.full(n, -1, dtype=np.int64)
+        formulas: List[Dict[str, float]] = []
+        formula_index: Dict[Tuple, int] = {}
+
+        for i, symbol in enumerate(symbols):
+            static = fabric.get_static(symbol)
+            if not static:
+                continue
+            has_static[i] = True
+
+            pc, pc_ok = _float_or_nan(static.get('prev_close'))
+            thg, thg_ok = _float_or_nan(static.get('FINAL_THG'))
+            sf, sf_ok = _float_or_nan(static.get('SHORT_FINAL'))
+            static_ok[i] = pc_ok and thg_ok and sf_ok
+            prev_close[i] = pc
+            prev_close_present[i] = static.get('prev_close') is not None
+            final_thg[i] = 0.0 if static.get('FINAL_THG') is None else thg
+            short_final[i] = 0.0 if static.get('SHORT_FINAL') is None else sf
+
+            raw63 = static.get('SMA63 chg')
+            raw246 = static.get('SMA246 chg')
+            sma63[i], ok63 = _float_or_nan(raw63)
+            sma246[i], ok246 = _float_or_nan(raw246)
+            sma63_present[i] = raw63 is not None and ok63
+            sma246_present[i] = raw246 is not None and ok246
+
+            group_keys[i] = calc._resolve_group_key_for_symbol(static)
+            benchmark_type = calc._get_benchmark_type(static.get('CGRUP'))
+            benchmark_types[i] = benchmark_type
+            formula = calc._get_benchmark_formula(benchmark_type, static)
+            if formula:
+                key = tuple(formula.items())
+                if key not in formula_index:
+                    formula_index[key] = len(formulas)
+                    formulas.append(dict(formula))
+                formula_ids[i] = formula_index[key]
+
+        self._static = _StaticColumns(
+            version=version,
+            symbols=list(symbols),
+            has_static=has_static,
+            static_ok=static_ok,
+            prev_close=prev_close,
+            prev_close_present=prev_close_present,
+            final_thg=final_thg,
+            short_final=short_final,
+            sma63=sma63,
+            sma63_present=sma63_present,
+            sma246=sma246,
+            sma246_present=sma246_present,
+            group_keys=group_keys,
+            benchmark_types=benchmark_types,
+            formula_ids=formula_ids,
+            formulas=formulas,
+        )
+        logger.info(
+            f"🧮 [VECTOR_SCORES] Static columns cached: {n} symbols, "
+            f"{len(set(k for k in group_keys if k))} groups, {len(formulas)} benchmark formulas"
+        )
+        return self._static
+
+    # =========================================================================
+    # L1 COLUMNS
+    # =========================================================================
+
+    def _read_l1(self, fabric, symbols: List[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Read bid/ask/last for symbols as arrays.
+
+        Returns:
+            (bid, ask, last, has_live, l1_ok) - NaN = None; has_live = live entry
+            exists (non-empty); l1_ok = all present values convertible to float.
+        """
+        n = len(symbols)
+        bid = np.full(n, np.nan)
+        ask = np.full(n, np.nan)
+        last = np.full(n, np.nan)
+        has_live = np.zeros(n, dtype=bool)
+        l1_ok = np.ones(n, dtype=bool)
+
+        needs_fallback: List[int] = []
+        columns = fabric.get_l1_columns(('bid', 'ask', 'last'))
+        if columns is not None:
+            # 🟢 Columnar DataFabric: gather rows, no per-symbol dicts
+            row_index = {sym: row for row, sym in enumerate(columns['symbols'])}
+            rows = np.array([row_index.get(sym, -1) for sym in symbols], dtype=np.int64)
+            found = rows >= 0
+            src = rows[found]
+            bid[found] = columns['bid'][src]
+            ask[found] = columns['ask'][src]
+            last[found] = columns['last'][src]
+            has_live[found] = columns['present'][src]
+            incomplete = ~has_live | np.isnan(bid) | np.isnan(ask)
+            needs_fallback = np.flatnonzero(incomplete).tolist()
+        else:
+            live_data = fabric._live_data
+            for i, symbol in enumerate(symbols):
+                live = live_data.get(symbol)
+                if not live or live.get('bid') is None or live.get('ask') is None:
+                    needs_fallback.append(i)
+                    continue
+                self._store_l1(i, live, bid, ask, last, has_live, l1_ok)
+
+        # Incomplete entries: same get_live() fallback (Redis) as the scalar path
+        for i in needs_fallback:
+            live = fabric.get_live(symbols[i])
+            if live:
+                self._store_l1(i, live, bid, ask, last, has_live, l1_ok)
+
+        return bid, ask, last, has_live, l1_ok
+
+    @staticmethod
+    def _store_l1(i: int, live, bid, ask, last, has_live, l1_ok) -> None:
+        has_live[i] = bool(live)
+        for name, out in (('bid', bid), ('ask', ask), ('last', last)):
+            out[i], ok = _float_or_nan(live.get(name))
+            if not ok:
+                l1_ok[i] = False
+
+    # =========================================================================
+    # BATCH COMPUTE
+    # =========================================================================
+
+    def compute(self, include_group_metrics: bool = True) -> Tuple[Dict[str, Dict[str, Any]], int, int]:
+        """
+        Compute FAST scores (and group overlays) for the whole static universe.
+
+        Returns:
+            (results, computed, skipped) - results has the same shape as
+            FastScoreCalculator.compute_all_fast_scores
+        """
+        from app.core.data_fabric import get_data_fabric
+        from app.core.fast_score_calculator import _build_fast_score_result, _group_overlay_fields
+
+        fabric = get_data_fabric()
+        calc = self._calculator
+        st = self._get_static_columns(fabric)
+        symbols = st.symbols
+        n = len(symbols)
+
+        bid, ask, last, has_live, l1_ok = self._read_l1(fabric, symbols)
+        pc = st.prev_close
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            valid = (
+                st.static_ok & has_live & l1_ok &
+                ~np.isnan(bid) & ~np.isnan(ask) & ~np.isnan(last) &
+                st.prev_close_present & ~(pc <= 0)
+            )
+
+            # Basic metrics
+            daily_change = last - pc
+            spread = np.where((ask > 0) & (bid > 0), ask - bid, 0.0)
+            spread_percent = np.where(last > 0, spread / last * 100, 0.0)
+
+            # PASSIVE FİYATLAR (Janall formülleri - Ntahaf)
+            pf = (
+                np.where(bid > 0, bid + (spread * 0.15), 0.0),   # pf_bid_buy
+                np.where(last > 0, last + 0.01, 0.0),            # pf_front_buy
+                np.where(ask > 0, ask + 0.01, 0.0),              # pf_ask_buy
+                np.where(ask > 0, ask - (spread * 0.15), 0.0),   # pf_ask_sell
+                np.where(last > 0, last - 0.01, 0.0),            # pf_front_sell
+                np.where(bid > 0, bid - 0.01, 0.0),              # pf_bid_sell
+            )
+
+            # Benchmark change: one evaluation per distinct formula
+            formula_chg = np.array(
+                [calc._apply_benchmark_formula(fabric, f) for f in st.formulas] + [0.0]
+            )
+            benchmark_chg = formula_chg[st.formula_ids]  # -1 → trailing 0.0
+
+            # UCUZLUK/PAHALILIK = (pf - prev_close) - benchmark_chg
+            scores = tuple(np.where(pc > 0, p - pc, 0.0) - benchmark_chg for p in pf)
+
+            # FINAL SKORLAR (1000 katsayısı - Janall BIREBIR)
+            thg = st.final_thg
+            sf = st.short_final
+            short_ok = sf > 0
+            finals = (
+                thg - 1000 * scores[0],
+                thg - 1000 * scores[1],
+                thg - 1000 * scores[2],
+                thg - 1000 * scores[3],
+                thg - 1000 * scores[4],
+                thg - 1000 * scores[5],
+                np.where(short_ok, sf - 1000 * scores[3], 0.0),
+                np.where(short_ok, sf - 1000 * scores[4], 0.0),
+                np.where(short_ok, sf - 1000 * scores[5], 0.0),
+            )
+
+        # Build result dicts (Python floats, Python round → scalar parity)
+        computed_at = datetime.now()
+        valid_idx = np.flatnonzero(valid).tolist()
+        cols = [c.tolist() for c in (daily_change, spread, spread_percent, benchmark_chg, *scores, *finals)]
+        results: Dict[str, Dict[str, Any]] = {}
+        for i in valid_idx:
+            (d_chg, spr, spr_pct, b_chg,
+             s0, s1, s2, s3, s4, s5,
+             f0, f1, f2, f3, f4, f5, f6, f7, f8) = (c[i] for c in cols)
+            results[symbols[i]] = _build_fast_score_result(
+                d_chg, spr, spr_pct, s0, s1, s2, s3, s4, s5,
+                st.benchmark_types[i], b_chg,
+                (f0, f1, f2, f3, f4, f5, f6, f7, f8),
+                computed_at
+            )
+
+        computed = len(results)
+        skipped = n - computed
+
+        if include_group_metrics and computed > 0:
+            self._apply_group_metrics(st, results, last, has_live, _group_overlay_fields)
+
+        return results, computed, skipped
+
+    def _apply_group_metrics(self, st: _StaticColumns, results: Dict[str, Dict[str, Any]],
+                             last: np.ndarray, has_live: np.ndarray, overlay_fields) -> None:
+        """Fbtot / SFStot / GORT / bench_chg for all symbols with static + live"""
+        from app.market_data.janall_metrics_engine import get_janall_metrics_engine
+
+        janall_engine = get_janall_metrics_engine()
+        if not janall_engine:
+            logger.warning("JanallMetricsEngine not available for group metrics")
+            return
+
+        members = np.flatnonzero(st.has_static & has_live).tolist()
+        if not members:
+            return
+
+        symbols = [st.symbols[i] for i in members]
+        final_fb = np.array([
+            results[s]['Final_FB_skor'] if s in results else np.nan for s in symbols
+        ], dtype=np.float64)
+        final_sfs = np.array([
+            results[s]['Final_SFS_skor'] if s in results else np.nan for s in symbols
+        ], dtype=np.float64)
+
+        m = np.array(members, dtype=np.int64)
+        pc = st.prev_close[m]
+        m_last = last[m]
+        with np.errstate(invalid='ignore'):
+            daily_chg = np.where((pc > 0) & (m_last > 0), m_last - pc, np.nan)
+
+        group_keys = [st.group_keys[i] for i in members]
+        group_stats, overlays = janall_engine.compute_group_overlays_columnar(
+            group_keys, final_fb, final_sfs, daily_chg,
+            st.sma63[m], st.sma246[m],
+            sma63_present=st.sma63_present[m],
+            sma246_present=st.sma246_present[m],
+        )
+        gort_set = st.sma63_present[m] & st.sma246_present[m]
+
+        fbtot = overlays['fbtot'].tolist()
+        sfstot = overlays['sfstot'].tolist()
+        gort = overlays['gort'].tolist()
+        bench = overlays['bench_chg'].tolist()
+        has_group = overlays['has_group'].tolist()
+        chg_count = overlays['daily_chg_count'].tolist()
+        daily = daily_chg.tolist()
+        with_fbtot = 0
+
+        for j, symbol in enumerate(symbols):
+            d_chg = None if daily[j] != daily[j] else daily[j]
+            if has_group[j]:
+                metrics = {
+                    'fbtot': None if fbtot[j] != fbtot[j] else round(fbtot[j], 4),
+                    'sfstot': None if sfstot[j] != sfstot[j] else round(sfstot[j], 4),
+                    'gort': round(gort[j], 4) if gort_set[j] else None,
+                    'bench_chg': None if bench[j] != bench[j] else bench[j],
+                    'bench_source': f"Group: {group_keys[j]} (n={chg_count[j]})",
+                    'daily_chg': d_chg,
+                }
+            else:
+                metrics = {'fbtot': None, 'sfstot': None, 'gort': None, 'daily_chg': d_chg}
+            if metrics['fbtot'] is not None:
+                with_fbtot += 1
+            if symbol in results:
+                results[symbol].update(overlay_fields(metrics))
+
+        logger.info(
+            f"📊 [FBTOT_SUMMARY] {with_fbtot}/{len(symbols)} symbols have FBTOT "
+            f"({len(group_stats)} groups, vectorized)"
+        )
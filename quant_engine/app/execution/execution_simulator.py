@@ -1,11 +1,15 @@
 """app/execution/execution_simulator.py
 
 Execution simulator - realistic order fill simulation with slippage, commission, and liquidity.
+
+Pending limit orders are indexed by symbol and limit price, so process_tick
+only re-evaluates the orders of the tick's symbol that actually cross.
 """
 
 import time
 import uuid
-from typing import Dict, Any, Optional
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass
 
 from app.core.logger import logger
@@ -59,6 +63,10 @@ class ExecutionSimulator:
         
         # Track pending limit orders
         self.pending_orders: Dict[str, Dict[str, Any]] = {}
+        # Price index of pending_orders: {symbol: {side: sorted [(limit_price, seq, order_id)]}}
+        self._pending_index: Dict[str, Dict[str, List[Tuple[float, int, str]]]] = {}
+        self._pending_keys: Dict[str, Tuple[str, str, Tuple[float, int, str]]] = {}
+        self._pending_seq = 0
     
     def simulate_market_order(
         self,
@@ -221,6 +229,7 @@ class ExecutionSimulator:
                 'side': side,
                 'timestamp': timestamp
             }
+            self._index_pending(order_id, symbol, side, limit_price)
             return FillReport(
                 filled_qty=0,
                 avg_fill_price=limit_price,
@@ -279,6 +288,7 @@ class ExecutionSimulator:
         # Remove from pending if fully filled
         if filled_qty >= requested_qty and order_id in self.pending_orders:
             del self.pending_orders[order_id]
+            self._unindex_pending(order_id)
         
         return FillReport(
             filled_qty=filled_qty,
@@ -304,12 +314,30 @@ class ExecutionSimulator:
         symbol = tick.get('symbol')
         if not symbol:
             return []
+        index = self._pending_index.get(symbol)
+        if not index:
+            return []
+        
+        bid = float(tick.get('bid', 0))
+        ask = float(tick.get('ask', 0))
+        last = float(tick.get('last', 0))
+        if bid <= 0 or ask <= 0:
+            return []
+        
+        # Only orders that cross (same rule as simulate_limit_order):
+        # BUY limit >= min(ask, last), SELL limit <= max(bid, last)
+        buys = index['BUY']
+        sells = index['SELL']
+        crossing = buys[bisect_left(buys, (min(ask, last),)):]
+        crossing += sells[:bisect_right(sells, (max(bid, last), float('inf')))]
+        crossing.sort(key=lambda key: key[1])  # Arrival order
         
         fills = []
         
-        # Check pending orders for this symbol
-        for order_id, order in list(self.pending_orders.items()):
-            if order['symbol'] != symbol:
+        for _, _, order_id in crossing:
+            order = self.pending_orders.get(order_id)
+            if order is None:
+                self._unindex_pending(order_id)
                 continue
             
             # Try to fill limit order
@@ -330,9 +358,29 @@ class ExecutionSimulator:
     def get_pending_orders(self) -> Dict[str, Dict[str, Any]]:
         """Get all pending orders"""
         return self.pending_orders.copy()
-
-
-
-
-
-
+    
+    def _index_pending(self, order_id: str, symbol: str, side: str, limit_price: float):
+        side = "BUY" if side.upper() == "BUY" else "SELL"
+        known = self._pending_keys.get(order_id)
+        if known is not None:
+            if known[:2] == (symbol, side) and known[2][0] == limit_price:
+                return
+            self._unindex_pending(order_id)
+        self._pending_seq += 1
+        key = (limit_price, self._pending_seq, order_id)
+        index = self._pending_index.get(symbol)
+        if index is None:
+            index = self._pending_index[symbol] = {'BUY': [], 'SELL': []}
+        insort(index[side], key)
+        self._pending_keys[order_id] = (symbol, side, key)
+    
+    def _unindex_pending(self, order_id: str):
+        known = self._pending_keys.pop(order_id, None)
+        if known is None:
+            return
+        symbol, side, key = known
+        index = self._pending_index[symbol]
+        ladder = index[side]
+        del ladder[bisect_left(ladder, key)]
+        if not index['BUY'] and not index['SELL']:
+            del self._pending_index[symbol]
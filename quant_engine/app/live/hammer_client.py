@@ -9,10 +9,14 @@ import json
 import threading
 import time
 import uuid
-from typing import Optional, Callable, Dict, Any, List
+import queue
+from collections import deque
+from typing import Optional, Callable, Dict, Any, List, Iterable, Iterator, Tuple
 from datetime import datetime
 
+from app.config.settings import settings
 from app.core.logger import logger
+from app.live.hammer_dispatch import HammerDispatcher
 from app.live.symbol_mapper import SymbolMapper
 
 
@@ -57,6 +61,7 @@ class HammerClient:
         
         # Request/response handling
         self._pending_responses: Dict[str, Any] = {}
+        self._pending_events: Dict[str, Any] = {}  # reqID → object with .set() (Event or pipelined waiter)
         self._pending_lock = threading.Lock()
         
         # Message callbacks (Legacy Single Callback + Observer Pattern)
@@ -64,6 +69,13 @@ class HammerClient:
         self._observers: List[Callable[[Dict[str, Any]], None]] = []
         self._observers_lock = threading.Lock()
         
+        # Off-socket-thread dispatch: each consumer runs on its own worker thread
+        # (None = legacy inline dispatch on the receive thread)
+        self._dispatcher: Optional[HammerDispatcher] = None
+        if settings.HAMMER_DISPATCH_ASYNC:
+            self._dispatcher = HammerDispatcher()
+            self._dispatcher.register('on_message_callback', 'on_message_callback', lambda: self.on_message_callback)
+        
         # Reconnection — exponential backoff, effectively unlimited
         self._reconnect_attempts = 0
         self._max_reconnect_attempts = 999  # Never give up — Hammer is critical
@@ -247,9 +259,11 @@ class HammerClient:
             # Store response if reqID present and signal waiting thread
             if req_id:
                 with self._pending_lock:
-                    self._pending_responses[req_id] = data
+                    # Only keep responses someone is waiting for (late replies after a timeout are dropped)
+                    if req_id in self._pending_responses:
+                        self._pending_responses[req_id] = data
                     # Signal the Event so send_command wakes up immediately
-                    if hasattr(self, '_pending_events') and req_id in self._pending_events:
+                    if req_id in self._pending_events:
                         self._pending_events[req_id].set()
             
             # Handle authentication
@@ -301,26 +315,11 @@ class HammerClient:
                 if self._l1_msg_count <= 50:
                     logger.info(f"📥 [HAMMER_CLIENT] L1Update #{self._l1_msg_count}: {result}")
                 
-            # Forward message to legacy callback
-            if self.on_message_callback:
-                try:
-                    # Log callback invocation for first few messages
-                    if self._msg_count <= 10:
-                        logger.debug(f"Calling on_message_callback for cmd={cmd}")
-                    self.on_message_callback(data)
-                except Exception as e:
-                    logger.error(f"Error in message callback: {e}", exc_info=True)
+            # Forward to legacy callback + observers (worker threads, receive thread only enqueues)
+            if self._dispatcher is not None:
+                self._dispatcher.dispatch(data)
             else:
-                if self._msg_count <= 10:
-                    logger.warning(f"No on_message_callback set for cmd={cmd}")
-            
-            # Forward to Observers
-            with self._observers_lock:
-                for observer in self._observers:
-                    try:
-                        observer(data)
-                    except Exception as e:
-                        logger.error(f"Error in observer {observer}: {e}", exc_info=True)
+                self._dispatch_inline(data)
 
             if not self.on_message_callback and not self._observers:
                 # DEBUG: Log if NO ONE is listening
@@ -332,6 +331,37 @@ class HammerClient:
         except Exception as e:
             logger.error(f"Error handling message: {e}", exc_info=True)
     
+    def _dispatch_inline(self, data: Dict[str, Any]):
+        """Legacy dispatch: run callback and observers on the receive thread"""
+        cmd = data.get("cmd", "")
+        
+        # Forward message to legacy callback
+        if self.on_message_callback:
+            try:
+                # Log callback invocation for first few messages
+                if self._msg_count <= 10:
+                    logger.debug(f"Calling on_message_callback for cmd={cmd}")
+                self.on_message_callback(data)
+            except Exception as e:
+                logger.error(f"Error in message callback: {e}", exc_info=True)
+        else:
+            if self._msg_count <= 10:
+                logger.warning(f"No on_message_callback set for cmd={cmd}")
+        
+        # Forward to Observers
+        with self._observers_lock:
+            for observer in self._observers:
+                try:
+                    observer(data)
+                except Exception as e:
+                    logger.error(f"Error in observer {observer}: {e}", exc_info=True)
+    
+    def get_dispatch_stats(self) -> Dict[str, Any]:
+        """Per-consumer latency histograms and queue high-water marks"""
+        if self._dispatcher is None:
+            return {'mode': 'inline'}
+        return {'mode': 'async', **self._dispatcher.get_stats()}
+    
     def _on_error(self, ws, error):
         """WebSocket error"""
         error_str = str(error) if error else "Unknown error"
@@ -453,56 +483,130 @@ class HammerClient:
             self.connected = False
             return False
     
+    def _register_request(self, command: Dict[str, Any], signal) -> str:
+        """Assign a reqID and register signal (.set() is called when the response arrives)"""
+        req_id = str(uuid.uuid4())
+        command['reqID'] = req_id
+        with self._pending_lock:
+            self._pending_responses[req_id] = None
+            self._pending_events[req_id] = signal
+        return req_id
+    
+    def _release_request(self, req_id: str) -> Optional[Dict[str, Any]]:
+        """Unregister reqID and return its response (None if not arrived)"""
+        with self._pending_lock:
+            self._pending_events.pop(req_id, None)
+            return self._pending_responses.pop(req_id, None)
+    
+    def _record_timeout(self, cmd: Optional[str]):
+        # Throttle timeout warnings — accumulate and report summary every 60s
+        # Previously logged each getTicks timeout (up to 16/min), flooding the log
+        now = time.time()
+        if not hasattr(self, '_timeout_counter'):
+            self._timeout_counter = 0
+            self._last_timeout_warn = 0.0
+        self._timeout_counter += 1
+        if now - self._last_timeout_warn > 60:
+            logger.warning(f"Command timeout: {cmd} ({self._timeout_counter} timeouts in last 60s)")
+            self._timeout_counter = 0
+            self._last_timeout_warn = now
+    
     def send_command(self, command: Dict[str, Any], wait_for_response: bool = False, timeout: float = 5.0) -> Optional[Dict[str, Any]]:
         """
         Send command and optionally wait for response.
         Uses threading.Event for efficient wait (no busy-loop polling).
         """
         if wait_for_response:
-            req_id = str(uuid.uuid4())
-            command['reqID'] = req_id
-            
             event = threading.Event()
-            with self._pending_lock:
-                self._pending_responses[req_id] = None
-                # Store event for this request so _on_message can signal it
-                if not hasattr(self, '_pending_events'):
-                    self._pending_events: Dict[str, threading.Event] = {}
-                self._pending_events[req_id] = event
+            req_id = self._register_request(command, event)
             
             if not self._send_command(command):
-                with self._pending_lock:
-                    self._pending_responses.pop(req_id, None)
-                    if hasattr(self, '_pending_events'):
-                        self._pending_events.pop(req_id, None)
+                self._release_request(req_id)
                 return None
             
             # Wait for response using Event (efficient, no GIL contention)
             event.wait(timeout=timeout)
             
-            with self._pending_lock:
-                if hasattr(self, '_pending_events'):
-                    self._pending_events.pop(req_id, None)
-                response = self._pending_responses.pop(req_id, None)
-            
+            response = self._release_request(req_id)
             if response is not None:
                 return response
             
-            # Throttle timeout warnings — accumulate and report summary every 60s
-            # Previously logged each getTicks timeout (up to 16/min), flooding the log
-            now = time.time()
-            if not hasattr(self, '_timeout_counter'):
-                self._timeout_counter = 0
-                self._last_timeout_warn = 0.0
-            self._timeout_counter += 1
-            if now - self._last_timeout_warn > 60:
-                logger.warning(f"Command timeout: {command.get('cmd')} ({self._timeout_counter} timeouts in last 60s)")
-                self._timeout_counter = 0
-                self._last_timeout_warn = now
+            self._record_timeout(command.get('cmd'))
             return None
         else:
             return self._send_command(command)
     
+    def send_commands_pipelined(
+        self,
+        commands: Iterable[Tuple[Any, Dict[str, Any]]],
+        max_in_flight: int = 16,
+        timeout: float = 5.0
+    ) -> Iterator[Tuple[Any, Optional[Dict[str, Any]]]]:
+        """
+        Send many commands over the one socket with up to max_in_flight outstanding.
+        
+        Responses are correlated by reqID and yielded as they arrive (not in input
+        order). Each request has its own timeout, so a few slow symbols do not hold
+        up the rest.
+        
+        Args:
+            commands: (key, command) pairs; key is echoed back with the response
+            max_in_flight: Max outstanding requests
+            timeout: Per-request timeout (seconds, from when it was sent)
+            
+        Yields:
+            (key, response) - response is None on send failure or timeout
+        """
+        done: "queue.Queue[str]" = queue.Queue()
+        waiting = deque(commands)
+        in_flight: Dict[str, Tuple[Any, float, Optional[str]]] = {}  # reqID → (key, deadline, cmd)
+        max_in_flight = max(1, max_in_flight)
+        
+        class _Waiter:
+            __slots__ = ('req_id',)
+            
+            def set(self):
+                done.put(self.req_id)
+        
+        try:
+            while waiting or in_flight:
+                # Fill the window
+                while waiting and len(in_flight) < max_in_flight:
+                    key, command = waiting.popleft()
+                    waiter = _Waiter()
+                    waiter.req_id = req_id = self._register_request(command, waiter)
+                    if not self._send_command(command):
+                        self._release_request(req_id)
+                        yield key, None
+                        continue
+                    in_flight[req_id] = (key, time.monotonic() + timeout, command.get('cmd'))
+                
+                if not in_flight:
+                    continue
+                
+                next_deadline = min(deadline for _, deadline, _ in in_flight.values())
+                try:
+                    req_id = done.get(timeout=max(0.0, next_deadline - time.monotonic()))
+                except queue.Empty:
+                    req_id = None
+                
+                if req_id is not None and req_id in in_flight:
+                    key, _, _ = in_flight.pop(req_id)
+                    yield key, self._release_request(req_id)
+                
+                # Expire timed-out requests
+                now = time.monotonic()
+                for expired_id in [r for r, (_, deadline, _) in in_flight.items() if deadline <= now]:
+                    key, _, cmd = in_flight.pop(expired_id)
+                    response = self._release_request(expired_id)
+                    if response is None:
+                        self._record_timeout(cmd)
+                    yield key, response
+        finally:
+            # Caller stopped early - forget outstanding requests
+            for req_id in in_flight:
+                self._release_request(req_id)
+    
     def send_command_and_wait(self, command: Dict[str, Any], wait_for_response: bool = True, timeout: float = 5.0) -> Optional[Dict[str, Any]]:
         """
         Send command and wait for response (convenience method).
@@ -792,14 +896,10 @@ class HammerClient:
         
         # Check cache first
         if use_cache:
-            with self._snapshot_cache_lock:
-                if symbol in self._snapshot_cache:
-                    cached = self._snapshot_cache[symbol]
-                    # Cache is valid for 5 minutes
-                    cache_age = time.time() - cached.get('_cache_time', 0)
-                    if cache_age < 300:  # 5 minutes
-                        logger.debug(f"📊 Using cached snapshot for {symbol}")
-                        return cached
+            cached = self._get_cached_snapshot(symbol)
+            if cached is not None:
+                logger.debug(f"📊 Using cached snapshot for {symbol}")
+                return cached
         
         try:
             # Convert symbol to Hammer format
@@ -816,41 +916,96 @@ class HammerClient:
             # Send command and wait for response (shorter timeout for better responsiveness)
             # Cache mechanism (5 min TTL) reduces need for frequent snapshot calls
             response = self.send_command_and_wait(command, wait_for_response=True, timeout=5.0)
-            
-            if response and response.get('success') == 'OK':
-                result = response.get('result', {})
-                
-                # Extract snapshot data
-                snapshot = {
-                    'prevClose': self._safe_float(result.get('prevClose')),
-                    'change': self._safe_float(result.get('change')),
-                    'dividend': self._safe_float(result.get('dividend')),
-                    'last': self._safe_float(result.get('last')),
-                    'bid': self._safe_float(result.get('bid')),
-                    'ask': self._safe_float(result.get('ask')),
-                    'open': self._safe_float(result.get('open')),
-                    'high': self._safe_float(result.get('high')),
-                    'low': self._safe_float(result.get('low')),
-                    'volume': self._safe_float(result.get('volume')),
-                    '_cache_time': time.time()  # Cache timestamp
-                }
-                
-                # Cache snapshot
-                with self._snapshot_cache_lock:
-                    self._snapshot_cache[symbol] = snapshot
-                
-                logger.debug(f"✅ getSymbolSnapshot successful: {symbol} - prevClose={snapshot.get('prevClose')}, change={snapshot.get('change')}")
-                return snapshot
-            else:
-                # Reduce log level: WARNING -> DEBUG (first time only, repeated failures are logged at debug)
-                logger.debug(f"⚠️ getSymbolSnapshot failed for {symbol} ({hammer_symbol}): {response}")
-                return None
+            return self._handle_snapshot_response(symbol, response)
                 
         except Exception as e:
             # Reduce log level: ERROR -> DEBUG (timeout is normal if Hammer is busy)
             logger.debug(f"Error getting symbol snapshot for {symbol}: {e}")
             return None
     
+    def _get_cached_snapshot(self, symbol: str) -> Optional[Dict[str, Any]]:
+        with self._snapshot_cache_lock:
+            cached = self._snapshot_cache.get(symbol)
+        # Cache is valid for 5 minutes
+        if cached and time.time() - cached.get('_cache_time', 0) < 300:
+            return cached
+        return None
+    
+    def _handle_snapshot_response(self, symbol: str, response: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Parse + cache a getSymbolSnapshot response"""
+        if response and response.get('success') == 'OK':
+            result = response.get('result', {})
+            
+            # Extract snapshot data
+            snapshot = {
+                'prevClose': self._safe_float(result.get('prevClose')),
+                'change': self._safe_float(result.get('change')),
+                'dividend': self._safe_float(result.get('dividend')),
+                'last': self._safe_float(result.get('last')),
+                'bid': self._safe_float(result.get('bid')),
+                'ask': self._safe_float(result.get('ask')),
+                'open': self._safe_float(result.get('open')),
+                'high': self._safe_float(result.get('high')),
+                'low': self._safe_float(result.get('low')),
+                'volume': self._safe_float(result.get('volume')),
+                '_cache_time': time.time()  # Cache timestamp
+            }
+            
+            # Cache snapshot
+            with self._snapshot_cache_lock:
+                self._snapshot_cache[symbol] = snapshot
+            
+            logger.debug(f"✅ getSymbolSnapshot successful: {symbol} - prevClose={snapshot.get('prevClose')}, change={snapshot.get('change')}")
+            return snapshot
+        
+        # Reduce log level: WARNING -> DEBUG (first time only, repeated failures are logged at debug)
+        logger.debug(f"⚠️ getSymbolSnapshot failed for {symbol}: {response}")
+        return None
+    
+    def get_symbol_snapshots(
+        self,
+        symbols: Iterable[str],
+        max_in_flight: int = 16,
+        timeout: float = 5.0,
+        use_cache: bool = True
+    ) -> Iterator[Tuple[str, Optional[Dict[str, Any]]]]:
+        """
+        Pipelined getSymbolSnapshot for many symbols.
+        
+        Keeps up to max_in_flight requests outstanding and yields results as they
+        arrive (cached symbols first). Same snapshot format/cache as get_symbol_snapshot().
+        
+        Args:
+            symbols: Symbols in display format
+            max_in_flight: Max outstanding requests on the socket
+            timeout: Per-symbol timeout (seconds)
+            use_cache: Serve symbols with a fresh cached snapshot without a request
+            
+        Yields:
+            (symbol, snapshot or None)
+        """
+        if not self.is_connected():
+            return
+        
+        def commands():
+            for symbol in symbols:
+                yield symbol, {"cmd": "getSymbolSnapshot", "sym": SymbolMapper.to_hammer_symbol(symbol)}
+        
+        to_fetch = []
+        for symbol, command in commands():
+            cached = self._get_cached_snapshot(symbol) if use_cache else None
+            if cached is not None:
+                yield symbol, cached
+            else:
+                to_fetch.append((symbol, command))
+        
+        for symbol, response in self.send_commands_pipelined(to_fetch, max_in_flight=max_in_flight, timeout=timeout):
+            try:
+                yield symbol, self._handle_snapshot_response(symbol, response)
+            except Exception as e:
+                logger.debug(f"Error getting symbol snapshot for {symbol}: {e}")
+                yield symbol, None
+    
     def _safe_float(self, value, default: float = 0.0) -> float:
         """Safely convert value to float"""
         if value is None or value == "":
@@ -909,6 +1064,43 @@ class HammerClient:
             logger.error(f"❌ getTicks exception for {symbol}: {e}", exc_info=True)
             return None
     
+    def get_ticks_many(
+        self,
+        symbols: Iterable[str],
+        lastFew: int = 50,
+        tradesOnly: bool = False,
+        regHoursOnly: bool = True,
+        max_in_flight: int = 8,
+        timeout: float = 10.0
+    ) -> Iterator[Tuple[str, Optional[Dict[str, Any]]]]:
+        """
+        Pipelined getTicks for many symbols (see get_ticks for arguments).
+        
+        Keeps up to max_in_flight requests outstanding and yields results as they arrive.
+        
+        Yields:
+            (symbol, result dict with 'data' or None) - symbol as passed in
+        """
+        if not self.is_connected():
+            return
+        
+        commands = (
+            (symbol, {
+                "cmd": "getTicks",
+                "sym": SymbolMapper.to_hammer_symbol(symbol),
+                "lastFew": lastFew,
+                "tradesOnly": tradesOnly,
+                "regHoursOnly": regHoursOnly
+            })
+            for symbol in symbols
+        )
+        for symbol, response in self.send_commands_pipelined(commands, max_in_flight=max_in_flight, timeout=timeout):
+            if response and response.get('success') == 'OK':
+                yield symbol, response.get('result', {})
+            else:
+                logger.debug(f"⚠️ getTicks failed for {symbol}: {response}")
+                yield symbol, None
+    
     def get_l2_snapshot(self, symbol: str, timeout: float = 5.0) -> Optional[Dict[str, Any]]:
         """
         Get Level 2 snapshot (bids/asks/prints) using getQuotes command.
@@ -955,6 +1147,10 @@ class HammerClient:
         with self._observers_lock:
             if callback not in self._observers:
                 self._observers.append(callback)
+                if self._dispatcher is not None:
+                    self._dispatcher.register(
+                        callback, HammerDispatcher.consumer_name(callback), lambda: callback
+                    )
                 logger.debug(f"Observer added: {callback}")
 
     def remove_observer(self, callback: Callable[[Dict[str, Any]], None]):
@@ -962,6 +1158,8 @@ class HammerClient:
         with self._observers_lock:
             if callback in self._observers:
                 self._observers.remove(callback)
+                if self._dispatcher is not None:
+                    self._dispatcher.unregister(callback)
                 logger.debug(f"Observer removed: {callback}")
 
     def get_transactions(self, account_key: Optional[str] = None, timeout: float = 5.0) -> Optional[Dict[str, Any]]:
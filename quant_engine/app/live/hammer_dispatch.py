@@ -0,0 +1,315 @@
+"""app/live/hammer_dispatch.py
+
+Off-socket-thread dispatch pipeline for HammerClient consumers.
+
+Receive thread'i sadece parse eder, reqID cevaplarını yönlendirir ve
+mesajı her consumer'ın (legacy callback + her observer) kuyruklarına koyar.
+Her consumer kendi worker thread'inde çalışır; yavaş consumer sadece
+kendini geciktirir.
+
+Consumer başına iki bounded kuyruk:
+- market: L1Update. Quote'lar (size yok / 0) sembol başına coalesce edilir
+  (result alanları merge, kuyruktaki yeri korunur). Trade print'ler
+  (size > 0) kayıpsızdır; bir trade'den sonra gelen quote onun arkasına
+  eklenir, yani sembol içi sıra bozulmaz.
+- events: diğer tüm mesajlar (transactionsUpdate, L2Update, cevaplar...),
+  kayıpsız, FIFO. Worker önce events kuyruğunu boşaltır.
+Receive thread hiçbir zaman beklemez. Kayıpsız kuyruk doluysa mesaj yine
+eklenir (overflow sayacı); kapasitenin OVERFLOW_LIMIT fazlasına ulaşan
+consumer "stalled" işaretlenir ve kuyruğu kapasitenin altına inene kadar
+kayıpsız mesajları düşürülür (dropped sayacı) - bellek sınırlı kalır.
+
+Stats: consumer başına callback latency histogramı, kuyruk bekleme süresi,
+kuyruk high-water mark'ları, coalesced/overflow/error sayaçları.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from typing import Callable, Dict, Any, Optional, List, Tuple
+
+from app.core.logger import logger
+
+
+# Callback latency histogram bucket upper bounds (ms); last bucket is +inf
+LATENCY_BUCKETS_MS = (0.1, 0.5, 1.0, 2.0, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 1000.0)
+
+
+def classify_message(data: Dict[str, Any]) -> Tuple[str, Optional[str]]:
+    """
+    Route a parsed Hammer message to a stream.
+
+    Returns:
+        (stream, coalesce_key): stream is 'market' or 'events'; coalesce_key is the
+        symbol for coalescable L1 quotes, None for lossless messages
+    """
+    if data.get("cmd") != "L1Update":
+        return "events", None
+    result = data.get("result") or {}
+    symbol = result.get("sym") if isinstance(result, dict) else None
+    if not symbol:
+        return "market", None
+    try:
+        is_trade = float(result.get("size") or 0) > 0
+    except (TypeError, ValueError):
+        is_trade = False
+    return "market", None if is_trade else symbol
+
+
+def _merge_l1(older: Dict[str, Any], newer: Dict[str, Any]) -> Dict[str, Any]:
+    merged = dict(newer)
+    old_result = older.get("result")
+    new_result = newer.get("result")
+    if isinstance(old_result, dict) and isinstance(new_result, dict):
+        merged["result"] = {**old_result, **new_result}
+    return merged
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (ms)"""
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.n = 0
+
+    def record(self, ms: float) -> None:
+        self.counts[bisect_left(LATENCY_BUCKETS_MS, ms)] += 1
+        self.total_ms += ms
+        self.n += 1
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        labels = [f"<={b:g}ms" for b in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]:g}ms"]
+        return {
+            'count': self.n,
+            'avg_ms': self.total_ms / self.n if self.n else 0.0,
+            'max_ms': self.max_ms,
+            'buckets': {label: c for label, c in zip(labels, self.counts) if c},
+        }
+
+
+class StreamQueue:
+    """
+    Ordered queue with optional per-key coalescing.
+
+    Not thread-safe on its own; guarded by the owning consumer's condition.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._items: deque = deque()  # entries: [key, data, enqueued_at]
+        self._pending: Dict[str, list] = {}  # key → entry still in queue and open for coalescing
+        self.high_water = 0
+        self.enqueued = 0
+        self.coalesced = 0
+        self.overflow = 0
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def full(self) -> bool:
+        return len(self._items) >= self.capacity
+
+    def put(self, data: Dict[str, Any], key: Optional[str] = None, barrier: Optional[str] = None) -> None:
+        """
+        Args:
+            key: Coalesce with a queued entry of the same key
+            barrier: Close the queued entry for this key (later puts queue behind this one)
+        """
+        self.enqueued += 1
+        if key is not None:
+            entry = self._pending.get(key)
+            if entry is not None:
+                entry[1] = _merge_l1(entry[1], data)
+                self.coalesced += 1
+                return
+        elif barrier is not None:
+            self._pending.pop(barrier, None)
+
+        entry = [key, data, time.perf_counter()]
+        self._items.append(entry)
+        if key is not None:
+            self._pending[key] = entry
+        if len(self._items) > self.high_water:
+            self.high_water = len(self._items)
+
+    def pop(self) -> Tuple[Dict[str, Any], float]:
+        key, data, enqueued_at = entry = self._items.popleft()
+        if key is not None and self._pending.get(key) is entry:
+            del self._pending[key]
+        return data, enqueued_at
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'depth': len(self._items),
+            'high_water': self.high_water,
+            'enqueued': self.enqueued,
+            'coalesced': self.coalesced,
+            'overflow': self.overflow,
+            'dropped': self.dropped,
+        }
+
+
+class DispatchConsumer:
+    """One consumer (callback) with its own queues and worker thread"""
+
+    MARKET_CAPACITY = 50000
+    EVENTS_CAPACITY = 20000
+    OVERFLOW_LIMIT = 10000  # Lossless messages accepted past capacity before the consumer is stalled
+
+    def __init__(self, name: str, get_callback: Callable[[], Optional[Callable]]):
+        self.name = name
+        self.get_callback = get_callback
+        self.queues = {
+            'events': StreamQueue(self.EVENTS_CAPACITY),
+            'market': StreamQueue(self.MARKET_CAPACITY),
+        }
+        self._cond = threading.Condition()
+        self._running = True
+        self.latency = LatencyHistogram()
+        self.queue_wait = LatencyHistogram()
+        self.errors = 0
+        self.stalled = False
+        self._thread = threading.Thread(target=self._run, name=f"HammerDispatch-{name}", daemon=True)
+        self._thread.start()
+
+    def put(self, stream: str, data: Dict[str, Any], key: Optional[str], barrier: Optional[str]) -> None:
+        """Enqueue without ever blocking (called on the websocket receive thread)"""
+        queue = self.queues[stream]
+        with self._cond:
+            if key is None and queue.full():
+                if self.stalled or len(queue) >= queue.capacity + self.OVERFLOW_LIMIT:
+                    queue.dropped += 1
+                    if not self.stalled:
+                        self.stalled = True
+                        logger.warning(
+                            f"[HammerDispatch] Consumer {self.name} stalled ({len(queue)} queued on {stream}) "
+                            f"- dropping its lossless messages until it catches up"
+                        )
+                    return
+                queue.overflow += 1
+            queue.put(data, key, barrier)
+            self._cond.notify_all()
+
+    def stop(self) -> None:
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+
+    def _next(self) -> Optional[Tuple[Dict[str, Any], float]]:
+        events = self.queues['events']
+        market = self.queues['market']
+        with self._cond:
+            while self._running and not events and not market:
+                self._cond.wait()
+            if not self._running:
+                return None
+            item = events.pop() if events else market.pop()
+            if self.stalled and not events.full() and not market.full():
+                self.stalled = False
+                logger.info(f"[HammerDispatch] Consumer {self.name} caught up - lossless delivery resumed")
+            return item
+
+    def _run(self) -> None:
+        while True:
+            item = self._next()
+            if item is None:
+                return
+            data, enqueued_at = item
+            callback = self.get_callback()
+            if callback is None:
+                continue
+            started = time.perf_counter()
+            self.queue_wait.record((started - enqueued_at) * 1000.0)
+            try:
+                callback(data)
+            except Exception as e:
+                self.errors += 1
+                logger.error(f"Error in Hammer consumer {self.name}: {e}", exc_info=True)
+            self.latency.record((time.perf_counter() - started) * 1000.0)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            queues = {name: q.stats() for name, q in self.queues.items()}
+        return {
+            'queues': queues,
+            'callback_latency': self.latency.to_dict(),
+            'queue_wait': self.queue_wait.to_dict(),
+            'errors': self.errors,
+            'stalled': self.stalled,
+        }
+
+
+class HammerDispatcher:
+    """
+    Fans parsed Hammer messages out to per-consumer worker threads.
+
+    dispatch() is called on the websocket receive thread and only enqueues.
+    """
+
+    def __init__(self):
+        self._consumers: Dict[Any, DispatchConsumer] = {}
+        self._lock = threading.Lock()
+        self._snapshot: List[DispatchConsumer] = []
+        self.dispatched = 0
+
+    @staticmethod
+    def consumer_name(callback: Callable) -> str:
+        owner = getattr(callback, '__self__', None)
+        name = (getattr(callback, '__qualname__', None) or repr(callback)).split('.<locals>.')[-1]
+        return f"{type(owner).__name__}.{callback.__name__}" if owner is not None else name
+
+    def register(self, token: Any, name: str, get_callback: Callable[[], Optional[Callable]]) -> None:
+        """Start a consumer; token identifies it for unregister()"""
+        with self._lock:
+            if token in self._consumers:
+                return
+            self._consumers[token] = DispatchConsumer(name, get_callback)
+            self._snapshot = list(self._consumers.values())
+
+    def unregister(self, token: Any) -> None:
+        with self._lock:
+            consumer = self._consumers.pop(token, None)
+            self._snapshot = list(self._consumers.values())
+        if consumer:
+            consumer.stop()
+
+    def has_consumers(self) -> bool:
+        return bool(self._snapshot)
+
+    def dispatch(self, data: Dict[str, Any]) -> None:
+        """Enqueue message for every consumer with a callback"""
+        stream, key = classify_message(data)
+        barrier = None
+        if stream == "market" and key is None:
+            result = data.get("result")
+            barrier = result.get("sym") if isinstance(result, dict) else None
+        self.dispatched += 1
+        for consumer in self._snapshot:
+            if consumer.get_callback() is not None:
+                consumer.put(stream, data, key, barrier)
+
+    def stop(self) -> None:
+        with self._lock:
+            consumers = list(self._consumers.values())
+            self._consumers.clear()
+            self._snapshot = []
+        for consumer in consumers:
+            consumer.stop()
+
+    def get_stats(self) -> Dict[str, Any]:
+        consumers = {}
+        for consumer in self._snapshot:
+            name = consumer.name
+            while name in consumers:
+                name += "'"
+            consumers[name] = consumer.stats()
+        return {
+            'dispatched': self.dispatched,
+            'consumers': consumers,
+        }
@@ -16,11 +16,20 @@ Rules:
 - Weight: 100/200/300 lot = 1.0, others = 0.25
 - Calculate: weighted price frequency, dominant price (grpan_price), 
   ±0.04 concentration %, real_lot_count, deviation_vs_last, deviation_vs_prev_window
+
+Incremental windows:
+Her print add_trade_print'te bir kere parse edilir (_PrintEntry);
+her window (GRPANWindowState) bir PriceHistogram tutar: print girince
+ağırlık eklenir, window'dan / buffer'dan düşünce çıkarılır. Dominant price
+lazy max-heap ile, concentration sıralı fiyat seviyeleri üzerinde bisect
+ile bulunur; real_lot_count / print_count running toplamlardır. Ağırlıklar
+tamsayı birimlerde toplanır (float toplama sırası sonucu değiştirmez).
 """
 
 from typing import Dict, Any, Optional, List, Set, Tuple
-from collections import defaultdict, deque
-from datetime import datetime, timedelta
+from collections import deque
+from bisect import bisect_left, bisect_right, insort
+import heapq
 import yaml
 from pathlib import Path
 import os
@@ -30,71 +39,225 @@ import re
 
 from app.core.logger import logger
 from app.market_data.trading_calendar import get_trading_calendar
+from app.market_data.trade_print import parse_print_time, print_time
+
+
+WEIGHT_SCALE = 1_000_000  # Print weights are summed as integer micro-units
+EXTENDED_PRINTS = 150  # extended_prints_store ring buffer size (rolling windows)
+
+
+class _PrintEntry:
+    """A trade print parsed once on arrival (timestamp, price, weight)"""
+    
+    __slots__ = ('seq', 'ts', 'price', 'size', 'units', 'counted')
+    
+    def __init__(self, seq: int, ts: Optional[float], price: float, size: float, units: int, counted: bool):
+        self.seq = seq
+        self.ts = ts  # None: unparseable time (legacy fallback = "now")
+        self.price = price
+        self.size = size
+        self.units = units
+        self.counted = counted  # size >= min_lot_size
+
+
+class _PriceLevel:
+    __slots__ = ('units', 'count', 'seqs')
+    
+    def __init__(self):
+        self.units = 0
+        self.count = 0
+        self.seqs: deque = deque()  # Member print seqs at this price (ascending)
+
+
+class PriceHistogram:
+    """
+    Price-keyed weighted print histogram with O(log n) add / remove.
+    
+    Ties in weighted frequency rank by the earliest print still in the
+    histogram (same order as the legacy insertion-ordered dict + stable sort).
+    """
+    
+    def __init__(self):
+        self.levels: Dict[float, _PriceLevel] = {}
+        self.prices: List[float] = []  # Sorted distinct prices
+        self._heap: List[Tuple[int, int, float]] = []  # (-units, first_seq, price), lazy
+        self.count = 0
+        self.total_lots = 0.0
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def add(self, entry: _PrintEntry) -> None:
+        level = self.levels.get(entry.price)
+        if level is None:
+            level = self.levels[entry.price] = _PriceLevel()
+            insort(self.prices, entry.price)
+        level.units += entry.units
+        level.count += 1
+        level.seqs.append(entry.seq)  # Members are always admitted in seq order
+        self.count += 1
+        self.total_lots += entry.size
+        self._push(entry.price, level)
+    
+    def remove(self, entry: _PrintEntry) -> None:
+        level = self.levels[entry.price]
+        level.units -= entry.units
+        level.count -= 1
+        if level.seqs[0] == entry.seq:
+            level.seqs.popleft()
+        else:
+            level.seqs.remove(entry.seq)
+        self.count -= 1
+        self.total_lots -= entry.size
+        if level.count == 0:
+            del self.levels[entry.price]
+            del self.prices[bisect_left(self.prices, entry.price)]
+        else:
+            self._push(entry.price, level)
+        if not self.count:
+            self.total_lots = 0.0
+    
+    def _push(self, price: float, level: _PriceLevel) -> None:
+        heapq.heappush(self._heap, (-level.units, level.seqs[0], price))
+        if len(self._heap) > 2 * len(self.levels) + 64:
+            self._heap = [(-lv.units, lv.seqs[0], p) for p, lv in self.levels.items()]
+            heapq.heapify(self._heap)
+    
+    def dominant(self) -> Optional[float]:
+        """Price with the highest weighted frequency"""
+        heap = self._heap
+        while heap:
+            neg_units, first_seq, price = heap[0]
+            level = self.levels.get(price)
+            if level is not None and level.units == -neg_units and level.seqs[0] == first_seq:
+                return price
+            heapq.heappop(heap)
+        return None
+    
+    def top(self, n: int) -> List[Tuple[float, float]]:
+        """Top n (price, weighted_freq), highest first"""
+        ranked = heapq.nsmallest(n, self.levels.items(), key=lambda kv: (-kv[1].units, kv[1].seqs[0]))
+        return [(price, level.units / WEIGHT_SCALE) for price, level in ranked]
+    
+    def count_within(self, center: float, width: float) -> int:
+        """Prints with abs(price - center) <= width"""
+        prices = self.prices
+        lo = bisect_left(prices, center - width - 1e-9)
+        hi = bisect_right(prices, center + width + 1e-9)
+        return sum(
+            self.levels[price].count
+            for price in prices[lo:hi]
+            if abs(price - center) <= width
+        )
 
 
 class GRPANWindowState:
-    """State for a single rolling time window"""
+    """
+    State for a single window (rolling time window or latest_pan).
+    
+    Members are the buffered prints with seq >= min_seq and time >= window
+    start. sync() applies only what changed since the last call: new prints,
+    prints dropped from the buffer, prints aged out of the window.
+    """
     
     def __init__(self, window_name: str, window_seconds: int):
         self.window_name = window_name
         self.window_seconds = window_seconds
-        self.prints: deque = deque()  # List of (timestamp, print_data) tuples
+        self.prints: Dict[int, _PrintEntry] = {}  # Members by seq (ascending)
+        self.histogram = PriceHistogram()
         self.last_computed: Optional[Dict[str, Any]] = None
+        self.window_start = float('-inf')
+        self._floating_in = True  # Prints without a parseable time are members
+        self._next_seq: Optional[int] = None
+        self._ts_heap: List[Tuple[float, int]] = []  # (ts, seq) for time eviction
     
-    def add_print(self, print_data: Dict[str, Any], current_time: float):
-        """Add print if within window"""
-        print_time = self._parse_timestamp(print_data.get('time'), current_time)
-        if print_time is None:
-            return False
-        
-        window_start = current_time - self.window_seconds
-        
-        # Debug: Log if print is outside window
-        if print_time < window_start:
-            time_diff_sec = current_time - print_time
-            time_diff_min = time_diff_sec / 60.0
-            logger.debug(
-                f"GRPAN {self.window_name}: Print outside window "
-                f"(print_time={print_time:.0f}, window_start={window_start:.0f}, "
-                f"diff={time_diff_min:.1f}min, window={self.window_seconds/60:.0f}min)"
-            )
-            return False
-        
-        self.prints.append((print_time, print_data))
-        return True
-    
-    def clean_old_prints(self, current_time: float):
-        """Remove prints outside window"""
-        window_start = current_time - self.window_seconds
-        while self.prints and self.prints[0][0] < window_start:
-            self.prints.popleft()
-    
-    def _parse_timestamp(self, time_str: Optional[str], fallback_time: float) -> Optional[float]:
-        """Parse timestamp string to unix timestamp"""
-        if time_str is None:
-            return fallback_time
+    def sync(
+        self,
+        entries: List[_PrintEntry],
+        window_start: Optional[float],
+        now: float,
+        min_seq: Optional[int] = None
+    ) -> None:
+        """
+        Bring the window up to date with the print buffer.
         
-        try:
-            # Try ISO format first
-            if 'T' in time_str:
-                dt = datetime.fromisoformat(time_str.replace('Z', '+00:00'))
-                return dt.timestamp()
-            
-            # Try unix timestamp
-            if time_str.replace('.', '').isdigit():
-                return float(time_str)
-            
-            # Try other formats
-            for fmt in ['%Y-%m-%d %H:%M:%S', '%Y-%m-%d %H:%M:%S.%f']:
-                try:
-                    dt = datetime.strptime(time_str, fmt)
-                    return dt.timestamp()
-                except:
-                    continue
-            
-            return fallback_time
-        except:
-            return fallback_time
+        Args:
+            entries: Buffered prints, oldest first (seq ascending)
+            window_start: Oldest print time kept (None = no time bound)
+            now: Time assigned to prints without a parseable time
+            min_seq: Oldest print seq kept (count-bounded windows)
+        """
+        if not entries:
+            self._reset(float('-inf'), True)
+            return
+        start = float('-inf') if window_start is None else window_start
+        floating_in = now >= start
+        floor_seq = entries[0].seq if min_seq is None else max(entries[0].seq, min_seq)
+        
+        if self._next_seq is None or start < self.window_start or floating_in != self._floating_in:
+            # Window grew backwards (or first sync): rebuild from the buffer
+            self._reset(start, floating_in)
+            for entry in entries:
+                if entry.seq >= floor_seq:
+                    self._admit(entry)
+        else:
+            self.window_start = start
+            # Dropped from the buffer / beyond the print count
+            prints = self.prints
+            while prints:
+                seq = next(iter(prints))
+                if seq >= floor_seq:
+                    break
+                self._evict(seq)
+            # New prints
+            new = []
+            for entry in reversed(entries):
+                if entry.seq < self._next_seq:
+                    break
+                new.append(entry)
+            for entry in reversed(new):
+                if entry.seq >= floor_seq:
+                    self._admit(entry)
+            # Aged out of the window
+            ts_heap = self._ts_heap
+            while ts_heap and ts_heap[0][0] < start:
+                _, seq = heapq.heappop(ts_heap)
+                if seq in prints:
+                    self._evict(seq)
+            if len(ts_heap) > 2 * len(prints) + 64:
+                self._ts_heap = [(e.ts, e.seq) for e in prints.values() if e.ts is not None]
+                heapq.heapify(self._ts_heap)
+        self._next_seq = entries[-1].seq + 1
+    
+    def _reset(self, start: float, floating_in: bool) -> None:
+        self.prints = {}
+        self.histogram = PriceHistogram()
+        self._ts_heap = []
+        self._next_seq = None
+        self.window_start = start
+        self._floating_in = floating_in
+    
+    def _admit(self, entry: _PrintEntry) -> None:
+        if entry.ts is None:
+            if not self._floating_in:
+                return
+        elif entry.ts < self.window_start:
+            return
+        else:
+            heapq.heappush(self._ts_heap, (entry.ts, entry.seq))
+        self.prints[entry.seq] = entry
+        if entry.counted:
+            self.histogram.add(entry)
+    
+    def _evict(self, seq: int) -> None:
+        entry = self.prints.pop(seq)
+        if entry.counted:
+            self.histogram.remove(entry)
+    
+    @staticmethod
+    def _parse_timestamp(time_str: Optional[str], fallback_time: float) -> Optional[float]:
+        """Parse timestamp string to unix timestamp"""
+        return parse_print_time(time_str, fallback_time)
 
 
 class GRPANEngine:
@@ -136,8 +299,13 @@ class GRPANEngine:
         # Stores last 150 ticks for rolling window calculations
         self.extended_prints_store: Dict[str, deque] = {}
         
-        # Rolling window states: {symbol: {window_name: GRPANWindowState}}
+        # Parsed twin of extended_prints_store: {symbol: deque(maxlen=150) of _PrintEntry}
+        self._print_entries: Dict[str, deque] = {}
+        self._print_seq = 0
+        
+        # Window states: {symbol: {window_name: GRPANWindowState}} (latest_pan + rolling)
         self.rolling_window_states: Dict[str, Dict[str, GRPANWindowState]] = {}
+        self._windows_lock = threading.Lock()
         
         # Bootstrap state: {symbol: bool} - tracks if symbol has been bootstrapped
         self.bootstrap_state: Dict[str, bool] = {}
@@ -184,21 +352,33 @@ class GRPANEngine:
         # self.start_compute_loop()  # DISABLED - call manually when needed
     
     def _get_rolling_window_states_for_symbol(self, symbol: str) -> Dict[str, GRPANWindowState]:
-        """Get or create rolling window states for a symbol"""
+        """Get or create window states (latest_pan + rolling windows) for a symbol"""
         if symbol not in self.rolling_window_states:
-            self.rolling_window_states[symbol] = {
-                window_name: GRPANWindowState(window_name, window_seconds)
-                for window_name, window_seconds in self.ROLLING_WINDOWS.items()
-            }
+            states = {'latest_pan': GRPANWindowState('latest_pan', 0)}
+            for window_name, window_seconds in self.ROLLING_WINDOWS.items():
+                states[window_name] = GRPANWindowState(window_name, window_seconds)
+            self.rolling_window_states[symbol] = states
         return self.rolling_window_states[symbol]
     
+    def _make_entry(self, seq: int, print_data: Dict[str, Any]) -> _PrintEntry:
+        """Parse a print once: time, price, size, weight"""
+        size = float(print_data.get('size', 0))
+        return _PrintEntry(
+            seq,
+            print_time(print_data),
+            float(print_data.get('price', 0)),
+            size,
+            round(self._get_weight(size, print_data.get('venue', 'UNKNOWN')) * WEIGHT_SCALE),
+            size >= self.min_lot_size
+        )
+    
     def add_trade_print(self, symbol: str, print_data: Dict[str, Any]):
         """
         Add a trade print to the store (EVENT-DRIVEN, LAZY COMPUTE).
         
         This method:
         1. Adds print to latest_pan ring buffer (O(1))
-        2. Adds print to all rolling windows (O(1) per window)
+        2. Adds print to the extended buffer, parsed once for the windows (O(1))
         3. Updates last price cache
         4. Marks symbol as dirty (O(1))
         5. Compute loop will batch-process dirty symbols
@@ -213,7 +393,6 @@ class GRPANEngine:
             if size < self.min_lot_size:
                 return  # Ignore tiny prints
             
-            current_time = time.time()
             price = float(print_data.get('price', 0))
             
             # Update last price cache (for deviation calculation)
@@ -227,23 +406,13 @@ class GRPANEngine:
             
             # Add to extended_prints_store (last 150 ticks for rolling windows)
             if symbol not in self.extended_prints_store:
-                self.extended_prints_store[symbol] = deque(maxlen=150)
+                self.extended_prints_store[symbol] = deque(maxlen=EXTENDED_PRINTS)
+                self._print_entries[symbol] = deque(maxlen=EXTENDED_PRINTS)
             self.extended_prints_store[symbol].append(print_data)
             
-            # Add to all rolling windows (timestamp-based, but only from extended_prints_store)
-            rolling_states = self._get_rolling_window_states_for_symbol(symbol)
-            added_to_windows = []
-            for window_name, window_state in rolling_states.items():
-                if window_state.add_print(print_data, current_time):
-                    added_to_windows.append(window_name)
-            
-            # Debug: Log which windows received the print
-            if len(added_to_windows) < len(rolling_states):
-                skipped_windows = [w for w in rolling_states.keys() if w not in added_to_windows]
-                logger.debug(
-                    f"GRPAN {symbol}: Print added to {len(added_to_windows)}/{len(rolling_states)} windows. "
-                    f"Skipped: {skipped_windows} (likely outside time window)"
-                )
+            # Parsed once here; windows pick it up incrementally on the next compute
+            self._print_seq += 1
+            self._print_entries[symbol].append(self._make_entry(self._print_seq, print_data))
             
             # Mark symbol as dirty (O(1))
             with self._dirty_lock:
@@ -327,7 +496,9 @@ class GRPANEngine:
         prev_grpan_price: Optional[float] = None
     ) -> Dict[str, Any]:
         """
-        Compute GRPAN for a list of prints (shared logic for latest_pan and rolling windows).
+        Compute GRPAN for an arbitrary list of prints (one-shot).
+        
+        latest_pan and rolling windows use their incremental histograms instead.
         
         Args:
             prints: List of print dicts
@@ -337,52 +508,42 @@ class GRPANEngine:
         Returns:
             GRPAN metrics dict
         """
-        # Filter: size >= min_lot_size
-        filtered_prints = [
-            p for p in prints 
-            if p.get('size', 0) >= self.min_lot_size
-        ]
-        
-        if not filtered_prints:
-            return self._empty_grpan_result(f'No prints with size >= {self.min_lot_size}')
-        
-        # Calculate weighted price frequency
-        price_frequency: Dict[float, float] = defaultdict(float)
-        total_lots = 0
+        histogram = PriceHistogram()
+        for seq, print_data in enumerate(prints):
+            if print_data.get('size', 0) >= self.min_lot_size:
+                histogram.add(self._make_entry(seq, print_data))
+        return self._grpan_result(histogram, len(prints), last_price, prev_grpan_price)
+    
+    def _grpan_result(
+        self,
+        histogram: PriceHistogram,
+        total_prints: int,
+        last_price: Optional[float] = None,
+        prev_grpan_price: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        GRPAN metrics from a window histogram (O(log n) + top-10 ranking).
         
-        for print_data in filtered_prints:
-            price = float(print_data.get('price', 0))
-            size = float(print_data.get('size', 0))
-            venue = print_data.get('venue', 'UNKNOWN')
-            weight = self._get_weight(size, venue)
+        Args:
+            histogram: Weighted histogram of the window's prints (size >= min_lot_size)
+            total_prints: All prints in the window (before the lot size filter)
+            last_price: Last price for deviation calculation
+            prev_grpan_price: Previous GRPAN price for deviation calculation
             
-            # Add weighted frequency
-            price_frequency[price] += weight
-            total_lots += size
-        
-        # Find dominant price (highest weighted frequency)
-        if not price_frequency:
-            return self._empty_grpan_result('No valid price frequency calculated')
-        
-        # Sort by weighted frequency (descending)
-        sorted_prices = sorted(
-            price_frequency.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )
+        Returns:
+            GRPAN metrics dict
+        """
+        if not histogram.count:
+            return self._empty_grpan_result(f'No prints with size >= {self.min_lot_size}')
         
-        grpan_price = sorted_prices[0][0]  # Dominant price
+        # Dominant price (highest weighted frequency) and top 10 by frequency
+        grpan_price = histogram.dominant()
+        sorted_prices = histogram.top(10)
         
         # Calculate concentration % (±0.04 range)
-        concentration_count = 0
-        total_prints = len(filtered_prints)
-        
-        for print_data in filtered_prints:
-            price = float(print_data.get('price', 0))
-            if abs(price - grpan_price) <= self.concentration_range:
-                concentration_count += 1
-        
-        concentration_percent = (concentration_count / total_prints * 100) if total_prints > 0 else 0.0
+        concentration_count = histogram.count_within(grpan_price, self.concentration_range)
+        total_lots = histogram.total_lots
+        concentration_percent = concentration_count / histogram.count * 100
         
         # Calculate deviations
         deviation_vs_last = None
@@ -403,12 +564,12 @@ class GRPANEngine:
             },
             'concentration_percent': round(concentration_percent, 2),
             'real_lot_count': round(total_lots, 2),
-            'print_count': len(filtered_prints),
+            'print_count': histogram.count,
             'deviation_vs_last': round(deviation_vs_last, 4) if deviation_vs_last is not None else None,
             'deviation_vs_prev_window': round(deviation_vs_prev_window, 4) if deviation_vs_prev_window is not None else None,
             'breakdown': {
-                'total_prints': len(prints),
-                'filtered_prints': len(filtered_prints),
+                'total_prints': total_prints,
+                'filtered_prints': histogram.count,
                 'min_lot_size': self.min_lot_size,
                 'concentration_range': self.concentration_range,
                 'weights': {
@@ -435,26 +596,35 @@ class GRPANEngine:
         Returns:
             Dict mapping window_name -> GRPAN metrics
         """
+        # Window states are mutated by sync(): compute loop and lazy init must not interleave
+        with self._windows_lock:
+            return self._compute_grpan_windows(symbol)
+    
+    def _compute_grpan_windows(self, symbol: str) -> Dict[str, Dict[str, Any]]:
         try:
             current_time = time.time()
             last_price = self.last_price_cache.get(symbol)
             
             results: Dict[str, Dict[str, Any]] = {}
             
-            # Compute latest_pan (backward compatible)
-            prints_deque = self.trade_prints_store.get(symbol)
-            if prints_deque:
-                prints = list(prints_deque)
-                latest_result = self._compute_grpan_for_prints(prints, last_price=last_price)
-                results['latest_pan'] = latest_result
+            # Snapshot of the parsed buffer (C-level copy; add_trade_print may append concurrently)
+            entries = list(self._print_entries.get(symbol, ()))
+            states = self._get_rolling_window_states_for_symbol(symbol)
+            
+            # Compute latest_pan (backward compatible): last max_prints prints, no time bound
+            if entries:
+                latest_state = states['latest_pan']
+                latest_min_seq = entries[-self.max_prints].seq if len(entries) > self.max_prints else None
+                latest_state.sync(entries, None, current_time, min_seq=latest_min_seq)
+                results['latest_pan'] = self._grpan_result(
+                    latest_state.histogram, len(latest_state.prints), last_price=last_price
+                )
             else:
                 results['latest_pan'] = self._empty_grpan_result('No trade prints available')
             
             # Compute rolling windows from extended_prints_store (last 150 ticks)
             # Use TRADING-TIME aware filtering (not wall-clock time)
-            extended_prints = list(self.extended_prints_store.get(symbol, deque()))
-            
-            if len(extended_prints) == 0:
+            if len(entries) == 0:
                 # No extended prints yet - mark as loading
                 for window_name in ['pan_10m', 'pan_30m', 'pan_1h', 'pan_3h', 'pan_1d', 'pan_3d']:
                     results[window_name] = self._empty_grpan_result('Loading... (bootstrap in progress)')
@@ -462,15 +632,10 @@ class GRPANEngine:
                 # Get trading-time aware "now"
                 trading_calendar = get_trading_calendar()
                 
-                # Get last trade timestamp from extended_prints (most recent)
-                last_trade_ts = None
-                if extended_prints:
-                    last_print = extended_prints[-1]
-                    # Use GRPANWindowState's _parse_timestamp method (same logic)
-                    window_state_temp = GRPANWindowState('temp', 60)
-                    last_trade_ts = window_state_temp._parse_timestamp(last_print.get('time'), current_time)
-                    if last_trade_ts is None:
-                        last_trade_ts = current_time
+                # Get last trade timestamp from the most recent print
+                last_trade_ts = entries[-1].ts
+                if last_trade_ts is None:
+                    last_trade_ts = current_time
                 
                 # Get trading-time "now" (market closed = last trade time, market open = real time)
                 trading_time_now = trading_calendar.get_trading_time_now(last_trade_ts)
@@ -501,32 +666,29 @@ class GRPANEngine:
                         # If market closed, window is relative to last trade time
                         window_start = trading_time_now - window_seconds
                     
-                    # Filter prints within window from extended_prints_store
-                    window_prints = []
-                    # Use GRPANWindowState's _parse_timestamp method (same logic)
-                    window_state_temp = GRPANWindowState('temp', 60)
-                    for print_data in extended_prints:
-                        print_time = window_state_temp._parse_timestamp(print_data.get('time'), trading_time_now)
-                        if print_time is not None and print_time >= window_start:
-                            window_prints.append(print_data)
+                    # Incremental update: new prints in, aged-out / dropped prints out
+                    window_state = states[window_name]
+                    window_state.sync(entries, window_start, trading_time_now)
                     
                     # Debug: Log window state
-                    if len(window_prints) == 0:
+                    if len(window_state.prints) == 0:
                         logger.debug(
                             f"GRPAN {symbol} {window_name}: No prints in window "
-                            f"(window_size={window_seconds/60:.0f}min, extended_prints={len(extended_prints)}, "
+                            f"(window_size={window_seconds/60:.0f}min, extended_prints={len(entries)}, "
                             f"trading_time_now={trading_time_now:.0f}, window_start={window_start:.0f})"
                         )
                     
                     # Compute GRPAN for this window
-                    window_result = self._compute_grpan_for_prints(
-                        window_prints,
+                    window_result = self._grpan_result(
+                        window_state.histogram,
+                        len(window_state.prints),
                         last_price=last_price,
                         prev_grpan_price=prev_window_grpan
                     )
+                    window_state.last_computed = window_result
                     
                     # If no data but we have extended prints, try to use cached value (stable during market closed)
-                    if window_result.get('grpan_price') is None and len(extended_prints) > 0:
+                    if window_result.get('grpan_price') is None and len(entries) > 0:
                         # Check if we have cached value from previous computation
                         cached_result = self.grpan_cache.get(symbol, {}).get(window_name)
                         if cached_result and cached_result.get('grpan_price') is not None:
@@ -555,6 +717,7 @@ class GRPANEngine:
             
         except Exception as e:
             logger.error(f"Error computing GRPAN for {symbol}: {e}", exc_info=True)
+            self.rolling_window_states.pop(symbol, None)  # Rebuilt from the buffer next time
             return {'latest_pan': self._empty_grpan_result(str(e))}
     
     def _empty_grpan_result(self, error_msg: str) -> Dict[str, Any]:
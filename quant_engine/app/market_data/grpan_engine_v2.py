@@ -21,12 +21,12 @@ Features:
 
 from typing import Dict, Any, Optional, List, Set, Tuple
 from collections import defaultdict, deque
-from datetime import datetime, timedelta
 import threading
 import time
 import re
 
 from app.core.logger import logger
+from app.market_data.trade_print import parse_print_time, print_time
 
 
 class GRPANWindowState:
@@ -41,13 +41,13 @@ class GRPANWindowState:
     
     def add_print(self, print_data: Dict[str, Any], current_time: float):
         """Add print if within window"""
-        print_time = self._parse_timestamp(print_data.get('time'), current_time)
-        if print_time is None:
+        print_ts = print_time(print_data, current_time)
+        if print_ts is None:
             return False
         
         window_start = current_time - self.window_seconds
-        if print_time >= window_start:
-            self.prints.append((print_time, print_data))
+        if print_ts >= window_start:
+            self.prints.append((print_ts, print_data))
             return True
         return False
     
@@ -59,30 +59,7 @@ class GRPANWindowState:
     
     def _parse_timestamp(self, time_str: Optional[str], fallback_time: float) -> Optional[float]:
         """Parse timestamp string to unix timestamp"""
-        if time_str is None:
-            return fallback_time
-        
-        try:
-            # Try ISO format first
-            if 'T' in time_str:
-                dt = datetime.fromisoformat(time_str.replace('Z', '+00:00'))
-                return dt.timestamp()
-            
-            # Try unix timestamp
-            if time_str.isdigit() or '.' in time_str:
-                return float(time_str)
-            
-            # Try other formats
-            for fmt in ['%Y-%m-%d %H:%M:%S', '%Y-%m-%d %H:%M:%S.%f']:
-                try:
-                    dt = datetime.strptime(time_str, fmt)
-                    return dt.timestamp()
-                except:
-                    continue
-            
-            return fallback_time
-        except:
-            return fallback_time
+        return parse_print_time(time_str, fallback_time)
 
 
 class GRPANEngineV2:
@@ -13,15 +13,135 @@ Metrics computed:
 Note: GRPAN, BGGG, ETF Cardinal are stubbed for future implementation.
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple, Iterable, Set
+import bisect
 import json
+import math
 from collections import defaultdict
+
+import numpy as np
 from app.core.logger import logger
 from app.market_data.grouping import resolve_group_key
 from app.market_data.benchmark_engine import BenchmarkEngine, get_benchmark_engine
 from app.core.redis_client import get_redis_client
 
 
+def _is_valid_score(value: Any) -> bool:
+    """Janall N/A rule: only finite positive numbers count (Final_FB / Final_SFS)"""
+    return (value is not None and isinstance(value, (int, float)) and value > 0 and
+            value == value and value != float('inf') and value != float('-inf'))
+
+
+class GroupAggregate:
+    """
+    Running aggregates for one group (incremental group metrics).
+    
+    Keeps the sums/counts behind the group averages and sorted
+    Final_FB / Final_SFS lists (order statistics for the Fbtot/SFStot
+    rank), so one symbol update costs O(log n) instead of regrouping the
+    whole universe. Inclusion rules are the same as compute_group_metrics.
+    
+    Running sums are re-anchored every RESYNC_EVERY updates to keep
+    floating-point drift below the rounding of the published averages.
+    """
+    
+    FIELDS = ('sma63chg', 'sma246chg', 'daily_chg', 'final_fb', 'final_sfs')
+    RESYNC_EVERY = 512
+    
+    def __init__(self):
+        self.members: Dict[str, Dict[str, Any]] = {}  # {symbol: inputs}
+        self.sums: Dict[str, float] = dict.fromkeys(self.FIELDS, 0.0)
+        self.counts: Dict[str, int] = dict.fromkeys(self.FIELDS, 0)
+        self.nonfinite: Dict[str, int] = dict.fromkeys(self.FIELDS, 0)  # NaN/inf → exact fallback
+        self.sorted_values: Dict[str, List[float]] = {'final_fb': [], 'final_sfs': []}
+        self._updates = 0
+    
+    @staticmethod
+    def _accepts(field: str, value: Any) -> bool:
+        """Same inclusion rules as compute_group_metrics"""
+        if field in ('final_fb', 'final_sfs'):
+            return _is_valid_score(value)
+        if field == 'daily_chg':
+            # Exclude extreme outliers (>$5 daily change is unusual for preferred stocks)
+            return value is not None and isinstance(value, (int, float)) and abs(value) < 5.0
+        return value is not None
+    
+    def _apply(self, inputs: Dict[str, Any], sign: int) -> None:
+        for field in self.FIELDS:
+            value = inputs.get(field)
+            if not self._accepts(field, value):
+                continue
+            self.counts[field] += sign
+            if math.isfinite(value):
+                self.sums[field] += sign * value
+            else:
+                self.nonfinite[field] += sign
+            values = self.sorted_values.get(field)
+            if values is not None:
+                if sign > 0:
+                    bisect.insort(values, value)
+                else:
+                    del values[bisect.bisect_left(values, value)]
+    
+    def add(self, symbol: str, inputs: Dict[str, Any]) -> None:
+        """Add symbol inputs to the group"""
+        self.members[symbol] = inputs
+        self._apply(inputs, 1)
+        self._tick()
+    
+    def remove(self, symbol: str) -> None:
+        """Remove symbol inputs from the group"""
+        inputs = self.members.pop(symbol, None)
+        if inputs is not None:
+            self._apply(inputs, -1)
+            self._tick()
+    
+    def _tick(self) -> None:
+        self._updates += 1
+        if self._updates >= self.RESYNC_EVERY:
+            self._updates = 0
+            for field in self.FIELDS:
+                self.sums[field] = math.fsum(
+                    v for v in self._accepted_values(field) if math.isfinite(v)
+                )
+    
+    def _accepted_values(self, field: str) -> List[float]:
+        return [inp.get(field) for inp in self.members.values() if self._accepts(field, inp.get(field))]
+    
+    def average(self, field: str) -> Optional[float]:
+        """Unrounded group average (None if no value qualifies)"""
+        count = self.counts[field]
+        if count == 0:
+            return None
+        if self.nonfinite[field]:
+            values = self._accepted_values(field)
+            return sum(values) / len(values)
+        return self.sums[field] / count
+    
+    def rank(self, field: str, value: float) -> int:
+        """How many valid group values are <= value"""
+        return bisect.bisect_right(self.sorted_values[field], value)
+    
+    def to_stats(self) -> Dict[str, Any]:
+        """Group stats in the compute_group_metrics format"""
+        def _rounded(field: str, digits: int) -> Optional[float]:
+            avg = self.average(field)
+            return round(avg, digits) if avg is not None else None
+        
+        return {
+            'symbol_count': len(self.members),
+            'group_avg_sma63': _rounded('sma63chg', 4),
+            'group_avg_sma246': _rounded('sma246chg', 4),
+            'group_avg_final_fb': _rounded('final_fb', 2),
+            'group_avg_final_sfs': _rounded('final_sfs', 2),
+            'group_avg_daily_chg': _rounded('daily_chg', 4),
+            'group_avg_price': None,
+            'daily_chg_count': self.counts['daily_chg'],
+            'final_fb_values': list(self.sorted_values['final_fb']),
+            'final_sfs_values': list(self.sorted_values['final_sfs'])
+        }
+
+
 class JanallMetricsEngine:
     """
     Computes Janall-derived metrics for symbols.
@@ -39,6 +159,10 @@ class JanallMetricsEngine:
         # Symbol metrics cache (updated in batch)
         self.symbol_metrics_cache: Dict[str, Dict[str, Any]] = {}  # {symbol: metrics}
         
+        # Incremental group aggregates (updated per dirty symbol)
+        self._group_aggregates: Dict[str, GroupAggregate] = {}  # {group_key: aggregate}
+        self._group_inputs: Dict[str, Dict[str, Any]] = {}  # {symbol: inputs}
+        
         # Stub flags for future features
         self.grpan_enabled = False  # TODO: Requires tick data store
         self.bggg_enabled = False  # TODO: Requires tick data store
@@ -764,6 +888,247 @@ class JanallMetricsEngine:
             logger.error(f"Error applying group overlays: {e}", exc_info=True)
             return symbol_metrics
     
+    def compute_group_overlays_columnar(
+        self,
+        group_keys: List[Optional[str]],
+        final_fb: np.ndarray,
+        final_sfs: np.ndarray,
+        daily_chg: np.ndarray,
+        sma63chg: np.ndarray,
+        sma246chg: np.ndarray,
+        sma63_present: Optional[np.ndarray] = None,
+        sma246_present: Optional[np.ndarray] = None
+    ) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, np.ndarray]]:
+        """
+        Vectorized compute_group_metrics + apply_group_overlays for a whole universe.
+        
+        Same formulas as the scalar pair (parity-tested), but one pass:
+        symbols are factorized by group key, each group is a contiguous
+        index segment and Fbtot/SFStot ranks come from searchsorted on the
+        sorted valid values instead of an O(n) scan per symbol.
+        
+        Args:
+            group_keys: Group key per symbol (None = no group)
+            final_fb, final_sfs: Final_FB / Final_SFS per symbol (NaN = None)
+            daily_chg: last - prev_close per symbol (NaN = None)
+            sma63chg, sma246chg: Static SMA changes
+            sma63_present, sma246_present: "not None" masks for the SMA
+                inputs (default: not NaN). The scalar path treats a CSV NaN
+                as a present value, so callers pass explicit masks for parity.
+            
+        Returns:
+            (group_stats, overlays) where overlays has per-symbol arrays
+            'fbtot', 'sfstot', 'gort', 'bench_chg' (NaN = None, unrounded
+            except bench_chg), 'has_group' (bool) and 'daily_chg_count' (int).
+        """
+        n = len(group_keys)
+        overlays = {
+            'fbtot': np.full(n, np.nan),
+            'sfstot': np.full(n, np.nan),
+            'gort': np.full(n, np.nan),
+            'bench_chg': np.full(n, np.nan),
+            'has_group': np.zeros(n, dtype=bool),
+            'daily_chg_count': np.zeros(n, dtype=np.int64),
+        }
+        group_stats: Dict[str, Dict[str, Any]] = {}
+        if n == 0:
+            return group_stats, overlays
+        
+        # Factorize group keys (first-appearance order, like defaultdict)
+        codes = np.empty(n, dtype=np.int64)
+        key_to_code: Dict[str, int] = {}
+        for i, key in enumerate(group_keys):
+            if key:
+                codes[i] = key_to_code.setdefault(key, len(key_to_code))
+            else:
+                codes[i] = -1
+        
+        order = np.argsort(codes, kind='stable')
+        sorted_codes = codes[order]
+        boundaries = np.searchsorted(sorted_codes, np.arange(len(key_to_code) + 1))
+        
+        fb_valid = np.isfinite(final_fb) & (final_fb > 0)
+        sfs_valid = np.isfinite(final_sfs) & (final_sfs > 0)
+        daily_valid = ~np.isnan(daily_chg) & (np.abs(daily_chg) < 5.0)
+        if sma63_present is None:
+            sma63_present = ~np.isnan(sma63chg)
+        if sma246_present is None:
+            sma246_present = ~np.isnan(sma246chg)
+        
+        def _avg(values: np.ndarray) -> Optional[float]:
+            # Sequential Python sum → bit-identical with the scalar path
+            if len(values) == 0:
+                return None
+            return sum(values.tolist()) / len(values)
+        
+        for group_key, code in key_to_code.items():
+            idx = order[boundaries[code]:boundaries[code + 1]]
+            
+            avg_sma63 = _avg(sma63chg[idx][sma63_present[idx]])
+            avg_sma246 = _avg(sma246chg[idx][sma246_present[idx]])
+            daily_values = daily_chg[idx][daily_valid[idx]]
+            avg_daily = _avg(daily_values)
+            fb_values = final_fb[idx][fb_valid[idx]]
+            sfs_values = final_sfs[idx][sfs_valid[idx]]
+            avg_fb = _avg(fb_values)
+            avg_sfs = _avg(sfs_values)
+            
+            stats = {
+                'symbol_count': len(idx),
+                'group_avg_sma63': round(avg_sma63, 4) if avg_sma63 is not None else None,
+                'group_avg_sma246': round(avg_sma246, 4) if avg_sma246 is not None else None,
+                'group_avg_final_fb': round(avg_fb, 2) if avg_fb is not None else None,
+                'group_avg_final_sfs': round(avg_sfs, 2) if avg_sfs is not None else None,
+                'group_avg_daily_chg': round(avg_daily, 4) if avg_daily is not None else None,
+                'group_avg_price': None,
+                'daily_chg_count': len(daily_values),
+                'final_fb_values': fb_values.tolist(),
+                'final_sfs_values': sfs_values.tolist()
+            }
+            group_stats[group_key] = stats
+            
+            overlays['has_group'][idx] = True
+            overlays['daily_chg_count'][idx] = stats['daily_chg_count']
+            if stats['group_avg_daily_chg'] is not None:
+                overlays['bench_chg'][idx] = stats['group_avg_daily_chg']
+            
+            # GORT (group averages, or own SMAs as fallback)
+            gort_idx = idx[sma63_present[idx] & sma246_present[idx]]
+            g63 = stats['group_avg_sma63']
+            g246 = stats['group_avg_sma246']
+            if g63 is not None and g246 is not None:
+                overlays['gort'][gort_idx] = (0.25 * (sma63chg[gort_idx] - g63)) + (0.75 * (sma246chg[gort_idx] - g246))
+            else:
+                overlays['gort'][gort_idx] = (0.25 * sma63chg[gort_idx]) + (0.75 * sma246chg[gort_idx])
+            
+            # Fbtot / SFStot = rank/total * 1.0 + value/avg * 1.0 [Balanced]
+            for values, valid, avg, out in (
+                (final_fb, fb_valid, stats['group_avg_final_fb'], overlays['fbtot']),
+                (final_sfs, sfs_valid, stats['group_avg_final_sfs'], overlays['sfstot']),
+            ):
+                if avg is None or avg <= 0:
+                    continue
+                member_idx = idx[valid[idx]]
+                if len(member_idx) == 0:
+                    continue
+                sorted_values = np.sort(values[member_idx])
+                ranks = np.searchsorted(sorted_values, values[member_idx], side='right')
+                total_count = len(sorted_values)
+                out[member_idx] = (ranks / total_count) * 1.0 + (values[member_idx] / avg) * 1.0
+        
+        return group_stats, overlays
+    
+    # =========================================================================
+    # INCREMENTAL GROUP METRICS (dirty-symbol driven)
+    # =========================================================================
+    
+    def reset_group_aggregates(self) -> None:
+        """Drop all incremental group state (e.g. after static reload)"""
+        self._group_aggregates = {}
+        self._group_inputs = {}
+    
+    def has_group_aggregates(self) -> bool:
+        """True once incremental group state has been seeded"""
+        return bool(self._group_inputs)
+    
+    def update_group_inputs(self, updates: Dict[str, Optional[Dict[str, Any]]]) -> Set[str]:
+        """
+        Upsert per-symbol group inputs into the running group aggregates.
+        
+        Args:
+            updates: {symbol: inputs or None}. inputs keys: group_key,
+                final_fb, final_sfs, daily_chg, sma63chg, sma246chg
+                (same meaning as in compute_group_metrics). None removes
+                the symbol (no static/live anymore).
+            
+        Returns:
+            Group keys whose stats changed (old and new group of each symbol)
+        """
+        touched: Set[str] = set()
+        for symbol, inputs in updates.items():
+            old = self._group_inputs.pop(symbol, None)
+            if old is not None and old.get('group_key'):
+                old_key = old['group_key']
+                aggregate = self._group_aggregates.get(old_key)
+                if aggregate is not None:
+                    aggregate.remove(symbol)
+                    if not aggregate.members:
+                        del self._group_aggregates[old_key]
+                touched.add(old_key)
+            
+            if inputs is None:
+                continue
+            self._group_inputs[symbol] = inputs
+            group_key = inputs.get('group_key')
+            if group_key:
+                aggregate = self._group_aggregates.get(group_key)
+                if aggregate is None:
+                    aggregate = self._group_aggregates[group_key] = GroupAggregate()
+                aggregate.add(symbol, inputs)
+                touched.add(group_key)
+        return touched
+    
+    def get_group_inputs(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Last inputs stored for symbol (None if not tracked)"""
+        return self._group_inputs.get(symbol)
+    
+    def get_incremental_group_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Current group stats from the running aggregates (compute_group_metrics format)"""
+        return {key: agg.to_stats() for key, agg in self._group_aggregates.items()}
+    
+    def compute_group_overlays_incremental(self, group_keys: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Re-rank the given groups from the running aggregates.
+        
+        Same formulas as apply_group_overlays (GORT, Fbtot, SFStot, group
+        bench_chg), evaluated for every member of the touched groups only.
+        
+        Returns:
+            {symbol: {'fbtot', 'sfstot', 'gort', 'bench_chg', 'bench_source', 'daily_chg'}}
+        """
+        overlays: Dict[str, Dict[str, Any]] = {}
+        for group_key in group_keys:
+            aggregate = self._group_aggregates.get(group_key)
+            if aggregate is None:
+                continue
+            stats = aggregate.to_stats()
+            group_avg_sma63 = stats['group_avg_sma63']
+            group_avg_sma246 = stats['group_avg_sma246']
+            bench_source = f"Group: {group_key} (n={stats['daily_chg_count']})"
+            
+            for symbol, inputs in aggregate.members.items():
+                sma63chg = inputs.get('sma63chg')
+                sma246chg = inputs.get('sma246chg')
+                gort = None
+                if sma63chg is not None and sma246chg is not None:
+                    if group_avg_sma63 is not None and group_avg_sma246 is not None:
+                        gort = (0.25 * (sma63chg - group_avg_sma63)) + (0.75 * (sma246chg - group_avg_sma246))
+                    else:
+                        gort = (0.25 * sma63chg) + (0.75 * sma246chg)
+                    gort = round(gort, 4)
+                
+                # Fbtot / SFStot = rank/total * 1.0 + value/avg * 1.0 [Balanced]
+                totals = {}
+                for field, avg_key in (('final_fb', 'group_avg_final_fb'), ('final_sfs', 'group_avg_final_sfs')):
+                    value = inputs.get(field)
+                    group_avg = stats[avg_key]
+                    total_count = aggregate.counts[field]
+                    totals[field] = None
+                    if (_is_valid_score(value) and group_avg is not None and group_avg > 0 and
+                            total_count > 0):
+                        plagr = aggregate.rank(field, value) / total_count
+                        totals[field] = round(plagr * 1.0 + (value / group_avg) * 1.0, 4)
+                
+                overlays[symbol] = {
+                    'fbtot': totals['final_fb'],
+                    'sfstot': totals['final_sfs'],
+                    'gort': gort,
+                    'bench_chg': stats['group_avg_daily_chg'],
+                    'bench_source': bench_source,
+                    'daily_chg': inputs.get('daily_chg'),
+                }
+        return overlays
+    
     def compute_batch_metrics(
         self,
         symbols: List[str],
@@ -0,0 +1,222 @@
+"""
+L1 REDIS PUBLISHER - Write-behind live:{symbol} publisher
+=========================================================
+
+🟢 FAST PATH COMPONENT
+
+update_market_data_cache her Hammer L1Update'inde publish() çağırır;
+Redis'e Hammer socket thread'i dışında toplu yazılır.
+
+1. publish() sadece memory'ye dokunur: sembol başına EN SON L1 tutulur
+   (aynı sembol flush'tan önce tekrar gelirse eskisinin üzerine yazılır →
+   coalesced sayacı).
+2. Tek bir flusher thread her L1_PUBLISH_FLUSH_MS'de bekleyen map'i swap
+   eder ve tek pipeline'da HSET + EXPIRE (tek TTL: LIVE_TTL_SEC) yazar.
+3. Pipeline hata verirse yazılamayan semboller (yeni veri gelmediyse)
+   tekrar kuyruğa alınır.
+
+Stats: queue depth, en eski bekleyen update yaşı, flush latency,
+coalesced / dropped sayaçları (GET /api/market-data/l1-publisher-stats).
+"""
+
+import threading
+import time
+from typing import Dict, Any, Optional
+
+from app.config.settings import settings
+from app.core.logger import logger
+from app.core.redis_keys import RedisKeys
+
+
+class L1RedisPublisher:
+    """
+    Coalescing write-behind publisher for live:{symbol} hashes.
+
+    Thread-safe. The worker thread is started lazily on the first publish().
+    """
+
+    LIVE_TTL_SEC = 3600  # 60 minutes (keep data fresh but allow expiration if feed dies)
+    PIPELINE_SYMBOLS = 500  # Symbols per pipeline execute
+    MAX_PENDING = 20000  # Distinct symbols waiting for a flush (beyond this, new symbols are dropped)
+
+    def __init__(self, flush_interval_ms: Optional[int] = None, write_behind: Optional[bool] = None):
+        """
+        Args:
+            flush_interval_ms: Flush period (default settings.L1_PUBLISH_FLUSH_MS)
+            write_behind: False = flush inline on every publish (default settings.L1_WRITE_BEHIND)
+        """
+        interval_ms = flush_interval_ms if flush_interval_ms is not None else settings.L1_PUBLISH_FLUSH_MS
+        self.flush_interval = max(interval_ms, 1) / 1000.0
+        self.write_behind = settings.L1_WRITE_BEHIND if write_behind is None else write_behind
+
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._pending_since: Optional[float] = None  # monotonic time of oldest unflushed update
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()  # One flush at a time (worker vs inline/forced)
+        self._start_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self._stats = {
+            'published': 0,
+            'coalesced': 0,
+            'dropped': 0,
+            'flushes': 0,
+            'symbols_written': 0,
+            'errors': 0,
+            'last_batch': 0,
+            'last_flush_ms': 0.0,
+            'max_flush_ms': 0.0,
+            'total_flush_ms': 0.0,
+        }
+
+    # =========================================================================
+    # PUBLISH (feed thread - memory only)
+    # =========================================================================
+
+    def publish(self, symbol: str, data: Dict[str, Any]) -> None:
+        """Queue the latest L1 for symbol (replaces any unflushed update)"""
+        with self._lock:
+            if symbol in self._pending:
+                self._stats['coalesced'] += 1
+            elif len(self._pending) >= self.MAX_PENDING:
+                self._stats['dropped'] += 1
+                return
+            elif self._pending_since is None:
+                self._pending_since = time.monotonic()
+            self._pending[symbol] = dict(data)
+            self._stats['published'] += 1
+
+        if self.write_behind:
+            self.start()
+        else:
+            self.flush()
+
+    # =========================================================================
+    # FLUSH
+    # =========================================================================
+
+    def flush(self) -> int:
+        """
+        Write all pending updates in pipelined batches.
+
+        Returns:
+            Number of symbols written
+        """
+        with self._flush_lock:
+            with self._lock:
+                if not self._pending:
+                    return 0
+                batch = self._pending
+                self._pending = {}
+                self._pending_since = None
+
+            r = self._get_redis()
+            if not r:
+                with self._lock:
+                    self._stats['dropped'] += len(batch)
+                return 0
+
+            items = list(batch.items())
+            written = 0
+            started = time.perf_counter()
+            try:
+                for i in range(0, len(items), self.PIPELINE_SYMBOLS):
+                    chunk = items[i:i + self.PIPELINE_SYMBOLS]
+                    pipe = r.pipeline(transaction=False)
+                    for symbol, data in chunk:
+                        # Filter None values (Redis doesn't like them), values as strings
+                        mapping = {k: str(v) for k, v in data.items() if v is not None}
+                        if mapping:
+                            key = RedisKeys.live(symbol)
+                            pipe.hset(key, mapping=mapping)
+                            pipe.expire(key, self.LIVE_TTL_SEC)
+                    pipe.execute()
+                    written += len(chunk)
+            except Exception as e:
+                # Re-queue unwritten symbols unless a newer update already arrived
+                with self._lock:
+                    self._stats['errors'] += 1
+                    for symbol, data in items[written:]:
+                        if symbol not in self._pending:
+                            self._pending[symbol] = data
+                    if self._pending and self._pending_since is None:
+                        self._pending_since = time.monotonic()
+                logger.warning(f"[L1-PUBLISH] Redis flush error ({len(items) - written} symbols re-queued): {e}")
+
+            elapsed_ms = (time.perf_counter() - started) * 1000.0
+            with self._lock:
+                stats = self._stats
+                stats['flushes'] += 1
+                stats['symbols_written'] += written
+                stats['last_batch'] = len(items)
+                stats['last_flush_ms'] = elapsed_ms
+                stats['max_flush_ms'] = max(stats['max_flush_ms'], elapsed_ms)
+                stats['total_flush_ms'] += elapsed_ms
+            return written
+
+    @staticmethod
+    def _get_redis():
+        from app.core.redis_client import get_redis_client
+        return get_redis_client().sync
+
+    # =========================================================================
+    # WORKER
+    # =========================================================================
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats['queue_depth'] = len(self._pending)
+            stats['oldest_pending_ms'] = (
+                (time.monotonic() - self._pending_since) * 1000.0 if self._pending_since is not None else 0.0
+            )
+        total_ms = stats.pop('total_flush_ms')
+        stats['avg_flush_ms'] = total_ms / stats['flushes'] if stats['flushes'] else 0.0
+        stats['flush_interval_ms'] = self.flush_interval * 1000.0
+        stats['write_behind'] = self.write_behind
+        return stats
+
+    def stop(self, flush: bool = True) -> None:
+        """Stop worker thread (optionally flushing what is pending)"""
+        self._running = False
+        self._wake.set()
+        if flush:
+            self.flush()
+
+    def start(self) -> None:
+        """Start worker thread (no-op if running)"""
+        if self._thread is None or not self._thread.is_alive():
+            with self._start_lock:
+                if self._thread is None or not self._thread.is_alive():
+                    self._running = True
+                    self._wake.clear()
+                    self._thread = threading.Thread(
+                        target=self._run, name="L1RedisPublisher", daemon=True
+                    )
+                    self._thread.start()
+
+    def _run(self) -> None:
+        while self._running:
+            self._wake.wait(timeout=self.flush_interval)
+            if not self._running:
+                break
+            try:
+                self.flush()
+            except Exception as e:
+                logger.debug(f"[L1-PUBLISH] Flush failed: {e}")
+
+
+# Global instance
+_l1_publisher: Optional[L1RedisPublisher] = None
+_l1_publisher_lock = threading.Lock()
+
+
+def get_l1_publisher() -> L1RedisPublisher:
+    """Get global L1RedisPublisher instance (singleton)"""
+    global _l1_publisher
+    if _l1_publisher is None:
+        with _l1_publisher_lock:
+            if _l1_publisher is None:
+                _l1_publisher = L1RedisPublisher()
+    return _l1_publisher
@@ -26,6 +26,7 @@ import threading
 
 from app.core.logger import logger
 from app.market_data.trading_calendar import get_trading_calendar
+from app.market_data.trade_print import print_time
 
 
 class RWVAPEngine:
@@ -128,8 +129,7 @@ class RWVAPEngine:
             
             # Get last trade timestamp
             last_print = extended_prints[-1]
-            window_state_temp = self._create_temp_window_state()
-            last_trade_ts = window_state_temp._parse_timestamp(last_print.get('time'), current_time)
+            last_trade_ts = print_time(last_print, current_time)
             if last_trade_ts is None:
                 last_trade_ts = current_time
             
@@ -164,8 +164,8 @@ class RWVAPEngine:
             weighted_price_sum = 0.0
             
             for print_data in extended_prints:
-                print_time = window_state_temp._parse_timestamp(print_data.get('time'), trading_time_now)
-                if print_time is None or print_time < window_start:
+                print_ts = print_time(print_data, trading_time_now)  # Parsed once by TradePrintRouter
+                if print_ts is None or print_ts < window_start:
                     continue
                 
                 price = float(print_data.get('price', 0))
@@ -263,11 +263,6 @@ class RWVAPEngine:
             results[window_name] = self.compute_rwvap(symbol, window_name)
         return results
     
-    def _create_temp_window_state(self):
-        """Create temporary window state for timestamp parsing."""
-        from app.market_data.grpan_engine import GRPANWindowState
-        return GRPANWindowState('temp', 60)
-    
     def _empty_rwvap_result(
         self,
         message: str,
@@ -0,0 +1,257 @@
+"""
+TRUTH TICK PERSISTER - Incremental Redis persistence for TruthTicksEngine
+=========================================================================
+
+🟢 FAST PATH COMPONENT
+
+Tek bir uzun ömürlü flusher thread:
+1. _tick_lock altında SADECE offset snapshot'ı alınır: her sembol için
+   son flush'tan beri eklenen tick'ler (TickRingBuffer.since) kopyalanır.
+2. Lock dışında, tek pipeline'da:
+   - tt:ticks:log:{symbol} → RPUSH yeni tick'ler + LTRIM (append-only log)
+   - tt:ticks:symbols      → SADD (restore index'i)
+   - tt:ticks:{symbol}     → JSON blob (mevcut ~20 okuyucu için kanonik format),
+     sadece yeni tick almış semboller için, en fazla BLOB_REFRESH_SEC'de bir;
+     yanında tt:ver:{symbol} INCR (TruthTickReadModel için)
+3. Offset'ler sadece pipeline başarılı olursa ilerletilir.
+
+Restore: SMEMBERS tt:ticks:symbols + pipelined LRANGE. Log'u henüz olmayan
+kurulumlarda tek seferlik blob okuması (chunked MGET) yapılır ve bu tick'ler
+ilk flush'ta log'a taşınır.
+"""
+
+import json
+import threading
+import time
+from typing import Dict, Any, Optional, List, Tuple, Iterator
+
+import numpy as np
+
+from app.core.logger import logger
+from app.core.redis_keys import RedisKeys
+from app.market_data.tick_ring_buffer import TickRingBuffer, venue_names
+
+
+class TruthTickPersister:
+    """
+    Single background flusher for TruthTicksEngine tick data.
+
+    Thread-safe. The worker thread is started lazily on the first start()/notify().
+    """
+
+    FLUSH_INTERVAL_SEC = 5.0  # Timed flush even if notify() is not called
+    BLOB_REFRESH_SEC = 30.0  # Min interval between tt:ticks:{symbol} rewrites
+    TTL_SEC = 12 * 86400  # 12 days (covers 2 weekends + buffer)
+    PIPELINE_SYMBOLS = 200  # Symbols per pipeline execute
+    RESTORE_CHUNK = 200  # Keys per pipelined restore round
+
+    def __init__(self, engine):
+        """
+        Args:
+            engine: TruthTicksEngine (tick_store, _tick_lock, _get_redis_sync)
+        """
+        self._engine = engine
+        self._flushed: Dict[str, int] = {}  # {symbol: TickRingBuffer.appended already in the log}
+        self._blob_at: Dict[str, float] = {}  # {symbol: monotonic time of last blob write}
+        self._blob_dirty: set = set()
+        self._flush_lock = threading.Lock()  # One flush at a time (worker vs persist_to_redis)
+        self._start_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self._stats = {
+            'flushes': 0,
+            'ticks_written': 0,
+            'blobs_written': 0,
+            'errors': 0,
+        }
+
+    # =========================================================================
+    # FLUSH
+    # =========================================================================
+
+    def notify(self) -> None:
+        """Request a flush soon (non-blocking)"""
+        self.start()
+        self._wake.set()
+
+    def mark_flushed(self, symbol: str, offset: int) -> None:
+        """Record that ticks up to offset are already persisted (restore path)"""
+        self._flushed[symbol] = offset
+
+    def flush(self, force_blobs: bool = False) -> int:
+        """
+        Write ticks added since the last flush.
+
+        Args:
+            force_blobs: Rewrite tt:ticks:{symbol} for every dirty symbol now
+
+        Returns:
+            Number of symbols written
+        """
+        with self._flush_lock:
+            r = self._engine._get_redis_sync()
+            if not r:
+                return 0
+
+            batches, blobs = self._snapshot(force_blobs)
+            if not batches and not blobs:
+                return 0
+
+            written = 0
+            try:
+                names = venue_names()
+                for i in range(0, max(len(batches), len(blobs)), self.PIPELINE_SYMBOLS):
+                    batch_chunk = batches[i:i + self.PIPELINE_SYMBOLS]
+                    blob_chunk = blobs[i:i + self.PIPELINE_SYMBOLS]
+                    pipe = r.pipeline(transaction=False)
+                    for symbol, new_ticks, _ in batch_chunk:
+                        self._queue_log_append(pipe, symbol, new_ticks, names)
+                    for symbol, arr in blob_chunk:
+                        pipe.setex(
+                            RedisKeys.tt_ticks(symbol),
+                            self.TTL_SEC,
+                            json.dumps(TickRingBuffer.to_dicts(arr))
+                        )
+                        # Version bump after the blob: readers (TruthTickReadModel) re-parse only on change
+                        pipe.incr(RedisKeys.tt_ticks_version(symbol))
+                        pipe.expire(RedisKeys.tt_ticks_version(symbol), self.TTL_SEC)
+                    pipe.execute()
+
+                    # Advance offsets only after a successful write
+                    for symbol, new_ticks, appended in batch_chunk:
+                        self._flushed[symbol] = appended
+                        self._stats['ticks_written'] += len(new_ticks)
+                    now = time.monotonic()
+                    for symbol, _ in blob_chunk:
+                        self._blob_at[symbol] = now
+                        self._blob_dirty.discard(symbol)
+                    self._stats['blobs_written'] += len(blob_chunk)
+                    written += len({s for s, _, _ in batch_chunk} | {s for s, _ in blob_chunk})
+            except Exception as e:
+                self._stats['errors'] += 1
+                logger.warning(f"[TT-PERSIST] Redis flush error: {e}")
+
+            self._stats['flushes'] += 1
+            return written
+
+    def _snapshot(self, force_blobs: bool) -> Tuple[List[Tuple[str, np.ndarray, int]], List[Tuple[str, np.ndarray]]]:
+        """Under _tick_lock: copy new ticks per symbol and full arrays for due blobs"""
+        engine = self._engine
+        now = time.monotonic()
+        batches = []
+        blobs = []
+        with engine._tick_lock:
+            for symbol, buffer in engine.tick_store.items():
+                offset = self._flushed.get(symbol, 0)
+                if buffer.appended > offset:
+                    batches.append((symbol, buffer.since(offset), buffer.appended))
+                    self._blob_dirty.add(symbol)
+            for symbol in self._blob_dirty:
+                last = self._blob_at.get(symbol)
+                buffer = engine.tick_store.get(symbol)
+                if buffer is not None and (force_blobs or last is None or now - last >= self.BLOB_REFRESH_SEC):
+                    blobs.append((symbol, buffer.arrays()))
+        return batches, blobs
+
+    def _queue_log_append(self, pipe, symbol: str, new_ticks: np.ndarray, names: List[str]) -> None:
+        if not len(new_ticks):
+            return
+        key = RedisKeys.tt_ticks_log(symbol)
+        records = [
+            json.dumps([ts, price, size, names[code] if code < len(names) else 'UNKNOWN'])
+            for ts, price, size, code in zip(
+                new_ticks['ts'].tolist(), new_ticks['price'].tolist(),
+                new_ticks['size'].tolist(), new_ticks['venue'].tolist()
+            )
+        ]
+        pipe.rpush(key, *records)
+        pipe.ltrim(key, -self._engine.TICK_CAPACITY, -1)
+        pipe.expire(key, self.TTL_SEC)
+        pipe.sadd(RedisKeys.TT_TICKS_SYMBOLS, symbol)
+
+    # =========================================================================
+    # RESTORE
+    # =========================================================================
+
+    def load(self, r) -> Iterator[Tuple[str, List[Dict[str, Any]], bool]]:
+        """
+        Bulk-read persisted ticks.
+
+        Yields:
+            (symbol, tick dicts oldest first, from_log). from_log=False means the
+            ticks came from a legacy tt:ticks:{symbol} blob and are not in the log yet.
+        """
+        symbols = sorted(self._decode(s) for s in (r.smembers(RedisKeys.TT_TICKS_SYMBOLS) or ()))
+        if symbols:
+            for i in range(0, len(symbols), self.RESTORE_CHUNK):
+                chunk = symbols[i:i + self.RESTORE_CHUNK]
+                pipe = r.pipeline(transaction=False)
+                for symbol in chunk:
+                    pipe.lrange(RedisKeys.tt_ticks_log(symbol), 0, -1)
+                for symbol, records in zip(chunk, pipe.execute()):
+                    ticks = []
+                    for raw in records or ():
+                        try:
+                            ts, price, size, exch = json.loads(raw)
+                            ticks.append({'ts': ts, 'price': price, 'size': size, 'exch': exch})
+                        except (ValueError, TypeError):
+                            continue
+                    if ticks:
+                        yield symbol, ticks, True
+            return
+
+        # Legacy: blobs only (no log written yet) → one scan, chunked MGET
+        keys = [
+            k for k in (self._decode(k) for k in r.scan_iter("tt:ticks:*", count=1000))
+            if not k.startswith("tt:ticks:log:") and k != RedisKeys.TT_TICKS_SYMBOLS
+        ]
+        for i in range(0, len(keys), self.RESTORE_CHUNK):
+            chunk = keys[i:i + self.RESTORE_CHUNK]
+            for key, raw in zip(chunk, r.mget(chunk)):
+                if not raw:
+                    continue
+                try:
+                    ticks = json.loads(raw)
+                except (ValueError, TypeError):
+                    continue
+                if ticks:
+                    yield key[len("tt:ticks:"):], ticks, False
+
+    @staticmethod
+    def _decode(value: Any) -> str:
+        return value.decode() if isinstance(value, bytes) else value
+
+    # =========================================================================
+    # WORKER
+    # =========================================================================
+
+    def get_stats(self) -> Dict[str, Any]:
+        return dict(self._stats, pending_blobs=len(self._blob_dirty))
+
+    def stop(self) -> None:
+        """Stop worker thread"""
+        self._running = False
+        self._wake.set()
+
+    def start(self) -> None:
+        """Start worker thread (no-op if running)"""
+        if self._thread is None or not self._thread.is_alive():
+            with self._start_lock:
+                if self._thread is None or not self._thread.is_alive():
+                    self._running = True
+                    self._thread = threading.Thread(
+                        target=self._run, name="TruthTickPersister", daemon=True
+                    )
+                    self._thread.start()
+
+    def _run(self) -> None:
+        while self._running:
+            self._wake.wait(timeout=self.FLUSH_INTERVAL_SEC)
+            self._wake.clear()
+            if not self._running:
+                break
+            try:
+                self.flush()
+            except Exception as e:
+                logger.debug(f"[TT-PERSIST] Flush failed: {e}")
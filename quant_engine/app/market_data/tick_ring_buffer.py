@@ -0,0 +1,244 @@
+"""
+TICK RING BUFFER - Compact per-symbol tick storage for TruthTicksEngine
+=======================================================================
+
+🟢 FAST PATH COMPONENT
+
+- TickRingBuffer: structured NumPy ring buffer (ts, price, size, venue code)
+  → 26 byte/tick. Kapasite 10000, küçük başlar ve ihtiyaç oldukça büyür.
+- Venue isimleri process-wide küçük bir tabloda uint16 koda çevrilir.
+- TickDedupIndex: sembol başına zaman pencereli dedup. En eski kayıtlar
+  yaşa göre (veya kapasite dolunca) tek tek düşer, hiçbir zaman topluca
+  silinmez.
+
+Uyumluluk:
+- `list(buffer)` / `for t in buffer` dict tick'ler üretir
+  ({'ts', 'price', 'size', 'exch'}) → route'lardaki
+  `list(engine.tick_store[symbol])` kodları bunu kullanır.
+- Hesaplama tarafı `buffer.arrays()` ile kronolojik array kopyası alır.
+
+⚠️ THREAD SAFETY:
+Buffer ve index kendi lock'unu tutmaz - TruthTicksEngine._tick_lock altında
+yazılır/okunur. Venue tablosu kendi lock'u ile korunur.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Dict, Any, List, Iterator, Optional
+
+import numpy as np
+
+
+TICK_DTYPE = np.dtype([
+    ('ts', 'f8'),
+    ('price', 'f8'),
+    ('size', 'f8'),
+    ('venue', 'u2'),
+])
+
+DEFAULT_CAPACITY = 10000
+_INITIAL_SIZE = 64
+
+DEDUP_WINDOW_SEC = 4 * 60 * 60  # Polling overlap is minutes; keep a wide margin
+
+
+# =============================================================================
+# VENUE CODES
+# =============================================================================
+
+_venue_names: List[str] = []
+_venue_index: Dict[str, int] = {}
+_venue_lock = threading.Lock()
+
+
+def venue_code(name: str) -> int:
+    """Get (or assign) the uint16 code for a venue name"""
+    code = _venue_index.get(name)
+    if code is None:
+        with _venue_lock:
+            code = _venue_index.get(name)
+            if code is None:
+                code = len(_venue_names)
+                _venue_names.append(name)
+                _venue_index[name] = code
+    return code
+
+
+def venue_name(code: int) -> str:
+    """Venue name for a code ('UNKNOWN' if never assigned)"""
+    try:
+        return _venue_names[code]
+    except IndexError:
+        return 'UNKNOWN'
+
+
+def venue_names() -> List[str]:
+    """Snapshot of the venue table (index = code)"""
+    return list(_venue_names)
+
+
+# =============================================================================
+# RING BUFFER
+# =============================================================================
+
+class TickRingBuffer:
+    """
+    Fixed-capacity ring buffer of ticks backed by a structured NumPy array.
+
+    Oldest ticks are overwritten once capacity is reached (deque(maxlen) semantics).
+    """
+
+    __slots__ = ('capacity', 'appended', '_buf', '_start', '_len')
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self.appended = 0  # Total ticks ever appended (persistence offset)
+        self._buf = np.zeros(min(_INITIAL_SIZE, capacity), dtype=TICK_DTYPE)
+        self._start = 0
+        self._len = 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __bool__(self) -> bool:
+        return self._len > 0
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self.to_dicts(self.arrays()))
+
+    def append(self, ts: float, price: float, size: float, venue: int) -> None:
+        """Append one tick (venue is a venue code)"""
+        buf = self._buf
+        n = len(buf)
+        if self._len == n and n < self.capacity:
+            self._grow()
+            buf = self._buf
+            n = len(buf)
+
+        if self._len < n:
+            idx = (self._start + self._len) % n
+            self._len += 1
+        else:
+            # Full: overwrite oldest
+            idx = self._start
+            self._start = (self._start + 1) % n
+        buf[idx] = (ts, price, size, venue)
+        self.appended += 1
+
+    def append_tick(self, tick: Dict[str, Any]) -> None:
+        """Append a tick dict ({'ts', 'price', 'size', 'exch'})"""
+        self.append(
+            float(tick.get('ts', 0) or 0),
+            float(tick.get('price', 0) or 0),
+            float(tick.get('size', 0) or 0),
+            venue_code(str(tick.get('exch') or 'UNKNOWN')),
+        )
+
+    def arrays(self) -> np.ndarray:
+        """Chronological (insertion order) copy of the stored ticks"""
+        n = len(self._buf)
+        end = self._start + self._len
+        if end <= n:
+            return self._buf[self._start:end].copy()
+        return np.concatenate((self._buf[self._start:], self._buf[:end - n]))
+
+    def since(self, offset: int) -> np.ndarray:
+        """
+        Copy of ticks appended after `offset` (a previous `appended` value).
+        
+        Ticks already overwritten by the ring are skipped.
+        """
+        count = min(self.appended - offset, self._len)
+        if count <= 0:
+            return np.empty(0, dtype=TICK_DTYPE)
+        n = len(self._buf)
+        first = (self._start + self._len - count) % n
+        if first + count <= n:
+            return self._buf[first:first + count].copy()
+        return np.concatenate((self._buf[first:], self._buf[:first + count - n]))
+
+    def last_ts(self) -> Optional[float]:
+        """Timestamp of the most recently appended tick"""
+        if not self._len:
+            return None
+        return float(self._buf[(self._start + self._len - 1) % len(self._buf)]['ts'])
+
+    def nbytes(self) -> int:
+        return self._buf.nbytes
+
+    def _grow(self) -> None:
+        new_size = min(self.capacity, len(self._buf) * 2)
+        new_buf = np.zeros(new_size, dtype=TICK_DTYPE)
+        new_buf[:self._len] = self.arrays()
+        self._buf = new_buf
+        self._start = 0
+
+    @staticmethod
+    def to_dicts(arr: np.ndarray) -> List[Dict[str, Any]]:
+        """Materialize a tick array as the legacy list of dicts"""
+        names = _venue_names
+        n_names = len(names)
+        return [
+            {
+                'ts': ts,
+                'price': price,
+                'size': size,
+                'exch': names[code] if code < n_names else 'UNKNOWN',
+            }
+            for ts, price, size, code in zip(
+                arr['ts'].tolist(), arr['price'].tolist(),
+                arr['size'].tolist(), arr['venue'].tolist()
+            )
+        ]
+
+
+# =============================================================================
+# DEDUP INDEX
+# =============================================================================
+
+def tick_key(ts: float, price: float, size: float, venue: int) -> int:
+    """Dedup key; timestamp rounded to ms to avoid float drift"""
+    return hash((round(ts * 1000.0), price, size, venue))
+
+
+class TickDedupIndex:
+    """
+    Per-symbol set of recently seen tick keys with age-based eviction.
+
+    Entries expire window_sec after insertion (monotonic clock) or, when
+    max_entries is reached, oldest-first. Nothing is ever cleared wholesale.
+    """
+
+    __slots__ = ('window_sec', 'max_entries', '_seen', '_order')
+
+    def __init__(self, window_sec: float = DEDUP_WINDOW_SEC, max_entries: int = DEFAULT_CAPACITY):
+        self.window_sec = window_sec
+        self.max_entries = max_entries
+        self._seen: set = set()
+        self._order: deque = deque()  # (inserted_at, key), oldest first
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def check_and_add(self, key: int, now: Optional[float] = None) -> bool:
+        """
+        Returns:
+            True if key is new (and records it), False if it is a duplicate
+        """
+        if now is None:
+            now = time.monotonic()
+        self._evict(now)
+        if key in self._seen:
+            return False
+        self._seen.add(key)
+        self._order.append((now, key))
+        return True
+
+    def _evict(self, now: float) -> None:
+        order = self._order
+        cutoff = now - self.window_sec
+        while order and (order[0][0] < cutoff or len(order) >= self.max_entries):
+            _, key = order.popleft()
+            self._seen.discard(key)
+
@@ -0,0 +1,97 @@
+"""
+TRADE PRINT - Parse-once normalized trade print record
+======================================================
+
+🟢 FAST PATH COMPONENT
+
+TradePrintRouter print'i ingestion'da BİR KERE normalize eder:
+    {'time': <Hammer'ın orijinal değeri>, 'ts': epoch float | None,
+     'price': float, 'size': float, 'venue': interned upper-case str,
+     'venue_code': int (tick_ring_buffer kodu), 'trade_id': ...}
+
+Tüketiciler print_time(print_data, fallback) ile 'ts'yi okur; 'ts' key'i
+olmayan (router'dan geçmemiş) dict'ler için parse_print_time() 'time'
+string'ini parse eder. 'ts' None ise (parse edilemeyen zaman) her tüketici
+kendi fallback'ini uygular.
+
+Not: Epoch milisaniye (> 1e12) saniyeye çevrilir.
+"""
+
+import sys
+from datetime import datetime
+from typing import Dict, Any, Optional
+
+from app.market_data.tick_ring_buffer import venue_code
+
+
+EPOCH_MS_THRESHOLD = 1e12  # Hammer Pro sends epoch milliseconds (e.g., 1773195043000)
+_FALLBACK_FORMATS = ('%Y-%m-%d %H:%M:%S', '%Y-%m-%d %H:%M:%S.%f')
+
+
+def _epoch(value: float) -> float:
+    return value / 1000.0 if value > EPOCH_MS_THRESHOLD else value
+
+
+def parse_print_time(value: Any, fallback: Optional[float] = None) -> Optional[float]:
+    """
+    Parse a print timestamp to unix seconds.
+
+    Accepts epoch numbers (s or ms), numeric strings, ISO 8601
+    ('T' or space separated, 'Z' suffix) and the legacy strptime formats.
+
+    Returns:
+        Unix timestamp, or fallback if value is None / unparseable
+    """
+    if value is None:
+        return fallback
+    if isinstance(value, (int, float)):
+        return _epoch(float(value))
+    try:
+        text = str(value)
+        if 'T' not in text and text.replace('.', '', 1).isdigit():
+            return _epoch(float(text))
+        try:
+            return datetime.fromisoformat(text.replace('Z', '+00:00')).timestamp()
+        except ValueError:
+            pass
+        for fmt in _FALLBACK_FORMATS:
+            try:
+                return datetime.strptime(text, fmt).timestamp()
+            except ValueError:
+                continue
+    except (TypeError, ValueError, OverflowError):
+        pass
+    return fallback
+
+
+def print_time(print_data: Dict[str, Any], fallback: Optional[float] = None) -> Optional[float]:
+    """Epoch timestamp of a print ('ts' if normalized, else parsed from 'time')"""
+    if 'ts' in print_data:
+        ts = print_data['ts']
+        return fallback if ts is None else ts
+    return parse_print_time(print_data.get('time'), fallback)
+
+
+def make_trade_print(
+    time_value: Any,
+    price: Any,
+    size: Any,
+    venue: Any,
+    trade_id: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Build the normalized trade print record (parse once at ingestion).
+
+    Raises:
+        ValueError / TypeError: price or size is not numeric
+    """
+    venue = sys.intern(str(venue or 'UNKNOWN').upper())
+    return {
+        'time': time_value,
+        'ts': parse_print_time(time_value),
+        'price': float(price),
+        'size': float(size),
+        'venue': venue,
+        'venue_code': venue_code(venue),
+        'trade_id': trade_id,
+    }
@@ -5,12 +5,15 @@ Normalizes trade prints from Hammer Time&Sales stream.
 Single source of truth for trade print normalization:
 - symbol, price, size, timestamp, trade_id
 - Separated from L2Update and last price logic
+- Timestamp parsed ONCE here ('ts' epoch float, see trade_print.py);
+  GRPAN / RWVAP / TruthTicks read it instead of re-parsing 'time'
 """
 
 from typing import Dict, Any, Optional
 from datetime import datetime
 from app.core.logger import logger
 from app.live.symbol_mapper import SymbolMapper
+from app.market_data.trade_print import make_trade_print
 
 
 class TradePrintRouter:
@@ -82,29 +85,30 @@ class TradePrintRouter:
             raw_print: Raw print (dict or string)
             
         Returns:
-            Normalized dict: {'time': str, 'price': float, 'size': float, 'venue': str}
+            Normalized dict: {'time': str, 'ts': float | None, 'price': float, 'size': float,
+                              'venue': str, 'venue_code': int, 'trade_id': str | None}
         """
         try:
             if isinstance(raw_print, dict):
                 # Dict format from Hammer
-                return {
-                    'time': raw_print.get('timeStamp') or raw_print.get('time') or datetime.now().strftime("%H:%M:%S.%f")[:-3],
-                    'price': float(raw_print.get('price', 0)),
-                    'size': float(raw_print.get('size', 0)),
-                    'venue': raw_print.get('MMID') or raw_print.get('venue', 'N/A'),
-                    'trade_id': raw_print.get('tradeId') or raw_print.get('trade_id')
-                }
+                return make_trade_print(
+                    raw_print.get('timeStamp') or raw_print.get('time') or datetime.now().strftime("%H:%M:%S.%f")[:-3],
+                    raw_print.get('price', 0),
+                    raw_print.get('size', 0),
+                    raw_print.get('MMID') or raw_print.get('venue', 'N/A'),
+                    raw_print.get('tradeId') or raw_print.get('trade_id')
+                )
             elif isinstance(raw_print, str):
                 # String format: "time,price,size,venue" or "time,price,size,venue,trade_id"
                 parts = raw_print.split(",")
                 if len(parts) >= 4:
-                    return {
-                        'time': parts[0].strip(),
-                        'price': float(parts[1]),
-                        'size': float(parts[2]),
-                        'venue': parts[3].strip(),
-                        'trade_id': parts[4].strip() if len(parts) >= 5 else None
-                    }
+                    return make_trade_print(
+                        parts[0].strip(),
+                        parts[1],
+                        parts[2],
+                        parts[3].strip(),
+                        parts[4].strip() if len(parts) >= 5 else None
+                    )
             
             return None
             
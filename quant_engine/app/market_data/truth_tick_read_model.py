@@ -0,0 +1,339 @@
+"""
+TRUTH TICK READ MODEL - Shared, versioned in-process cache of truth tick blobs
+=============================================================================
+
+🟢 FAST PATH COMPONENT
+
+NewCLMM, GreatestMM, XNL, Gem, OrderLifecycleTracker, qagentt tools,
+TruthShift ... truth_ticks:inspect:{symbol} / tt:ticks:{symbol} blob'larını
+buradan okur:
+
+- Writer'lar blob ile birlikte sembol başına bir versiyon key'i INCR eder
+  (tt:ver:{symbol}, truth_ticks:inspect:ver:{symbol}).
+- refresh(symbols): tek pipelined MGET ile versiyonlar okunur; sadece
+  versiyonu değişen semboller için blob'lar MGET edilip BİR KERE parse
+  edilir. Versiyon key'i olmayan blob'lar en fazla
+  UNVERSIONED_REFRESH_SEC'de bir yeniden okunur.
+- Her sembol için TruthTickSeries: tick'ler TICK_DTYPE NumPy array'i
+  (ts, price, size, venue code) + önceden filtrelenmiş truth view
+  (FNRA: sadece 100/200, diğerleri ≥15 lot, price > 0; ts sıralı).
+  Inspect blob'unun 'data' payload'ı (volav_levels, temporal_analysis...)
+  olduğu gibi tutulur.
+- get(symbol): CHECK_INTERVAL_SEC'den eski ise o sembolü tek round-trip
+  ile kontrol eder; aksi halde saf memory okuması.
+
+⚠️ Series objeleri paylaşılır: okuyucular array'leri / data dict'ini
+DEĞİŞTİRMEMELİ (to_dicts() her çağrıda yeni dict'ler üretir).
+"""
+
+import json
+import threading
+import time
+from typing import Dict, Any, Optional, List, Iterable
+
+import numpy as np
+
+from app.core.logger import logger
+from app.core.redis_keys import RedisKeys
+from app.market_data.tick_ring_buffer import TICK_DTYPE, TickRingBuffer, venue_code
+
+
+FNRA_VENUE = 'FNRA'
+FNRA_VALID_SIZES = (100, 200)  # Only 100/200 from FNRA
+NON_FNRA_MIN_SIZE = 15  # Others: ≥15 lot
+
+SOURCE_INSPECT = 'inspect'  # truth_ticks:inspect:{symbol} (TruthTicksWorker, path_dataset)
+SOURCE_RAW = 'raw'  # tt:ticks:{symbol} (TruthTickPersister, raw tick list)
+
+
+def _num(value: Any) -> float:
+    try:
+        return float(value) if value is not None else 0.0
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def ticks_to_array(ticks: List[Dict[str, Any]], ts_key: str = 'ts', venue_key: str = 'exch') -> np.ndarray:
+    """Tick dicts → TICK_DTYPE array (blob order; missing numbers become 0)"""
+    arr = np.empty(len(ticks), dtype=TICK_DTYPE)
+    arr['ts'] = [_num(t.get(ts_key)) for t in ticks]
+    arr['price'] = [_num(t.get('price')) for t in ticks]
+    arr['size'] = [_num(t.get('size')) for t in ticks]
+    arr['venue'] = [
+        venue_code(str(t.get(venue_key) or t.get('venue') or t.get('exch') or 'UNKNOWN'))
+        for t in ticks
+    ]
+    return arr
+
+
+def truth_filter(arr: np.ndarray) -> np.ndarray:
+    """FNRA only 100/200 | others ≥15 lot | price > 0; ts ascending (stable)"""
+    is_fnra = arr['venue'] == venue_code(FNRA_VENUE)
+    size_ok = np.where(is_fnra, np.isin(arr['size'], FNRA_VALID_SIZES), arr['size'] >= NON_FNRA_MIN_SIZE)
+    filtered = arr[size_ok & (arr['price'] > 0)]
+    return filtered[np.argsort(filtered['ts'], kind='stable')]
+
+
+class TruthTickSeries:
+    """One symbol's parsed blob (shared, read-only)"""
+
+    __slots__ = ('symbol', 'source', 'version', 'ticks', 'truth', 'data', 'loaded_at')
+
+    def __init__(
+        self,
+        symbol: str,
+        source: str,
+        version: Optional[int],
+        ticks: np.ndarray,
+        data: Optional[Dict[str, Any]] = None
+    ):
+        self.symbol = symbol
+        self.source = source
+        self.version = version
+        self.ticks = ticks  # TICK_DTYPE, blob order
+        self.truth = truth_filter(ticks)  # Pre-filtered view
+        self.data = data  # Inspect payload ({path_dataset, volav_levels, temporal_analysis, ...})
+        self.loaded_at = time.time()
+
+    def __len__(self) -> int:
+        return len(self.ticks)
+
+    def to_dicts(self, truth_only: bool = False, last: Optional[int] = None) -> List[Dict[str, Any]]:
+        """[{ts, price, size, exch}, ...] oldest first (truth_only: filtered view)"""
+        arr = self.truth if truth_only else self.ticks
+        if last is not None:
+            arr = arr[-last:] if last > 0 else arr[:0]
+        return TickRingBuffer.to_dicts(arr)
+
+    def last_tick(self, truth_only: bool = False) -> Optional[Dict[str, Any]]:
+        ticks = self.to_dicts(truth_only, last=1)
+        return ticks[0] if ticks else None
+
+    def latest(
+        self,
+        n: int,
+        max_age_sec: Optional[float] = None,
+        size_above: Optional[float] = None,
+        truth_only: bool = False,
+        now: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Last n ticks with price > 0, NEWEST FIRST ({ts, price, size, exch}).
+
+        Args:
+            max_age_sec: Skip ticks older than this (ticks without ts are kept)
+            size_above: Keep only size > size_above
+        """
+        arr = self.truth if truth_only else self.ticks
+        mask = arr['price'] > 0
+        if size_above is not None:
+            mask &= arr['size'] > size_above
+        if max_age_sec is not None:
+            ts = arr['ts']
+            mask &= ~((ts > 0) & ((time.time() if now is None else now) - ts > max_age_sec))
+        idx = np.flatnonzero(mask)[-n:][::-1] if n > 0 else []
+        return TickRingBuffer.to_dicts(arr[idx])
+
+
+class _Entry:
+    __slots__ = ('series', 'version', 'checked_at', 'fetched_at')
+
+    def __init__(self, series: Optional[TruthTickSeries], version: Optional[int], now: float):
+        self.series = series  # None: key missing / unparseable
+        self.version = version
+        self.checked_at = now
+        self.fetched_at = now
+
+
+class TruthTickReadModel:
+    """
+    Process-wide truth tick cache, refreshed by per-symbol version keys.
+
+    Thread-safe: parsing happens outside the lock, entries are swapped in.
+    """
+
+    CHECK_INTERVAL_SEC = 1.0  # get() re-checks a symbol's version at most this often
+    UNVERSIONED_REFRESH_SEC = 30.0  # Blobs without a version key (legacy writers)
+    CHUNK = 200  # Keys per MGET
+
+    def __init__(self, redis_client: Any = None):
+        self._redis = redis_client
+        self._entries: Dict[str, Dict[str, _Entry]] = {SOURCE_INSPECT: {}, SOURCE_RAW: {}}
+        self._lock = threading.Lock()
+        self._stats = {
+            'version_checks': 0,
+            'blobs_fetched': 0,
+            'blobs_parsed_bytes': 0,
+            'hits': 0,
+        }
+
+    def _get_redis(self):
+        if self._redis is None:
+            try:
+                from app.core.redis_client import get_redis_client
+                client = get_redis_client()
+                self._redis = getattr(client, 'sync', client)
+            except Exception:
+                return None
+        return self._redis
+
+    # =========================================================================
+    # READ
+    # =========================================================================
+
+    def get(self, symbol: str, source: str = SOURCE_INSPECT) -> Optional[TruthTickSeries]:
+        """Parsed series for symbol (None if the blob does not exist)"""
+        entry = self._entries[source].get(symbol)
+        if entry is None or time.monotonic() - entry.checked_at >= self.CHECK_INTERVAL_SEC:
+            self.refresh([symbol], source)
+            entry = self._entries[source].get(symbol)
+        else:
+            self._stats['hits'] += 1
+        return entry.series if entry is not None else None
+
+    def get_many(self, symbols: Iterable[str], source: str = SOURCE_INSPECT) -> Dict[str, TruthTickSeries]:
+        """{symbol: series} for symbols with data (one pipelined refresh)"""
+        symbols = list(symbols)
+        self.refresh(symbols, source)
+        entries = self._entries[source]
+        result = {}
+        for symbol in symbols:
+            entry = entries.get(symbol)
+            if entry is not None and entry.series is not None:
+                result[symbol] = entry.series
+        return result
+
+    def refresh(self, symbols: Iterable[str], source: str = SOURCE_INSPECT, force: bool = False) -> int:
+        """
+        Re-read blobs whose version changed.
+
+        Args:
+            symbols: Symbols to check
+            source: SOURCE_INSPECT or SOURCE_RAW
+            force: Ignore CHECK_INTERVAL_SEC (still skips unchanged versions)
+
+        Returns:
+            Number of blobs fetched and parsed
+        """
+        entries = self._entries[source]
+        now = time.monotonic()
+        due = [
+            s for s in dict.fromkeys(symbols)
+            if force or s not in entries or now - entries[s].checked_at >= self.CHECK_INTERVAL_SEC
+        ]
+        if not due:
+            return 0
+        r = self._get_redis()
+        if not r:
+            return 0
+
+        version_key, blob_key = self._keys(source)
+        try:
+            versions = self._mget(r, [version_key(s) for s in due])
+        except Exception as e:
+            logger.warning(f"[TT-READ] Version check failed: {e}")
+            return 0
+        self._stats['version_checks'] += len(due)
+
+        to_fetch = []
+        for symbol, raw_version in zip(due, versions):
+            version = int(raw_version) if raw_version is not None else None
+            entry = entries.get(symbol)
+            if entry is None:
+                to_fetch.append((symbol, version))
+            elif version is not None:
+                if version != entry.version:
+                    to_fetch.append((symbol, version))
+                else:
+                    entry.checked_at = now
+            elif entry.version is not None or now - entry.fetched_at >= self.UNVERSIONED_REFRESH_SEC:
+                to_fetch.append((symbol, None))  # Version key gone / legacy writer
+            else:
+                entry.checked_at = now
+        if not to_fetch:
+            return 0
+
+        # Version read BEFORE the blob: a blob is never labelled with a newer version than its own
+        try:
+            blobs = self._mget(r, [blob_key(s) for s, _ in to_fetch])
+        except Exception as e:
+            logger.warning(f"[TT-READ] Blob fetch failed: {e}")
+            return 0
+        fresh = {}
+        for (symbol, version), raw in zip(to_fetch, blobs):
+            fresh[symbol] = _Entry(self._parse(symbol, source, version, raw), version, now)
+        with self._lock:
+            entries.update(fresh)
+        self._stats['blobs_fetched'] += len(fresh)
+        return len(fresh)
+
+    def invalidate(self, symbol: Optional[str] = None) -> None:
+        """Drop cached series (all symbols if None)"""
+        with self._lock:
+            for entries in self._entries.values():
+                if symbol is None:
+                    entries.clear()
+                else:
+                    entries.pop(symbol, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = dict(self._stats)
+        stats['cached_inspect'] = len(self._entries[SOURCE_INSPECT])
+        stats['cached_raw'] = len(self._entries[SOURCE_RAW])
+        return stats
+
+    # =========================================================================
+    # INTERNALS
+    # =========================================================================
+
+    @staticmethod
+    def _keys(source: str):
+        if source == SOURCE_RAW:
+            return RedisKeys.tt_ticks_version, RedisKeys.tt_ticks
+        return RedisKeys.truth_ticks_inspect_version, RedisKeys.truth_ticks_inspect
+
+    def _mget(self, r, keys: List[str]) -> List[Any]:
+        values: List[Any] = []
+        for i in range(0, len(keys), self.CHUNK):
+            values.extend(r.mget(keys[i:i + self.CHUNK]))
+        return values
+
+    def _parse(self, symbol: str, source: str, version: Optional[int], raw: Any) -> Optional[TruthTickSeries]:
+        if not raw:
+            return None
+        try:
+            if isinstance(raw, bytes):
+                raw = raw.decode('utf-8')
+            self._stats['blobs_parsed_bytes'] += len(raw)
+            payload = json.loads(raw)
+            if source == SOURCE_RAW:
+                if not isinstance(payload, list):
+                    return None
+                return TruthTickSeries(symbol, source, version, ticks_to_array(payload))
+            data = payload.get('data') if isinstance(payload, dict) else None
+            if not isinstance(data, dict):
+                return None
+            path = data.get('path_dataset') or []
+            return TruthTickSeries(
+                symbol, source, version,
+                ticks_to_array(path, ts_key='timestamp', venue_key='venue'),
+                data=data
+            )
+        except Exception as e:
+            logger.debug(f"[TT-READ] Unparseable {source} blob for {symbol}: {e}")
+            return None
+
+
+# Global instance
+_truth_tick_read_model: Optional[TruthTickReadModel] = None
+_model_lock = threading.Lock()
+
+
+def get_truth_tick_read_model() -> TruthTickReadModel:
+    """Get (or create) the process-wide TruthTickReadModel"""
+    global _truth_tick_read_model
+    if _truth_tick_read_model is None:
+        with _model_lock:
+            if _truth_tick_read_model is None:
+                _truth_tick_read_model = TruthTickReadModel()
+    return _truth_tick_read_model
@@ -13,20 +13,74 @@ Key Features:
 """
 
 from typing import Dict, Any, Optional, List, Tuple
-from collections import defaultdict, deque
+from collections import defaultdict
 from datetime import datetime, timedelta
 import threading
 import time
 import math
-import json
+
+import numpy as np
 
 from app.core.logger import logger
 from app.market_data.trading_calendar import get_trading_calendar
+from app.market_data.tick_persister import TruthTickPersister
+from app.market_data.trade_print import parse_print_time
+from app.market_data.tick_ring_buffer import (
+    TickRingBuffer,
+    TickDedupIndex,
+    tick_key,
+    venue_code,
+    venue_names,
+)
 
 
 import yaml
 from pathlib import Path
 
+class _PriceRangeIndex:
+    """
+    Price-sorted view of a tick set for compute_volav_levels range queries.
+    
+    query() sums in original tick order (np.cumsum is sequential), so the
+    results are bit-identical to a Python `+=` loop over the tick list.
+    """
+    
+    __slots__ = ('price', 'weighted_size', 'ts', '_order', '_sorted_price')
+    
+    def __init__(self, price: np.ndarray, weighted_size: np.ndarray, ts: np.ndarray):
+        self.price = price
+        self.weighted_size = weighted_size
+        self.ts = ts
+        self._order = np.argsort(price, kind='stable')
+        self._sorted_price = price[self._order]
+    
+    def query(self, range_min: float, range_max: float) -> Optional[Tuple[float, float, int, Optional[float], float]]:
+        """
+        Ticks with range_min <= price <= range_max.
+        
+        Returns:
+            (weighted_volume, weighted_price_sum, weighted_tick_count,
+             last_ts of weighted ticks or None, last_ts of all ticks in range)
+            or None if the range holds no ticks at all
+        """
+        lo = np.searchsorted(self._sorted_price, range_min, side='left')
+        hi = np.searchsorted(self._sorted_price, range_max, side='right')
+        if hi <= lo:
+            return None
+        
+        idx = np.sort(self._order[lo:hi])  # back to tick order
+        weights = self.weighted_size[idx]
+        mask = weights > 0
+        last_ts_all = float(self.ts[idx].max())
+        if not mask.any():
+            return 0.0, 0.0, 0, None, last_ts_all
+        
+        weights = weights[mask]
+        volume = float(np.cumsum(weights)[-1])
+        price_sum = float(np.cumsum(self.price[idx][mask] * weights)[-1])
+        return volume, price_sum, int(mask.sum()), float(self.ts[idx][mask].max()), last_ts_all
+
+
 class TruthTicksEngine:
     """
     Truth Ticks Engine for illiquid preferred stocks.
@@ -38,6 +92,10 @@ class TruthTicksEngine:
     # Configuration defaults (overridden by yaml)
     BUCKET_SIZE = 0.01
     MIN_SIZE = 15 # Updated to 15 per new rule
+    TICK_CAPACITY = 10000  # Ticks kept per symbol (ring buffer)
+    
+    # Venues where only 100/200 lot prints are trusted
+    RESTRICTED_VENUES = ('FNRA', 'ADFN', 'FINRA', 'OTC', 'DARK')
     
     # Timeframe constants
     TIMEFRAMES = {
@@ -49,13 +107,13 @@ class TruthTicksEngine:
     
     def __init__(self):
         """Initialize Truth Ticks Engine"""
-        # Tick store: {symbol: deque(maxlen=200)}
-        self.tick_store: Dict[str, deque] = {}
+        # Tick store: {symbol: TickRingBuffer} (structured NumPy ring, TICK_CAPACITY)
+        self.tick_store: Dict[str, TickRingBuffer] = {}
         self._tick_lock = threading.Lock()
         
-        # Deduplication using unique tick signatures
-        # Format: "{ts}_{price}_{size}_{exch}"
-        self.seen_hashes: Set[str] = set()
+        # Deduplication: per-symbol time-windowed index of (ts, price, size, venue) keys
+        # Oldest keys expire by age - never cleared wholesale
+        self._dedup_index: Dict[str, TickDedupIndex] = {}
         
         # Results cache
         self.results_cache: Dict[str, Dict[str, Any]] = {}
@@ -79,9 +137,10 @@ class TruthTicksEngine:
         
         logger.info("TruthTicksEngine initialized (Weighted Print Realism)")
         
-        # Redis persistence
+        # Redis persistence (single incremental flusher, see tick_persister.py)
+        self._persister = TruthTickPersister(self)
         self._persist_counter = 0
-        self._persist_interval = 500  # Auto-persist every N ticks
+        self._persist_interval = 500  # Wake the flusher every N ticks
         self._last_persist_time = 0
         
         # Try to restore from Redis on init
@@ -101,48 +160,20 @@ class TruthTicksEngine:
 
     def persist_to_redis(self):
         """
-        Persist all tick data to Redis.
-        Key format: tt:ticks:{symbol}
+        Flush tick data to Redis now (ticks added since the last flush).
+        
+        Keys: tt:ticks:log:{symbol} (append-only) + tt:ticks:{symbol} (JSON blob)
         TTL: 12 days (covers 2 weekends + buffer)
         """
-        r = self._get_redis_sync()
-        if not r:
-            return 0
-        
-        try:
-            count = 0
-            with self._tick_lock:
-                for symbol, ticks_deque in self.tick_store.items():
-                    if not ticks_deque:
-                        continue
-                    # Serialize ticks
-                    ticks_list = []
-                    for t in ticks_deque:
-                        ticks_list.append({
-                            "ts": t.get("ts", 0),
-                            "price": t.get("price", 0),
-                            "size": t.get("size", 0),
-                            "exch": t.get("exch", "UNK"),
-                        })
-                    
-                    key = f"tt:ticks:{symbol}"
-                    r.setex(
-                        key,
-                        12 * 86400,  # 12 days TTL
-                        json.dumps(ticks_list)
-                    )
-                    count += 1
-            
-            self._last_persist_time = time.time()
+        count = self._persister.flush(force_blobs=True)
+        self._last_persist_time = time.time()
+        if count:
             logger.info(f"[TT-ENGINE] 💾 Persisted {count} symbols to Redis")
-            return count
-        except Exception as e:
-            logger.warning(f"[TT-ENGINE] Redis persist error: {e}")
-            return 0
+        return count
 
     def restore_from_redis(self):
         """
-        Restore tick data from Redis on startup.
+        Restore tick data from Redis on startup (pipelined bulk read).
         This allows analysis even after restart or on weekends.
         """
         r = self._get_redis_sync()
@@ -150,39 +181,31 @@ class TruthTicksEngine:
             return 0
         
         try:
-            # Find all persisted tick keys
-            keys = list(r.scan_iter("tt:ticks:*", count=1000))
-            if not keys:
-                logger.debug("[TT-ENGINE] No persisted ticks in Redis")
-                return 0
-            
             restored = 0
-            with self._tick_lock:
-                for key in keys:
-                    symbol = key.decode().replace("tt:ticks:", "") if isinstance(key, bytes) else key.replace("tt:ticks:", "")
-                    
+            for symbol, ticks, from_log in self._persister.load(r):
+                with self._tick_lock:
                     # Skip if already has in-memory data
                     if symbol in self.tick_store and len(self.tick_store[symbol]) > 0:
                         continue
                     
-                    raw = r.get(key)
-                    if not raw:
-                        continue
-                    
-                    try:
-                        ticks = json.loads(raw)
-                        if not ticks:
+                    buffer, dedup = self._get_symbol_store(symbol)
+                    now = time.monotonic()
+                    for t in ticks:
+                        try:
+                            buffer.append_tick(t)
+                        except (TypeError, ValueError, AttributeError):
                             continue
-                        
-                        self.tick_store[symbol] = deque(maxlen=10000)
-                        for t in ticks:
-                            self.tick_store[symbol].append(t)
-                        restored += 1
-                    except (json.JSONDecodeError, TypeError):
-                        continue
+                        # Seed dedup so post-restart polling overlap is ignored
+                        dedup.check_and_add(self._tick_key(t), now)
+                    if from_log:
+                        self._persister.mark_flushed(symbol, buffer.appended)
+                    # Legacy blob ticks stay unflushed → migrated into the log on first flush
+                    restored += 1
             
             if restored > 0:
                 logger.info(f"[TT-ENGINE] 📥 Restored {restored} symbols from Redis")
+            else:
+                logger.debug("[TT-ENGINE] No persisted ticks in Redis")
             return restored
         except Exception as e:
             logger.debug(f"[TT-ENGINE] Redis restore error: {e}")
@@ -218,8 +241,7 @@ class TruthTicksEngine:
         """
         try:
             with self._tick_lock:
-                if symbol not in self.tick_store:
-                    self.tick_store[symbol] = deque(maxlen=10000)
+                buffer, dedup = self._get_symbol_store(symbol)
                 
                 # Normalize tick data
                 normalized_tick = self._normalize_tick(tick)
@@ -236,42 +258,110 @@ class TruthTicksEngine:
                         # Ignore invalid tick (noise)
                         return
 
-                    # Deduplication Check
-                    # Deduplication Check
-                    # Create a unique signature for this tick
-                    # Precision handling: Format timestamp to 3 decimal places to avoid float drift issues
-                    ts_str = f"{normalized_tick['ts']:.3f}"
-                    tick_hash = f"{symbol}_{ts_str}_{normalized_tick['price']}_{normalized_tick['size']}_{normalized_tick.get('exch','UNK')}"
-                    
-                    if tick_hash in self.seen_hashes:
+                    # Deduplication Check (per-symbol, time-windowed)
+                    # Timestamp is rounded to ms inside tick_key to avoid float drift issues
+                    code = venue_code(normalized_tick['exch'])
+                    key = tick_key(
+                        normalized_tick['ts'], normalized_tick['price'],
+                        normalized_tick['size'], code
+                    )
+                    if not dedup.check_and_add(key):
                         # Duplicate tick (likely from polling overlap) - Ignore
                         return
-                    
-                    self.seen_hashes.add(tick_hash)
-                    
-                    # Memory Management: Prevent seen_hashes from growing indefinitely
-                    if len(self.seen_hashes) > 200000:
-                        # Crude flush mechanism - accepted trade-off for simplicity
-                        # In a perfect world, use LRU or time-based expiry
-                        self.seen_hashes.clear()
-                        # Re-add current to avoid immediate potential duplicate? No, safe enough.
-                        self.seen_hashes.add(tick_hash)
 
-                    self.tick_store[symbol].append(normalized_tick)
+                    buffer.append(
+                        normalized_tick['ts'], normalized_tick['price'],
+                        normalized_tick['size'], code
+                    )
                     
-                    # Auto-persist to Redis periodically
+                    # Wake the flusher periodically (it snapshots offsets, writes outside the lock)
                     self._persist_counter += 1
-                    if self._persist_counter >= self._persist_interval:
+                    if self._persist_counter == 1:
+                        self._persister.start()  # No-op when running; timed flushes cover quiet periods
+                    elif self._persist_counter >= self._persist_interval:
                         self._persist_counter = 0
-                        # Persist in a separate call (outside the lock)
-                        threading.Thread(
-                            target=self.persist_to_redis,
-                            daemon=True
-                        ).start()
+                        self._persister.notify()
                     
         except Exception as e:
             logger.error(f"Error adding tick for {symbol}: {e}", exc_info=True)
 
+    def _get_symbol_store(self, symbol: str) -> Tuple[TickRingBuffer, TickDedupIndex]:
+        """(ring buffer, dedup index) for symbol, created on first use. Caller holds _tick_lock."""
+        buffer = self.tick_store.get(symbol)
+        if buffer is None:
+            buffer = TickRingBuffer(self.TICK_CAPACITY)
+            self.tick_store[symbol] = buffer
+        dedup = self._dedup_index.get(symbol)
+        if dedup is None:
+            dedup = TickDedupIndex(max_entries=self.TICK_CAPACITY)
+            self._dedup_index[symbol] = dedup
+        return buffer, dedup
+
+    @staticmethod
+    def _tick_key(tick: Dict[str, Any]) -> int:
+        return tick_key(
+            float(tick.get('ts', 0) or 0),
+            float(tick.get('price', 0) or 0),
+            float(tick.get('size', 0) or 0),
+            venue_code(str(tick.get('exch') or 'UNKNOWN')),
+        )
+
+    def get_truth_tick_array(self, symbol: str) -> Optional[np.ndarray]:
+        """
+        Truth ticks for symbol as a time-sorted structured array (TICK_DTYPE).
+        
+        Array equivalent of filter_truth_ticks(list(tick_store[symbol])).
+        
+        Returns:
+            Array (possibly empty) or None if symbol has no tick store
+        """
+        with self._tick_lock:
+            buffer = self.tick_store.get(symbol)
+            if buffer is None:
+                return None
+            arr = buffer.arrays()
+        
+        if len(arr):
+            arr = arr[self._truth_tick_mask(arr)]
+            arr = arr[np.argsort(arr['ts'], kind='stable')]
+        return arr
+
+    def _truth_tick_mask(self, arr: np.ndarray) -> np.ndarray:
+        """Vectorized calculate_print_weight(size, venue) > 0"""
+        restricted = np.array(
+            [name in self.RESTRICTED_VENUES for name in venue_names()] or [False],
+            dtype=bool
+        )
+        size = arr['size']
+        codes = np.minimum(arr['venue'], len(restricted) - 1)
+        return (size >= 15) & (~restricted[codes] | (size == 100) | (size == 200))
+
+    def _build_price_index(self, truth_ticks: Any) -> '_PriceRangeIndex':
+        """Price-sorted range index over tick dicts or a TICK_DTYPE array"""
+        if isinstance(truth_ticks, np.ndarray):
+            price = truth_ticks['price'].astype(np.float64)
+            size = truth_ticks['size'].astype(np.float64)
+            ts = truth_ticks['ts'].astype(np.float64)
+            restricted_by_code = np.array(
+                [name.upper() in self.RESTRICTED_VENUES for name in venue_names()] or [False],
+                dtype=bool
+            )
+            codes = np.minimum(truth_ticks['venue'], len(restricted_by_code) - 1)
+            restricted = restricted_by_code[codes]
+        else:
+            price = np.array([t.get('price', 0) for t in truth_ticks], dtype=np.float64)
+            size = np.array([t.get('size', 0) for t in truth_ticks], dtype=np.float64)
+            ts = np.array([t.get('ts', 0) for t in truth_ticks], dtype=np.float64)
+            restricted = np.array(
+                [str(t.get('exch', 'UNKNOWN')).upper() in self.RESTRICTED_VENUES for t in truth_ticks],
+                dtype=bool
+            )
+        
+        # size * calculate_print_weight(size, venue) (binary weight)
+        accepted = (size >= 15) & (~restricted | (size == 100) | (size == 200))
+        weighted_size = np.where(accepted, size, 0.0)
+        return _PriceRangeIndex(price, weighted_size, ts)
+
     def find_volav_at_time_window(self, truth_ticks: List[Dict], target_ts: float, avg_adv: float) -> Optional[float]:
         """
         Find Volav price at a specific historical timestamp with tolerance.
@@ -358,20 +448,15 @@ class TruthTicksEngine:
                 return None
             
             # Parse timestamp to float (unix timestamp)
+            # Router prints arrive as epoch float already (parsed once in TradePrintRouter)
             if isinstance(timestamp, str):
-                # Try to parse ISO format or other formats
-                try:
-                    dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                    timestamp = dt.timestamp()
-                except:
-                    # Fallback: use current time
+                # Unparseable string → fallback: use current time
+                timestamp = parse_print_time(timestamp, None)
+                if timestamp is None:
                     timestamp = time.time()
             elif isinstance(timestamp, (int, float)):
-                timestamp = float(timestamp)
-                # Hammer Pro sends epoch milliseconds (e.g., 1773195043000)
-                # Convert to seconds if needed
-                if timestamp > 1e12:
-                    timestamp = timestamp / 1000.0
+                # Hammer Pro sends epoch milliseconds (e.g., 1773195043000) → seconds
+                timestamp = parse_print_time(timestamp)
             else:
                 return None
             
@@ -437,7 +522,7 @@ class TruthTicksEngine:
         
         # FNRA / ADFN Specific Rule
         # Added ADFN, FINRA, OTC to restricted list per user request
-        if venue_upper in ['FNRA', 'ADFN', 'FINRA', 'OTC', 'DARK']:
+        if venue_upper in self.RESTRICTED_VENUES:
             # Strictly only 100 or 200 allowed for FNRA/ADFN
             # The user explicitly asked for "FNRA elemesi" - we treat this as "Strict Mode"
             # Strictly only 100 or 200 allowed for FNRA
@@ -526,16 +611,24 @@ class TruthTicksEngine:
     
     def compute_volav_levels(
         self,
-        truth_ticks: List[Dict[str, Any]],
+        truth_ticks: Any,
         top_n: int = 4,
         avg_adv: float = 0.0,
         return_all_buckets: bool = False
     ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
         """
         Compute Volume-Averaged Levels (Volav) using WEIGHTED volume.
+        
+        truth_ticks: list of tick dicts or a TICK_DTYPE array slice.
+        
+        Vectorized: buckets via np.bincount, range queries via searchsorted on
+        a price-sorted index (O(log n) per range instead of a full rescan).
+        Sums keep the original tick order, so results match the former
+        dict-loop implementation exactly.
         """
-        if not truth_ticks:
+        if len(truth_ticks) == 0:
             return [], []
+        index = self._build_price_index(truth_ticks)
         
         # Get dynamic bucket size and min gap based on avg_adv
         dynamic_bucket_size = self.bucket_size(avg_adv)
@@ -545,53 +638,40 @@ class TruthTicksEngine:
         # MM-Anchor minimum gap
         MM_ANCHOR_MIN_GAP = 0.06
         
-        # Step 1: Bucket aggregation
-        bucket_volume: Dict[float, float] = defaultdict(float)
-        bucket_price_sum: Dict[float, float] = defaultdict(float)
-        bucket_tick_count: Dict[float, int] = defaultdict(int)
-        
-        for tick in truth_ticks:
-            price = tick.get('price', 0)
-            size = tick.get('size', 0)
-            
-            if price <= 0 or size <= 0:
-                continue
-            
-            # Weighted volume (pass venue for FNRA rule consistency)
-            venue = tick.get('exch', 'UNKNOWN')
-            weight = self.calculate_print_weight(size, venue)
-            weighted_size = size * weight
-            
-            if weighted_size <= 0:
-                continue
-            
-            # Bucket key: round to dynamic bucket_size
-            bucket_key = round(price / dynamic_bucket_size) * dynamic_bucket_size
-            
-            # Aggregate by WEIGHTED volume
-            bucket_volume[bucket_key] += weighted_size
-            bucket_price_sum[bucket_key] += price * weighted_size
-            bucket_tick_count[bucket_key] += 1
-        
-        if not bucket_volume:
+        # Step 1: Bucket aggregation (WEIGHTED volume, bucket = round(price / bucket_size))
+        price = index.price
+        weighted = index.weighted_size
+        valid = (price > 0) & (weighted > 0)
+        if not valid.any():
             return [], []
         
-        # Calculate bucket VWAP for each bucket
-        bucket_vwap: Dict[float, float] = {}
-        total_volume = sum(bucket_volume.values())
+        valid_price = price[valid]
+        valid_weighted = weighted[valid]
+        bucket_ids = np.rint(valid_price / dynamic_bucket_size).astype(np.int64)
+        bins = bucket_ids - bucket_ids.min()
+        bin_volume = np.bincount(bins, weights=valid_weighted)
+        bin_price_sum = np.bincount(bins, weights=valid_price * valid_weighted)
+        bin_tick_count = np.bincount(bins)
+        
+        # Buckets in first-seen order (dict insertion order of the former implementation)
+        present_bins, first_seen = np.unique(bins, return_index=True)
+        present_bins = present_bins[np.argsort(first_seen, kind='stable')]
+        volumes = bin_volume[present_bins].tolist()
+        price_sums = bin_price_sum[present_bins].tolist()
+        tick_counts = bin_tick_count[present_bins].tolist()
+        bucket_keys = (bucket_ids.min() + present_bins).tolist()
         
-        for bucket_key, volume in bucket_volume.items():
-            price_sum = bucket_price_sum[bucket_key]
-            bucket_vwap[bucket_key] = price_sum / volume if volume > 0 else bucket_key
+        total_volume = sum(volumes)
         
         # Build all buckets list (for debugging)
         all_buckets = []
-        for bucket_key, volume in bucket_volume.items():
+        for key_id, volume, price_sum, tick_count in zip(bucket_keys, volumes, price_sums, tick_counts):
+            bucket_key = key_id * dynamic_bucket_size
             all_buckets.append({
                 'bucket_key': bucket_key,
-                'price': bucket_vwap[bucket_key],
+                'price': price_sum / volume if volume > 0 else bucket_key,
                 'volume': volume,
-                'tick_count': bucket_tick_count[bucket_key],
+                'tick_count': tick_count,
                 'pct_of_truth_volume': (volume / total_volume * 100) if total_volume > 0 else 0
             })
         
@@ -610,35 +690,15 @@ class TruthTicksEngine:
             bucket_range_min = bucket_center - half_bucket
             bucket_range_max = bucket_center + half_bucket
             
-            # Find all ticks within this Volav range (center ± bucket_size/2)
-            range_ticks = [
-                tick for tick in truth_ticks
-                if bucket_range_min <= tick.get('price', 0) <= bucket_range_max
-            ]
-            
-            if not range_ticks:
+            # All ticks within this Volav range (center ± bucket_size/2), WEIGHTED
+            range_stats = index.query(bucket_range_min, bucket_range_max)
+            if range_stats is None:
                 continue
             
-            # Calculate VWAP and volume for this range (WEIGHTED)
-            range_volume = 0.0
-            range_price_sum = 0.0
-            range_ticks_filtered = []
-            
-            for tick in range_ticks:
-                size = tick.get('size', 0)
-                price = tick.get('price', 0)
-                venue = tick.get('exch', 'UNKNOWN')
-                weight = self.calculate_print_weight(size, venue)
-                weighted_size = size * weight
-                
-                if weighted_size > 0:
-                     range_volume += weighted_size
-                     range_price_sum += price * weighted_size
-                     range_ticks_filtered.append(tick)
-            
+            range_volume, range_price_sum, range_tick_count, range_last_ts, _ = range_stats
             range_vwap = range_price_sum / range_volume if range_volume > 0 else bucket_center
-            range_tick_count = len(range_ticks_filtered)
-            range_last_ts = max([tick.get('ts', 0) for tick in range_ticks_filtered]) if range_ticks_filtered else 0
+            if range_last_ts is None:
+                range_last_ts = 0
             
             # Check if this Volav should be merged with existing Volavs
             merged = False
@@ -657,33 +717,13 @@ class TruthTicksEngine:
                     combined_range_min = min(existing_range_min, bucket_range_min)
                     combined_range_max = max(existing_range_max, bucket_range_max)
                     
-                    # Find all ticks in combined range
-                    combined_ticks = [
-                        tick for tick in truth_ticks
-                        if combined_range_min <= tick.get('price', 0) <= combined_range_max
-                    ]
+                    # All ticks in combined range
+                    combined_stats = index.query(combined_range_min, combined_range_max)
                     
-                    if combined_ticks:
-                        combined_volume = 0.0
-                        combined_price_sum = 0.0
-                        combined_filtered_ticks = []
-                        
-                        for tick in combined_ticks:
-                            size = tick.get('size', 0)
-                            price = tick.get('price', 0)
-                            venue = tick.get('exch', 'UNKNOWN')
-                            weight = self.calculate_print_weight(size, venue)
-                            weighted_size = size * weight
-                            
-                            if weighted_size > 0:
-                                combined_volume += weighted_size
-                                combined_price_sum += price * weighted_size
-                                combined_filtered_ticks.append(tick)
-                            
+                    if combined_stats is not None:
+                        combined_volume, combined_price_sum, combined_tick_count, _, combined_last_ts = combined_stats
                         combined_vwap = combined_price_sum / combined_volume if combined_volume > 0 else existing_center
-                        combined_tick_count = len(combined_filtered_ticks)
                         combined_pct = (combined_volume / total_volume * 100) if total_volume > 0 else 0
-                        combined_last_ts = max([tick.get('ts', 0) for tick in combined_ticks]) if combined_ticks else max(existing_volav.get('last_print_ts', 0), range_last_ts)
                         
                         # Update existing Volav with merged data
                         existing_volav['price'] = combined_vwap
@@ -732,33 +772,15 @@ class TruthTicksEngine:
                         final_range_min = min(merged_volav['range_min'], other_range_min)
                         final_range_max = max(merged_volav['range_max'], other_range_max)
                         
-                        # Find all ticks in final combined range
-                        final_ticks = [
-                            tick for tick in truth_ticks
-                            if final_range_min <= tick.get('price', 0) <= final_range_max
-                        ]
+                        # All ticks in final combined range
+                        final_stats = index.query(final_range_min, final_range_max)
                         
-                        if final_ticks:
-                            final_volume = 0.0
-                            final_price_sum = 0.0
-                            final_filtered_ticks = []
-                            
-                            for tick in final_ticks:
-                                size = tick.get('size', 0)
-                                price = tick.get('price', 0)
-                                venue = tick.get('exch', 'UNKNOWN')
-                                weight = self.calculate_print_weight(size, venue)
-                                weighted_size = size * weight
-                                
-                                if weighted_size > 0:
-                                    final_volume += weighted_size
-                                    final_price_sum += price * weighted_size
-                                    final_filtered_ticks.append(tick)
-                            
+                        if final_stats is not None:
+                            final_volume, final_price_sum, final_tick_count, final_last_ts, _ = final_stats
                             final_vwap = final_price_sum / final_volume if final_volume > 0 else merged_center
-                            final_tick_count = len(final_filtered_ticks)
                             final_pct = (final_volume / total_volume * 100) if total_volume > 0 else 0
-                            final_last_ts = max([tick.get('ts', 0) for tick in final_filtered_ticks]) if final_filtered_ticks else max(merged_volav.get('last_print_ts', 0), other_volav.get('last_print_ts', 0))
+                            if final_last_ts is None:
+                                final_last_ts = max(merged_volav.get('last_print_ts', 0), other_volav.get('last_print_ts', 0))
                             
                             # Update merged Volav
                             merged_volav['price'] = final_vwap
@@ -826,7 +848,7 @@ class TruthTicksEngine:
         MM_ANCHOR_MIN_GAP = 0.06
         volav_levels = self._apply_mm_anchor_spacing_constraint(
             volav_levels,
-            truth_ticks,
+            index,
             total_volume,
             MM_ANCHOR_MIN_GAP,
             half_bucket
@@ -837,7 +859,7 @@ class TruthTicksEngine:
     def _apply_mm_anchor_spacing_constraint(
         self,
         volav_levels: List[Dict[str, Any]],
-        truth_ticks: List[Dict[str, Any]],
+        truth_ticks: Any,
         total_volume: float,
         min_gap: float = 0.06,
         half_bucket: float = 0.005
@@ -853,7 +875,7 @@ class TruthTicksEngine:
         
         Args:
             volav_levels: List of Volav levels (already merged with merge_threshold)
-            truth_ticks: All truth ticks (for recalculating merged Volavs)
+            truth_ticks: All truth ticks (list / array / _PriceRangeIndex) for recalculating merged Volavs
             total_volume: Total truth volume
             min_gap: Minimum gap between anchors (default: 0.06)
             half_bucket: Half of bucket size (for range calculation)
@@ -864,6 +886,8 @@ class TruthTicksEngine:
         if len(volav_levels) <= 1:
             return volav_levels
         
+        index = truth_ticks if isinstance(truth_ticks, _PriceRangeIndex) else self._build_price_index(truth_ticks)
+        
         # Sort by price (ascending)
         sorted_volavs = sorted(volav_levels, key=lambda v: v.get('price', 0))
         
@@ -902,34 +926,15 @@ class TruthTicksEngine:
                 combined_range_min = min(v1_range_min, v2_range_min)
                 combined_range_max = max(v1_range_max, v2_range_max)
                 
-                # Find all ticks in combined range
-                combined_ticks = [
-                    tick for tick in truth_ticks
-                    if combined_range_min <= tick.get('price', 0) <= combined_range_max
-                ]
+                # All ticks in combined range (weighted volume integration)
+                combined_stats = index.query(combined_range_min, combined_range_max)
                 
-                if combined_ticks:
-                    # Weighted volume integration
-                    combined_volume = 0.0
-                    combined_price_sum = 0.0
-                    combined_filtered_ticks = []
-                    
-                    for tick in combined_ticks:
-                        size = tick.get('size', 0)
-                        price = tick.get('price', 0)
-                        venue = tick.get('exch', 'UNKNOWN')
-                        weight = self.calculate_print_weight(size, venue)
-                        weighted_size = size * weight
-                        
-                        if weighted_size > 0:
-                             combined_volume += weighted_size
-                             combined_price_sum += price * weighted_size
-                             combined_filtered_ticks.append(tick)
-
+                if combined_stats is not None:
+                    combined_volume, combined_price_sum, combined_tick_count, combined_last_ts, _ = combined_stats
                     combined_vwap = combined_price_sum / combined_volume if combined_volume > 0 else (v1['price'] + v2['price']) / 2
-                    combined_tick_count = len(combined_filtered_ticks)
                     combined_pct = (combined_volume / total_volume * 100) if total_volume > 0 else 0
-                    combined_last_ts = max([tick.get('ts', 0) for tick in combined_filtered_ticks]) if combined_filtered_ticks else max(v1.get('last_print_ts', 0), v2.get('last_print_ts', 0))
+                    if combined_last_ts is None:
+                        combined_last_ts = max(v1.get('last_print_ts', 0), v2.get('last_print_ts', 0))
                     
                     # Create merged Volav
                     merged_volav = {
@@ -1060,41 +1065,24 @@ class TruthTicksEngine:
             Metrics dict or None if insufficient data
         """
         try:
-            with self._tick_lock:
-                if symbol not in self.tick_store:
-                    return None
-                
-            # Get last 10000 ticks (renamed from 200, kept var name for minimal diff but logic changed)
-                all_ticks = list(self.tick_store[symbol])
-            
-            if not all_ticks:
-                return None
-            
-            # Filter to TruthTicks
-            truth_ticks_200 = self.filter_truth_ticks(all_ticks)
-            
-            if not truth_ticks_200:
+            # Time-sorted TruthTicks as a structured array (ring buffer slice)
+            truth_arr = self.get_truth_tick_array(symbol)
+            if truth_arr is None or not len(truth_arr):
                 return None
             
             # Apply 10-day limit: Only use ticks from last 10 days
             current_time = time.time()
             ten_days_ago = current_time - (10 * 24 * 60 * 60)  # 10 days in seconds
-            
-            # Filter truth_ticks_200 to only include ticks from last 10 days
-            truth_ticks_200_filtered = [
-                tick for tick in truth_ticks_200
-                if tick.get('ts', 0) >= ten_days_ago
-            ]
+            window_arr = truth_arr[np.searchsorted(truth_arr['ts'], ten_days_ago, side='left'):]
+            truth_ticks_200_filtered = TickRingBuffer.to_dicts(window_arr)
             
             # Check tick count in last 10 days for insufficient data flag
             ticks_in_last_10_days = len(truth_ticks_200_filtered)
             insufficient_data_flag = ticks_in_last_10_days < 30
             
             # Get most recent 100 TruthTicks for VWAP calculation (from filtered set)
-            if len(truth_ticks_200_filtered) >= self.REQUIRED_TRUTH_TICKS:
-                truth_ticks_100 = truth_ticks_200_filtered[-self.REQUIRED_TRUTH_TICKS:]
-            else:
-                truth_ticks_100 = truth_ticks_200_filtered
+            recent_arr = window_arr[-self.REQUIRED_TRUTH_TICKS:]
+            truth_ticks_100 = truth_ticks_200_filtered[-self.REQUIRED_TRUTH_TICKS:]
             
             # Check if we have minimum TruthTicks
             insufficient_truth_ticks = len(truth_ticks_100) < self.MIN_TRUTH_TICKS
@@ -1103,17 +1091,10 @@ class TruthTicksEngine:
             truth_tick_count_100 = len(truth_ticks_100)
             
             # VWAP: Sum(Price * Size) / Sum(Size) -> CRITICAL: Use Weighted Volume
-            truth_volume_100 = 0.0
-            truth_value_100 = 0.0
-            
-            for tick in truth_ticks_100:
-                size = tick.get('size', 0)
-                price = tick.get('price', 0)
-                weight = self.calculate_print_weight(size)
-                weighted_size = size * weight
-                
-                truth_volume_100 += weighted_size
-                truth_value_100 += price * weighted_size
+            # (size-only weight: every stored TruthTick has size >= 15 → weight 1.0)
+            weighted_sizes = np.where(recent_arr['size'] >= 15, recent_arr['size'], 0.0)
+            truth_volume_100 = float(weighted_sizes.sum())
+            truth_value_100 = float((recent_arr['price'] * weighted_sizes).sum())
             
             # Truth VWAP (Volume Weighted Average Price)
             truth_vwap_100 = truth_value_100 / truth_volume_100 if truth_volume_100 > 0 else 0
@@ -1123,11 +1104,11 @@ class TruthTicksEngine:
             
             # Venue volume mix
             volume_by_exch: Dict[str, float] = defaultdict(float)
-            for tick in truth_ticks_100:
-                exch = tick.get('exch', 'UNKNOWN')
-                size = tick.get('size', 0)
-                weight = self.calculate_print_weight(size)
-                volume_by_exch[exch] += size * weight
+            venue_volume = np.bincount(recent_arr['venue'], weights=weighted_sizes)
+            names = venue_names()
+            for code in np.unique(recent_arr['venue']).tolist():
+                exch = names[code] if code < len(names) else 'UNKNOWN'
+                volume_by_exch[exch] += float(venue_volume[code])
             
             venue_mix_pct: Dict[str, float] = {}
             if truth_volume_100 > 0:
@@ -1136,7 +1117,7 @@ class TruthTicksEngine:
             
             # Volav levels (from truth_ticks_100) - Volume Weighted Average Price clusters
             # Each Volav is a VWAP of a volume-dominant price region
-            volav_levels, _ = self.compute_volav_levels(truth_ticks_100, top_n=4, avg_adv=avg_adv)
+            volav_levels, _ = self.compute_volav_levels(recent_arr, top_n=4, avg_adv=avg_adv)
             min_volav_gap_used = self.min_volav_gap(avg_adv) if avg_adv > 0 else 0.05
             
             # Volav Timeline - How Volav levels evolve over time (5 windows)
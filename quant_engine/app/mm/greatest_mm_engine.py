@@ -307,11 +307,14 @@ class GreatestMMEngine:
                 return True
             return False
     
-    def update_new_print(self, symbol: str, price: float, size: int):
+    def update_new_print(self, symbol: str, price: float, size: int, ts: Optional[float] = None):
         """
         Update new print for a symbol.
         
         If prints accumulate near new_print area, update son5_tick.
+        
+        Args:
+            ts: Print epoch time (TradePrintRouter record 'ts'); receive time if None
         """
         with self._lock:
             if symbol not in self.recent_prints:
@@ -320,7 +323,7 @@ class GreatestMMEngine:
             self.recent_prints[symbol].append({
                 'price': price,
                 'size': size,
-                'ts': datetime.now().timestamp()
+                'ts': ts if ts is not None else datetime.now().timestamp()
             })
             
             # If symbol in watchlist, update new_print
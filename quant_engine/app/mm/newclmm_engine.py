@@ -29,7 +29,6 @@ VALIDATED EDGE (1.46M simulation + TEST set):
   - Med spread 25c + 3-consec: %82 WR, $3K/day (sim)
 """
 
-import json
 import time
 from datetime import datetime
 from typing import List, Dict, Any, Optional
@@ -38,6 +37,8 @@ from dataclasses import dataclass, field
 
 from app.core.logger import logger
 from app.core.redis_client import get_redis_client
+from app.market_data.tick_ring_buffer import venue_name
+from app.market_data.truth_tick_read_model import SOURCE_INSPECT, get_truth_tick_read_model
 from app.psfalgo.decision_models import DecisionRequest, Decision
 from app.psfalgo.free_exposure_engine import get_free_exposure_engine
 
@@ -116,10 +117,8 @@ def get_dynamic_config(spread_dollars: float) -> Dict[str, Any]:
 ORDER_TYPE = "LIMIT"        # Limit order
 HIDDEN = True               # Always hidden — never show on book
 
-# FNRA venue filter
-FNRA_VENUE = 'FNRA'
-FNRA_VALID_SIZES = frozenset({100, 200})  # Only 100/200 from FNRA
-NON_FNRA_MIN_SIZE = 15                     # Others: ≥15 lot
+# FNRA venue filter (FNRA: only 100/200 | others: ≥15 lot) is applied once
+# per blob version by TruthTickReadModel (TruthTickSeries.truth)
 
 # Consecutive tick (momentum signal)
 CONSEC_STRONG = 3           # 3+ consecutive = STRONG signal (lot boost)
@@ -391,54 +390,23 @@ class NewCLMMEngine:
         FNRA: only 100/200 | Others: ≥15 lot
         """
         result = {}
-        redis = self._get_redis()
-        if not redis:
+        try:
+            # Shared read model: blobs parsed once per version, filter precomputed
+            series_by_symbol = get_truth_tick_read_model().get_many(symbols, SOURCE_INSPECT)
+        except Exception as e:
+            logger.debug(f"[{self.ENGINE_NAME}] Tick fetch err: {e}")
             return result
         
-        for symbol in symbols:
-            try:
-                key = f"truth_ticks:inspect:{symbol}"
-                raw = redis.get(key)
-                if not raw:
-                    continue
-                if isinstance(raw, bytes):
-                    raw = raw.decode('utf-8')
-                
-                data = json.loads(raw)
-                path_data = data.get('data', {}).get('path_dataset', [])
-                if not path_data:
-                    continue
-                
-                filtered = []
-                for t in path_data:
-                    venue = t.get('venue', '')
-                    size = t.get('size', 0)
-                    
-                    # FNRA filter: only 100 or 200
-                    if venue == FNRA_VENUE:
-                        if size not in FNRA_VALID_SIZES:
-                            continue
-                    else:
-                        # Non-FNRA: must be ≥15
-                        if size < NON_FNRA_MIN_SIZE:
-                            continue
-                    
-                    price = t.get('price', 0)
-                    if price <= 0:
-                        continue
-                    
-                    filtered.append({
-                        'ts': t.get('timestamp', 0),
-                        'price': price,
-                        'size': size,
-                        'venue': venue,
-                    })
-                
-                if filtered:
-                    result[symbol] = sorted(filtered, key=lambda x: x['ts'])
-            
-            except Exception as e:
-                logger.debug(f"[{self.ENGINE_NAME}] Tick fetch err {symbol}: {e}")
+        for symbol, series in series_by_symbol.items():
+            truth = series.truth  # FNRA 100/200 | others ≥15 | price > 0, ts sorted
+            if len(truth):
+                result[symbol] = [
+                    {'ts': ts, 'price': price, 'size': size, 'venue': venue_name(code)}
+                    for ts, price, size, code in zip(
+                        truth['ts'].tolist(), truth['price'].tolist(),
+                        truth['size'].tolist(), truth['venue'].tolist()
+                    )
+                ]
         
         return result
     
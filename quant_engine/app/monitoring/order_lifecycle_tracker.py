@@ -14,7 +14,7 @@ Data Sources (per account):
   - psfalgo:exposure:{account}           → exposure (pot_total, pot_max, pct)
   - psfalgo:open_orders:{account}        → open orders
   - psfalgo:todays_fills:{account}       → today's fills
-  - tt:ticks:{symbol}                    → truth tick history
+  - tt:ticks:{symbol}                    → truth tick history (via TruthTickReadModel)
   - ETF:PFF live data                    → PFF health monitoring
 
 Output:
@@ -36,6 +36,7 @@ from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 
 from app.core.logger import logger
+from app.market_data.truth_tick_read_model import SOURCE_RAW, get_truth_tick_read_model
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -480,27 +481,14 @@ class OrderLifecycleTracker:
         ⚠️ STALENESS CHECK: Rejects ticks older than 24 hours.
         """
         try:
-            import time as _time_tt
-            r = self._get_redis()
-            raw = r.get(f"tt:ticks:{symbol}")
-            if raw:
-                ticks = json.loads(raw)
-                if ticks and isinstance(ticks, list):
-                    now = _time_tt.time()
-                    STALENESS_LIMIT = 86400  # 24 hours
-                    # Iterate from newest to oldest
-                    for tick in reversed(ticks):
-                        tick_ts = tick.get('ts', 0)
-                        if tick_ts > 0 and (now - tick_ts) > STALENESS_LIMIT:
-                            continue  # STALE — skip
-                        price = float(tick.get('price', 0))
-                        if price > 0:
-                            return (
-                                price,
-                                tick.get('exch', tick.get('venue', ''))
-                            )
-                    # All ticks are stale
-                    return (0.0, '')
+            STALENESS_LIMIT = 86400  # 24 hours
+            series = get_truth_tick_read_model().get(symbol, SOURCE_RAW)
+            if series is not None:
+                # Newest non-stale tick (all stale → none)
+                latest = series.latest(1, max_age_sec=STALENESS_LIMIT)
+                if latest:
+                    return (latest[0]['price'], latest[0]['exch'])
+                return (0.0, '')
         except Exception:
             pass
         return (0.0, '')
@@ -508,25 +496,13 @@ class OrderLifecycleTracker:
     def _get_last_n_truth_ticks(self, symbol: str, n: int = 5) -> List[Dict[str, Any]]:
         """Get last N truth ticks as compact dicts: [{p: price, v: venue, ts: timestamp}, ...]"""
         try:
-            r = self._get_redis()
-            raw = r.get(f"tt:ticks:{symbol}")
-            if not raw:
-                return []
-            ticks = json.loads(raw)
-            if not ticks or not isinstance(ticks, list):
+            series = get_truth_tick_read_model().get(symbol, SOURCE_RAW)
+            if series is None:
                 return []
-            result = []
-            for tick in reversed(ticks):  # newest first
-                price = float(tick.get('price', 0))
-                if price > 0:
-                    result.append({
-                        'p': round(price, 4),
-                        'v': tick.get('exch', tick.get('venue', '')),
-                        'ts': tick.get('ts', 0),
-                    })
-                if len(result) >= n:
-                    break
-            return result
+            return [
+                {'p': round(tick['price'], 4), 'v': tick['exch'], 'ts': tick['ts']}
+                for tick in series.latest(n)  # newest first
+            ]
         except Exception:
             return []
 
@@ -552,27 +528,15 @@ class OrderLifecycleTracker:
             'dominant_venue': '', 'tick_count': 0,
         }
         try:
-            r = self._get_redis()
-            raw = r.get(f"tt:ticks:{symbol}")
-            if not raw:
-                return result
-            ticks = json.loads(raw)
-            if not ticks or not isinstance(ticks, list):
+            series = get_truth_tick_read_model().get(symbol, SOURCE_RAW)
+            if series is None:
                 return result
 
-            # Filter valid ticks (last 2 hours — illiquid prefs trade rarely)
-            now = time.time()
-            valid = []
-            for tick in reversed(ticks):  # newest first
-                ts = tick.get('ts', 0)
-                if ts > 0 and (now - ts) > 7200:  # 2 hour cutoff (was 5min — too short for illiquid)
-                    continue
-                price = float(tick.get('price', 0))
-                if price > 0:
-                    venue = tick.get('exch', tick.get('venue', ''))
-                    valid.append({'price': price, 'venue': venue, 'ts': ts})
-                if len(valid) >= lookback:
-                    break
+            # Valid ticks, newest first (last 2 hours — illiquid prefs trade rarely; was 5min)
+            valid = [
+                {'price': tick['price'], 'venue': tick['exch'], 'ts': tick['ts']}
+                for tick in series.latest(lookback, max_age_sec=7200)
+            ]
 
             if not valid:
                 return result
@@ -616,24 +580,18 @@ class OrderLifecycleTracker:
     def _get_l1(self, symbol: str) -> Tuple[float, float]:
         """Get bid/ask for a symbol.
         
-        🔑 TICKER CONVENTION: Tries both Hammer and PREF_IBKR formats.
+        🔑 TICKER CONVENTION: Tries both Hammer and PREF_IBKR formats
+        (shared L1Resolver, cached format variants).
         """
         try:
-            from app.core.data_fabric import DataFabric
-            from app.live.symbol_mapper import SymbolMapper
-            
-            fb = DataFabric()
+            from app.core.l1_resolver import resolve_l1_sync
             
-            # Try all format variants
-            hammer_sym = SymbolMapper.to_hammer_symbol(symbol)
-            display_sym = SymbolMapper.to_display_symbol(symbol)
-            for sym in dict.fromkeys([symbol, hammer_sym, display_sym]):
-                snap = fb.get_fast_snapshot(sym)
-                if snap:
-                    bid = float(snap.get('bid', 0) or 0)
-                    ask = float(snap.get('ask', 0) or 0)
-                    if bid > 0 and ask > 0:
-                        return (bid, ask)
+            l1 = resolve_l1_sync([symbol]).get(symbol)
+            if l1:
+                bid = float(l1.get('bid', 0) or 0)
+                ask = float(l1.get('ask', 0) or 0)
+                if bid > 0 and ask > 0:
+                    return (bid, ask)
         except Exception:
             pass
         return (0.0, 0.0)
@@ -2,18 +2,38 @@
 
 Parameter optimizer for strategy parameter tuning.
 Supports grid search and random search.
+
+Historical data is read and converted once per optimize() call into
+SharedMarketData (memory-mapped NumPy columns); every evaluation slices its
+ticks from there instead of re-reading CSV/Parquet through DataReader.
+With n_jobs > 1 combinations fan out over a process pool whose workers open
+the same memory maps once (pool initializer). Results stream back as they
+finish (iter_results / on_result); all_results is still returned in
+combination order, and ties resolve to the earlier combination, so a
+parallel run picks the same best parameters as a sequential one.
+
+Early abandonment: a running backtest is stopped as soon as its drawdown
+passes a bound it can no longer recover from:
+- DRAWDOWN scoring: max drawdown only grows, so once it exceeds the best
+  finished result's drawdown the set is provably dominated.
+- max_drawdown_limit: optional hard cap for any scoring metric.
+Abandoned sets are kept in all_results with abandoned=True and never win.
 """
 
+import os
+import time
 import random
 import itertools
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
 from enum import Enum
-from typing import Dict, Any, List, Optional, Callable
+from typing import Dict, Any, List, Optional, Callable, Iterator, Tuple
 from dataclasses import dataclass
 
 from app.core.logger import logger
 from app.strategy.strategy_base import StrategyBase
 from app.backtest.backtest_engine import BacktestEngine
 from app.backtest.replay_engine import ReplayMode, ReplaySpeed
+from app.backtest.shared_market_data import SharedMarketData
 
 
 class SearchMethod(Enum):
@@ -42,6 +62,136 @@ class OptimizationResult:
     num_evaluations: int
 
 
+def score_results(results: Dict[str, Any], scoring_metric: ScoringMetric) -> float:
+    """Calculate score of backtest results for a scoring metric"""
+    if scoring_metric == ScoringMetric.PNL:
+        return results.get('total_pnl', 0)
+    elif scoring_metric == ScoringMetric.SHARPE:
+        return results.get('sharpe', 0)
+    elif scoring_metric == ScoringMetric.SORTINO:
+        return results.get('sortino', 0)
+    elif scoring_metric == ScoringMetric.DRAWDOWN:
+        # Negative drawdown (lower is better)
+        return -abs(results.get('max_drawdown', 0))
+    elif scoring_metric == ScoringMetric.WIN_RATE:
+        return results.get('win_rate', 0)
+    elif scoring_metric == ScoringMetric.PROFIT_FACTOR:
+        return results.get('profit_factor', 0)
+    elif scoring_metric == ScoringMetric.WEIGHTED:
+        # Weighted combination
+        sharpe = results.get('sharpe', 0)
+        pnl = results.get('total_pnl', 0) / 1000.0  # Normalize
+        drawdown = -abs(results.get('max_drawdown', 0))
+        win_rate = results.get('win_rate', 0)
+        
+        # Weights: sharpe=0.4, pnl=0.3, drawdown=0.2, win_rate=0.1
+        score = 0.4 * sharpe + 0.3 * pnl + 0.2 * drawdown + 0.1 * win_rate
+        return score
+    else:
+        return 0.0
+
+
+class DrawdownGuard:
+    """
+    BacktestEngine equity_guard: True once the running drawdown exceeds limit.
+    
+    Same drawdown definition as BacktestReport.compute_metrics (peak starts at
+    the first equity point), so the abandoned run's final |max_drawdown| would
+    have been > limit.
+    """
+    
+    def __init__(self, limit: float):
+        self.limit = limit
+        self.peak: Optional[float] = None
+    
+    def __call__(self, equity: float) -> bool:
+        if self.peak is None or equity > self.peak:
+            self.peak = equity
+            return False
+        return self.peak > 0 and (self.peak - equity) / self.peak > self.limit
+
+
+# Per-process market data, opened once by the pool initializer
+_worker_market_data: Optional[SharedMarketData] = None
+
+
+def _init_worker(market_data: SharedMarketData) -> None:
+    global _worker_market_data
+    _worker_market_data = market_data
+
+
+def evaluate_params(
+    strategy_class: type,
+    params: Dict[str, Any],
+    symbols: List[str],
+    start_date: str,
+    end_date: str,
+    initial_capital: float,
+    data_dir: str,
+    scoring_metric: ScoringMetric,
+    market_data: Optional[SharedMarketData] = None,
+    drawdown_limit: Optional[float] = None
+) -> Dict[str, Any]:
+    """
+    Run one backtest for a parameter set (also the process pool task).
+    
+    Args:
+        market_data: Pre-loaded data; None = the worker's shared data, or
+            DataReader if there is none
+        drawdown_limit: Abandon the run once its drawdown exceeds this
+    
+    Returns:
+        {'params', 'score', 'metrics', 'abandoned', 'eval_seconds'}
+    """
+    started = time.perf_counter()
+    if market_data is None:
+        market_data = _worker_market_data
+    
+    # Create strategy instance with parameters
+    strategy = strategy_class(**params)
+    
+    # Create backtest engine
+    engine = BacktestEngine(
+        strategy=strategy,
+        initial_capital=initial_capital,
+        data_dir=data_dir,
+        replay_mode=market_data.replay_mode if market_data is not None else ReplayMode.TICK,
+        replay_speed=ReplaySpeed.INSTANT,
+        save_reports=False,
+        keep_equity_curve=False,
+        equity_guard=DrawdownGuard(drawdown_limit) if drawdown_limit is not None else None
+    )
+    
+    # Run backtest
+    engine.run(
+        symbols=symbols,
+        start_date=start_date,
+        end_date=end_date,
+        market_data=market_data
+    )
+    
+    # Get results
+    results = engine.get_results()
+    
+    # Extract metrics
+    metrics = {
+        'total_pnl': results.get('total_pnl', 0),
+        'sharpe': results.get('sharpe', 0),
+        'sortino': results.get('sortino', 0),
+        'max_drawdown': results.get('max_drawdown', 0),
+        'win_rate': results.get('win_rate', 0),
+        'profit_factor': results.get('profit_factor', 0)
+    }
+    
+    return {
+        'params': params,
+        'score': score_results(results, scoring_metric),
+        'metrics': metrics,
+        'abandoned': engine.abandoned,
+        'eval_seconds': time.perf_counter() - started
+    }
+
+
 class ParameterOptimizer:
     """
     Parameter optimizer for strategy tuning.
@@ -50,6 +200,7 @@ class ParameterOptimizer:
     - Grid search (exhaustive)
     - Random search (sampling)
     - Multiple scoring metrics
+    - Process pool evaluation over shared, pre-parsed data
     """
     
     def __init__(
@@ -57,7 +208,10 @@ class ParameterOptimizer:
         search_method: SearchMethod = SearchMethod.GRID,
         scoring_metric: ScoringMetric = ScoringMetric.WEIGHTED,
         max_evaluations: Optional[int] = None,
-        random_seed: Optional[int] = None
+        random_seed: Optional[int] = None,
+        n_jobs: int = 1,
+        max_drawdown_limit: Optional[float] = None,
+        prune: bool = True
     ):
         """
         Initialize parameter optimizer.
@@ -67,11 +221,17 @@ class ParameterOptimizer:
             scoring_metric: Metric to optimize
             max_evaluations: Max evaluations for random search
             random_seed: Random seed for reproducibility
+            n_jobs: Worker processes (1 = in-process, -1 = all CPUs)
+            max_drawdown_limit: Abandon any set whose drawdown exceeds this fraction
+            prune: Abandon sets that provably cannot beat the best finished one
         """
         self.search_method = search_method
         self.scoring_metric = scoring_metric
         self.max_evaluations = max_evaluations
         self.random_seed = random_seed
+        self.n_jobs = n_jobs
+        self.max_drawdown_limit = max_drawdown_limit
+        self.prune = prune
         
         if random_seed:
             random.seed(random_seed)
@@ -84,7 +244,9 @@ class ParameterOptimizer:
         start_date: str,
         end_date: str,
         initial_capital: float = 100000.0,
-        data_dir: str = "data/historical"
+        data_dir: str = "data/historical",
+        market_data: Optional[SharedMarketData] = None,
+        on_result: Optional[Callable[[Dict[str, Any]], None]] = None
     ) -> OptimizationResult:
         """
         Optimize strategy parameters.
@@ -97,59 +259,32 @@ class ParameterOptimizer:
             end_date: Training end date
             initial_capital: Initial capital
             data_dir: Data directory
+            market_data: Pre-loaded data covering the date range (None = load once here)
+            on_result: Called with each result as soon as it finishes
             
         Returns:
             OptimizationResult with best parameters
         """
-        logger.info(f"Starting parameter optimization ({self.search_method.value})")
-        logger.info(f"Parameter space: {list(param_space.keys())}")
-        
-        # Generate parameter combinations
-        if self.search_method == SearchMethod.GRID:
-            param_combinations = list(itertools.product(*param_space.values()))
-        else:
-            # Random search
-            num_combinations = self._count_combinations(param_space)
-            max_evals = self.max_evaluations or min(100, num_combinations)
-            param_combinations = self._sample_random(param_space, max_evals)
-        
-        logger.info(f"Evaluating {len(param_combinations)} parameter combinations")
-        
         results = []
-        best_score = float('-inf')
-        best_params = None
+        best: Optional[Dict[str, Any]] = None
         
-        for i, param_values in enumerate(param_combinations):
-            params = dict(zip(param_space.keys(), param_values))
-            
-            try:
-                score, metrics = self._evaluate_params(
-                    strategy_class,
-                    params,
-                    symbols,
-                    start_date,
-                    end_date,
-                    initial_capital,
-                    data_dir
-                )
-                
-                result = {
-                    'params': params,
-                    'score': score,
-                    'metrics': metrics
-                }
-                results.append(result)
-                
-                if score > best_score:
-                    best_score = score
-                    best_params = params
-                
-                if (i + 1) % 10 == 0:
-                    logger.info(f"Evaluated {i + 1}/{len(param_combinations)} combinations")
-            
-            except Exception as e:
-                logger.warning(f"Error evaluating params {params}: {e}")
-                continue
+        for result in self.iter_results(
+            strategy_class, param_space, symbols, start_date, end_date,
+            initial_capital, data_dir, market_data
+        ):
+            results.append(result)
+            if on_result is not None:
+                on_result(result)
+            if not result['abandoned'] and (
+                best is None
+                or result['score'] > best['score']
+                or (result['score'] == best['score'] and result['index'] < best['index'])
+            ):
+                best = result
+        
+        results.sort(key=lambda r: r['index'])
+        best_score = best['score'] if best else float('-inf')
+        best_params = best['params'] if best else None
         
         logger.info(f"Optimization complete. Best score: {best_score:.4f}")
         logger.info(f"Best parameters: {best_params}")
@@ -161,6 +296,134 @@ class ParameterOptimizer:
             num_evaluations=len(results)
         )
     
+    def iter_results(
+        self,
+        strategy_class: type,
+        param_space: Dict[str, List[Any]],
+        symbols: List[str],
+        start_date: str,
+        end_date: str,
+        initial_capital: float = 100000.0,
+        data_dir: str = "data/historical",
+        market_data: Optional[SharedMarketData] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Evaluate all combinations, yielding each result as it finishes.
+        
+        Result dicts: {'index', 'params', 'score', 'metrics', 'abandoned',
+        'eval_seconds'}; index is the combination's position. Failed
+        evaluations are logged and skipped.
+        """
+        logger.info(f"Starting parameter optimization ({self.search_method.value})")
+        logger.info(f"Parameter space: {list(param_space.keys())}")
+        
+        param_combinations = self._generate_combinations(param_space)
+        total = len(param_combinations)
+        n_jobs = self._resolve_jobs(total)
+        logger.info(f"Evaluating {total} parameter combinations (n_jobs={n_jobs})")
+        
+        owned = market_data is None
+        if owned:
+            market_data = SharedMarketData.load(data_dir, symbols, start_date, end_date)
+        
+        keys = list(param_space.keys())
+        jobs = [(i, dict(zip(keys, values))) for i, values in enumerate(param_combinations)]
+        best: Dict[str, Any] = {}
+        started = time.perf_counter()
+        done = 0
+        
+        def task_args(params: Dict[str, Any]) -> tuple:
+            return (
+                strategy_class, params, symbols, start_date, end_date,
+                initial_capital, data_dir, self.scoring_metric
+            )
+        
+        def finished(index: int, result: Dict[str, Any]) -> Dict[str, Any]:
+            nonlocal done
+            done += 1
+            result['index'] = index
+            if not result['abandoned'] and ('metrics' not in best or result['score'] > best['score']):
+                best.update(result)
+            if done % 10 == 0 or done == total:
+                elapsed = time.perf_counter() - started
+                logger.info(
+                    f"Evaluated {done}/{total} combinations "
+                    f"({done / elapsed if elapsed > 0 else 0:.2f}/s, best score {best.get('score', float('nan')):.4f})"
+                )
+            return result
+        
+        try:
+            if n_jobs == 1:
+                for index, params in jobs:
+                    try:
+                        result = evaluate_params(
+                            *task_args(params), market_data=market_data,
+                            drawdown_limit=self._drawdown_limit(best)
+                        )
+                    except Exception as e:
+                        logger.warning(f"Error evaluating params {params}: {e}")
+                        continue
+                    yield finished(index, result)
+                return
+            
+            with ProcessPoolExecutor(
+                max_workers=n_jobs, initializer=_init_worker, initargs=(market_data,)
+            ) as pool:
+                pending = {}
+                queue = iter(jobs)
+                max_in_flight = n_jobs * 2  # Keep prune bounds fresh for queued sets
+                try:
+                    while True:
+                        for index, params in queue:
+                            future = pool.submit(
+                                evaluate_params, *task_args(params),
+                                drawdown_limit=self._drawdown_limit(best)
+                            )
+                            pending[future] = (index, params)
+                            if len(pending) >= max_in_flight:
+                                break
+                        if not pending:
+                            break
+                        completed, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in completed:
+                            index, params = pending.pop(future)
+                            try:
+                                result = future.result()
+                            except Exception as e:
+                                logger.warning(f"Error evaluating params {params}: {e}")
+                                continue
+                            yield finished(index, result)
+                finally:
+                    for future in pending:
+                        future.cancel()
+        finally:
+            if owned:
+                market_data.close()
+    
+    def _generate_combinations(self, param_space: Dict[str, List[Any]]) -> List[tuple]:
+        """Parameter combinations for the search method"""
+        if self.search_method == SearchMethod.GRID:
+            return list(itertools.product(*param_space.values()))
+        # Random search
+        num_combinations = self._count_combinations(param_space)
+        max_evals = self.max_evaluations or min(100, num_combinations)
+        return self._sample_random(param_space, max_evals)
+    
+    def _resolve_jobs(self, total: int) -> int:
+        n_jobs = self.n_jobs or 1
+        if n_jobs < 0:
+            n_jobs = os.cpu_count() or 1
+        return max(1, min(n_jobs, total))
+    
+    def _drawdown_limit(self, best: Dict[str, Any]) -> Optional[float]:
+        """Drawdown beyond which a new run is dominated (None = never abandon)"""
+        limits = []
+        if self.max_drawdown_limit is not None:
+            limits.append(self.max_drawdown_limit)
+        if self.prune and self.scoring_metric == ScoringMetric.DRAWDOWN and 'metrics' in best:
+            limits.append(abs(best['metrics'].get('max_drawdown', 0)))
+        return min(limits) if limits else None
+    
     def _evaluate_params(
         self,
         strategy_class: type,
@@ -169,7 +432,8 @@ class ParameterOptimizer:
         start_date: str,
         end_date: str,
         initial_capital: float,
-        data_dir: str
+        data_dir: str,
+        market_data: Optional[SharedMarketData] = None
     ) -> Tuple[float, Dict[str, Any]]:
         """
         Evaluate a parameter set.
@@ -177,70 +441,15 @@ class ParameterOptimizer:
         Returns:
             Tuple of (score, metrics_dict)
         """
-        # Create strategy instance with parameters
-        strategy = strategy_class(**params)
-        
-        # Create backtest engine
-        engine = BacktestEngine(
-            strategy=strategy,
-            initial_capital=initial_capital,
-            data_dir=data_dir,
-            replay_mode=ReplayMode.TICK,
-            replay_speed=ReplaySpeed.INSTANT
-        )
-        
-        # Run backtest
-        engine.run(
-            symbols=symbols,
-            start_date=start_date,
-            end_date=end_date
+        result = evaluate_params(
+            strategy_class, params, symbols, start_date, end_date,
+            initial_capital, data_dir, self.scoring_metric, market_data=market_data
         )
-        
-        # Get results
-        results = engine.get_results()
-        
-        # Calculate score based on metric
-        score = self._calculate_score(results)
-        
-        # Extract metrics
-        metrics = {
-            'total_pnl': results.get('total_pnl', 0),
-            'sharpe': results.get('sharpe', 0),
-            'sortino': results.get('sortino', 0),
-            'max_drawdown': results.get('max_drawdown', 0),
-            'win_rate': results.get('win_rate', 0),
-            'profit_factor': results.get('profit_factor', 0)
-        }
-        
-        return score, metrics
+        return result['score'], result['metrics']
     
     def _calculate_score(self, results: Dict[str, Any]) -> float:
         """Calculate score based on selected metric"""
-        if self.scoring_metric == ScoringMetric.PNL:
-            return results.get('total_pnl', 0)
-        elif self.scoring_metric == ScoringMetric.SHARPE:
-            return results.get('sharpe', 0)
-        elif self.scoring_metric == ScoringMetric.SORTINO:
-            return results.get('sortino', 0)
-        elif self.scoring_metric == ScoringMetric.DRAWDOWN:
-            # Negative drawdown (lower is better)
-            return -abs(results.get('max_drawdown', 0))
-        elif self.scoring_metric == ScoringMetric.WIN_RATE:
-            return results.get('win_rate', 0)
-        elif self.scoring_metric == ScoringMetric.PROFIT_FACTOR:
-            return results.get('profit_factor', 0)
-        elif self.scoring_metric == ScoringMetric.WEIGHTED:
-            # Weighted combination
-            sharpe = results.get('sharpe', 0)
-            pnl = results.get('total_pnl', 0) / 1000.0  # Normalize
-            drawdown = -abs(results.get('max_drawdown', 0))
-            win_rate = results.get('win_rate', 0)
-            
-            # Weights: sharpe=0.4, pnl=0.3, drawdown=0.2, win_rate=0.1
-            score = 0.4 * sharpe + 0.3 * pnl + 0.2 * drawdown + 0.1 * win_rate
-            return score
-        else:
-            return 0.0
+        return score_results(results, self.scoring_metric)
     
     def _count_combinations(self, param_space: Dict[str, List[Any]]) -> int:
         """Count total parameter combinations"""
@@ -2,6 +2,10 @@
 
 Walk-forward optimization engine.
 Manages the complete WFO process.
+
+Historical data for the whole walk-forward span is loaded once into
+SharedMarketData; each window's optimization (process pool when n_jobs > 1)
+and its out-of-sample test slice their ticks from it.
 """
 
 import json
@@ -14,6 +18,7 @@ from app.optimization.window_generator import WindowGenerator, WindowMode
 from app.optimization.parameter_optimizer import ParameterOptimizer, SearchMethod, ScoringMetric
 from app.backtest.backtest_engine import BacktestEngine
 from app.backtest.replay_engine import ReplayMode, ReplaySpeed
+from app.backtest.shared_market_data import SharedMarketData
 from app.strategy.strategy_base import StrategyBase
 
 
@@ -44,7 +49,9 @@ class WalkForwardEngine:
         scoring_metric: ScoringMetric = ScoringMetric.WEIGHTED,
         initial_capital: float = 100000.0,
         data_dir: str = "data/historical",
-        output_dir: str = "walkforward_results"
+        output_dir: str = "walkforward_results",
+        n_jobs: int = 1,
+        max_drawdown_limit: Optional[float] = None
     ):
         """
         Initialize walk-forward engine.
@@ -63,6 +70,8 @@ class WalkForwardEngine:
             initial_capital: Initial capital
             data_dir: Data directory
             output_dir: Output directory
+            n_jobs: Worker processes per window optimization (-1 = all CPUs)
+            max_drawdown_limit: Abandon parameter sets whose drawdown exceeds this
         """
         self.strategy_class = strategy_class
         self.param_space = param_space
@@ -72,6 +81,7 @@ class WalkForwardEngine:
         self.initial_capital = initial_capital
         self.data_dir = data_dir
         self.output_dir = output_dir
+        self.market_data: Optional[SharedMarketData] = None
         
         # Window generator
         self.window_generator = WindowGenerator(
@@ -83,7 +93,9 @@ class WalkForwardEngine:
         # Parameter optimizer
         self.optimizer = ParameterOptimizer(
             search_method=search_method,
-            scoring_metric=scoring_metric
+            scoring_metric=scoring_metric,
+            n_jobs=n_jobs,
+            max_drawdown_limit=max_drawdown_limit
         )
         
         # Results storage
@@ -113,7 +125,26 @@ class WalkForwardEngine:
         
         logger.info(f"Generated {len(windows)} windows")
         
-        # Process each window
+        # Load every window's data once
+        span_start = min(w[0] for w in windows).strftime("%Y-%m-%d")
+        span_end = max(w[3] for w in windows).strftime("%Y-%m-%d")
+        self.market_data = SharedMarketData.load(self.data_dir, self.symbols, span_start, span_end)
+        try:
+            self._run_windows(windows)
+        finally:
+            self.market_data.close()
+            self.market_data = None
+        
+        # Generate reports
+        logger.info("\n" + "="*60)
+        logger.info("Generating reports...")
+        self._generate_reports()
+        
+        logger.info(f"\nWalk-forward optimization complete!")
+        logger.info(f"Results saved to: {self.output_dir}")
+    
+    def _run_windows(self, windows: List[tuple]):
+        """Optimize and test each window"""
         for i, (train_start, train_end, test_start, test_end) in enumerate(windows):
             logger.info(f"\n{'='*60}")
             logger.info(f"Window {i+1}/{len(windows)}")
@@ -130,7 +161,8 @@ class WalkForwardEngine:
                 start_date=train_start.strftime("%Y-%m-%d"),
                 end_date=train_end.strftime("%Y-%m-%d"),
                 initial_capital=self.initial_capital,
-                data_dir=self.data_dir
+                data_dir=self.data_dir,
+                market_data=self.market_data
             )
             
             best_params = opt_result.best_params
@@ -165,14 +197,6 @@ class WalkForwardEngine:
                 'test_period': f"{test_start.strftime('%Y-%m-%d')} to {test_end.strftime('%Y-%m-%d')}"
             })
             self.oos_results.append(oos_result)
-        
-        # Generate reports
-        logger.info("\n" + "="*60)
-        logger.info("Generating reports...")
-        self._generate_reports()
-        
-        logger.info(f"\nWalk-forward optimization complete!")
-        logger.info(f"Results saved to: {self.output_dir}")
     
     def _test_parameters(
         self,
@@ -197,7 +221,8 @@ class WalkForwardEngine:
         engine.run(
             symbols=self.symbols,
             start_date=test_start,
-            end_date=test_end
+            end_date=test_end,
+            market_data=self.market_data
         )
         
         # Get results
@@ -0,0 +1,163 @@
+"""
+Cycle Scheduler - Dependency-aware engine fan-out for RUNALL
+============================================================
+
+run_single_cycle KARBOTU / REDUCEMORE / ADDNEWPOS / PATADD / LT_TRIM / MM'i
+burada koşar. Her motor bir EngineTask:
+- depends_on: sadece gerçekten okuduğu motorlar (LT_TRIM ← KARBOTU
+  signals + REDUCEMORE multipliers). Bağımsız motorlar aynı anda başlar;
+  LT_TRIM diğerlerini beklemez.
+- offload=True: motor kendi worker thread'inde, kendi event loop'uyla
+  (asyncio.run) koşar; ana event loop (WebSocket, API) bloklanmaz ve
+  sync I/O / NumPy / pandas kısımları örtüşür.
+- Sonuçlar gather(return_exceptions=True) gibi: hata veren motorun sonucu
+  Exception objesidir, diğerlerini durdurmaz.
+
+Process pool yerine thread: motorlar singleton state, Redis client ve
+Janall cache okuyor; pickle edilip başka process'e taşınamazlar.
+
+get_timings() motor başına wall time / başlangıç offset'i ve toplam cycle
+süresini verir (RUNALL cycle raporuna yazılır).
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from app.core.logger import logger
+
+
+@dataclass
+class EngineTask:
+    """One engine run inside a cycle"""
+    name: str
+    factory: Callable[[Dict[str, Any]], Awaitable[Any]]  # deps {name: result} → coroutine
+    depends_on: Tuple[str, ...] = ()
+    offload: bool = True  # Run in a worker thread (own event loop)
+
+
+def _run_in_thread(factory: Callable[[Dict[str, Any]], Awaitable[Any]], deps: Dict[str, Any]) -> Any:
+    return asyncio.run(factory(deps))
+
+
+def _check_graph(tasks: List[EngineTask]) -> None:
+    """Unknown dependency or cycle → ValueError"""
+    by_name = {t.name: t for t in tasks}
+    if len(by_name) != len(tasks):
+        raise ValueError("Duplicate engine names in cycle")
+    for task in tasks:
+        for dep in task.depends_on:
+            if dep not in by_name:
+                raise ValueError(f"{task.name} depends on unknown engine {dep}")
+
+    state: Dict[str, int] = {}  # 1 = visiting, 2 = done
+
+    def visit(name: str, path: Tuple[str, ...]) -> None:
+        if state.get(name) == 2:
+            return
+        if state.get(name) == 1:
+            raise ValueError(f"Engine dependency cycle: {' → '.join(path + (name,))}")
+        state[name] = 1
+        for dep in by_name[name].depends_on:
+            visit(dep, path + (name,))
+        state[name] = 2
+
+    for task in tasks:
+        visit(task.name, ())
+
+
+class CycleScheduler:
+    """Runs EngineTasks as soon as their dependencies finish"""
+
+    def __init__(self, max_workers: int = 4):
+        self.max_workers = max(1, max_workers)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._last_timings: Dict[str, Any] = {}
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix="runall-engine"
+                    )
+        return self._executor
+
+    async def run(self, tasks: List[EngineTask]) -> Dict[str, Any]:
+        """
+        Run all tasks.
+
+        Returns:
+            {engine name: result or Exception}
+        """
+        _check_graph(tasks)
+        loop = asyncio.get_running_loop()
+        cycle_start = time.perf_counter()
+        futures: Dict[str, asyncio.Future] = {}
+        timings: Dict[str, Dict[str, Any]] = {}
+
+        async def run_task(task: EngineTask) -> Any:
+            deps = {}
+            for dep in task.depends_on:
+                try:
+                    deps[dep] = await futures[dep]
+                except Exception as e:
+                    deps[dep] = e
+            started = time.perf_counter()
+            try:
+                if task.offload:
+                    return await loop.run_in_executor(self._get_executor(), _run_in_thread, task.factory, deps)
+                return await task.factory(deps)
+            finally:
+                timings[task.name] = {
+                    'wall_ms': round((time.perf_counter() - started) * 1000.0, 2),
+                    'start_offset_ms': round((started - cycle_start) * 1000.0, 2),
+                    'offload': task.offload,
+                    'depends_on': list(task.depends_on),
+                }
+
+        for task in tasks:
+            futures[task.name] = asyncio.ensure_future(run_task(task))
+
+        outcomes = await asyncio.gather(*futures.values(), return_exceptions=True)
+        results = dict(zip(futures.keys(), outcomes))
+
+        total_ms = (time.perf_counter() - cycle_start) * 1000.0
+        engine_sum_ms = sum(t['wall_ms'] for t in timings.values())
+        self._last_timings = {
+            'engines': timings,
+            'cycle_wall_ms': round(total_ms, 2),
+            'engine_sum_ms': round(engine_sum_ms, 2),
+        }
+        logger.info(
+            f"[CYCLE_SCHEDULER] ⏱️ Engines wall={total_ms:.0f}ms (sum {engine_sum_ms:.0f}ms): "
+            + ", ".join(f"{name}={t['wall_ms']:.0f}ms" for name, t in timings.items())
+        )
+        return results
+
+    def get_timings(self) -> Dict[str, Any]:
+        """Per-engine timings of the last run()"""
+        return self._last_timings
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+
+
+# Global instance
+_cycle_scheduler: Optional[CycleScheduler] = None
+
+
+def get_cycle_scheduler() -> CycleScheduler:
+    """Get global CycleScheduler instance (singleton)"""
+    global _cycle_scheduler
+    if _cycle_scheduler is None:
+        from app.config.settings import settings
+        _cycle_scheduler = CycleScheduler(max_workers=settings.RUNALL_ENGINE_WORKERS)
+    return _cycle_scheduler
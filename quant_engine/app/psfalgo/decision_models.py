@@ -209,6 +209,7 @@ class DecisionRequest:
     l1_data: Dict[str, Any] = field(default_factory=dict) # L1 Data (Ladder, etc.)
     snapshot_ts: Optional[datetime] = None  # Snapshot timestamp (for consistency)
     correlation_id: Optional[str] = None  # Trace ID for CleanLogs
+    epoch_id: Optional[int] = None  # MarketEpoch the request was built from (None = legacy merge)
 
 
 @dataclass
@@ -541,6 +541,8 @@ class IBKRConnector:
                     stale_date_key = f"psfalgo:befday:date:{self.account_type}"
                     redis.delete(stale_key)
                     redis.delete(stale_date_key)
+                    from app.psfalgo.position_snapshot_api import notify_befday_write
+                    notify_befday_write(self.account_type)
                     logger.info(f"[IBKR] Cleared stale Redis BEFDAY keys: {stale_key}, {stale_date_key}")
             except Exception as redis_err:
                 logger.warning(f"[IBKR] Redis stale key cleanup failed: {redis_err}")
@@ -4,17 +4,85 @@ Metrics Snapshot API - Production-Grade
 Provides async metrics snapshot API for PSFALGO decision engines.
 Aggregates data from market_data_cache, GRPAN, RWVAP, pricing_overlay, and static data.
 This is the SINGLE entry point for decision engines to get all metrics.
+
+Bulk mode: get_metrics_snapshot() reads every source's whole-universe
+cache once per call (MarketSnapshot map, static data, pricing overlay
+cache) instead of doing per-symbol lookups; get_metrics_snapshot_bulk()
+additionally returns a struct-of-arrays view (MetricsColumns).
 """
 
 from datetime import datetime
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional, Callable, Tuple
+from dataclasses import dataclass, field, fields
+
+import numpy as np
 
 from app.core.logger import logger
 from app.psfalgo.decision_models import SymbolMetrics
 from app.market_data.static_data_store import StaticDataStore
 
 
+DEFAULT_SNAPSHOT_ACCOUNT = 'IBKR_GUN'  # MarketSnapshotStore.get_current_snapshot default
+
+# Numeric SymbolMetrics fields in the columnar view
+METRIC_COLUMNS: Tuple[str, ...] = tuple(
+    f.name for f in fields(SymbolMetrics) if f.name not in ('symbol', 'dos_grup', 'timestamp')
+)
+
+
+def _nan_if_none(value: Any) -> float:
+    if value is None:
+        return np.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+@dataclass
+class MetricsColumns:
+    """
+    Struct-of-arrays view of a metrics snapshot.
+    
+    columns[name][i] belongs to symbols[i] (snapshot order); None → NaN.
+    """
+    symbols: List[str]
+    columns: Dict[str, np.ndarray]
+    dos_grup: List[Optional[str]]
+    index: Dict[str, int] = field(default_factory=dict)
+    
+    @classmethod
+    def from_metrics(cls, snapshot: Dict[str, SymbolMetrics]) -> 'MetricsColumns':
+        symbols = list(snapshot)
+        metrics = list(snapshot.values())
+        columns = {
+            name: np.array([_nan_if_none(getattr(m, name)) for m in metrics], dtype=np.float64)
+            for name in METRIC_COLUMNS
+        }
+        return cls(
+            symbols=symbols,
+            columns=columns,
+            dos_grup=[m.dos_grup for m in metrics],
+            index={symbol: i for i, symbol in enumerate(symbols)},
+        )
+    
+    def __len__(self) -> int:
+        return len(self.symbols)
+    
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+
+@dataclass
+class _MetricSources:
+    """Source lookups used to build one snapshot (None = source unavailable)"""
+    market_snapshot: Optional[Callable[[str], Any]]
+    static_data: Optional[Callable[[str], Optional[Dict[str, Any]]]]
+    overlay_scores: Optional[Callable[[str], Optional[Dict[str, Any]]]]
+    rwvap: Optional[Callable[..., Any]]
+    janall: Optional[Callable[[str], Any]]
+
+
 @dataclass
 class MetricsSnapshotAPI:
     """
@@ -65,6 +133,9 @@ class MetricsSnapshotAPI:
         This is the SINGLE entry point for decision engines.
         All metrics are aggregated here to ensure consistency.
         
+        Each source is read once per call (whole-universe maps, see
+        _bulk_sources), not once per symbol.
+        
         Args:
             symbols: List of symbols to get metrics for
             snapshot_ts: Snapshot timestamp (for consistency). If None, uses now.
@@ -75,11 +146,12 @@ class MetricsSnapshotAPI:
         if snapshot_ts is None:
             snapshot_ts = datetime.now()
         
+        sources = self._bulk_sources()
         snapshot = {}
         
         for symbol in symbols:
             try:
-                metrics = await self._aggregate_metrics_for_symbol(symbol, snapshot_ts)
+                metrics = self._build_symbol_metrics(symbol, snapshot_ts, sources)
                 if metrics:
                     snapshot[symbol] = metrics
             except Exception as e:
@@ -89,10 +161,75 @@ class MetricsSnapshotAPI:
         logger.debug(f"Metrics snapshot: {len(snapshot)}/{len(symbols)} symbols")
         return snapshot
     
+    async def get_metrics_snapshot_bulk(
+        self,
+        symbols: List[str],
+        snapshot_ts: Optional[datetime] = None
+    ) -> Tuple[Dict[str, SymbolMetrics], MetricsColumns]:
+        """
+        Bulk snapshot for a whole universe (e.g. RUNALL's JFIN candidates).
+        
+        Same SymbolMetrics mapping as get_metrics_snapshot, plus a
+        struct-of-arrays view of it for vectorized consumers.
+        
+        Returns:
+            (snapshot, columns)
+        """
+        snapshot = await self.get_metrics_snapshot(symbols, snapshot_ts)
+        return snapshot, MetricsColumns.from_metrics(snapshot)
+    
     async def _aggregate_metrics_for_symbol(
         self,
         symbol: str,
         snapshot_ts: datetime
+    ) -> Optional[SymbolMetrics]:
+        """Aggregate all metrics for a single symbol (per-symbol source lookups)"""
+        return self._build_symbol_metrics(symbol, snapshot_ts, self._symbol_sources())
+    
+    # ═══════════════════════════════════════════════════════════════
+    # SOURCES
+    # ═══════════════════════════════════════════════════════════════
+    
+    def _symbol_sources(self) -> _MetricSources:
+        """Per-symbol getters straight on the source engines"""
+        from app.psfalgo.market_snapshot_store import get_market_snapshot_store
+        
+        snapshot_store = get_market_snapshot_store()
+        return _MetricSources(
+            market_snapshot=snapshot_store.get_current_snapshot if snapshot_store else None,
+            static_data=self.static_store.get_static_data if self.static_store else None,
+            overlay_scores=self.pricing_overlay_engine.get_overlay_scores if self.pricing_overlay_engine else None,
+            rwvap=getattr(self.rwvap_engine, 'get_rwvap', None) if self.rwvap_engine else None,
+            janall=getattr(self.janall_metrics_engine, 'get_metrics', None) if self.janall_metrics_engine else None,
+        )
+    
+    def _bulk_sources(self) -> _MetricSources:
+        """
+        Whole-universe views, read once per snapshot.
+        
+        MarketSnapshots and overlay scores are copied (writers keep updating
+        them during the cycle → every symbol sees the same data). Static data
+        is replaced, never mutated, on reload, so its dict is used directly.
+        """
+        from app.psfalgo.market_snapshot_store import get_market_snapshot_store
+        
+        sources = self._symbol_sources()
+        snapshot_store = get_market_snapshot_store()
+        if snapshot_store:
+            sources.market_snapshot = snapshot_store.get_all_current_snapshots(DEFAULT_SNAPSHOT_ACCOUNT).get
+        static_map = getattr(self.static_store, 'data', None)
+        if isinstance(static_map, dict):
+            sources.static_data = static_map.get
+        overlay_cache = getattr(self.pricing_overlay_engine, 'overlay_cache', None)
+        if isinstance(overlay_cache, dict):
+            sources.overlay_scores = dict(overlay_cache).get
+        return sources
+    
+    def _build_symbol_metrics(
+        self,
+        symbol: str,
+        snapshot_ts: datetime,
+        sources: _MetricSources
     ) -> Optional[SymbolMetrics]:
         """
         Aggregate all metrics for a single symbol.
@@ -103,26 +240,24 @@ class MetricsSnapshotAPI:
         Args:
             symbol: Symbol (PREF_IBKR)
             snapshot_ts: Snapshot timestamp
+            sources: Source lookups for this snapshot
             
         Returns:
             SymbolMetrics object or None if no data available
         """
         # PHASE 7: Try to get from MarketSnapshot first (single source of truth)
-        from app.psfalgo.market_snapshot_store import get_market_snapshot_store
-        
-        snapshot_store = get_market_snapshot_store()
-        if snapshot_store:
-            market_snapshot = snapshot_store.get_current_snapshot(symbol)
+        if sources.market_snapshot:
+            market_snapshot = sources.market_snapshot(symbol)
             if market_snapshot:
                 # Get additional metrics (GRPAN, RWVAP, Pricing Overlay)
                 grpan_metrics = self._get_grpan_metrics(symbol)
-                rwvap_metrics = self._get_rwvap_metrics(symbol)
-                overlay_metrics = self._get_pricing_overlay_metrics(symbol)
+                rwvap_metrics = self._get_rwvap_metrics(symbol, sources.rwvap)
+                overlay_metrics = self._get_pricing_overlay_metrics(symbol, sources.overlay_scores)
                 
                 # Get static data for final_thg, short_final
                 static_data = None
-                if self.static_store:
-                    static_data = self.static_store.get_static_data(symbol)
+                if sources.static_data:
+                    static_data = sources.static_data(symbol)
                 
                 # Convert MarketSnapshot to SymbolMetrics
                 return SymbolMetrics(
@@ -182,20 +317,20 @@ class MetricsSnapshotAPI:
         
         # Get static data
         static_data = None
-        if self.static_store:
-            static_data = self.static_store.get_static_data(symbol)
+        if sources.static_data:
+            static_data = sources.static_data(symbol)
         
         # Get GRPAN metrics
         grpan_metrics = self._get_grpan_metrics(symbol)
         
         # Get RWVAP metrics
-        rwvap_metrics = self._get_rwvap_metrics(symbol)
+        rwvap_metrics = self._get_rwvap_metrics(symbol, sources.rwvap)
         
         # Get pricing overlay metrics
-        overlay_metrics = self._get_pricing_overlay_metrics(symbol)
+        overlay_metrics = self._get_pricing_overlay_metrics(symbol, sources.overlay_scores)
         
         # Get Janall metrics
-        janall_metrics = self._get_janall_metrics(symbol)
+        janall_metrics = self._get_janall_metrics(symbol, sources.janall)
         
         # Aggregate into SymbolMetrics
         metrics = SymbolMetrics(
@@ -326,20 +461,20 @@ class MetricsSnapshotAPI:
             logger.debug(f"Error getting GRPAN metrics for {symbol}: {e}")
             return {}
     
-    def _get_rwvap_metrics(self, symbol: str) -> Dict[str, Any]:
-        """Get RWVAP metrics for symbol"""
-        if not self.rwvap_engine:
+    def _get_rwvap_metrics(self, symbol: str, get_rwvap: Optional[Callable[..., Any]]) -> Dict[str, Any]:
+        """Get RWVAP metrics for symbol (get_rwvap: RWVAP engine lookup, None if unavailable)"""
+        if not get_rwvap:
             return {}
         
         try:
             # Get RWVAP 1D
-            rwvap_1d = self.rwvap_engine.get_rwvap(symbol, window='1D')
+            rwvap_1d = get_rwvap(symbol, window='1D')
             
             # Get RWVAP ORT DEV (ROD) - average of all RWVAP windows
             rwvap_windows = ['1D', '3D', '5D']
             rwvap_prices = []
             for window in rwvap_windows:
-                rwvap = self.rwvap_engine.get_rwvap(symbol, window=window)
+                rwvap = get_rwvap(symbol, window=window)
                 if rwvap and rwvap.get('rwvap_price'):
                     rwvap_prices.append(rwvap['rwvap_price'])
             
@@ -359,13 +494,17 @@ class MetricsSnapshotAPI:
             logger.debug(f"Error getting RWVAP metrics for {symbol}: {e}")
             return {}
     
-    def _get_pricing_overlay_metrics(self, symbol: str) -> Dict[str, Any]:
+    def _get_pricing_overlay_metrics(
+        self,
+        symbol: str,
+        get_overlay_scores: Optional[Callable[[str], Optional[Dict[str, Any]]]]
+    ) -> Dict[str, Any]:
         """Get pricing overlay metrics for symbol including JFIN scores"""
-        if not self.pricing_overlay_engine:
+        if not get_overlay_scores:
             return {}
         
         try:
-            overlay_scores = self.pricing_overlay_engine.get_overlay_scores(symbol)
+            overlay_scores = get_overlay_scores(symbol)
             if not overlay_scores or overlay_scores.get('status') != 'OK':
                 return {}
             
@@ -385,14 +524,14 @@ class MetricsSnapshotAPI:
             logger.debug(f"Error getting pricing overlay metrics for {symbol}: {e}")
             return {}
     
-    def _get_janall_metrics(self, symbol: str) -> Dict[str, Any]:
-        """Get Janall metrics for symbol"""
-        if not self.janall_metrics_engine:
+    def _get_janall_metrics(self, symbol: str, get_metrics: Optional[Callable[[str], Any]]) -> Dict[str, Any]:
+        """Get Janall metrics for symbol (get_metrics: Janall engine lookup, None if unavailable)"""
+        if not get_metrics:
             return {}
         
         try:
             # Get Janall metrics from cache
-            janall_metrics = self.janall_metrics_engine.get_metrics(symbol)
+            janall_metrics = get_metrics(symbol)
             if not janall_metrics:
                 return {}
             
@@ -19,8 +19,17 @@ _POSITION_SNAPSHOT_CACHE: Dict[str, Tuple[float, List[Any]]] = {}
 _POSITION_SNAPSHOT_CACHE_TTL = 5
 
 # BEFDAY exposure cache: /api/trading/exposure calls get_befday_exposure_snapshot every time (103 symbols + calculate_exposure).
-_BEFDAY_EXPOSURE_CACHE: Dict[str, Tuple[float, Any]] = {}
+# (expiry_ts, befday_map the result was computed from, result) — a new BEFDAY map invalidates immediately.
+_BEFDAY_EXPOSURE_CACHE: Dict[str, Tuple[float, Any, Any]] = {}
 _BEFDAY_EXPOSURE_CACHE_TTL = 10
+
+# BEFDAY map cache: account_id -> (date_str YYYYMMDD, redis version, loaded_at, befday_map).
+# BEFDAY is immutable for the trading day once written, so the map is reused until the date rolls
+# over or a writer bumps psfalgo:befday:ver:{account_id} (notify_befday_write). An EMPTY map
+# (no capture yet today) is only trusted for _BEFDAY_EMPTY_MAP_TTL seconds — a CSV-only capture
+# (befday_tracker) does not bump the version. The cached dict is SHARED by every caller: read-only.
+_BEFDAY_MAP_CACHE: Dict[str, Tuple[str, Optional[str], float, Dict[str, Dict[str, Any]]]] = {}
+_BEFDAY_EMPTY_MAP_TTL = 5
 from app.psfalgo.decision_models import PositionSnapshot, PositionPriceStatus, PositionTag
 from app.market_data.grouping import resolve_primary_group, resolve_secondary_group
 from app.market_data.static_data_store import StaticDataStore
@@ -945,7 +954,33 @@ class PositionSnapshotAPI:
 
     def _load_befday_map(self, account_id: str) -> Dict[str, Dict[str, Any]]:
         """
-        Load Befday Map (Redis First, CSV Fallback).
+        Befday Map, memoized per account and trading date.
+
+        Tek bir GET (psfalgo:befday:ver:{account_id}) ile doğrulanır: tarih ve
+        versiyon değişmediyse cache'teki map döner. Reload sadece gün dönümünde,
+        notify_befday_write() ile versiyon arttığında veya boş map'in
+        _BEFDAY_EMPTY_MAP_TTL süresi dolduğunda yapılır.
+
+        Returned dict is shared between callers — do NOT mutate it.
+        """
+        today_str = datetime.now().strftime("%Y%m%d")
+        version = _get_befday_version(account_id)
+        now = time.time()
+
+        cached = _BEFDAY_MAP_CACHE.get(account_id)
+        if cached is not None:
+            cached_date, cached_version, loaded_at, befday_map = cached
+            if cached_date == today_str and cached_version == version:
+                if befday_map or now - loaded_at < _BEFDAY_EMPTY_MAP_TTL:
+                    return befday_map
+
+        befday_map = self._read_befday_map(account_id)
+        _BEFDAY_MAP_CACHE[account_id] = (today_str, version, now, befday_map)
+        return befday_map
+
+    def _read_befday_map(self, account_id: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Load Befday Map (Redis First, CSV Fallback). Uncached — use _load_befday_map.
         Returns map: Symbol -> {
             'quantity': float,
             'full_taxonomy': str,
@@ -1201,16 +1236,16 @@ class PositionSnapshotAPI:
         Compute ExposureSnapshot from BEFDAY positions for the account.
         Uses avg_cost from BEFDAY when available, else current price (last/bid/ask).
         Returns None if no befday data or calculator not available.
-        Cached 10s to avoid recalc on every /api/trading/exposure poll.
+        Cached 10s (while the BEFDAY map is unchanged) to avoid recalc on every /api/trading/exposure poll.
         """
         now = time.time()
+        befday_map = self._load_befday_map(account_id)
         if account_id in _BEFDAY_EXPOSURE_CACHE:
-            expiry_ts, cached = _BEFDAY_EXPOSURE_CACHE[account_id]
-            if now < expiry_ts and cached is not None:
+            expiry_ts, cached_map, cached = _BEFDAY_EXPOSURE_CACHE[account_id]
+            if now < expiry_ts and cached is not None and cached_map is befday_map:
                 return cached
         from app.psfalgo.decision_models import PositionSnapshot as PosSnap
         from app.psfalgo.exposure_calculator import get_exposure_calculator
-        befday_map = self._load_befday_map(account_id)
         if not befday_map:
             return None
         calculator = get_exposure_calculator()
@@ -1233,7 +1268,7 @@ class PositionSnapshotAPI:
         if not positions:
             return None
         result = calculator.calculate_exposure(positions)
-        _BEFDAY_EXPOSURE_CACHE[account_id] = (time.time() + _BEFDAY_EXPOSURE_CACHE_TTL, result)
+        _BEFDAY_EXPOSURE_CACHE[account_id] = (time.time() + _BEFDAY_EXPOSURE_CACHE_TTL, befday_map, result)
         return result
 
     def _determine_taxonomy(self, qty: float, befday_qty: float, symbol: str = "", account_id: str = "") -> tuple[str, str, str]:
@@ -1571,6 +1606,42 @@ class PositionSnapshotAPI:
             return 0.0
 
 
+def _get_befday_version(account_id: str) -> Optional[str]:
+    """Current BEFDAY write counter for the account (None if never bumped / Redis down)"""
+    try:
+        from app.core.redis_client import get_redis_client
+        from app.core.redis_keys import RedisKeys
+        redis = get_redis_client()
+        if not redis:
+            return None
+        version = redis.get(RedisKeys.befday_version(account_id))
+        return version.decode() if isinstance(version, bytes) else version
+    except Exception:
+        return None
+
+
+def notify_befday_write(account_id: str) -> None:
+    """
+    Invalidate the cached BEFDAY map after psfalgo:befday:positions:{account_id}
+    (or the BEFDAY CSV) was written or deleted.
+
+    Drops this process's entry and bumps psfalgo:befday:ver:{account_id} so
+    other processes reload on their next _load_befday_map call.
+    """
+    _BEFDAY_MAP_CACHE.pop(account_id, None)
+    _BEFDAY_EXPOSURE_CACHE.pop(account_id, None)
+    try:
+        from app.core.redis_client import get_redis_client
+        from app.core.redis_keys import RedisKeys
+        redis = get_redis_client()
+        if redis and redis.sync:
+            key = RedisKeys.befday_version(account_id)
+            redis.sync.incr(key)
+            redis.sync.expire(key, 172800)
+    except Exception as e:
+        logger.warning(f"[BEFDAY] Version bump failed for {account_id}: {e}")
+
+
 # Global instance
 _position_snapshot_api: Optional[PositionSnapshotAPI] = None
 
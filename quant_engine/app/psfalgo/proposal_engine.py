@@ -561,16 +561,23 @@ class ProposalEngine:
         # Get metrics snapshot API for market context
         metrics_api = get_metrics_snapshot_api()
         
+        # One snapshot for all decision symbols (sources read once, not per decision)
+        metrics = {}
+        if metrics_api:
+            try:
+                metrics = await metrics_api.get_metrics_snapshot(
+                    symbols=list(dict.fromkeys(d.symbol for d in response.decisions)),
+                    snapshot_ts=decision_timestamp
+                )
+            except Exception as e:
+                logger.warning(f"[PROPOSAL] Error getting metrics snapshot: {e}")
+        
         # Map each decision to proposal
         for decision in response.decisions:
             # Get market context for this symbol
             market_context = None
             if metrics_api:
                 try:
-                    metrics = await metrics_api.get_metrics_snapshot(
-                        symbols=[decision.symbol],
-                        snapshot_ts=decision_timestamp
-                    )
                     symbol_metrics = metrics.get(decision.symbol)
                     if symbol_metrics:
                         market_context = {
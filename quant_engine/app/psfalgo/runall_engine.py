@@ -4,17 +4,20 @@ RUNALL Cycle Engine - Phase 11 Orchestrator
 
 Role: "Central Conductor"
 1.  Loads State: Config, Inputs, Runtime Controls.
-2.  Runs Analyzers: Karbotu (Signals), Reducemore (Multipliers).
-3.  Runs Executive: LT Trim (consumes Signals + Multipliers).
+2.  Runs Analyzers: Karbotu (Signals), Reducemore (Multipliers), ADDNEWPOS, PATADD, MM
+    concurrently via CycleScheduler (per-engine wall time in the cycle diagnostic).
+3.  Runs Executive: LT Trim (consumes Signals + Multipliers; starts as soon as both are ready).
 4.  Resolves Conflicts: Priority-based selection (Emergency > Macro > Micro).
 5.  Submits Final Intents to Execution.
 """
 
 import asyncio
+from dataclasses import replace as dataclass_replace
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 import uuid
 
+from app.config.settings import settings
 from app.core.logger import logger
 from app.psfalgo.decision_models import (
     DecisionRequest,
@@ -31,6 +34,7 @@ from app.psfalgo.reducemore_engine import get_reducemore_engine
 from app.psfalgo.addnewpos_engine import get_addnewpos_engine # NEW: AddNewPos Integration
 from app.mm.greatest_mm_decision_engine import get_greatest_mm_decision_engine # NEW: Greatest MM Integration
 from app.event_driven.decision_engine.lt_trim_engine import get_lt_trim_engine
+from app.psfalgo.cycle_scheduler import EngineTask, get_cycle_scheduler
 
 # Proposal & Intent Storage
 from app.psfalgo.proposal_engine import get_proposal_engine
@@ -74,6 +78,9 @@ class RunallEngine:
         self.metrics_snapshot_api = None
         self.exposure_calculator = None
         
+        # (epoch_id, symbols) the Janall batch metrics were last computed for
+        self._janall_epoch_key = None
+        
         # Active Engines (Default from User Request: LT, KARBOTU, MM, ADDNEWPOS)
         self._default_engines = ['LT_TRIM', 'KARBOTU', 'PATADD_ENGINE', 'ADDNEWPOS_ENGINE', 'MM_ENGINE']
         self.active_engines = self._load_active_engines()
@@ -219,7 +226,7 @@ class RunallEngine:
                 logger.warning(f"[RUNALL] ⚠️ Request preparation failed - no request object")
                 return
             
-            logger.info(f"[RUNALL] 📊 Request prepared: {len(request.positions)} positions, {len(request.metrics)} metrics")
+            logger.info(f"[RUNALL] 📊 Request prepared: {len(request.positions)} positions, {len(request.metrics)} metrics, epoch={request.epoch_id}")
 
             # 2.5. Score Calculation (BATCH - at cycle start)
             # Computes all scores and updates SecurityContexts
@@ -271,49 +278,81 @@ class RunallEngine:
             # Log before running engines
             logger.info(f"[RUNALL] 🚀 Starting parallel engines: KARBOTU={'KARBOTU' in self.active_engines} (enabled={controls.karbotu_enabled}), REDUCEMORE={'REDUCEMORE' in self.active_engines}, PATADD={'PATADD_ENGINE' in self.active_engines}, ADDNEWPOS={'ADDNEWPOS_ENGINE' in self.active_engines}, MM={'MM_ENGINE' in self.active_engines}")
             
-            karbotu_task = _run_or_skip('KARBOTU', lambda: get_karbotu_engine().run(request, effective_rules))
-            reducemore_task = _run_or_skip('REDUCEMORE', lambda: get_reducemore_engine().run(request, effective_rules))
-            
             # Safe AddNewPos Call - MUST initialize if not yet done
             from app.psfalgo.addnewpos_engine import get_addnewpos_engine, initialize_addnewpos_engine
             addnewpos_engine = get_addnewpos_engine()
             if not addnewpos_engine:
                 logger.info("[RUNALL] 🔧 AddnewposEngine not initialized - initializing now...")
                 addnewpos_engine = initialize_addnewpos_engine()
-            if addnewpos_engine:
-                addnewpos_task = _run_or_skip('ADDNEWPOS_ENGINE', lambda: addnewpos_engine.addnewpos_decision_engine(request))
-            else:
+            if not addnewpos_engine:
                 logger.error("[RUNALL] ❌ AddnewposEngine failed to initialize!")
-                async def _empty_task(): return EmptyResult()
-                addnewpos_task = _empty_task()
             
             # PATADD Engine Task (Pattern-based position increase)
             from app.psfalgo.patadd_engine import get_patadd_engine
             patadd_engine = get_patadd_engine()
-            if patadd_engine:
-                patadd_task = _run_or_skip('PATADD_ENGINE', lambda: patadd_engine.run(request, account_id=account_id))
-            else:
-                async def _empty_patadd(): return None
-                patadd_task = _empty_patadd()
             
-            # Greatest MM Task (mapped to MM_ENGINE label)
-            mm_engine_task = _run_or_skip('MM_ENGINE', lambda: get_greatest_mm_decision_engine().run(request))
+            # ADDNEWPOS / PATADD add SymbolMetrics for their candidates → private metrics dict
+            # (engines run concurrently; the shared request stays read-only while they run)
+            addnewpos_request = dataclass_replace(request, metrics=dict(request.metrics))
+            patadd_request = dataclass_replace(request, metrics=dict(request.metrics))
             
-            karbotu_out, reducemore_out, addnewpos_out, patadd_out, mm_out = await asyncio.gather(
-                karbotu_task, 
-                reducemore_task, 
-                addnewpos_task,
-                patadd_task,
-                mm_engine_task,
-                return_exceptions=True # Prevent one crash from killing all
-            )
+            async def _run_addnewpos(deps):
+                if not addnewpos_engine:
+                    return EmptyResult()
+                return await _run_or_skip('ADDNEWPOS_ENGINE', lambda: addnewpos_engine.addnewpos_decision_engine(addnewpos_request))
+            
+            async def _run_patadd(deps):
+                if not patadd_engine:
+                    return None
+                return await _run_or_skip('PATADD_ENGINE', lambda: patadd_engine.run(patadd_request, account_id=account_id))
+            
+            # LT_TRIM consumes KARBOTU signals + REDUCEMORE multipliers; everything else is independent
+            async def _run_lt_trim(deps):
+                if 'LT_TRIM' not in self.active_engines:
+                    return [], {}
+                karbotu_dep = deps.get('KARBOTU')
+                reducemore_dep = deps.get('REDUCEMORE')
+                logger.info(f"[RUNALL] 🔍 LT_TRIM engine starting... (positions={len(request.positions)}, lt_trim_enabled={controls.lt_trim_enabled})")
+                return await get_lt_trim_engine().run(
+                    request,
+                    (karbotu_dep.signals if hasattr(karbotu_dep, 'signals') else {}),
+                    (reducemore_dep.multipliers if hasattr(reducemore_dep, 'multipliers') else {}),
+                    effective_rules,
+                    controls,
+                    account_id=account_id # Explicitly pass account_id for Befday loading
+                )
+            
+            offload = settings.RUNALL_ENGINE_OFFLOAD
+            def _task(name, factory, depends_on=()):
+                return EngineTask(name, factory, depends_on, offload=offload and name in self.active_engines)
+            
+            scheduler = get_cycle_scheduler()
+            engine_results = await scheduler.run([
+                _task('KARBOTU', lambda deps: _run_or_skip('KARBOTU', lambda: get_karbotu_engine().run(request, effective_rules))),
+                _task('REDUCEMORE', lambda deps: _run_or_skip('REDUCEMORE', lambda: get_reducemore_engine().run(request, effective_rules))),
+                _task('ADDNEWPOS_ENGINE', _run_addnewpos),
+                _task('PATADD_ENGINE', _run_patadd),
+                # Greatest MM Task (mapped to MM_ENGINE label)
+                _task('MM_ENGINE', lambda deps: _run_or_skip('MM_ENGINE', lambda: get_greatest_mm_decision_engine().run(request))),
+                _task('LT_TRIM', _run_lt_trim, depends_on=('KARBOTU', 'REDUCEMORE')),
+            ])
+            karbotu_out = engine_results['KARBOTU']
+            reducemore_out = engine_results['REDUCEMORE']
+            addnewpos_out = engine_results['ADDNEWPOS_ENGINE']
+            patadd_out = engine_results['PATADD_ENGINE']
+            mm_out = engine_results['MM_ENGINE']
+            
+            # Metrics created by ADDNEWPOS / PATADD → shared request (proposal adapters below)
+            for private_request in (addnewpos_request, patadd_request):
+                for symbol, symbol_metrics in private_request.metrics.items():
+                    request.metrics.setdefault(symbol, symbol_metrics)
             
             # Helper to handle Exception results from return_exceptions=True
             if isinstance(karbotu_out, Exception):
                 logger.error(f"[RUNALL] Karbotu crashed: {karbotu_out}", exc_info=True)
                 karbotu_out = EmptyResult()
             else:
-                logger.info(f"[RUNALL] ✅ KARBOTU completed: {len(karbotu_out.intents) if hasattr(karbotu_out, 'intents') else 0} intents")
+                logger.info(f"[RUNALL] ✅ KARBOTU completed: {len(karbotu_out.intents) if hasattr(karbotu_out, 'intents') else 0} intents (epoch={request.epoch_id})")
             if isinstance(reducemore_out, Exception):
                 logger.error(f"[RUNALL] Reducemore crashed: {reducemore_out}")
                 reducemore_out = EmptyResult()
@@ -325,7 +364,7 @@ class RunallEngine:
                 anp_decisions = getattr(addnewpos_out, 'decisions', []) if addnewpos_out else []
                 anp_filtered = getattr(addnewpos_out, 'filtered_out', []) if addnewpos_out else []
                 anp_summary = getattr(addnewpos_out, 'step_summary', {}) if addnewpos_out else {}
-                logger.info(f"[RUNALL] ✅ ADDNEWPOS completed: {len(anp_decisions)} decisions, {len(anp_filtered)} filtered, summary={anp_summary}")
+                logger.info(f"[RUNALL] ✅ ADDNEWPOS completed: {len(anp_decisions)} decisions, {len(anp_filtered)} filtered, summary={anp_summary} (epoch={request.epoch_id})")
             if isinstance(patadd_out, Exception):
                 logger.error(f"[RUNALL] PATADD crashed: {patadd_out}")
                 patadd_out = None
@@ -447,19 +486,13 @@ class RunallEngine:
                             proposal_store.add_proposal(p)
                         logger.info(f"[RUNALL] ✅ PATADD generated {len(proposals)} proposals from {len(patadd_decisions)} decisions")
 
-            # 3. Executive Engine Execution (LT Trim)
-            lt_intents = []
-            lt_diagnostic = {}
+            # 3. Executive Engine Execution (LT Trim) - ran in the scheduler as soon as KARBOTU + REDUCEMORE finished
+            lt_out = engine_results['LT_TRIM']
+            if isinstance(lt_out, Exception):
+                logger.error(f"[RUNALL] LT_TRIM crashed: {lt_out}", exc_info=lt_out)
+                lt_out = ([], {})
+            lt_intents, lt_diagnostic = lt_out
             if 'LT_TRIM' in self.active_engines:
-                logger.info(f"[RUNALL] 🔍 LT_TRIM engine starting... (positions={len(request.positions)}, lt_trim_enabled={controls.lt_trim_enabled})")
-                lt_intents, lt_diagnostic = await get_lt_trim_engine().run(
-                    request,
-                    (karbotu_out.signals if hasattr(karbotu_out, 'signals') else {}),
-                    (reducemore_out.multipliers if hasattr(reducemore_out, 'multipliers') else {}),
-                    effective_rules,
-                    controls,
-                    account_id=account_id # Explicitly pass account_id for Befday loading
-                )
                 logger.info(f"[RUNALL] LT_TRIM generated {len(lt_intents)} intents (diagnostic: {lt_diagnostic.get('generated_count', 0)} generated, {lt_diagnostic.get('analyzed_count', 0)} analyzed, global_status={lt_diagnostic.get('global_status', 'N/A')})")
                 if lt_diagnostic.get('analyzed_count', 0) > 0:
                     # Log filter breakdown
@@ -481,7 +514,8 @@ class RunallEngine:
                 'lt_trim': lt_diagnostic,
                 'addnewpos': getattr(addnewpos_out, 'diagnostic', {}), # Assuming AddNewPos will have one
                 'reducemore': getattr(reducemore_out, 'diagnostic', {}),
-                'greatest_mm': len(mm_out) if mm_out and isinstance(mm_out, list) else 0
+                'greatest_mm': len(mm_out) if mm_out and isinstance(mm_out, list) else 0,
+                'engine_timings': scheduler.get_timings()
             }
             
             # Persist to Redis for API visibility (Cross-Process Support)
@@ -906,6 +940,26 @@ class RunallEngine:
         cid = correlation_id or str(uuid.uuid4())
         return await self._prepare_request(account_id, cid)
 
+    def _get_cycle_epoch(self):
+        """
+        MarketEpoch for this cycle (re-published from DataFabric if stale).
+        
+        None → legacy path (market_data_cache merge + per-symbol L1 copies).
+        """
+        try:
+            if not settings.MARKET_EPOCH_ENABLED:
+                return None
+            from app.core.data_fabric import get_data_fabric
+            fabric = get_data_fabric()
+            if not fabric or fabric.is_lifeless_mode():
+                # Lifeless mode: legacy path keeps syncing fake L1 into market_data_cache
+                return None
+            from app.core.market_epoch import get_fresh_epoch
+            return get_fresh_epoch(source="runall")
+        except Exception as e:
+            logger.warning(f"[RUNALL] Market epoch unavailable, using legacy merge: {e}")
+            return None
+
     async def _prepare_request(self, account_id, correlation_id):
         """
         Prepare DecisionRequest by fetching real data from APIs.
@@ -997,6 +1051,16 @@ class RunallEngine:
             # Merge and deduplicate symbols for metrics fetching
             all_symbols = list(set(pos_symbols + jfin_candidates))
             
+            # 🔒 MARKET EPOCH: one read-only L1 + static + score version for the whole cycle
+            # (read by reference - no market_data_cache merge / per-symbol copies)
+            epoch = self._get_cycle_epoch()
+            market_source = epoch
+            if epoch is not None:
+                logger.info(
+                    f"[RUNALL] 🔒 Market epoch {epoch.epoch_id} ({len(epoch)} symbols, "
+                    f"age {epoch.age_sec * 1000:.0f}ms, source={epoch.source})"
+                )
+            
             # 🔥 CRITICAL: Compute Janall Metrics BEFORE fetching snapshot
             # This ensures GORT/FBtot/SFStot are calculated in BOTH live and lifeless modes
             # In lifeless mode, market_data_cache contains fake bid/ask/last from DataFabric
@@ -1015,7 +1079,7 @@ class RunallEngine:
                     try:
                         from app.core.data_fabric import get_data_fabric
                         fabric = get_data_fabric()
-                        if fabric:
+                        if fabric and epoch is None:
                             mode_str = "💀 LIFELESS" if fabric.is_lifeless_mode() else "🟢 LIVE"
                             logger.info(f"[RUNALL] {mode_str} MODE: Syncing market_data_cache for {len(all_symbols)} symbols")
                             for symbol in all_symbols:
@@ -1047,13 +1111,22 @@ class RunallEngine:
                     except Exception as e:
                         logger.error(f"[RUNALL] Error syncing market_data_cache: {e}")
                     
+                    if market_source is None:
+                        market_source = market_data_cache
+                    
                     etf_data = get_etf_market_data()
                     
                     # Compute batch metrics - this calculates GORT/FBtot/SFStot from bid/ask/last
-                    janall_engine.compute_batch_metrics(
-                        all_symbols, static_store, market_data_cache, etf_data
-                    )
-                    logger.info(f"[RUNALL] Computed Janall metrics for {len(all_symbols)} symbols")
+                    # Same epoch + same universe (e.g. second account, XNL) → cache is already current
+                    janall_key = (epoch.epoch_id, frozenset(all_symbols)) if epoch is not None else None
+                    if janall_key is not None and janall_key == self._janall_epoch_key:
+                        logger.info(f"[RUNALL] Janall metrics already computed for epoch {epoch.epoch_id} - reused")
+                    else:
+                        janall_engine.compute_batch_metrics(
+                            all_symbols, static_store, market_source, etf_data
+                        )
+                        self._janall_epoch_key = janall_key
+                        logger.info(f"[RUNALL] Computed Janall metrics for {len(all_symbols)} symbols")
                     
                     # Update MarketSnapshotStore with computed metrics
                     # This ensures MetricsSnapshotAPI can read GORT/FBtot from MarketSnapshot
@@ -1072,7 +1145,7 @@ class RunallEngine:
                                     if not static_data:
                                         continue
                                     
-                                    market_data = market_data_cache.get(symbol, {})
+                                    market_data = market_source.get(symbol) or {}
                                     
                                     # 💀 LIFELESS MODE: Use fake data from DataFabric
                                     try:
@@ -1254,12 +1327,14 @@ class RunallEngine:
             # Update request available_symbols for AddNewPosEngine
             available_symbols = jfin_candidates
             
-            # D. L1 Data (Bid/Ask/Last) from DataFabric
+            # D. L1 Data (Bid/Ask/Last) from the epoch (shared rows), DataFabric for the rest
             from app.core.data_fabric import get_data_fabric
-            l1_data = {}
+            l1_data = epoch.l1_data(all_symbols) if epoch is not None else {}
             data_fabric = get_data_fabric()
             if data_fabric:
                 for symbol in all_symbols:
+                    if epoch is not None and symbol in epoch:
+                        continue
                     live_data = data_fabric.get_live(symbol)
                     if live_data:
                         l1_data[symbol] = {
@@ -1305,7 +1380,8 @@ class RunallEngine:
                 exposure=exposure,
                 snapshot_ts=datetime.now(),
                 correlation_id=correlation_id,
-                available_symbols=available_symbols # NEW: Pass JFIN candidates
+                available_symbols=available_symbols, # NEW: Pass JFIN candidates
+                epoch_id=epoch.epoch_id if epoch is not None else None
             )
             
         except Exception as e:
@@ -2,12 +2,22 @@
 
 Monte Carlo Simulation for risk analysis.
 Simulates portfolio returns under different scenarios.
+
+Paths are generated in chunks as (paths × horizon) return matrices; equity is
+np.cumprod along the horizon and drawdown uses np.maximum.accumulate. Chunks
+are spread across processes (joblib) with independent np.random.Generator
+streams spawned from one SeedSequence, so a seeded run is reproducible for
+any n_jobs / chunk order. Above MAX_KEPT_PATHS simulations, statistics are
+streamed: VaR/CVaR/worst 1% come from an exact lower-tail buffer and the
+per-path lists hold only the first MAX_KEPT_PATHS paths.
 """
 
+import math
+
 import numpy as np
 import pandas as pd
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import List, Optional, Tuple
 from app.core.logger import logger
 
 try:
@@ -18,6 +28,12 @@ except ImportError:
     logger.warning("joblib not available, Monte Carlo will run sequentially")
 
 
+MODELS = ("bootstrap", "gbm", "regime")
+
+REGIME_STRESS_PROB = 0.15  # 15% chance of high volatility regime per step
+REGIME_STRESS_VOL_MULT = 2.5  # high vol regime
+
+
 @dataclass
 class MonteCarloResult:
     """Result of Monte Carlo simulation"""
@@ -32,168 +48,250 @@ class MonteCarloResult:
     mean_return: float
 
 
+# -------------------------------
+# PATH GENERATION (batched)
+# -------------------------------
+def max_drawdown(equity: np.ndarray, initial_peak: Optional[float] = None) -> np.ndarray:
+    """
+    Maximum drawdown per path.
+
+    Args:
+        equity: (paths × horizon) equity matrix (or a single 1-D path)
+        initial_peak: Starting equity counted as a peak (e.g. 1.0)
+
+    Returns:
+        Array of max drawdowns (positive fractions), one per path
+    """
+    equity = np.atleast_2d(equity)
+    peak = np.maximum.accumulate(equity, axis=1)
+    if initial_peak is not None:
+        np.maximum(peak, initial_peak, out=peak)
+    drawdown = (equity - peak) / peak
+    return np.abs(np.minimum(drawdown.min(axis=1), 0.0))
+
+
+def simulate_chunk(
+    returns: np.ndarray,
+    model: str,
+    n_paths: int,
+    horizon: int,
+    seed: np.random.SeedSequence
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Simulate n_paths paths at once.
+
+    Returns:
+        (ending_values, max_drawdowns) arrays of length n_paths
+    """
+    rng = np.random.default_rng(seed)
+    mu = np.mean(returns)
+    sigma = np.std(returns)
+
+    if model == "bootstrap":
+        # Resample from historical returns
+        shocks = returns[rng.integers(0, len(returns), size=(n_paths, horizon))]
+        initial_peak = None
+    elif model == "gbm":
+        shocks = rng.normal(mu, sigma, size=(n_paths, horizon))
+        initial_peak = None
+    elif model == "regime":
+        stress = rng.random((n_paths, horizon)) < REGIME_STRESS_PROB
+        scale = np.where(stress, sigma * REGIME_STRESS_VOL_MULT, sigma)
+        shocks = mu + rng.standard_normal((n_paths, horizon)) * scale
+        initial_peak = 1.0  # Regime paths start at equity 1.0
+    else:
+        raise ValueError(f"Unknown model: {model}. Use 'bootstrap', 'gbm', or 'regime'")
+
+    np.add(shocks, 1.0, out=shocks)
+    equity = np.cumprod(shocks, axis=1)
+    return equity[:, -1].copy(), max_drawdown(equity, initial_peak)
+
+
+# -------------------------------
+# STREAMING STATISTICS
+# -------------------------------
+class TailRiskAccumulator:
+    """
+    Streaming ending-value statistics.
+
+    Keeps every path up to keep_paths; beyond that only the exact lower tail
+    needed for VaR 95 / CVaR 95 / worst 1% (np.percentile 'linear' semantics),
+    a running sum for the mean, and the first keep_paths paths as a sample
+    for the median.
+    """
+
+    def __init__(self, simulations: int, keep_paths: int):
+        self.simulations = simulations
+        self.keep_paths = keep_paths
+        self.streaming = simulations > keep_paths
+        self._count = 0
+        self._sum = 0.0
+        self._kept_end: List[np.ndarray] = []
+        self._kept_dd: List[np.ndarray] = []
+        self._kept = 0
+        # Order statistics needed for the 5% percentile (+1 for interpolation, +1 margin for ties)
+        self._tail_size = int(math.floor((simulations - 1) * 0.05)) + 3
+        self._tail = np.empty(0)
+
+    def add(self, ending_values: np.ndarray, drawdowns: np.ndarray) -> None:
+        self._count += len(ending_values)
+        self._sum += float(np.sum(ending_values))
+
+        if self._kept < self.keep_paths:
+            take = min(self.keep_paths - self._kept, len(ending_values))
+            self._kept_end.append(ending_values[:take])
+            self._kept_dd.append(drawdowns[:take])
+            self._kept += take
+
+        if self.streaming:
+            tail = np.concatenate((self._tail, ending_values))
+            if len(tail) > self._tail_size:
+                tail = np.partition(tail, self._tail_size - 1)[:self._tail_size]
+            self._tail = tail
+
+    @staticmethod
+    def _percentile_from_sorted_tail(tail: np.ndarray, n: int, q: float) -> float:
+        pos = (n - 1) * q / 100.0
+        lo = int(math.floor(pos))
+        hi = min(lo + 1, n - 1, len(tail) - 1)
+        frac = pos - lo
+        return float(tail[lo] + (tail[hi] - tail[lo]) * frac)
+
+    def result(self, horizon: int) -> MonteCarloResult:
+        end_vals = np.concatenate(self._kept_end) if self._kept_end else np.empty(0)
+        drawdowns = np.concatenate(self._kept_dd) if self._kept_dd else np.empty(0)
+
+        if not self.streaming:
+            var_95 = np.percentile(end_vals, 5)
+            cvar_95 = np.mean(end_vals[end_vals <= var_95])
+            worst_1pct = np.percentile(end_vals, 1)
+            mean_return = np.mean(end_vals)
+        else:
+            tail = np.sort(self._tail)
+            var_95 = self._percentile_from_sorted_tail(tail, self._count, 5)
+            cvar_95 = np.mean(tail[tail <= var_95])
+            worst_1pct = self._percentile_from_sorted_tail(tail, self._count, 1)
+            mean_return = self._sum / self._count
+
+        return MonteCarloResult(
+            simulations=self.simulations,
+            horizon=horizon,
+            max_drawdowns=drawdowns.tolist(),
+            ending_values=end_vals.tolist(),
+            var_95=float(var_95),
+            cvar_95=float(cvar_95),
+            worst_1pct=float(worst_1pct),
+            median_return=float(np.median(end_vals)),  # Exact unless streaming (sample median)
+            mean_return=float(mean_return)
+        )
+
+
 class MonteCarloEngine:
     """
     Monte Carlo simulation engine for risk analysis.
-    
+
     Simulates portfolio returns under different scenarios:
     - Bootstrap: Resample from historical returns
     - GBM: Geometric Brownian Motion
     - Regime: Volatility regime switching
     """
-    
+
+    CHUNK_SIZE = 2000  # Paths per batch (chunk_size × horizon float64 matrix)
+    MAX_KEPT_PATHS = 1_000_000  # Above this, stream statistics instead of keeping every path
+
     def __init__(
         self,
         returns: pd.Series,
         simulations: int = 10000,
         horizon: int = 252,
         n_jobs: int = -1,
+        seed: Optional[int] = None,
+        chunk_size: Optional[int] = None,
     ):
         """
         Initialize Monte Carlo engine.
-        
+
         Args:
             returns: Historical returns series
             simulations: Number of simulations to run
             horizon: Time horizon (days)
             n_jobs: Number of parallel jobs (-1 = all cores)
+            seed: Seed for reproducible runs (None = fresh entropy)
+            chunk_size: Paths per batch (default CHUNK_SIZE)
         """
-        self.returns = returns.dropna().values
+        self.returns = returns.dropna().values.astype(float)
         self.simulations = simulations
         self.horizon = horizon
         self.n_jobs = n_jobs if HAS_JOBLIB else 1
-        
+        self.seed = seed
+        self.chunk_size = chunk_size or self.CHUNK_SIZE
+
         if len(self.returns) == 0:
             raise ValueError("No valid returns provided")
-    
-    # -------------------------------
-    # BOOTSTRAP MODEL
-    # -------------------------------
-    def _simulate_bootstrap(self):
-        """Bootstrap simulation: resample from historical returns"""
-        sampled = np.random.choice(self.returns, size=self.horizon, replace=True)
-        equity = np.cumprod(1 + sampled)
-        max_dd = self._max_drawdown(equity)
-        return equity[-1], max_dd
-    
-    # -------------------------------
-    # GEOMETRIC BROWNIAN MOTION
-    # -------------------------------
-    def _simulate_gbm(self):
-        """Geometric Brownian Motion simulation"""
-        mu = np.mean(self.returns)
-        sigma = np.std(self.returns)
-        shocks = np.random.normal(mu, sigma, self.horizon)
-        equity = np.cumprod(1 + shocks)
-        max_dd = self._max_drawdown(equity)
-        return equity[-1], max_dd
-    
-    # -------------------------------
-    # VOLATILITY REGIME SWITCHING
-    # -------------------------------
-    def _simulate_regime(self):
-        """Volatility regime switching simulation"""
-        mu = np.mean(self.returns)
-        sigma_normal = np.std(self.returns)
-        sigma_stress = sigma_normal * 2.5  # high vol regime
-        
-        equity = [1.0]
-        for _ in range(self.horizon):
-            # 15% chance of high volatility regime
-            if np.random.rand() < 0.15:
-                shock = np.random.normal(mu, sigma_stress)
-            else:
-                shock = np.random.normal(mu, sigma_normal)
-            equity.append(equity[-1] * (1 + shock))
-        
-        equity = np.array(equity)
-        max_dd = self._max_drawdown(equity)
-        return equity[-1], max_dd
-    
+
     # -------------------------------
     # MAX DRAWDOWN HELPER
     # -------------------------------
     @staticmethod
     def _max_drawdown(series):
-        """Calculate maximum drawdown"""
-        peak = -np.inf
-        max_dd = 0
-        for x in series:
-            peak = max(peak, x)
-            dd = (x - peak) / peak
-            max_dd = min(max_dd, dd)
-        return abs(max_dd)
-    
+        """Calculate maximum drawdown of a single equity path"""
+        return float(max_drawdown(np.asarray(series, dtype=float))[0])
+
+    def _chunks(self) -> List[int]:
+        full, rest = divmod(self.simulations, self.chunk_size)
+        return [self.chunk_size] * full + ([rest] if rest else [])
+
     # -------------------------------
     # MAIN EXECUTION
     # -------------------------------
     def run(self, model: str = "bootstrap") -> MonteCarloResult:
         """
         Run Monte Carlo simulation.
-        
+
         Args:
             model: Simulation model ("bootstrap", "gbm", "regime")
-            
+
         Returns:
             MonteCarloResult
         """
+        if model not in MODELS:
+            raise ValueError(f"Unknown model: {model}. Use 'bootstrap', 'gbm', or 'regime'")
+
+        chunks = self._chunks()
+        seeds = np.random.SeedSequence(self.seed).spawn(len(chunks))
+
         logger.info(f"Running Monte Carlo simulation: {model}")
-        logger.info(f"  Simulations: {self.simulations:,}")
+        logger.info(f"  Simulations: {self.simulations:,} ({len(chunks)} chunks of {self.chunk_size:,})")
         logger.info(f"  Horizon: {self.horizon} days")
         logger.info(f"  Parallel jobs: {self.n_jobs}")
-        
-        if model == "bootstrap":
-            sim_func = self._simulate_bootstrap
-        elif model == "gbm":
-            sim_func = self._simulate_gbm
-        elif model == "regime":
-            sim_func = self._simulate_regime
-        else:
-            raise ValueError(f"Unknown model: {model}. Use 'bootstrap', 'gbm', or 'regime'")
-        
-        # Run simulations
-        if HAS_JOBLIB and self.n_jobs != 1:
+
+        # Run simulations (results arrive in chunk order → seeded runs are reproducible)
+        if HAS_JOBLIB and self.n_jobs != 1 and len(chunks) > 1:
             logger.info("Running parallel simulations...")
-            results = Parallel(n_jobs=self.n_jobs)(
-                delayed(sim_func)() for _ in range(self.simulations)
+            results = Parallel(n_jobs=self.n_jobs, return_as="generator")(
+                delayed(simulate_chunk)(self.returns, model, n, self.horizon, s)
+                for n, s in zip(chunks, seeds)
             )
         else:
             logger.info("Running sequential simulations...")
-            results = [sim_func() for _ in range(self.simulations)]
-        
-        end_vals, drawdowns = zip(*results)
-        
-        # Calculate statistics
-        end_vals = np.array(end_vals)
-        drawdowns = np.array(drawdowns)
-        
-        var_95 = np.percentile(end_vals, 5)
-        cvar_95 = np.mean([x for x in end_vals if x <= var_95])
-        worst_1pct = np.percentile(end_vals, 1)
-        
-        result = MonteCarloResult(
-            simulations=self.simulations,
-            horizon=self.horizon,
-            max_drawdowns=drawdowns.tolist(),
-            ending_values=end_vals.tolist(),
-            var_95=float(var_95),
-            cvar_95=float(cvar_95),
-            worst_1pct=float(worst_1pct),
-            median_return=float(np.median(end_vals)),
-            mean_return=float(np.mean(end_vals))
-        )
-        
+            results = (
+                simulate_chunk(self.returns, model, n, self.horizon, s)
+                for n, s in zip(chunks, seeds)
+            )
+
+        accumulator = TailRiskAccumulator(self.simulations, self.MAX_KEPT_PATHS)
+        for end_vals, drawdowns in results:
+            accumulator.add(end_vals, drawdowns)
+
+        result = accumulator.result(self.horizon)
+
         logger.info(f"Simulation complete!")
         logger.info(f"  Mean return: {result.mean_return:.4f}")
         logger.info(f"  Median return: {result.median_return:.4f}")
         logger.info(f"  VaR (95%): {result.var_95:.4f}")
         logger.info(f"  CVaR (95%): {result.cvar_95:.4f}")
         logger.info(f"  Worst 1%: {result.worst_1pct:.4f}")
-        
-        return result
-
-
-
-
-
+        if accumulator.streaming:
+            logger.info(f"  Streaming stats: per-path lists/median from first {self.MAX_KEPT_PATHS:,} paths")
 
+        return result
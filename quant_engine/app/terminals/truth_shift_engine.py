@@ -42,8 +42,12 @@ from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime, timedelta
 from collections import defaultdict
 
+import numpy as np
 from loguru import logger
 
+from app.market_data.tick_ring_buffer import TickRingBuffer
+from app.market_data.truth_tick_read_model import SOURCE_RAW, TruthTickSeries, get_truth_tick_read_model
+
 
 # ═══════════════════════════════════════════════════════════════════════
 # CONSTANTS
@@ -482,9 +486,11 @@ class TruthShiftEngine:
             return {}, {}
         
         # ── Step 2: Compute TSS per symbol ──
+        # Shared read model: pipelined version check, only changed blobs are re-parsed
+        series_by_symbol = get_truth_tick_read_model().get_many(all_symbols, SOURCE_RAW)
         symbol_results = {}
         for symbol in all_symbols:
-            ticks = self._read_ticks(redis, symbol)
+            ticks = self._read_ticks(series_by_symbol.get(symbol))
             if not ticks:
                 continue
             
@@ -561,46 +567,23 @@ class TruthShiftEngine:
             logger.warning(f"[TruthShift] Symbol discovery error: {e}")
             return []
     
-    def _read_ticks(self, redis, symbol: str) -> List[Dict]:
-        """Read truth ticks from Redis for a symbol (chronological order)."""
+    def _read_ticks(self, series: Optional[TruthTickSeries]) -> List[Dict]:
+        """Valid truth ticks of a symbol's tt:ticks series (chronological order)."""
+        if series is None or not len(series):
+            return []
         try:
-            data = redis.get(f"tt:ticks:{symbol}")
-            if not data:
-                return []
-            
-            raw = data.decode() if isinstance(data, bytes) else data
-            ticks = json.loads(raw)
-            
-            if not isinstance(ticks, list):
-                return []
-            
-            # Filter valid ticks and ensure chronological order
-            valid = []
-            now = time.time()
-            for t in ticks:
-                ts = t.get('ts', 0)
-                price = float(t.get('price', 0))
-                size = float(t.get('size', 0))
-                
-                # Skip stale (>24h) or invalid
-                if price <= 0 or size <= 0:
-                    continue
-                if ts > 0 and (now - ts) > 86400:
-                    continue
-                
-                valid.append({
-                    'price': price,
-                    'size': size,
-                    'venue': str(t.get('exch', t.get('venue', ''))),
-                    'ts': ts
-                })
-            
-            # Sort by timestamp (chronological)
-            valid.sort(key=lambda x: x['ts'])
-            return valid
-            
+            # Skip invalid (price/size <= 0) or stale (>24h)
+            arr = series.ticks
+            ts = arr['ts']
+            mask = (arr['price'] > 0) & (arr['size'] > 0) & ~((ts > 0) & (time.time() - ts > 86400))
+            valid = arr[mask]
+            valid = valid[np.argsort(valid['ts'], kind='stable')]  # Chronological
+            return [
+                {'price': t['price'], 'size': t['size'], 'venue': t['exch'], 'ts': t['ts']}
+                for t in TickRingBuffer.to_dicts(valid)
+            ]
         except Exception as e:
-            logger.debug(f"[TruthShift] Read ticks error for {symbol}: {e}")
+            logger.debug(f"[TruthShift] Read ticks error for {series.symbol}: {e}")
             return []
     
     # ═══════════════════════════════════════════════════════════════════
@@ -12,6 +12,11 @@ Benchmark Tracking (v2):
 - bench_chg = group average (last - prev_close) across all stocks in the symbol's DOS group
 - bench_source = the DOS group key used for the benchmark
 - This enables post-trade attribution: was the fill cheap/expensive relative to peers?
+
+Queries (v3):
+- The daily CSV is the append-only fills journal; it is indexed in memory once
+  (FillsIndex) and only newly appended rows are parsed on later calls.
+- Dedup keys and per-symbol / per-tag aggregates come from the index.
 """
 
 import os
@@ -19,9 +24,9 @@ import csv
 import threading
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
-from collections import defaultdict
 
 from app.core.logger import logger
+from app.trading.fills_index import FillsIndex, fill_dedup_key
 
 class DailyFillsStore:
     _instance = None
@@ -43,6 +48,7 @@ class DailyFillsStore:
         self.log_dir = r"data/logs/daily_fills"
         os.makedirs(self.log_dir, exist_ok=True)
         self.lock = threading.Lock()
+        self._indexes: Dict[str, FillsIndex] = {}  # filepath -> index (new file each day)
         
     def _get_filename(self, account_type: str) -> str:
         """
@@ -68,113 +74,52 @@ class DailyFillsStore:
         else:
              # Fallback
              return f"unknown_filledorders{date_str}.csv"
+    
+    def _get_index(self, account_type: str) -> FillsIndex:
+        """Today's fills index for account, refreshed with rows appended since last call"""
+        filepath = os.path.join(self.log_dir, self._get_filename(account_type))
+        index = self._indexes.get(filepath)
+        if index is None:
+            with self.lock:
+                index = self._indexes.get(filepath)
+                if index is None:
+                    # Drop previous days' indexes
+                    prefix = self._get_filename(account_type)[:-len("YYMMDD.csv")]
+                    for old in [p for p in self._indexes if os.path.basename(p).startswith(prefix)]:
+                        del self._indexes[old]
+                    index = FillsIndex(filepath)
+                    self._indexes[filepath] = index
+        index.refresh()
+        return index
         
     def _fetch_bid_ask_at_fill(self, symbol: str) -> Tuple[Optional[float], Optional[float]]:
         """
         Fetch current bid/ask from market data at fill time.
         Returns (bid, ask) or (None, None) if unavailable.
         
-        Resolution layers (in priority order):
-        1. In-memory market data getter (fastest)
-        2. In-memory market_data_cache dict (direct access)
-        3. Redis market:l1:{symbol} (L1Feed Terminal streaming data)
-        4. Redis live:{symbol} hash (legacy)
-        5. DataFabric (aggregated data source)
+        Resolved by the shared L1Resolver (priority order):
+        1. DataFabric in-memory (fresh)
+        2. Redis market:l1:{symbol} (L1Feed Terminal streaming data)
+        3. Redis live:{symbol} hash (Hammer L1 feed via L1RedisPublisher)
+        4. In-memory market_data_cache (under its lock)
+        5. DataFabric in-memory (stale)
         
         IMPORTANT: Fills from Hammer arrive with Hammer symbol format (e.g. PSA-N)
-        but market_data_cache uses display format (e.g. PSA PRN). We try BOTH.
+        but market_data_cache uses display format (e.g. PSA PRN). The resolver
+        tries ALL format variants.
         """
-        # Build list of symbol variants to try
-        symbols_to_try = [symbol]
         try:
-            from app.live.symbol_mapper import SymbolMapper
-            display = SymbolMapper.to_display_symbol(symbol)
-            if display != symbol:
-                symbols_to_try.append(display)
-            hammer = SymbolMapper.to_hammer_symbol(symbol)
-            if hammer != symbol and hammer not in symbols_to_try:
-                symbols_to_try.append(hammer)
-        except Exception:
-            pass
-        
-        for sym in symbols_to_try:
-            # Layer 1: Thread-safe market data getter
-            try:
-                from app.api.market_data_routes import get_market_data
-                data = get_market_data(sym)
-                if data:
-                    bid = data.get('bid')
-                    ask = data.get('ask')
-                    if bid is not None and ask is not None and float(bid) > 0 and float(ask) > 0:
-                        return float(bid), float(ask)
-            except ImportError:
-                pass
-            except Exception as e:
-                logger.debug(f"[FILL_LOG] Could not fetch bid/ask via getter for {sym}: {e}")
-            
-            # Layer 2: Direct cache access
-            try:
-                from app.api.market_data_routes import market_data_cache
-                if market_data_cache and sym in market_data_cache:
-                    cached = market_data_cache[sym]
-                    bid = cached.get('bid')
-                    ask = cached.get('ask')
-                    if bid is not None and ask is not None and float(bid) > 0 and float(ask) > 0:
-                        return float(bid), float(ask)
-            except Exception:
-                pass
-        
-        # Layer 3: Redis market:l1:{symbol} (L1Feed Terminal streaming data — has TTL)
-        for sym in symbols_to_try:
-            try:
-                from app.core.redis_client import get_redis_client
-                import json as _json
-                redis = get_redis_client()
-                if redis:
-                    r = redis.sync if hasattr(redis, 'sync') else redis
-                    val = r.get(f"market:l1:{sym}")
-                    if val:
-                        l1_data = _json.loads(val if isinstance(val, str) else val.decode('utf-8'))
-                        bid = l1_data.get('bid')
-                        ask = l1_data.get('ask')
-                        if bid and ask and float(bid) > 0 and float(ask) > 0:
-                            return float(bid), float(ask)
-            except Exception:
-                pass
-        
-        # Layer 4: Redis live:{symbol} hash (legacy Hammer L1 feed)
-        for sym in symbols_to_try:
-            try:
-                from app.core.redis_client import get_redis_client
-                redis = get_redis_client()
-                if redis:
-                    r = redis.sync if hasattr(redis, 'sync') else redis
-                    bid_raw = r.hget(f"live:{sym}", "bid")
-                    ask_raw = r.hget(f"live:{sym}", "ask")
-                    if bid_raw and ask_raw:
-                        bid = float(bid_raw if isinstance(bid_raw, str) else bid_raw.decode('utf-8'))
-                        ask = float(ask_raw if isinstance(ask_raw, str) else ask_raw.decode('utf-8'))
-                        if bid > 0 and ask > 0:
-                            return bid, ask
-            except Exception:
-                pass
-        
-        # Layer 5: DataFabric (aggregated source)
-        for sym in symbols_to_try:
-            try:
-                from app.core.data_fabric import get_data_fabric
-                fabric = get_data_fabric()
-                if fabric:
-                    md = fabric.get_market_data(sym)
-                    if md:
-                        bid = md.get('bid')
-                        ask = md.get('ask')
-                        if bid is not None and ask is not None and float(bid) > 0 and float(ask) > 0:
-                            return float(bid), float(ask)
-            except Exception:
-                pass
+            from app.core.l1_resolver import get_l1_resolver
+            resolver = get_l1_resolver()
+            l1 = resolver.resolve_l1_sync([symbol]).get(symbol)
+            if l1:
+                return float(l1['bid']), float(l1['ask'])
+            symbols_to_try = list(resolver.get_variants(symbol))
+        except Exception as e:
+            logger.debug(f"[FILL_LOG] Could not resolve bid/ask for {symbol}: {e}")
+            symbols_to_try = [symbol]
         
-        # All 5 layers failed — log a warning so we can diagnose
+        # All layers failed — log a warning so we can diagnose
         logger.warning(
             f"[FILL_LOG] ⚠️ Bid/Ask NOT FOUND for {symbol} "
             f"(tried variants: {symbols_to_try}). "
@@ -210,31 +155,17 @@ class DailyFillsStore:
                         If None, uses current time (datetime.now()).
         """
         # === Deduplication: check if this exact fill already exists ===
-        dedup_key = f"{symbol}|{action}|{qty}|{price}|{fill_id or ''}"
-        
-        if not hasattr(self, '_existing_keys'):
-            self._existing_keys = {}  # account -> set of keys
+        dedup_key = fill_dedup_key(symbol, action, qty, price, fill_id)
         
         filename = self._get_filename(account_type)
         filepath = os.path.join(self.log_dir, filename)
         
-        # Load existing keys from CSV on first call for this account
-        if account_type not in self._existing_keys:
-            self._existing_keys[account_type] = set()
-            if os.path.isfile(filepath):
-                try:
-                    with open(filepath, 'r') as f:
-                        reader = csv.DictReader(f)
-                        for row in reader:
-                            k = f"{row.get('Symbol','')}|{row.get('Action','')}|{row.get('Quantity','')}|{row.get('Price','')}|{row.get('FillID','')}"
-                            self._existing_keys[account_type].add(k)
-                except Exception:
-                    pass
-        
-        if dedup_key in self._existing_keys[account_type]:
+        # Keys of every row in the CSV (incl. other processes' writes) live in the index
+        index = self._get_index(account_type)
+        if index.has_key(dedup_key):
             return  # Already logged, skip
         
-        self._existing_keys[account_type].add(dedup_key)
+        index.add_key(dedup_key)
         
         # Auto-fetch benchmark if not provided
         if bench_chg is None:
@@ -735,93 +666,8 @@ class DailyFillsStore:
         Returns:
             List of fill dicts with: order_id, symbol, action, qty, price, status, timestamp, tag
         """
-        filename = self._get_filename(account_type)
-        filepath = os.path.join(self.log_dir, filename)
-        
-        fills = []
-        if not os.path.exists(filepath):
-            return fills
-        
         try:
-            with open(filepath, 'r') as f:
-                reader = csv.DictReader(f)
-                for idx, row in enumerate(reader):
-                    time_str = row.get("Time", "")
-                    # Convert HH:MM:SS to timestamp
-                    ts = 0
-                    try:
-                        today = datetime.now().strftime("%Y-%m-%d")
-                        dt = datetime.strptime(f"{today} {time_str}", "%Y-%m-%d %H:%M:%S")
-                        ts = dt.timestamp()
-                    except Exception:
-                        ts = 0
-                    
-                    # Parse bench_chg (may be empty string in old CSVs)
-                    bench_chg_raw = row.get("Bench_Chg", "")
-                    bench_chg = None
-                    try:
-                        if bench_chg_raw and bench_chg_raw.strip():
-                            bench_chg = float(bench_chg_raw)
-                    except (ValueError, TypeError):
-                        bench_chg = None
-                    
-                    # Parse bid/ask (may be empty in old CSVs without these columns)
-                    bid_raw = row.get("Bid", "")
-                    ask_raw = row.get("Ask", "")
-                    spread_raw = row.get("Spread", "")
-                    bid_val = None
-                    ask_val = None
-                    spread_val = None
-                    try:
-                        if bid_raw and str(bid_raw).strip():
-                            bid_val = float(bid_raw)
-                    except (ValueError, TypeError):
-                        pass
-                    try:
-                        if ask_raw and str(ask_raw).strip():
-                            ask_val = float(ask_raw)
-                    except (ValueError, TypeError):
-                        pass
-                    try:
-                        if spread_raw and str(spread_raw).strip():
-                            spread_val = float(spread_raw)
-                    except (ValueError, TypeError):
-                        pass
-                    
-                    # Parse bench_price
-                    bench_price_raw = row.get("Bench_Price", "")
-                    bench_price_val = None
-                    try:
-                        if bench_price_raw and str(bench_price_raw).strip():
-                            bench_price_val = float(bench_price_raw)
-                    except (ValueError, TypeError):
-                        pass
-                    
-                    fills.append({
-                        "order_id": f"csv_fill_{idx}",
-                        "symbol": row.get("Symbol", ""),
-                        "action": row.get("Action", ""),
-                        "qty": float(row.get("Quantity", 0)),
-                        "filled_qty": float(row.get("Quantity", 0)),
-                        "remaining_qty": 0,
-                        "price": float(row.get("Price", 0)),
-                        "bid": bid_val,
-                        "ask": ask_val,
-                        "spread": spread_val,
-                        "status": "Filled",
-                        "source": row.get("Source", "CSV_FALLBACK"),
-                        "tag": row.get("Strategy", ""),
-                        "timestamp": ts,
-                        "time": time_str,
-                        "bench_chg": bench_chg,
-                        "bench_price": bench_price_val,
-                        "bench_source": row.get("Bench_Source", ""),
-                    })
-            
-            # Sort by timestamp descending (newest first)
-            fills.sort(key=lambda x: x.get("timestamp", 0), reverse=True)
-            return fills
-            
+            return self._get_index(account_type).all_fills()
         except Exception as e:
             logger.error(f"[FILL_LOG] Failed to read all fills: {e}")
             return []
@@ -832,40 +678,9 @@ class DailyFillsStore:
         Returns:
             Dict: {'LT': 100.0, 'MM': 50.0} (Aggregated by inferred bucket)
         """
-        filename = self._get_filename(account_type)
-        filepath = os.path.join(self.log_dir, filename)
-        
-        breakdown = defaultdict(float)
-        
-        if not os.path.exists(filepath):
-            return dict(breakdown)
-            
         try:
-            with open(filepath, 'r') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    if row.get("Symbol") == symbol:
-                        qty = float(row.get("Quantity", 0))
-                        action = row.get("Action", "").upper()
-                        strategy = row.get("Strategy", "UNKNOWN").upper()
-                        
-                        # Sign correction (Sell is negative impact on holdings)
-                        signed_qty = qty if action == "BUY" else -qty
-                        
-                        # Map specific strategies to buckets (LT/MM)
-                        # "JFIN", "LT_TRIM", "REDUCEMORE" -> LT
-                        # "GREATEST_MM", "SIDEHIT", "MM_ENGINE" -> MM
-                        bucket = "LT" # Default fallback as per user request
-                        
-                        if any(x in strategy for x in ["MM", "SIDEHIT"]):
-                            bucket = "MM"
-                        elif any(x in strategy for x in ["LT", "JFIN", "REDUCEMORE", "KARBOTU"]):
-                            bucket = "LT"
-                        
-                        breakdown[bucket] += signed_qty
-                        
-            return dict(breakdown)
-            
+            # Net quantity per book, maintained on append (see fills_index.strategy_bucket)
+            return self._get_index(account_type).breakdown(symbol)
         except Exception as e:
             logger.error(f"[FILL_LOG] Failed to read breakdown: {e}")
             return {}
@@ -881,26 +696,30 @@ class DailyFillsStore:
         fills = []
         for account_type in ["HAMMER_PRO", "IBKR_PED"]:
             try:
-                filename = self._get_filename(account_type)
-                filepath = os.path.join(self.log_dir, filename)
-                if not os.path.exists(filepath):
-                    continue
-                with open(filepath, 'r') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        if row.get("Symbol") == symbol:
-                            fills.append({
-                                "symbol": symbol,
-                                "action": row.get("Action", ""),
-                                "tag": row.get("Strategy", ""),
-                                "time": row.get("Time", ""),
-                                "qty": float(row.get("Quantity", 0)),
-                                "price": float(row.get("Price", 0)),
-                            })
+                for fill in self._get_index(account_type).fills_for_symbol(symbol):
+                    fills.append({
+                        "symbol": symbol,
+                        "action": fill["action"],
+                        "tag": fill["tag"],
+                        "time": fill["time"],
+                        "qty": fill["qty"],
+                        "price": fill["price"],
+                    })
             except Exception:
                 continue
         return fills
 
+    def get_fill_aggregates(self, account_type: str) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """
+        Today's per-symbol and per-strategy-tag aggregates (maintained on append).
+        
+        Returns:
+            {'by_symbol': {symbol: stats}, 'by_tag': {tag: stats}} where stats is
+            {fills, buy_qty, sell_qty, net_qty, notional}
+        """
+        index = self._get_index(account_type)
+        return {'by_symbol': index.symbol_stats(), 'by_tag': index.tag_stats()}
+
 _daily_fills_store = None
 def get_daily_fills_store():
     global _daily_fills_store
@@ -33,6 +33,7 @@ except ImportError:
 from app.core.logger import logger
 from app.core.redis_client import get_redis_client
 from app.config.settings import settings
+from app.market_data.truth_tick_read_model import SOURCE_INSPECT, get_truth_tick_read_model
 from app.mm.greatest_mm_engine import GreatestMMEngine, get_greatest_mm_engine
 from app.mm.greatest_mm_models import MMAnalysis, MMScenario
 
@@ -149,38 +150,11 @@ class GreatestMMWorker:
             if not symbols:
                 return all_ticks
                 
-            # Use pipeline for performance if we have many symbols
-            pipe = self.redis_client.pipeline()
-            # Split into batches of 200 to avoid blocking Redis for too long
-            for i in range(0, len(symbols), 200):
-                batch = symbols[i:i+200]
-                for symbol in batch:
-                    pipe.get(f"truth_ticks:inspect:{symbol}")
-                
-                results = pipe.execute()
-                
-                for idx, result_json in enumerate(results):
-                    if result_json:
-                        try:
-                            symbol = batch[idx]
-                            if isinstance(result_json, bytes):
-                                result_json = result_json.decode('utf-8')
-                            result_data = json.loads(result_json)
-                            # Extract path_dataset (the latest 100 qualified truth ticks)
-                            path_data = result_data.get('data', {}).get('path_dataset', [])
-                            if path_data:
-                                # Normalize for MM engine
-                                normalized_ticks = []
-                                for t in path_data:
-                                    normalized_ticks.append({
-                                        'ts': t.get('timestamp'),
-                                        'price': t.get('price'),
-                                        'size': t.get('size'),
-                                        'exch': t.get('venue')
-                                    })
-                                all_ticks[symbol] = normalized_ticks
-                        except:
-                            continue
+            # Shared read model: pipelined version check, blobs parsed once per version
+            # path_dataset normalized for MM engine: [{ts, price, size, exch}, ...]
+            for symbol, series in get_truth_tick_read_model().get_many(symbols, SOURCE_INSPECT).items():
+                if len(series):
+                    all_ticks[symbol] = series.to_dicts()
         except Exception as e:
             logger.warning(f"⚠️ [{self.worker_name}] Could not load ticks from Redis: {e}")
         
@@ -30,6 +30,7 @@ except ImportError:
 
 from app.core.logger import logger
 from app.core.redis_client import get_redis_client
+from app.core.redis_keys import RedisKeys
 from app.config.settings import settings
 from app.market_data.truth_ticks_engine import get_truth_ticks_engine
 from app.market_data.static_data_store import get_static_store
@@ -57,6 +58,9 @@ class TruthTicksWorker:
     Backend terminal is NOT blocked - all heavy work happens here.
     """
     
+    L1_MAX_IN_FLIGHT = 16  # Concurrent getSymbolSnapshot requests in the L1 feed loop
+    L1_SNAPSHOT_TIMEOUT = 5.0  # Per-symbol snapshot timeout (seconds)
+    
     def initialize_services(self):
         """Initialize worker's own services"""
         try:
@@ -144,8 +148,10 @@ class TruthTicksWorker:
                     # normalized already has display_symbol from TradePrintRouter
                     display_symbol = normalized.get('symbol')
                     if display_symbol:
+                        # 'ts' parsed once by TradePrintRouter (None: unparseable → receive time)
+                        ts = normalized.get('ts')
                         truth_tick = {
-                            'ts': normalized.get('time'),
+                            'ts': ts if ts is not None else time.time(),
                             'price': normalized.get('price'),
                             'size': normalized.get('size'),
                             'exch': normalized.get('venue', 'UNKNOWN')
@@ -247,14 +253,20 @@ class TruthTicksWorker:
                     errors = 0
                     pipeline = self.redis_client.pipeline()
                     
-                    for symbol in self.assigned_symbols:
+                    # Pipelined snapshots: L1_MAX_IN_FLIGHT requests outstanding, results as they arrive
+                    # (per-symbol timeout, so a few slow symbols don't stall the cycle)
+                    from app.live.symbol_mapper import SymbolMapper
+                    snapshots = self.hammer_client.get_symbol_snapshots(
+                        self.assigned_symbols,
+                        max_in_flight=self.L1_MAX_IN_FLIGHT,
+                        timeout=self.L1_SNAPSHOT_TIMEOUT,
+                        use_cache=False
+                    )
+                    for symbol, snapshot in snapshots:
                         if not self.running:
                             break
                         
                         try:
-                            # Fetch snapshot from Hammer (lightweight, just bid/ask/last)
-                            snapshot = self.hammer_client.get_symbol_snapshot(symbol, use_cache=False)
-                            
                             if snapshot:
                                 bid = snapshot.get('bid', 0.0) or 0.0
                                 ask = snapshot.get('ask', 0.0) or 0.0
@@ -278,7 +290,6 @@ class TruthTicksWorker:
                                 # 🔑 TICKER CONVENTION: Write BOTH Hammer and PREF_IBKR keys
                                 # so ALL consumers can find L1 data regardless of format.
                                 # Hammer format (WBS-F) is the canonical key for market data.
-                                from app.live.symbol_mapper import SymbolMapper
                                 hammer_sym = SymbolMapper.to_hammer_symbol(symbol)
                                 
                                 # Primary key: Hammer format (canonical for market data)
@@ -289,14 +300,14 @@ class TruthTicksWorker:
                                     pipeline.setex(f"market:l1:{symbol}", 120, l1_json)
                                 
                                 updated += 1
-                                
-                                # Small delay to avoid overwhelming Hammer
-                                time.sleep(0.01)
+                            else:
+                                errors += 1
                                 
                         except Exception as e:
                             errors += 1
                             if errors <= 5:  # Only log first 5 errors
                                 logger.debug(f"[{self.worker_name}] L1 feed error for {symbol}: {e}")
+                    snapshots.close()
                     
                     # Execute pipeline
                     try:
@@ -304,7 +315,8 @@ class TruthTicksWorker:
                         cycle_time = time.time() - cycle_start
                         logger.debug(
                             f"📊 [{self.worker_name}] L1 Feed Cycle: "
-                            f"Updated {updated}/{len(self.assigned_symbols)} symbols in {cycle_time:.1f}s"
+                            f"Updated {updated}/{len(self.assigned_symbols)} symbols in {cycle_time:.1f}s "
+                            f"({errors} failed/timed out)"
                         )
                     except Exception as e:
                         logger.error(f"❌ [{self.worker_name}] Redis pipeline error: {e}")
@@ -501,12 +513,18 @@ class TruthTicksWorker:
                             # The engine's get_inspect_data now calculates this correctly (in cents)
                             # inspect_data['temporal_analysis'] = symbol_timeframes
                             
-                            inspect_key = f"truth_ticks:inspect:{symbol}"
-                            self.redis_client.setex(
-                                inspect_key,
+                            # Blob + version bump in one round trip (version after the blob):
+                            # TruthTickReadModel re-parses the blob only when the version changes
+                            version_key = RedisKeys.truth_ticks_inspect_version(symbol)
+                            pipe = self.redis_client.pipeline(transaction=False)
+                            pipe.setex(
+                                RedisKeys.truth_ticks_inspect(symbol),
                                 3600,
                                 json.dumps({"success": True, "symbol": symbol, "data": inspect_data})
                             )
+                            pipe.incr(version_key)
+                            pipe.expire(version_key, 3600)
+                            pipe.execute()
                             # Write latest truth tick for RevnBookCheck/Frontlama (truthtick:latest:{symbol})
                             path_dataset = inspect_data.get("path_dataset") or []
                             if path_dataset:
@@ -335,7 +335,7 @@ class XNLEngine:
             logger.warning("[XNL_ENGINE] Cycle request preparation failed (RUNALL preparer returned None), skipping initial cycle")
             return
 
-        logger.info("[XNL_ENGINE] Using shared cycle request (metrics, exposure, Janall from RUNALL layer)")
+        logger.info(f"[XNL_ENGINE] Using shared cycle request (metrics, exposure, Janall from RUNALL layer, epoch={request.epoch_id})")
 
         # Hard risk: cur >= max_cur_exp OR pot >= max_pot_exp → skip position increase (ADDNEWPOS, MM INC, REV saved)
         # V2: Account-aware thresholds (each account can have different max_cur_exp/max_pot_exp)
@@ -912,9 +912,10 @@ class XNLEngine:
                 account_id=account_id
             )
             
+            l1_batch = await self._get_l1_batch([intent.symbol for intent in intents])
             for intent in intents:
                 # Check L1 data before creating order (same logic as MM)
-                l1_data = await self._get_l1_data(intent.symbol)
+                l1_data = l1_batch.get(intent.symbol)
                 if not l1_data:
                     logger.warning(f"[XNL_ENGINE] No L1 data for {intent.symbol}, skipping")
                     continue
@@ -1048,9 +1049,10 @@ class XNLEngine:
                 minmax_svc = get_minmax_area_service()
                 minmax_svc.get_all_rows(account_id)
                 
+                l1_batch = await self._get_l1_batch([dec.symbol for dec in output.decisions])
                 for dec in output.decisions:
                     # Check L1 data before creating order (same logic as MM)
-                    l1_data = await self._get_l1_data(dec.symbol)
+                    l1_data = l1_batch.get(dec.symbol)
                     if not l1_data:
                         logger.warning(f"[XNL_ENGINE] No L1 data for {dec.symbol}, skipping")
                         continue
@@ -1153,6 +1155,9 @@ class XNLEngine:
             }
             
             # Apply settings filters and JFIN percentage
+            l1_batch = await self._get_l1_batch(
+                [dec.symbol for dec in response.decisions if not dec.filtered_out]
+            )
             for dec in response.decisions:
                 if dec.filtered_out:
                     continue
@@ -1223,7 +1228,7 @@ class XNLEngine:
                     continue
                 
                 # Check L1 data before creating order (same logic as MM)
-                l1_data = await self._get_l1_data(dec.symbol)
+                l1_data = l1_batch.get(dec.symbol)
                 if not l1_data:
                     logger.warning(f"[XNL_ENGINE] No L1 data for {dec.symbol}, skipping")
                     continue
@@ -1780,6 +1785,9 @@ class XNLEngine:
             # Convert to orders
             mm_blocked = 0
             mm_trimmed = 0
+            l1_batch = await self._get_l1_batch(
+                [dec.symbol for dec in final_longs + final_shorts if not dec.price_hint]
+            )
             for dec in final_longs:
                 # Get price from proposal (bid + spread * 0.15)
                 # If price_hint exists, use it; otherwise calculate
@@ -1787,7 +1795,7 @@ class XNLEngine:
                     order_price = dec.price_hint
                 else:
                     # Get L1 data for price calculation
-                    l1_data = await self._get_l1_data(dec.symbol)
+                    l1_data = l1_batch.get(dec.symbol)
                     if l1_data:
                         bid = l1_data.get('bid', 0)
                         ask = l1_data.get('ask', 0)
@@ -1854,7 +1862,7 @@ class XNLEngine:
                     order_price = dec.price_hint
                 else:
                     # Get L1 data for price calculation
-                    l1_data = await self._get_l1_data(dec.symbol)
+                    l1_data = l1_batch.get(dec.symbol)
                     if l1_data:
                         bid = l1_data.get('bid', 0)
                         ask = l1_data.get('ask', 0)
@@ -2138,13 +2146,16 @@ class XNLEngine:
             
             sent_count = 0
             
+            # One batch L1 resolve for the whole send cycle
+            l1_batch = await self._get_l1_batch([order['symbol'] for order in orders])
+            
             for order in orders:
                 if not self._running:
                     logger.info("[XNL_ENGINE] Stop requested, aborting order send")
                     break
                 try:
                     # Get L1 data for this symbol
-                    l1_data = await self._get_l1_data(order['symbol'])
+                    l1_data = l1_batch.get(order['symbol'])
                     
                     if not l1_data:
                         logger.warning(f"[XNL_ENGINE] No L1 data for {order['symbol']}, skipping")
@@ -2396,9 +2407,12 @@ class XNLEngine:
             
             modified_count = 0
             
+            # One batch L1 resolve for the whole front cycle
+            l1_batch = await self._get_l1_batch([order['symbol'] for order in open_orders])
+            
             for order in open_orders:
                 try:
-                    l1_data = await self._get_l1_data(order['symbol'])
+                    l1_data = l1_batch.get(order['symbol'])
                     if not l1_data:
                         continue
                     
@@ -2663,86 +2677,24 @@ class XNLEngine:
     async def _get_l1_data(self, symbol: str) -> Optional[Dict[str, Any]]:
         """Get L1 market data for a symbol with freshness guarantee.
         
-        Priority:
+        Single-symbol wrapper over L1Resolver.resolve_l1 (see
+        _get_l1_batch for loops). Priority:
         1. DataFabric in-memory (if fresh — updated within 120s)
         2. Redis market:l1:{symbol} (L1Feed Terminal streaming — 2s refresh)
-        3. market_data_cache (Hammer L1Update handler)
-        4. DataFabric in-memory (stale — as last resort)
+        3. Redis live:{symbol} hash (Hammer L1 feed)
+        4. market_data_cache (Hammer L1Update handler)
+        5. DataFabric in-memory (stale — as last resort)
         """
-        stale_data = None  # Hold stale data as last resort
-        
+        return (await self._get_l1_batch([symbol])).get(symbol)
+    
+    async def _get_l1_batch(self, symbols: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Resolve L1 for a whole cycle at once (one pipelined Redis call)."""
         try:
-            from app.core.data_fabric import get_data_fabric
-            
-            fabric = get_data_fabric()
-            if fabric:
-                live = fabric._live_data.get(symbol, {})
-                if live and live.get('bid') is not None and live.get('ask') is not None:
-                    bid = live.get('bid', 0)
-                    ask = live.get('ask', 0)
-                    if bid > 0 and ask > 0:
-                        # Check freshness
-                        last_update = live.get('_last_update')
-                        is_fresh = False
-                        if last_update:
-                            from datetime import datetime
-                            age = (datetime.now() - last_update).total_seconds() if hasattr(last_update, 'total_seconds') is False else 0
-                            try:
-                                age = (datetime.now() - last_update).total_seconds()
-                                is_fresh = age < 120  # 2 minutes
-                            except Exception:
-                                is_fresh = True  # Assume fresh if can't check
-                        else:
-                            is_fresh = True  # No timestamp = assume fresh
-                        
-                        data = {'bid': bid, 'ask': ask, 'last': live.get('last', 0)}
-                        if is_fresh:
-                            return data
-                        else:
-                            stale_data = data  # Save as fallback
+            from app.core.l1_resolver import resolve_l1
+            return await resolve_l1(symbols)
         except Exception as e:
-            logger.debug(f"[XNL_ENGINE] DataFabric L1 error for {symbol}: {e}")
-        
-        # Layer 2: Redis market:l1:{symbol} (L1Feed Terminal streaming data)
-        try:
-            import json as _json
-            from app.core.redis_client import get_redis_client
-            from app.live.symbol_mapper import SymbolMapper
-            redis_client = get_redis_client()
-            if redis_client:
-                r = redis_client.sync if hasattr(redis_client, 'sync') else redis_client
-                # 🔑 TICKER CONVENTION: Try both Hammer and PREF_IBKR formats
-                _h_sym = SymbolMapper.to_hammer_symbol(symbol)
-                _d_sym = SymbolMapper.to_display_symbol(symbol)
-                for _try_sym in dict.fromkeys([symbol, _h_sym, _d_sym]):
-                    val = r.get(f"market:l1:{_try_sym}")
-                    if val:
-                        l1 = _json.loads(val if isinstance(val, str) else val.decode('utf-8'))
-                        bid = l1.get('bid')
-                        ask = l1.get('ask')
-                        if bid and ask and float(bid) > 0 and float(ask) > 0:
-                            return {'bid': float(bid), 'ask': float(ask), 'last': float(l1.get('last', 0))}
-        except Exception as e:
-            logger.debug(f"[XNL_ENGINE] Redis L1 error for {symbol}: {e}")
-        
-        # Layer 3: market_data_cache (Hammer L1Update handler in main app)
-        try:
-            from app.api.market_data_routes import market_data_cache
-            if market_data_cache and symbol in market_data_cache:
-                cached = market_data_cache[symbol]
-                bid = cached.get('bid')
-                ask = cached.get('ask')
-                if bid is not None and ask is not None and float(bid) > 0 and float(ask) > 0:
-                    return {'bid': float(bid), 'ask': float(ask), 'last': float(cached.get('last', 0))}
-        except Exception:
-            pass
-        
-        # Layer 4: Return stale data as last resort (better than nothing)
-        if stale_data:
-            logger.debug(f"[XNL_ENGINE] Using STALE L1 data for {symbol} (no fresh source available)")
-            return stale_data
-        
-        return None
+            logger.debug(f"[XNL_ENGINE] L1 batch resolve error: {e}")
+            return {}
     
     async def _get_truth_tick_data(self, symbol: str) -> tuple:
         """
@@ -2778,44 +2730,18 @@ class XNLEngine:
             redis_sync = getattr(redis_client, 'sync', redis_client)
             
             # PRIMARY: tt:ticks:{symbol} — canonical source (12-day TTL)
-            key = f"tt:ticks:{symbol}"
-            data = redis_sync.get(key)
-            
-            if data:
-                raw = data.decode() if isinstance(data, bytes) else data
-                ticks = json.loads(raw)
-                
-                if ticks and isinstance(ticks, list):
-                    now = time.time()
-                    valid_ticks = []
-                    
-                    # Iterate from newest to oldest (list is chronological)
-                    for tick in reversed(ticks):
-                        tick_ts = tick.get('ts', 0)
-                        
-                        # Allow up to 24 hours (illiquid stocks + overnight)
-                        if tick_ts > 0:
-                            age = now - tick_ts
-                            if age > 86400:
-                                continue
-                        
-                        price = float(tick.get('price', 0))
-                        size = float(tick.get('size', 0))
-                        venue = str(tick.get('exch', tick.get('venue', '')))
-                        
-                        if price > 0 and size > 0:
-                            valid_ticks.append({
-                                'price': price,
-                                'venue': venue,
-                                'size': size,
-                                'ts': tick_ts
-                            })
-                        
-                        if len(valid_ticks) >= count:
-                            break
-                    
-                    if valid_ticks:
-                        return valid_ticks  # Already newest-first (from reversed)
+            # Shared read model: parsed once per blob version, not per order
+            from app.market_data.truth_tick_read_model import SOURCE_RAW, get_truth_tick_read_model
+            series = get_truth_tick_read_model().get(symbol, SOURCE_RAW)
+            
+            if series is not None:
+                # Newest first; allow up to 24 hours (illiquid stocks + overnight)
+                valid_ticks = [
+                    {'price': t['price'], 'venue': t['exch'], 'size': t['size'], 'ts': t['ts']}
+                    for t in series.latest(count, max_age_sec=86400, size_above=0)
+                ]
+                if valid_ticks:
+                    return valid_ticks
             
             # FALLBACK: truthtick:latest:{symbol} (legacy, short TTL)
             legacy_key = f"truthtick:latest:{symbol}"
@@ -0,0 +1,168 @@
+"""tests/unit/conftest.py
+
+Shared in-memory Redis test double for the unit tests.
+
+FakeRedis keeps strings / hashes / lists / sets in dicts and records what the
+code under test sent (direct MGETs, executed pipelines, RPUSH sizes) so tests
+can assert on round trips. FakeRedisClient mirrors app.core.redis_client
+(`.sync`, proxied `get`, `async_client()`).
+"""
+
+import fnmatch
+import importlib
+
+import pytest
+
+
+class FakePipeline:
+    """Queues any command and replays it against FakeRedis on execute()"""
+
+    def __init__(self, redis, is_async=False):
+        self._redis = redis
+        self._async = is_async
+        self._ops = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self._ops.append((name, args, kwargs))
+        return queue
+
+    def _run(self):
+        if self._redis.fail:
+            raise ConnectionError("redis down")
+        self._redis.pipelines.append([(name, args) for name, args, _ in self._ops])
+        # Replay through the class so forbid() only guards direct calls
+        return [getattr(FakeRedis, name)(self._redis, *args, **kwargs) for name, args, kwargs in self._ops]
+
+    def execute(self):
+        if not self._async:
+            return self._run()
+
+        async def run():
+            return self._run()
+        return run()
+
+
+class FakeRedis:
+    """Sync redis-py stand-in"""
+
+    def __init__(self):
+        self.strings = {}
+        self.hashes = {}
+        self.lists = {}
+        self.sets = {}
+        self.ttls = {}
+        self.mgets = []      # Key list of every direct MGET
+        self.pipelines = []  # [(command, args), ...] of every executed pipeline
+        self.pushed = []     # (key, count) of every RPUSH
+        self.fail = False    # Pipelines raise ConnectionError while set
+
+    def forbid(self, name, reason):
+        """Make a direct call to `name` fail the test (pipelined calls still work)"""
+        def forbidden(*args, **kwargs):
+            raise AssertionError(reason)
+        setattr(self, name, forbidden)
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    # Strings
+    def get(self, key):
+        return self.strings.get(key)
+
+    def set(self, key, value, ex=None):
+        self.strings[key] = value
+        if ex:
+            self.ttls[key] = ex
+        return True
+
+    def setex(self, key, ttl, value):
+        return self.set(key, value, ex=ttl)
+
+    def mget(self, keys):
+        self.mgets.append(list(keys))
+        return [self.strings.get(k) for k in keys]
+
+    def incr(self, key):
+        self.strings[key] = str(int(self.strings.get(key) or 0) + 1)
+        return int(self.strings[key])
+
+    def expire(self, key, ttl):
+        self.ttls[key] = ttl
+        return True
+
+    # Hashes
+    def hset(self, key, field=None, value=None, mapping=None):
+        row = self.hashes.setdefault(key, {})
+        if field is not None:
+            row[field] = str(value)
+        row.update({k: str(v) for k, v in (mapping or {}).items()})
+
+    def hmget(self, key, *fields):
+        row = self.hashes.get(key, {})
+        return [row.get(f) for f in fields]
+
+    # Lists
+    def rpush(self, key, *values):
+        self.pushed.append((key, len(values)))
+        self.lists.setdefault(key, []).extend(values)
+        return len(self.lists[key])
+
+    def ltrim(self, key, start, end):
+        self.lists[key] = self.lrange(key, start, end)
+
+    def lrange(self, key, start, end):
+        return list(self.lists.get(key, [])[start:None if end == -1 else end + 1])
+
+    # Sets
+    def sadd(self, key, *members):
+        self.sets.setdefault(key, set()).update(members)
+
+    def smembers(self, key):
+        return set(self.sets.get(key, ()))
+
+    def scan_iter(self, match='*', count=None):
+        keys = [*self.strings, *self.hashes, *self.lists, *self.sets]
+        return [k for k in keys if fnmatch.fnmatchcase(k, match)]
+
+
+class FakeAsyncRedis:
+    """redis.asyncio view over the same FakeRedis data"""
+
+    def __init__(self, redis):
+        self._redis = redis
+
+    async def mget(self, keys):
+        return self._redis.mget(keys)
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self._redis, is_async=True)
+
+
+class FakeRedisClient:
+    """get_redis_client() stand-in"""
+
+    def __init__(self, redis):
+        self.sync = redis
+        self._async = FakeAsyncRedis(redis)
+
+    def get(self, key):
+        return self.sync.get(key)
+
+    async def async_client(self):
+        return self._async
+
+
+@pytest.fixture
+def fake_redis():
+    return FakeRedis()
+
+
+@pytest.fixture
+def redis_client(monkeypatch, fake_redis):
+    """Route get_redis_client() to a FakeRedisClient over `fake_redis`"""
+    client = FakeRedisClient(fake_redis)
+    # app.core re-exports a redis_client attribute that shadows the submodule
+    module = importlib.import_module('app.core.redis_client')
+    monkeypatch.setattr(module, 'get_redis_client', lambda: client)
+    return client
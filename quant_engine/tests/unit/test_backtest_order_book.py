@@ -0,0 +1,77 @@
+"""tests/unit/test_backtest_order_book.py
+
+Unit test for the price-indexed pending order books of the backtest ExecutionSimulator.
+"""
+
+import app.engine.engine_loop  # noqa: F401 - must precede strategy_base (circular import)
+from app.backtest.execution_simulator import ExecutionSimulator
+
+
+def tick(last, bid=None, ask=None, volume=None, symbol='AAA', ts=1000):
+    t = {'symbol': symbol, 'last': str(last), 'bid': str(bid if bid is not None else last),
+         'ask': str(ask if ask is not None else last), 'ts': ts}
+    if volume is not None:
+        t['volume'] = volume
+    return t
+
+
+def test_resting_orders_away_from_market_are_not_touched():
+    sim = ExecutionSimulator()
+    for i in range(500):  # Ladder of resting buys far below the market
+        sim.process_new_order({'symbol': 'AAA', 'side': 'BUY', 'qty': 100, 'limit_price': 10.0 - i * 0.01})
+    sim.process_new_order({'symbol': 'AAA', 'side': 'SELL', 'qty': 100, 'limit_price': 30.0})
+
+    for _ in range(100):
+        assert sim.process_tick(tick(20.0, 19.99, 20.01, volume=1000)) == []
+
+    stats = sim.get_stats()
+    assert stats['orders_touched'] == 0
+    assert stats['open_orders'] == 501
+    assert stats['price_levels'] == 501
+
+
+def test_price_time_priority_with_shared_volume_and_queue_position():
+    sim = ExecutionSimulator()
+    first = sim.process_new_order({'symbol': 'AAA', 'side': 'BUY', 'qty': 300, 'limit_price': 20.0})
+    second = sim.process_new_order({'symbol': 'AAA', 'side': 'BUY', 'qty': 300, 'limit_price': 20.0})
+    better = sim.process_new_order({'symbol': 'AAA', 'side': 'BUY', 'qty': 200, 'limit_price': 20.05})
+
+    fills = sim.process_tick(tick(19.98, 19.97, 19.99, volume=400))
+    assert [(f['order_id'], f['fill_qty']) for f in fills] == [(better, 200), (first, 200)]
+    assert fills[1]['fill_price'] == 19.99  # min(limit, ask)
+
+    # first keeps its place at the head of the 20.00 level
+    fills = sim.process_tick(tick(19.98, 19.97, 19.99, volume=150))
+    assert [(f['order_id'], f['fill_qty']) for f in fills] == [(first, 100), (second, 50)]
+    assert [o.order_id for o in sim.get_pending_orders('AAA')] == [second]
+    assert sim.get_pending_orders()[0].remaining == 250
+
+
+def test_market_orders_sells_and_cancel():
+    sim = ExecutionSimulator(slippage=0.01)
+    market = sim.process_new_order({'symbol': 'AAA', 'side': 'BUY', 'qty': 50})
+    sell_low = sim.process_new_order({'symbol': 'AAA', 'side': 'SELL', 'qty': 100, 'limit_price': 20.0})
+    sell_high = sim.process_new_order({'symbol': 'AAA', 'side': 'SELL', 'qty': 100, 'limit_price': 20.5})
+    cancelled = sim.process_new_order({'symbol': 'AAA', 'side': 'SELL', 'qty': 100, 'limit_price': 19.9})
+    assert sim.cancel_order(cancelled)
+    assert not sim.cancel_order(cancelled)
+
+    fills = sim.process_tick(tick(20.1, 20.05, 20.15))  # No volume field: full fills
+    assert [(f['order_id'], f['fill_qty'], f['fill_price']) for f in fills] == [
+        (market, 50, 20.15 + 0.01),
+        (sell_low, 100, 20.05 - 0.01),  # max(limit, bid) - slippage
+    ]
+    assert list(sim.pending_orders) == ['AAA']
+    assert [o.order_id for o in sim.pending_orders['AAA']] == [sell_high]
+
+
+def test_legacy_volume_mode_and_determinism():
+    def run(shared):
+        sim = ExecutionSimulator(shared_volume=shared)
+        for _ in range(3):
+            sim.process_new_order({'symbol': 'AAA', 'side': 'BUY', 'qty': 100, 'limit_price': 20.0})
+        return [(f['order_id'], f['exec_id'], f['fill_qty']) for f in sim.process_tick(tick(19.9, volume=120))]
+
+    assert [q for _, _, q in run(False)] == [100, 100, 100]  # Each order up to the tick volume
+    assert [q for _, _, q in run(True)] == [100, 20]
+    assert run(True) == run(True)  # Sequential ids: identical runs, identical fills
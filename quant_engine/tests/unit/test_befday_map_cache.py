@@ -0,0 +1,93 @@
+"""tests/unit/test_befday_map_cache.py
+
+Unit test for the per-account, per-date BEFDAY map cache in PositionSnapshotAPI.
+"""
+
+from datetime import datetime
+
+import pytest
+
+import app.psfalgo.position_snapshot_api as pos_module
+from app.psfalgo.position_snapshot_api import PositionSnapshotAPI, notify_befday_write
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = datetime(2026, 3, 10, 9, 30)
+        self.ts = 1_000.0
+
+    def time(self):
+        return self.ts
+
+
+@pytest.fixture
+def api(monkeypatch, fake_redis, redis_client):
+    clock = FakeClock()
+
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return clock.now
+
+    monkeypatch.setattr(pos_module, 'datetime', FrozenDatetime)
+    monkeypatch.setattr(pos_module, 'time', clock)
+    monkeypatch.setattr(pos_module, '_BEFDAY_MAP_CACHE', {})
+    monkeypatch.setattr(pos_module, '_BEFDAY_EXPOSURE_CACHE', {})
+
+    api = PositionSnapshotAPI()
+    api.loads = 0
+    api.next_map = {'AAA': {'quantity': 100.0}}
+
+    def read(account_id):
+        api.loads += 1
+        return dict(api.next_map)
+
+    api._read_befday_map = read
+    api.clock, api.redis = clock, fake_redis
+    return api
+
+
+def test_map_is_reused_until_version_bump_or_date_rollover(api):
+    first = api._load_befday_map('IBKR_GUN')
+    assert api._load_befday_map('IBKR_GUN') is first
+    assert api.loads == 1
+
+    # Another process wrote BEFDAY: only the Redis version changes
+    api.redis.incr('psfalgo:befday:ver:IBKR_GUN')
+    api.next_map = {'AAA': {'quantity': 50.0}}
+    second = api._load_befday_map('IBKR_GUN')
+    assert second is not first and second['AAA']['quantity'] == 50.0
+    assert api._load_befday_map('IBKR_GUN') is second
+    assert api.loads == 2
+
+    # Accounts are independent
+    api._load_befday_map('IBKR_PED')
+    assert api.loads == 3
+
+    api.clock.now = datetime(2026, 3, 11, 4, 0)
+    api._load_befday_map('IBKR_GUN')
+    assert api.loads == 4
+
+
+def test_empty_map_is_rechecked_after_ttl(api):
+    api.next_map = {}
+    assert api._load_befday_map('HAMPRO') == {}
+    api.clock.ts += pos_module._BEFDAY_EMPTY_MAP_TTL - 1
+    api._load_befday_map('HAMPRO')
+    assert api.loads == 1
+
+    api.clock.ts += 2
+    api.next_map = {'BBB': {'quantity': -200.0}}
+    assert api._load_befday_map('HAMPRO') == {'BBB': {'quantity': -200.0}}
+    assert api.loads == 2
+
+
+def test_notify_befday_write_invalidates_local_and_remote(api):
+    first = api._load_befday_map('HAMPRO')
+    notify_befday_write('HAMPRO')
+
+    assert 'HAMPRO' not in pos_module._BEFDAY_MAP_CACHE
+    assert api.redis.strings['psfalgo:befday:ver:HAMPRO'] == '1'
+    assert api.redis.ttls['psfalgo:befday:ver:HAMPRO'] == 172800
+    assert api._load_befday_map('HAMPRO') is not first
+    assert api.loads == 2
@@ -0,0 +1,90 @@
+"""tests/unit/test_columnar_replay.py
+
+Unit test for columnar tick replay (TickColumns / Tick) in BacktestEngine.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import app.engine.engine_loop  # noqa: F401 - must precede strategy_base (circular import)
+from app.backtest.backtest_engine import BacktestEngine
+from app.backtest.tick_columns import Tick, TickColumns
+from app.strategy.strategy_base import StrategyBase
+
+
+class RecordingStrategy(StrategyBase):
+    def __init__(self):
+        super().__init__(name="RecordingStrategy")
+        self.seen = []
+
+    def on_market_data(self, symbol, price, tick, position, candle_data, completed_candle):
+        self.seen.append((symbol, price, float(tick['bid']), float(tick['ask']), int(tick['ts'])))
+        return None
+
+
+def cols(ts_sec, price):
+    ts_sec = np.asarray(ts_sec, dtype=np.int64)
+    price = np.asarray(price, dtype=np.float64)
+    return {
+        'ts_ns': ts_sec * 1_000_000_000,
+        'last': price,
+        'bid': price - 0.01,
+        'ask': price + 0.01,
+        'volume': np.full(len(ts_sec), 100, dtype=np.int64),
+    }
+
+
+def test_merge_orders_by_timestamp_and_keeps_single_symbol_zero_copy():
+    merged = TickColumns.merge({
+        'AAA': cols([1, 3, 5], [10.0, 10.1, 10.2]),
+        'BBB': cols([2, 3, 4], [20.0, 20.1, 20.2]),
+        'EMPTY': cols([], []),
+    })
+    rows = [(symbol, tick.ts, tick.last) for symbol, tick in merged.iter_ticks()]
+    assert rows == [
+        ('AAA', 1000, 10.0), ('BBB', 2000, 20.0), ('AAA', 3000, 10.1),  # Tie: symbol order
+        ('BBB', 3000, 20.1), ('BBB', 4000, 20.2), ('AAA', 5000, 10.2),
+    ]
+    assert merged.symbols == ['AAA', 'BBB']
+
+    single = cols([1, 2], [10.0, 10.1])
+    assert TickColumns.merge({'AAA': single}).last is single['last']
+    assert len(TickColumns.merge({})) == 0
+
+
+def test_tick_reads_like_legacy_dict():
+    tick = Tick('AAA', 10.5, 10.49, 10.51, 300, 1704067200000)
+    assert tick.get('last') == 10.5
+    assert tick['volume'] == 300
+    assert tick.get('missing', 'x') == 'x'
+    tick['symbol'] = 'BBB'
+    tick['note'] = 'extra'
+    assert tick['symbol'] == 'BBB' and 'note' in tick and tick.get('note') == 'extra'
+    with pytest.raises(KeyError):
+        tick['unknown']
+    assert tick.to_dict()['ts'] == 1704067200000
+
+
+def test_columnar_replay_matches_legacy_path(tmp_path):
+    for symbol, offset in (('AAA', 0), ('BBB', 30)):
+        ts = pd.date_range('2024-01-01', periods=300, freq='min') + pd.Timedelta(seconds=offset)
+        price = 20 + np.sin(np.arange(300) / 20.0)
+        pd.DataFrame({
+            'timestamp': ts, 'symbol': symbol, 'last': price.round(2),
+            'bid': (price - 0.01).round(2), 'ask': (price + 0.01).round(2), 'volume': 200,
+        }).to_csv(tmp_path / f"{symbol}.csv", index=False)
+
+    runs = {}
+    for columnar in (False, True):
+        strategy = RecordingStrategy()
+        engine = BacktestEngine(strategy, data_dir=str(tmp_path), save_reports=False, columnar=columnar)
+        engine.run(['AAA', 'BBB'])
+        runs[columnar] = (engine, strategy)
+
+    legacy, columnar = runs[False], runs[True]
+    assert columnar[0].tick_count == legacy[0].tick_count == 600
+    assert columnar[1].seen == legacy[1].seen
+    assert [p['timestamp'] for p in columnar[0].report.equity_curve] == \
+        [p['timestamp'] for p in legacy[0].report.equity_curve]
+    assert columnar[0].get_results()['ticks_per_second'] > 0
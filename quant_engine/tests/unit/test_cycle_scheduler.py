@@ -0,0 +1,85 @@
+"""tests/unit/test_cycle_scheduler.py
+
+Unit test for the dependency-aware RUNALL engine scheduler.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.psfalgo.cycle_scheduler import CycleScheduler, EngineTask
+
+
+def blocking_engine(result, delay=0.2, log=None, name=None):
+    async def run(deps):
+        if log is not None:
+            log.append((name, 'start', threading.current_thread().name))
+        time.sleep(delay)  # CPU / sync I/O style engine: never yields to the loop
+        if log is not None:
+            log.append((name, 'end', threading.current_thread().name))
+        return result
+    return run
+
+
+def test_independent_engines_overlap_and_dependents_get_results():
+    scheduler = CycleScheduler(max_workers=4)
+    log = []
+
+    async def lt_trim(deps):
+        return (deps['KARBOTU'], deps['REDUCEMORE'])
+
+    tasks = [
+        EngineTask('KARBOTU', blocking_engine('signals', log=log, name='KARBOTU')),
+        EngineTask('REDUCEMORE', blocking_engine('multipliers', log=log, name='REDUCEMORE')),
+        EngineTask('MM_ENGINE', blocking_engine(['mm'], log=log, name='MM_ENGINE')),
+        EngineTask('LT_TRIM', lt_trim, depends_on=('KARBOTU', 'REDUCEMORE'), offload=False),
+    ]
+    started = time.perf_counter()
+    results = asyncio.run(scheduler.run(tasks))
+    elapsed = time.perf_counter() - started
+    scheduler.shutdown()
+
+    assert results['LT_TRIM'] == ('signals', 'multipliers')
+    assert results['MM_ENGINE'] == ['mm']
+    assert elapsed < 0.5  # Three 0.2s engines ran concurrently, not back to back
+    assert all(thread.startswith('runall-engine') for _, _, thread in log)
+
+    timings = scheduler.get_timings()
+    assert set(timings['engines']) == {'KARBOTU', 'REDUCEMORE', 'MM_ENGINE', 'LT_TRIM'}
+    assert timings['engines']['LT_TRIM']['start_offset_ms'] >= timings['engines']['KARBOTU']['wall_ms'] * 0.9
+    assert timings['engine_sum_ms'] > timings['cycle_wall_ms']
+
+
+def test_failed_engine_is_returned_and_passed_to_dependents():
+    scheduler = CycleScheduler(max_workers=2)
+
+    async def crashing(deps):
+        raise RuntimeError("boom")
+
+    async def dependent(deps):
+        return type(deps['KARBOTU']).__name__
+
+    results = asyncio.run(scheduler.run([
+        EngineTask('KARBOTU', crashing),
+        EngineTask('ADDNEWPOS_ENGINE', blocking_engine('ok', delay=0.01)),
+        EngineTask('LT_TRIM', dependent, depends_on=('KARBOTU',)),
+    ]))
+    scheduler.shutdown()
+
+    assert isinstance(results['KARBOTU'], RuntimeError)
+    assert results['ADDNEWPOS_ENGINE'] == 'ok'
+    assert results['LT_TRIM'] == 'RuntimeError'
+
+
+def test_invalid_graph_is_rejected():
+    scheduler = CycleScheduler()
+
+    async def noop(deps):
+        return None
+
+    with pytest.raises(ValueError):
+        asyncio.run(scheduler.run([EngineTask('A', noop, depends_on=('B',)), EngineTask('B', noop, depends_on=('A',))]))
+    with pytest.raises(ValueError):
+        asyncio.run(scheduler.run([EngineTask('A', noop, depends_on=('MISSING',))]))
@@ -0,0 +1,80 @@
+"""tests/unit/test_execution_simulator_index.py
+
+Unit test for the symbol / price index of pending limit orders in the
+BacktestEngine ExecutionSimulator (app.execution) against the legacy full scan.
+"""
+
+import random
+
+from app.execution.execution_simulator import ExecutionSimulator
+from app.execution.liquidity import LiquidityModel, LiquidityModelType
+
+
+def simulator():
+    return ExecutionSimulator(liquidity_model=LiquidityModel(LiquidityModelType.VOLUME_BASED, volume_fraction=0.5))
+
+
+def legacy_process_tick(sim, tick):
+    """The pre-index process_tick: re-evaluate every pending order of every symbol"""
+    fills = []
+    for order_id, order in list(sim.pending_orders.items()):
+        if order['symbol'] != tick['symbol']:
+            continue
+        fill = sim.simulate_limit_order(
+            symbol=order['symbol'], qty=order['qty'], limit_price=order['limit_price'],
+            side=order['side'], tick=tick, order_id=order_id
+        )
+        if fill.filled_qty > 0:
+            fills.append(fill)
+    return fills
+
+
+def make_tick(rng, symbol, ts):
+    mid = 20.0 + rng.choice([-0.3, -0.1, 0.0, 0.1, 0.3])
+    return {'symbol': symbol, 'bid': mid - 0.02, 'ask': mid + 0.02, 'last': mid, 'ts': ts,
+            'volume': rng.choice([100, 400, 2000])}
+
+
+def test_indexed_process_tick_matches_full_scan():
+    rng = random.Random(5)
+    indexed, legacy = simulator(), simulator()
+    filled = 0
+    for i in range(400):
+        tick = make_tick(rng, rng.choice(['AAA', 'BBB', 'CCC']), 1_000_000 + i * 1000)
+        if i % 2 == 0:
+            side = rng.choice(['BUY', 'SELL'])
+            limit = round(20.0 + rng.uniform(-0.6, 0.6), 2)
+            qty = rng.choice([100, 200, 500])
+            for sim in (indexed, legacy):
+                sim.simulate_limit_order(tick['symbol'], qty, limit, side, dict(tick, bid=1.0, ask=99.0, last=50.0), f"O{i}")
+
+        got = [(f.filled_qty, f.avg_fill_price) for f in indexed.process_tick(tick)]
+        want = [(f.filled_qty, f.avg_fill_price) for f in legacy_process_tick(legacy, tick)]
+        assert got == want, i
+        assert indexed.pending_orders.keys() == legacy.pending_orders.keys()
+        filled += len(got)
+    assert filled > 50 and indexed.pending_orders
+
+
+def test_orders_of_other_symbols_and_away_from_market_are_skipped(monkeypatch):
+    sim = simulator()
+    far = {'symbol': 'AAA', 'bid': 1.0, 'ask': 99.0, 'last': 50.0, 'ts': 1000}
+    for i in range(200):
+        sim.simulate_limit_order('AAA', 100, 10.0 - i * 0.01, 'BUY', far, f"A{i}")
+        sim.simulate_limit_order('BBB', 100, 19.0, 'BUY', dict(far, symbol='BBB'), f"B{i}")
+    crossing = sim.simulate_limit_order('AAA', 100, 20.5, 'BUY', far, 'CROSS')
+    assert crossing.filled_qty == 0
+
+    evaluated = []
+    original = sim.simulate_limit_order
+
+    def spy(symbol, qty, limit_price, side, tick, order_id=None):
+        evaluated.append(order_id)
+        return original(symbol, qty, limit_price, side, tick, order_id)
+
+    monkeypatch.setattr(sim, 'simulate_limit_order', spy)
+    fills = sim.process_tick({'symbol': 'AAA', 'bid': 20.38, 'ask': 20.42, 'last': 20.4, 'ts': 2000, 'volume': 1000})
+    assert evaluated == ['CROSS']
+    assert [f.filled_qty for f in fills] == [100]
+    assert 'CROSS' not in sim.get_pending_orders()
+    assert len(sim.get_pending_orders()) == 400
@@ -0,0 +1,88 @@
+"""tests/unit/test_fills_index.py
+
+Unit test for the in-memory DailyFillsStore fills index.
+"""
+
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from app.trading.daily_fills_store import DailyFillsStore
+from app.trading.fills_index import FillsIndex
+
+
+@pytest.fixture
+def store(monkeypatch, tmp_path):
+    DailyFillsStore._instance = None
+    store = DailyFillsStore()
+    store.log_dir = str(tmp_path)
+    monkeypatch.setattr(store, '_update_qebench', lambda *args: None)
+    monkeypatch.setitem(sys.modules, 'app.core.order_context_logger', SimpleNamespace())
+    yield store
+    DailyFillsStore._instance = None
+
+
+def _log(store, symbol, action, qty, price, tag, fill_time, fill_id=None):
+    store.log_fill('HAMMER_PRO', symbol, action, qty, price, tag,
+                   bench_chg=1.5, bench_source='heldff', bid=price - 0.01, ask=price + 0.01,
+                   fill_id=fill_id, bench_price=31.0, fill_time=fill_time)
+
+
+class TestFillsIndex:
+    """Test indexed queries, aggregates and incremental tailing"""
+
+    def test_queries_and_aggregates(self, store):
+        """Fills are indexed once; queries and aggregates follow appends"""
+        _log(store, 'AAA PRA', 'BUY', 200, 25.0, 'LT_TRIM', '09:31:00', 'f1')
+        _log(store, 'AAA PRA', 'SELL', 100, 25.1, 'MM_ENGINE', '10:15:00', 'f2')
+        _log(store, 'BBB PRB', 'BUY', 300, 19.5, 'JFIN', '09:45:00', 'f3')
+        _log(store, 'AAA PRA', 'BUY', 200, 25.0, 'LT_TRIM', '09:31:00', 'f1')  # duplicate
+
+        fills = store.get_all_fills('HAMMER_PRO')
+        assert [f['order_id'] for f in fills] == ['csv_fill_1', 'csv_fill_2', 'csv_fill_0']
+        assert fills[0]['bid'] == 25.09 and fills[0]['bench_chg'] == 1.5
+        assert fills[0]['time'] == '10:15:00' and fills[0]['timestamp'] > fills[1]['timestamp']
+
+        assert store.get_intraday_breakdown('HAMMER_PRO', 'AAA PRA') == {'LT': 200.0, 'MM': -100.0}
+        assert store.get_intraday_breakdown('HAMMER_PRO', 'ZZZ PRZ') == {}
+        assert [f['tag'] for f in store.get_fills_for_symbol('AAA PRA')] == ['LT_TRIM', 'MM_ENGINE']
+
+        aggregates = store.get_fill_aggregates('HAMMER_PRO')
+        assert aggregates['by_symbol']['AAA PRA']['net_qty'] == 100.0
+        assert aggregates['by_tag']['JFIN'] == {
+            'fills': 1, 'buy_qty': 300.0, 'sell_qty': 0.0, 'net_qty': 300.0, 'notional': 5850.0
+        }
+
+    def test_tails_external_appends(self, store):
+        """Rows written by another process are picked up; partial rows wait"""
+        _log(store, 'AAA PRA', 'BUY', 100, 25.0, 'LT_TRIM', '09:31:00', 'f1')
+        index = store._get_index('HAMMER_PRO')
+        assert len(index) == 1
+
+        with open(index.filepath, 'a', newline='') as f:
+            f.write('09:40:00,CCC PRC,SELL,50,10.0,,,,SIDEHIT,AUTO,,,,x9\n')
+            f.write('09:41:00,CCC PRC,BUY')  # Writer mid-row
+        assert index.refresh() == 1
+        assert store.get_intraday_breakdown('HAMMER_PRO', 'CCC PRC') == {'MM': -50.0}
+
+        with open(index.filepath, 'a', newline='') as f:
+            f.write(',70,10.1,,,,LT_TRIM,AUTO,,,,x10\n')
+        assert store.get_intraday_breakdown('HAMMER_PRO', 'CCC PRC') == {'MM': -50.0, 'LT': 70.0}
+
+        # Fill logged elsewhere is deduped here too
+        _log(store, 'CCC PRC', 'SELL', 50, 10.0, 'SIDEHIT', '09:40:00', 'x9')
+        assert len(store.get_all_fills('HAMMER_PRO')) == 3
+
+    def test_rebuilds_on_replaced_file(self, tmp_path):
+        """A truncated/replaced journal is re-indexed from scratch"""
+        path = os.path.join(tmp_path, 'hamfilledorders260101.csv')
+        with open(path, 'w') as f:
+            f.write('Time,Symbol,Action,Quantity,Price,Strategy\n09:30:00,A,BUY,10,1.0,LT\n09:31:00,B,BUY,10,1.0,LT\n')
+        index = FillsIndex(path)
+        assert index.refresh() == 2
+        with open(path, 'w') as f:
+            f.write('Time,Symbol,Action,Quantity,Price,Strategy\n09:32:00,C,SELL,5,2.0,MM\n')
+        assert index.refresh() == 1
+        assert [f['symbol'] for f in index.all_fills()] == ['C']
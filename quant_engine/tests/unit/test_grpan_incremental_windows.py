@@ -0,0 +1,151 @@
+"""tests/unit/test_grpan_incremental_windows.py
+
+Unit test for GRPANEngine incremental window histograms against the legacy
+rebuild-every-compute algorithm.
+"""
+
+import random
+from collections import defaultdict
+from datetime import datetime
+
+import pytest
+
+import app.market_data.grpan_engine as grpan_module
+from app.market_data.grpan_engine import GRPANEngine, GRPANWindowState, PriceHistogram, _PrintEntry
+
+T0 = 1_700_000_000.0
+WINDOW_ORDER = ['pan_10m', 'pan_30m', 'pan_1h', 'pan_3h', 'pan_1d', 'pan_3d']
+
+
+class FakeCalendar:
+    def __init__(self):
+        self.day_end = T0
+        self.three_days = T0 - 3 * 86400
+
+    def get_trading_time_now(self, last_trade_ts):
+        return last_trade_ts
+
+    def get_trading_day_end(self):
+        return datetime.fromtimestamp(self.day_end)
+
+    def get_trading_days_back(self, n):
+        return [datetime.fromtimestamp(self.three_days)]
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    calendar = FakeCalendar()
+    monkeypatch.setattr(grpan_module, 'get_trading_calendar', lambda: calendar)
+    eng = GRPANEngine()
+    eng.min_lot_size = 20
+    # Binary-exact weights: legacy float sums have no rounding noise to compare against
+    eng.config = {'print_realism': {'weights': {'lot_100_200': 1.0, 'round_large': 0.5, 'irregular': 0.25}}}
+    eng.calendar = calendar
+    return eng
+
+
+def legacy_grpan(eng, prints, last_price=None, prev_grpan_price=None):
+    """The pre-incremental _compute_grpan_for_prints"""
+    filtered = [p for p in prints if p.get('size', 0) >= eng.min_lot_size]
+    if not filtered:
+        return eng._empty_grpan_result(f'No prints with size >= {eng.min_lot_size}')
+    freq = defaultdict(float)
+    total_lots = 0
+    for p in filtered:
+        freq[float(p['price'])] += eng._get_weight(float(p['size']), p.get('venue', 'UNKNOWN'))
+        total_lots += float(p['size'])
+    ranked = sorted(freq.items(), key=lambda x: x[1], reverse=True)
+    grpan = ranked[0][0]
+    conc = sum(1 for p in filtered if abs(float(p['price']) - grpan) <= eng.concentration_range)
+    return {
+        'grpan_price': round(grpan, 4),
+        'weighted_price_frequency': {round(p, 4): round(f, 4) for p, f in ranked[:10]},
+        'concentration_percent': round(conc / len(filtered) * 100, 2),
+        'real_lot_count': round(total_lots, 2),
+        'print_count': len(filtered),
+        'deviation_vs_last': round(last_price - grpan, 4) if last_price else None,
+        'deviation_vs_prev_window': round(grpan - prev_grpan_price, 4) if prev_grpan_price is not None else None,
+        'top_prices': [{'price': round(p, 4), 'weighted_freq': round(f, 4)} for p, f in ranked[:5]],
+        'total_prints': len(prints),
+    }
+
+
+def comparable(result):
+    out = {k: v for k, v in result.items() if k != 'breakdown'}
+    breakdown = result.get('breakdown', {})
+    if 'top_prices' in breakdown:
+        out['top_prices'] = breakdown['top_prices']
+        out['total_prints'] = breakdown['total_prints']
+    return out
+
+
+def legacy_windows(eng, symbol, results):
+    extended = list(eng.extended_prints_store[symbol])
+    last_price = eng.last_price_cache.get(symbol)
+    now = GRPANWindowState._parse_timestamp(extended[-1].get('time'), None)
+    expected = {'latest_pan': legacy_grpan(eng, list(eng.trade_prints_store[symbol]), last_price)}
+    prev = results['latest_pan']['grpan_price']
+    for name in WINDOW_ORDER:
+        if name == 'pan_1d':
+            start = eng.calendar.day_end
+        elif name == 'pan_3d':
+            start = eng.calendar.three_days
+        else:
+            start = now - eng.ROLLING_WINDOWS[name]
+        window = [p for p in extended if GRPANWindowState._parse_timestamp(p.get('time'), now) >= start]
+        expected[name] = legacy_grpan(eng, window, last_price, prev)
+        if results[name]['grpan_price'] is not None:
+            prev = results[name]['grpan_price']
+    return expected
+
+
+def test_incremental_windows_match_legacy_rebuild(engine):
+    rng = random.Random(11)
+    ts = T0
+    for i in range(700):
+        ts += rng.choice([1, 5, 30, 120, 900])
+        if i % 97 == 0:
+            ts -= 600  # Out-of-order print: aged out by time, not by arrival
+        if i == 400:
+            engine.calendar.day_end = ts - 7200  # pan_1d start jumps forward
+        if i == 550:
+            engine.calendar.day_end = T0  # ... and back (forces a rebuild)
+        engine.add_trade_print('AAA', {
+            'time': str(ts) if i % 50 else datetime.fromtimestamp(ts).strftime('%Y-%m-%d %H:%M:%S'),
+            'price': round(25.0 + rng.choice([-0.06, -0.03, -0.01, 0.0, 0.01, 0.02, 0.05, 0.10]), 2),
+            'size': rng.choice([100, 200, 300, 400, 37, 150, 500, 1000]),
+            'venue': rng.choice(['FNRA', 'FNRA', 'EDGX', 'UNKNOWN']),
+        })
+        if i % 3 == 0:
+            results = engine._compute_grpan_internal('AAA')
+            expected = legacy_windows(engine, 'AAA', results)
+            for name, exp in expected.items():
+                if exp['grpan_price'] is None:
+                    assert results[name]['grpan_price'] is None or 'message' in results[name]
+                    continue
+                assert comparable(results[name]) == exp, (i, name)
+
+
+def test_histogram_dominant_ties_and_concentration():
+    hist = PriceHistogram()
+    entries = [
+        _PrintEntry(1, None, 10.00, 100, 1_000_000, True),
+        _PrintEntry(2, None, 10.04, 100, 1_000_000, True),
+        _PrintEntry(3, None, 10.05, 100, 500_000, True),
+        _PrintEntry(4, None, 10.04, 100, 500_000, True),
+    ]
+    for entry in entries[:2]:
+        hist.add(entry)
+    assert hist.dominant() == 10.00  # Tie: earliest print wins
+    assert hist.count_within(10.00, 0.04) == 2  # 10.04 - 10.00 is within after float rounding
+
+    for entry in entries[2:]:
+        hist.add(entry)
+    assert hist.dominant() == 10.04
+    assert hist.top(2) == [(10.04, 1.5), (10.00, 1.0)]
+
+    hist.remove(entries[3])
+    hist.remove(entries[0])
+    assert hist.dominant() == 10.04
+    assert hist.prices == [10.04, 10.05]
+    assert hist.count == 2 and hist.total_lots == 200
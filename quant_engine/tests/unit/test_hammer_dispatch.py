@@ -0,0 +1,140 @@
+"""tests/unit/test_hammer_dispatch.py
+
+Unit test for the HammerClient off-socket-thread dispatch pipeline.
+"""
+
+import json
+import threading
+import time
+
+from app.live.hammer_client import HammerClient
+from app.live.hammer_dispatch import DispatchConsumer, StreamQueue, classify_message
+
+
+def _l1(sym, bid=None, size=None, last=None):
+    result = {'sym': sym}
+    if bid is not None:
+        result['bid'] = bid
+    if size is not None:
+        result['size'] = size
+    if last is not None:
+        result['last'] = last
+    return {'cmd': 'L1Update', 'result': result}
+
+
+def _trades(seen):
+    return sum(1 for d in seen if d.get('result', {}).get('size'))
+
+
+def _wait(predicate, timeout=2.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return False
+
+
+class TestHammerDispatch:
+    """Test stream routing, ordered coalescing and slow-consumer isolation"""
+
+    def test_classify(self):
+        assert classify_message(_l1('AAA-A', bid=25.0)) == ('market', 'AAA-A')
+        assert classify_message(_l1('AAA-A', size=100, last=25.0)) == ('market', None)
+        assert classify_message({'cmd': 'transactionsUpdate', 'result': {}}) == ('events', None)
+
+    def test_quotes_coalesce_trades_keep_order(self):
+        """Quotes merge in place; a trade closes the symbol's open quote"""
+        queue = StreamQueue(capacity=100)
+        queue.put(_l1('A', bid=1.0), key='A')
+        queue.put({'cmd': 'L1Update', 'result': {'sym': 'A', 'ask': 1.2}}, key='A')
+        queue.put(_l1('A', size=100, last=1.1), barrier='A')
+        queue.put(_l1('A', bid=1.05), key='A')
+        queue.put(_l1('B', bid=2.0), key='B')
+        queue.put(_l1('A', bid=1.06), key='A')
+
+        results = [queue.pop()[0]['result'] for _ in range(len(queue))]
+        assert results == [
+            {'sym': 'A', 'bid': 1.0, 'ask': 1.2},
+            {'sym': 'A', 'size': 100, 'last': 1.1},
+            {'sym': 'A', 'bid': 1.06},
+            {'sym': 'B', 'bid': 2.0},
+        ]
+        assert queue.coalesced == 2 and queue.high_water == 4
+
+    def test_slow_observer_does_not_block_responses(self):
+        """Receive thread routes reqID responses while an observer is blocked"""
+        client = HammerClient(password='x')
+        release = threading.Event()
+        slow_seen, fast_seen = [], []
+
+        def slow_observer(data):
+            release.wait(5)
+            slow_seen.append(data)
+
+        client.add_observer(slow_observer)
+        client.on_message_callback = fast_seen.append
+
+        client._pending_events = {'r1': threading.Event()}
+        client._pending_responses['r1'] = None
+        for i in range(5):
+            client._on_message(None, json.dumps(_l1('AAA-A', bid=25.0 + i / 100)))
+        client._on_message(None, json.dumps({'cmd': 'getSymbolSnapshot', 'reqID': 'r1', 'success': 'OK'}))
+        for i in range(3):
+            client._on_message(None, json.dumps(_l1('AAA-A', size=100, last=25.1)))
+
+        # Response delivered immediately despite the blocked observer
+        assert client._pending_events['r1'].is_set()
+        # Fast consumer is not held back (its quotes may be coalesced, trades are not)
+        assert _wait(lambda: _trades(fast_seen) == 3)
+        assert max(d['result'].get('bid', 0) for d in fast_seen if 'result' in d) == 25.04
+        assert slow_seen == []
+
+        release.set()
+        assert _wait(lambda: _trades(slow_seen) == 3)  # Trade prints are lossless
+        stats = client.get_dispatch_stats()
+        assert stats['mode'] == 'async' and stats['dispatched'] == 9
+        slow = stats['consumers']['slow_observer']
+        assert slow['queues']['market']['coalesced'] >= 3  # Quotes merged while blocked
+        assert slow['queues']['market']['enqueued'] == 8
+        assert slow['callback_latency']['max_ms'] > 0
+        assert any(d.get('reqID') == 'r1' for d in slow_seen)  # Responses reach observers too
+        assert slow_seen[-1]['result'] == {'sym': 'AAA-A', 'size': 100, 'last': 25.1}
+
+        client.remove_observer(slow_observer)
+        assert 'slow_observer' not in client.get_dispatch_stats()['consumers']
+
+    def test_full_lossless_queue_never_blocks_receive_thread(self, monkeypatch):
+        """A stuck consumer with full queues costs the receive thread nothing"""
+        monkeypatch.setattr(DispatchConsumer, 'MARKET_CAPACITY', 5)
+        monkeypatch.setattr(DispatchConsumer, 'EVENTS_CAPACITY', 5)
+        monkeypatch.setattr(DispatchConsumer, 'OVERFLOW_LIMIT', 3)
+        client = HammerClient(password='x')
+        release = threading.Event()
+        stuck_seen = []
+
+        def stuck_observer(data):
+            release.wait(5)
+            stuck_seen.append(data)
+
+        client.add_observer(stuck_observer)
+        client._pending_events = {'r2': threading.Event()}
+        client._pending_responses['r2'] = None
+
+        started = time.perf_counter()
+        for i in range(40):  # Lossless trade prints, far past capacity + overflow limit
+            client._on_message(None, json.dumps(_l1('AAA-A', size=100, last=25.0 + i / 100)))
+        client._on_message(None, json.dumps({'cmd': 'getSymbolSnapshot', 'reqID': 'r2', 'success': 'OK'}))
+        elapsed = time.perf_counter() - started
+
+        assert client._pending_events['r2'].is_set()
+        assert elapsed < 0.5  # Was ~1s per message once the queue filled
+        stats = client.get_dispatch_stats()['consumers']['stuck_observer']
+        market = stats['queues']['market']
+        assert stats['stalled'] is True
+        assert market['overflow'] == 3 and market['dropped'] > 0
+        assert market['depth'] <= 5 + 3
+
+        release.set()
+        assert _wait(lambda: not client.get_dispatch_stats()['consumers']['stuck_observer']['stalled'])
+        client.remove_observer(stuck_observer)
@@ -0,0 +1,94 @@
+"""tests/unit/test_hammer_pipelined_requests.py
+
+Unit test for pipelined multi-symbol HammerClient requests.
+"""
+
+import json
+import threading
+import time
+
+import pytest
+
+from app.config.settings import settings
+from app.live.hammer_client import HammerClient
+
+
+class FakeHammer:
+    """Answers requests from another thread after a per-symbol delay"""
+
+    def __init__(self, client, delays, silent=()):
+        self.client = client
+        self.delays = delays
+        self.silent = set(silent)
+        self.max_in_flight = 0
+        self.sent = []
+        self._lock = threading.Lock()
+
+    def send(self, command):
+        sym = command['sym']
+        with self._lock:
+            self.sent.append(sym)
+            # Outstanding requests as seen by the client (this one included)
+            self.max_in_flight = max(self.max_in_flight, len(self.client._pending_events))
+        if sym not in self.silent:
+            threading.Timer(self.delays.get(sym, 0.01), self._reply, (command,)).start()
+        return True
+
+    def _reply(self, command):
+        if command['cmd'] == 'getSymbolSnapshot':
+            result = {'sym': command['sym'], 'bid': 25.0, 'ask': 25.1, 'prevClose': 24.9}
+        else:
+            result = {'data': [{'p': 25.0}] * command['lastFew']}
+        self.client._on_message(None, json.dumps({
+            'cmd': command['cmd'], 'reqID': command['reqID'], 'success': 'OK', 'result': result
+        }))
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(settings, 'HAMMER_DISPATCH_ASYNC', False)
+    client = HammerClient(password='x')
+    monkeypatch.setattr(client, 'is_connected', lambda: True)
+    return client
+
+
+class TestPipelinedRequests:
+    """Test bounded in-flight window, arrival order and per-symbol timeouts"""
+
+    def test_snapshots_window_and_timeouts(self, client, monkeypatch):
+        symbols = [f"SYM{i} PRA" for i in range(12)]
+        fake = FakeHammer(client, delays={'SYM0-A': 0.15}, silent={'SYM5-A'})
+        monkeypatch.setattr(client, '_send_command', fake.send)
+
+        started = time.monotonic()
+        results = list(client.get_symbol_snapshots(symbols, max_in_flight=4, timeout=0.25, use_cache=False))
+        elapsed = time.monotonic() - started
+
+        assert sorted(s for s, _ in results) == sorted(symbols)
+        assert fake.max_in_flight <= 4
+        by_symbol = dict(results)
+        assert by_symbol['SYM5 PRA'] is None  # Timed out without stalling the others
+        assert by_symbol['SYM1 PRA']['prevClose'] == 24.9
+        # Slow symbol arrives after faster ones sent later
+        order = [s for s, _ in results]
+        assert order.index('SYM0 PRA') > order.index('SYM1 PRA')
+        assert elapsed < 1.0  # Serially this would be > 12 * 0.01 + 0.15 + 0.25 per symbol timeout
+        assert not client._pending_events and not client._pending_responses
+
+        # Cached snapshots are served without a request
+        sent = len(fake.sent)
+        cached = dict(client.get_symbol_snapshots(['SYM1 PRA'], use_cache=True))
+        assert cached['SYM1 PRA']['bid'] == 25.0 and len(fake.sent) == sent
+
+    def test_ticks_many_and_early_stop(self, client, monkeypatch):
+        fake = FakeHammer(client, delays={})
+        monkeypatch.setattr(client, '_send_command', fake.send)
+
+        results = dict(client.get_ticks_many(['AAA PRA', 'BBB'], lastFew=3, max_in_flight=2, timeout=1.0))
+        assert {s: len(r['data']) for s, r in results.items()} == {'AAA PRA': 3, 'BBB': 3}
+
+        # Caller stopping early releases outstanding requests
+        gen = client.get_ticks_many([f"S{i}" for i in range(10)], lastFew=1, max_in_flight=5)
+        next(gen)
+        gen.close()
+        assert not client._pending_events and not client._pending_responses
@@ -0,0 +1,127 @@
+"""tests/unit/test_incremental_group_metrics.py
+
+Unit test for incremental (dirty-symbol driven) group metrics.
+"""
+
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.data_fabric import DataFabric
+import app.core.data_fabric as data_fabric_module
+from app.core.fast_score_calculator import FastScoreCalculator
+import app.market_data.janall_metrics_engine as janall_module
+from app.market_data.janall_metrics_engine import GroupAggregate, JanallMetricsEngine
+
+GROUP_FIELDS = ('Fbtot', 'SFStot', 'GORT', 'bench_chg', 'bench_source', 'daily_chg')
+
+
+@pytest.fixture
+def fabric(monkeypatch):
+    DataFabric._instance = None
+    FastScoreCalculator._instance = None
+    monkeypatch.setattr(sys.modules['app.core.redis_client'], 'get_redis_client',
+                        lambda: SimpleNamespace(sync=None))  # no Redis fallback
+    monkeypatch.setattr(janall_module, '_janall_metrics_engine_instance', None)
+    fabric = DataFabric()
+    monkeypatch.setattr(data_fabric_module, '_data_fabric', fabric)
+
+    groups = ['heldff', 'heldsolidbig', 'heldnff']
+    fabric._static_data = {}
+    for i in range(30):
+        symbol = f"INC P{i}"
+        fabric._static_data[symbol] = {
+            'PREF IBKR': symbol,
+            'GROUP': groups[i % 3],
+            'prev_close': 20.0 + i * 0.1,
+            'FINAL_THG': 900.0 + i * 7,
+            'SHORT_FINAL': 300.0 + i * 3,
+            'SMA63 chg': (i % 5) - 2.0,
+            'SMA246 chg': (i % 7) - 3.0,
+        }
+        if i != 29:
+            fabric.update_live(symbol, {'bid': 20.0 + i * 0.1, 'ask': 20.1 + i * 0.1, 'last': 20.05 + i * 0.1})
+    fabric.set_etf_prev_close('PFF', 31.0)
+    fabric.update_etf_live('PFF', {'last': 31.1})
+    yield fabric
+    DataFabric._instance = None
+    FastScoreCalculator._instance = None
+
+
+def _group_view(fabric):
+    view = {}
+    for symbol in fabric.get_all_static_symbols():
+        derived = fabric.get_derived(symbol)
+        if derived:
+            view[symbol] = {k: derived.get(k) for k in GROUP_FIELDS}
+    return view
+
+
+def _assert_matches_batch(fabric):
+    incremental = _group_view(fabric)
+    batch = FastScoreCalculator().compute_all_fast_scores(True, vectorized=False)
+    assert set(incremental) == set(batch)
+    for symbol, scores in batch.items():
+        for key in GROUP_FIELDS:
+            expected = scores.get(key)
+            if isinstance(expected, float):
+                assert incremental[symbol][key] == pytest.approx(expected, abs=1e-9), (symbol, key)
+            else:
+                assert incremental[symbol][key] == expected, (symbol, key)
+
+
+class TestIncrementalGroupMetrics:
+    """Test dirty-driven group re-ranking against the full batch"""
+
+    def test_seed_matches_batch(self, fabric):
+        """First incremental run seeds every group like the batch"""
+        results = FastScoreCalculator().compute_dirty_symbols(include_group_metrics=True)
+        assert len(results) == 29
+        assert any(r['Fbtot'] is not None for r in results.values())
+        _assert_matches_batch(fabric)
+
+    def test_dirty_update_reranks_only_its_group(self, fabric, monkeypatch):
+        """A dirty symbol updates and re-ranks its own group only"""
+        calc = FastScoreCalculator()
+        calc.compute_dirty_symbols(include_group_metrics=True)
+
+        reranked = []
+        original = JanallMetricsEngine.compute_group_overlays_incremental
+
+        def spy(engine, group_keys):
+            group_keys = list(group_keys)
+            overlays = original(engine, group_keys)
+            reranked.append((group_keys, set(overlays)))
+            return overlays
+
+        monkeypatch.setattr(JanallMetricsEngine, 'compute_group_overlays_incremental', spy)
+
+        fabric.update_live_batch({'INC P3': {'bid': 19.0, 'ask': 19.2, 'last': 19.1}})
+        results = calc.compute_dirty_symbols(include_group_metrics=True)
+        assert set(results) == {'INC P3'}
+
+        engine = janall_module.get_janall_metrics_engine()
+        dirty_group = engine.get_group_inputs('INC P3')['group_key']
+        members = {s for s in fabric.get_all_static_symbols()
+                   if (engine.get_group_inputs(s) or {}).get('group_key') == dirty_group}
+        assert len(engine.get_incremental_group_stats()) == 3
+        # One re-rank call, for the dirty symbol's group, touching only its members
+        assert reranked == [([dirty_group], members)]
+        assert 'INC P4' not in members and 'INC P5' not in members
+        _assert_matches_batch(fabric)
+
+    def test_aggregate_add_remove(self):
+        """Aggregates follow adds/removes (sorted ranks + running sums)"""
+        agg = GroupAggregate()
+        agg.add('A', {'final_fb': 10.0, 'daily_chg': 0.1, 'sma63chg': 1.0})
+        agg.add('B', {'final_fb': 30.0, 'daily_chg': 9.0, 'sma63chg': None})
+        agg.add('C', {'final_fb': -5.0, 'daily_chg': -0.3, 'sma63chg': 3.0})
+        assert agg.rank('final_fb', 30.0) == 2
+        assert agg.average('final_fb') == 20.0
+        assert agg.average('daily_chg') == pytest.approx(-0.1)
+        assert agg.average('sma63chg') == 2.0
+
+        agg.remove('B')
+        assert agg.to_stats()['final_fb_values'] == [10.0]
+        assert agg.to_stats()['daily_chg_count'] == 2
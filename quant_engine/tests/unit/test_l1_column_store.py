@@ -0,0 +1,93 @@
+"""tests/unit/test_l1_column_store.py
+
+Unit test for the columnar L1 store and DataFabric columnar mode.
+"""
+
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from app.core.l1_column_store import L1ColumnStore
+from app.core.data_fabric import DataFabric
+
+
+class TestL1ColumnStore:
+    """Test L1ColumnStore mapping semantics"""
+
+    def test_write_and_view(self):
+        """Written fields read back like the old dict store"""
+        store = L1ColumnStore(["AAA PRA", "BBB PRB"])
+        store.write("AAA PRA", {"bid": 24.5, "ask": 24.6, "last": None, "venue": "NYSE"}, now=1000.0)
+
+        live = store.get("AAA PRA")
+        assert live["bid"] == 24.5
+        assert live.get("last") is None
+        assert live["venue"] == "NYSE"
+        assert isinstance(live["_last_update"], datetime)
+        assert "BBB PRB" not in store
+        assert store.get("BBB PRB") is None
+        assert len(store) == 1
+
+    def test_dict_style_merge(self):
+        """`store[sym] = {}` + `.update()` keeps working (lifeless mode path)"""
+        store = L1ColumnStore(["AAA PRA"])
+        store["AAA PRA"] = {}
+        store["AAA PRA"].update({"bid": 10.0, "ask": 10.2, "timestamp": "2026-01-02T10:00:00"})
+        store["AAA PRA"]["last"] = 10.1
+
+        row = store["AAA PRA"].copy()
+        assert row["bid"] == 10.0
+        assert row["last"] == 10.1
+        assert row["timestamp"] == "2026-01-02T10:00:00"
+
+    def test_overflow_rows_grow(self):
+        """Symbols outside the universe get appended rows"""
+        store = L1ColumnStore(["AAA PRA"])
+        for i in range(200):
+            store.write(f"X{i}", {"bid": float(i)})
+        assert store.row_of("AAA PRA") == 0
+        assert store["X199"]["bid"] == 199.0
+        assert len(store.column("bid")) == 201
+
+    def test_snapshot_columns(self):
+        """Columns are copies aligned with the row map"""
+        store = L1ColumnStore(["AAA PRA", "BBB PRB"])
+        store.write_batch({"BBB PRB": {"bid": 5.0, "ask": 5.1}}, now=1.0)
+        cols = store.snapshot_columns(("bid", "ask"))
+        assert np.isnan(cols["bid"][0])
+        assert cols["bid"][1] == 5.0
+        assert cols["present"].tolist() == [False, True]
+
+
+class TestDataFabricColumnar:
+    """Test DataFabric with columnar L1 enabled"""
+
+    @pytest.fixture
+    def fabric(self):
+        DataFabric._instance = None
+        fabric = DataFabric()
+        fabric._static_data = {
+            "AAA PRA": {"prev_close": 25.0, "GROUP": "heldff"},
+            "BBB PRB": {"prev_close": 20.0, "GROUP": "heldff"},
+        }
+        fabric.update_live("AAA PRA", {"bid": 24.9, "ask": 25.1})
+        fabric.enable_columnar_l1()
+        yield fabric
+        DataFabric._instance = None
+
+    def test_migration_and_updates(self, fabric):
+        """Existing live data is migrated; updates go to columns"""
+        assert fabric.is_columnar_l1()
+        assert fabric.get_live("AAA PRA")["bid"] == 24.9
+
+        fabric.update_live_batch({"BBB PRB": {"bid": 19.8, "ask": 20.0, "last": 19.9}})
+        assert fabric.get_live("BBB PRB")["last"] == 19.9
+        assert "BBB PRB" in fabric.get_dirty_symbols()
+
+    def test_fast_snapshots_match_scalar_path(self, fabric):
+        """Columnar get_all_fast_snapshots == per-symbol get_fast_snapshot"""
+        fabric.update_live("BBB PRB", {"bid": 19.8, "ask": 20.0, "volume": 1200.0})
+        all_snaps = fabric.get_all_fast_snapshots()
+        for symbol in ("AAA PRA", "BBB PRB"):
+            assert all_snaps[symbol] == fabric.get_fast_snapshot(symbol)
@@ -0,0 +1,66 @@
+"""tests/unit/test_l1_publisher.py
+
+Unit test for the write-behind live:{symbol} publisher.
+"""
+
+import pytest
+
+from app.market_data.l1_publisher import L1RedisPublisher
+
+
+@pytest.fixture
+def redis(fake_redis, redis_client):
+    fake_redis.forbid('hset', "publisher must pipeline writes")
+    return fake_redis
+
+
+class TestL1RedisPublisher:
+    """Test coalescing, pipelined flushes and stats"""
+
+    def test_coalesces_latest_per_symbol(self, redis):
+        """publish() only queues; one pipeline writes the latest L1 per symbol"""
+        publisher = L1RedisPublisher(flush_interval_ms=10_000)
+        publisher.start = lambda: None  # Drive flushes manually
+        publisher.publish('AAA PRA', {'bid': 25.0, 'ask': 25.1, 'last': None})
+        publisher.publish('AAA PRA', {'bid': 25.02, 'ask': 25.1, 'last': 25.05})
+        publisher.publish('BBB PRB', {'bid': 19.5, 'ask': 19.6})
+        assert not redis.pipelines
+
+        stats = publisher.get_stats()
+        assert stats['queue_depth'] == 2 and stats['coalesced'] == 1 and stats['published'] == 3
+
+        assert publisher.flush() == 2
+        assert len(redis.pipelines) == 1
+        assert redis.hashes['live:AAA PRA'] == {'bid': '25.02', 'ask': '25.1', 'last': '25.05'}
+        assert redis.ttls == {'live:AAA PRA': 3600, 'live:BBB PRB': 3600}
+        assert publisher.flush() == 0
+
+        stats = publisher.get_stats()
+        assert stats['queue_depth'] == 0 and stats['symbols_written'] == 2 and stats['flushes'] == 1
+
+    def test_failed_flush_requeues_without_overwriting_newer(self, redis):
+        """Unwritten symbols return to the queue unless newer data arrived"""
+        publisher = L1RedisPublisher(flush_interval_ms=10_000)
+        publisher.start = lambda: None
+        publisher.publish('AAA PRA', {'bid': 25.0})
+        publisher.publish('BBB PRB', {'bid': 19.5})
+        redis.fail = True
+        assert publisher.flush() == 0
+        publisher.publish('AAA PRA', {'bid': 25.5})
+        redis.fail = False
+        assert publisher.flush() == 2
+        assert redis.hashes['live:AAA PRA'] == {'bid': '25.5'}
+        assert redis.hashes['live:BBB PRB'] == {'bid': '19.5'}
+        assert publisher.get_stats()['errors'] == 1
+
+    def test_background_flush_and_overflow(self, redis):
+        """Worker thread flushes on its timer; overflowing new symbols are dropped"""
+        publisher = L1RedisPublisher(flush_interval_ms=5)
+        publisher.MAX_PENDING = 1
+        publisher._flush_lock.acquire()  # Hold the worker off while filling the queue
+        publisher.publish('AAA PRA', {'bid': 25.0})
+        publisher.publish('BBB PRB', {'bid': 19.5})
+        publisher._flush_lock.release()
+        publisher.stop(flush=True)
+        assert list(redis.hashes) == ['live:AAA PRA']
+        assert publisher.get_stats()['dropped'] == 1
@@ -0,0 +1,84 @@
+"""tests/unit/test_l1_resolver.py
+
+Unit test for the batch L1 resolver.
+"""
+
+import asyncio
+import json
+import sys
+import threading
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.data_fabric import DataFabric
+import app.core.data_fabric as data_fabric_module
+from app.core.l1_resolver import L1Resolver
+
+
+@pytest.fixture
+def env(monkeypatch, fake_redis, redis_client):
+    DataFabric._instance = None
+    fabric = DataFabric()
+    monkeypatch.setattr(data_fabric_module, '_data_fabric', fabric)
+
+    fabric.update_live('FRESH PRA', {'bid': 24.9, 'ask': 25.1, 'last': 25.0})
+    fabric.update_live('STALE PRB', {'bid': 10.0, 'ask': 10.2, 'last': 10.1})
+    fabric._live_data['STALE PRB']['_last_update'] = datetime.now() - timedelta(minutes=10)
+    fabric.update_live('OLD PRC', {'bid': 5.0, 'ask': 5.1})
+    fabric._live_data['OLD PRC']['_last_update'] = datetime.now() - timedelta(minutes=10)
+
+    fake_redis.strings['market:l1:STALE-B'] = json.dumps({'bid': 10.5, 'ask': 10.6, 'last': 10.55})
+    # L1RedisPublisher HSET: values are strings
+    fake_redis.hset('live:HASH-F', mapping={'bid': '3.1', 'ask': '3.2', 'last': '3.15'})
+    fake_redis.hset('live:CACHE PRD', mapping={'bid': '0', 'ask': '7.3'})
+    monkeypatch.setitem(sys.modules, 'app.api.market_data_routes', SimpleNamespace(
+        market_data_cache={'CACHE PRD': {'bid': 7.0, 'ask': 7.2, 'last': 7.1}},
+        _market_data_cache_lock=threading.RLock(),
+    ))
+    yield fake_redis
+    DataFabric._instance = None
+
+
+class TestL1Resolver:
+    """Test layered batch resolution"""
+
+    def test_batch_layers_one_round_trip(self, env):
+        """Fresh fabric → Redis (any format) → live hash → market_data_cache → stale fabric"""
+        resolver = L1Resolver()
+        symbols = ['FRESH PRA', 'STALE PRB', 'CACHE-D', 'OLD PRC', 'NONE PRE', 'HASH PRF']
+        result = asyncio.run(resolver.resolve_l1(symbols))
+
+        assert result['FRESH PRA']['source'] == 'fabric'
+        assert result['FRESH PRA']['bid'] == 24.9
+        assert result['STALE PRB']['source'] == 'redis_l1'
+        assert result['STALE PRB']['bid'] == 10.5
+        assert result['CACHE-D']['source'] == 'market_data_cache'
+        assert result['OLD PRC']['source'] == 'fabric_stale'
+        assert result['OLD PRC']['fresh'] is False
+        assert result['NONE PRE'] is None
+        assert result['HASH PRF']['source'] == 'redis_live'
+        assert (result['HASH PRF']['bid'], result['HASH PRF']['ask']) == (3.1, 3.2)
+
+        # Pending symbols × format variants in a single MGET, then one
+        # HMGET pipeline for the symbols market:l1 could not resolve
+        assert len(env.mgets) == 1 and len(env.pipelines) == 1
+        assert 'market:l1:STALE-B' in env.mgets[0]
+        assert 'market:l1:FRESH PRA' not in env.mgets[0]
+        hmget_keys = [args[0] for _, args in env.pipelines[0]]
+        assert 'live:HASH-F' in hmget_keys
+        assert not any(k.startswith('live:STALE') for k in hmget_keys)
+
+    def test_sync_path_and_variant_cache(self, env):
+        """Sync callers get the same answers; formats are computed once"""
+        resolver = L1Resolver()
+        result = resolver.resolve_l1_sync(['STALE-B', 'FRESH PRA'])
+        # Hammer format hits the display-format DataFabric row (stale) → Redis wins
+        assert result['STALE-B']['bid'] == 10.5
+        assert result['FRESH PRA']['ask'] == 25.1
+
+        resolver.resolve_l1_sync(['STALE-B'])
+        stats = resolver.get_stats()
+        assert stats['variant_cache_size'] == 2
+        assert stats['redis_round_trips'] == 2
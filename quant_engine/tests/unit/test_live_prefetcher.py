@@ -0,0 +1,82 @@
+"""tests/unit/test_live_prefetcher.py
+
+Unit test for the non-blocking get_live Redis fallback.
+"""
+
+import json
+import time
+
+import pytest
+
+from app.core.data_fabric import DataFabric
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@pytest.fixture
+def redis_store(fake_redis, redis_client):
+    fake_redis.strings.update({
+        'live:AAA PRA': json.dumps({'bid': 24.9, 'ask': 25.1, 'last': 25.0}),
+        'market:l1:BBB PRB': json.dumps({'bid': 19.8, 'ask': 20.0, 'last': 19.9, 'ts': 1}),
+        'market_data:snapshot:CCC PRC': json.dumps({'bid': 10.0, 'ask': 10.1, 'prev_close': 9.9}),
+    })
+    fake_redis.forbid('get', "get_live must not issue blocking GETs")
+    return fake_redis
+
+
+@pytest.fixture
+def fabric():
+    DataFabric._instance = None
+    fabric = DataFabric()
+    fabric._static_data = {s: {'prev_close': 20.0} for s in ('AAA PRA', 'BBB PRB', 'CCC PRC', 'ZZZ PRZ')}
+    yield fabric
+    fabric._live_prefetcher.stop()
+    DataFabric._instance = None
+
+
+class TestLivePrefetcher:
+    """Test background prefetch + negative cache"""
+
+    def test_miss_returns_immediately_then_prefetches(self, fabric, redis_store):
+        """Misses never block; all fallback keys come back in one pipeline"""
+        for symbol in ('AAA PRA', 'BBB PRB', 'CCC PRC', 'ZZZ PRZ'):
+            assert fabric.get_live(symbol) is None
+
+        assert _wait_for(lambda: fabric.get_stats()['live_prefetch_loaded'] == 3)
+        assert fabric.get_live('AAA PRA')['bid'] == 24.9
+        assert fabric.get_live('BBB PRB')['ask'] == 20.0
+        assert fabric.get_live('CCC PRC')['prev_close'] == 9.9
+        assert 'BBB PRB' in fabric.get_dirty_symbols()
+
+    def test_negative_cache(self, fabric, redis_store):
+        """Symbols missing from Redis are not re-requested within the TTL"""
+        fabric.get_live('ZZZ PRZ')
+        assert _wait_for(lambda: fabric.get_stats()['live_negative_cached'] == 1)
+        calls = len(redis_store.pipelines)
+
+        for _ in range(5):
+            assert fabric.get_live('ZZZ PRZ') is None
+        stats = fabric.get_stats()
+        assert stats['live_negative_hits'] == 5
+        assert stats['live_misses'] == 1
+        assert len(redis_store.pipelines) == calls
+
+    def test_feed_data_wins_and_counts_hits(self, fabric, redis_store):
+        """Complete RAM data is a hit and is never overwritten by Redis"""
+        fabric.update_live('AAA PRA', {'bid': 25.5, 'ask': 25.6})
+        assert fabric.get_live('AAA PRA')['bid'] == 25.5
+        fabric._apply_redis_live('AAA PRA', {'bid': 1.0, 'ask': 2.0})
+        assert fabric.get_live('AAA PRA')['bid'] == 25.5
+        assert fabric.get_stats()['live_hits'] == 2
+
+    def test_load_live_from_redis_bulk(self, fabric, redis_store):
+        """Startup bulk load uses the same pipelined fetch"""
+        assert fabric.load_live_from_redis() == 3
+        assert [len(ops) for ops in redis_store.pipelines] == [1]
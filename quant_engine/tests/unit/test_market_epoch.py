@@ -0,0 +1,93 @@
+"""tests/unit/test_market_epoch.py
+
+Unit test for versioned, copy-on-write market epochs.
+"""
+
+import pytest
+
+from app.core.market_epoch import MarketEpochStore
+
+
+def snap(symbol, bid=None, ask=None, last=None, live=True, static=True, **extra):
+    row = {
+        '_symbol': symbol, 'bid': bid, 'ask': ask, 'last': last,
+        'prev_close': 20.0, '_has_live': live, '_has_static': static,
+    }
+    row.update(extra)
+    return row
+
+
+class FakeFabric:
+    def __init__(self, snapshots):
+        self.snapshots = snapshots
+        self.full_calls = 0
+
+    def get_all_fast_snapshots(self):
+        self.full_calls += 1
+        return {s: dict(v) for s, v in self.snapshots.items() if v.get('_has_static')}
+
+    def get_fast_snapshot(self, symbol):
+        row = self.snapshots.get(symbol)
+        return dict(row) if row else None
+
+
+def test_full_publish_is_read_only_and_versioned():
+    store = MarketEpochStore()
+    first = store.publish({'AAA PRA': snap('AAA PRA', 20.0, 20.1, 20.05, GORT=1.5)}, 'test')
+    second = store.publish({'AAA PRA': snap('AAA PRA', 21.0, 21.1, 21.05)}, 'test')
+
+    assert second.epoch_id == first.epoch_id + 1
+    assert store.current is second
+    assert first['AAA PRA']['bid'] == 20.0  # Old epoch unchanged
+    assert first.get('AAA PRA')['GORT'] == 1.5
+    with pytest.raises(TypeError):
+        second['AAA PRA']['bid'] = 0.0
+    assert store.get_epoch(first.epoch_id) is first
+
+
+def test_incremental_publish_shares_unchanged_symbols():
+    store = MarketEpochStore()
+    base = store.publish({
+        'AAA PRA': snap('AAA PRA', 20.0, 20.1, 20.05),
+        'BBB PRB': snap('BBB PRB', 24.0, 24.2, 24.1),
+    }, 'batch')
+    nxt = store.publish({'AAA PRA': snap('AAA PRA', 20.2, 20.3, 20.25)}, 'dirty', full=False)
+
+    assert nxt['BBB PRB'] is base['BBB PRB']
+    assert nxt.l1('BBB PRB') is base.l1('BBB PRB')
+    assert nxt['AAA PRA']['bid'] == 20.2
+    assert base['AAA PRA']['bid'] == 20.0
+    assert store.get_stats()['incremental'] == 1
+
+
+def test_l1_data_matches_legacy_shape():
+    store = MarketEpochStore()
+    epoch = store.publish({
+        'AAA PRA': snap('AAA PRA', 20.0, None, 20.05),
+        'CCC PRC': snap('CCC PRC', live=False),
+    }, 'batch')
+
+    l1 = epoch.l1_data(['AAA PRA', 'CCC PRC', 'ZZZ'])
+    assert l1 == {'AAA PRA': {'bid': 20.0, 'ask': 0, 'last': 20.05}}
+    assert isinstance(l1['AAA PRA'], dict)  # MM engines check isinstance(l1, dict)
+
+
+def test_publish_from_fabric_full_then_copy_on_write():
+    fabric = FakeFabric({
+        'AAA PRA': snap('AAA PRA', 20.0, 20.1, 20.05),
+        'BBB PRB': snap('BBB PRB', 24.0, 24.2, 24.1),
+        'ETF': snap('ETF', 50.0, 50.1, 50.0, static=False),
+    })
+    store = MarketEpochStore()
+
+    # No base epoch yet → incremental request falls back to a full publish
+    first = store.publish_from_fabric(fabric, ['AAA PRA'], source='fast_scores_dirty')
+    assert fabric.full_calls == 1
+    assert set(first) == {'AAA PRA', 'BBB PRB'}
+
+    fabric.snapshots['AAA PRA'] = snap('AAA PRA', 19.9, 20.0, 19.95)
+    second = store.publish_from_fabric(fabric, ['AAA PRA', 'ETF'], source='fast_scores_dirty')
+    assert fabric.full_calls == 1
+    assert 'ETF' not in second  # Same universe as the full publish (static only)
+    assert second['AAA PRA']['last'] == 19.95
+    assert second['BBB PRB'] is first['BBB PRB']
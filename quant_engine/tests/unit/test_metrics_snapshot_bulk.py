@@ -0,0 +1,131 @@
+"""tests/unit/test_metrics_snapshot_bulk.py
+
+Unit test for the bulk MetricsSnapshotAPI path (sources read once) against
+the per-symbol aggregation.
+"""
+
+import asyncio
+import math
+from dataclasses import fields
+from datetime import datetime
+
+import pytest
+
+import app.psfalgo.market_snapshot_store as snapshot_store_module
+from app.psfalgo.decision_models import SymbolMetrics
+from app.psfalgo.market_snapshot_models import MarketSnapshot
+from app.psfalgo.metrics_snapshot_api import METRIC_COLUMNS, MetricsSnapshotAPI
+
+TS = datetime(2024, 1, 2, 10, 0, 0)
+
+
+class FakeSnapshotStore:
+    def __init__(self, snapshots):
+        self.current_snapshots = {'IBKR_GUN': snapshots, 'IBKR_PED': {}}
+        self.single_reads = 0
+
+    def get_current_snapshot(self, symbol, account_type='IBKR_GUN'):
+        self.single_reads += 1
+        return self.current_snapshots.get(account_type, {}).get(symbol)
+
+    def get_all_current_snapshots(self, account_type=None):
+        return self.current_snapshots.get(account_type, {}).copy()
+
+
+class FakeStaticStore:
+    def __init__(self, data):
+        self.data = data
+
+    def get_static_data(self, symbol):
+        return self.data.get(symbol)
+
+
+class FakeOverlayEngine:
+    def __init__(self, cache):
+        self.overlay_cache = cache
+        self.single_reads = 0
+
+    def get_overlay_scores(self, symbol):
+        self.single_reads += 1
+        return self.overlay_cache.get(symbol)
+
+
+class FakeRWVAPEngine:
+    def get_rwvap(self, symbol, window='1D'):
+        price = {'1D': 25.0, '3D': 25.2, '5D': 25.4}[window]
+        return {'rwvap_price': price} if symbol != 'NORW' else None
+
+
+@pytest.fixture
+def api(monkeypatch):
+    snapshots = {
+        'AAA': MarketSnapshot('AAA', bid=24.9, ask=25.1, last=25.0, spread=0.2, fbtot=1.1, gort=-0.3, avg_adv=5000),
+        'NORW': MarketSnapshot('NORW', bid=19.0, ask=19.2, last=19.1),
+    }
+    static = {
+        'AAA': {'GROUP': 'heldff', 'FINAL_THG': '812.5', 'SHORT_FINAL': None, 'MAXALW': 3000},
+        'BBB': {'GROUP': 'heldkuponlu', 'FINAL_THG': 700, 'SHORT_FINAL': 650, 'AVG_ADV': 1200,
+                'SMA63 chg': '0.4', 'SMA246 chg': 'n/a'},
+        'NORW': {'GROUP': 'heldff'},
+    }
+    overlay = {
+        'AAA': {'status': 'OK', 'Bid_buy_ucuzluk_skoru': -0.05, 'Final_BB_skor': '862.5', 'Final_SFS_skor': None},
+        'BBB': {'status': 'COLLECTING', 'Bid_buy_ucuzluk_skoru': 0.1},
+    }
+    store = FakeSnapshotStore(snapshots)
+    monkeypatch.setattr(snapshot_store_module, 'get_market_snapshot_store', lambda: store)
+    snapshot_api = MetricsSnapshotAPI(
+        market_data_cache={'BBB': {'bid': '21.0', 'ask': 21.2, 'price': 21.1}, 'NORW': {'last': 19.1}},
+        static_store=FakeStaticStore(static),
+        rwvap_engine=FakeRWVAPEngine(),
+        pricing_overlay_engine=FakeOverlayEngine(overlay),
+        janall_metrics_engine=object(),  # No get_metrics → no Janall metrics (as before)
+    )
+    return snapshot_api, store
+
+
+def as_tuple(metrics: SymbolMetrics):
+    return tuple(getattr(metrics, f.name) for f in fields(SymbolMetrics))
+
+
+def test_bulk_snapshot_matches_per_symbol_aggregation(api):
+    snapshot_api, store = api
+    symbols = ['AAA', 'BBB', 'NORW', 'MISSING']
+    expected = {s: asyncio.run(snapshot_api._aggregate_metrics_for_symbol(s, TS)) for s in symbols}
+
+    store.single_reads = snapshot_api.pricing_overlay_engine.single_reads = 0
+    snapshot, columns = asyncio.run(snapshot_api.get_metrics_snapshot_bulk(symbols, snapshot_ts=TS))
+    assert store.single_reads == 0 and snapshot_api.pricing_overlay_engine.single_reads == 0
+
+    assert list(snapshot) == symbols
+    for symbol in symbols:
+        assert as_tuple(snapshot[symbol]) == as_tuple(expected[symbol]), symbol
+    assert snapshot['AAA'].final_thg == 812.5 and snapshot['AAA'].rwvap_1d == 25.0
+    assert snapshot['BBB'].bid == 21.0 and snapshot['BBB'].sma63_chg == 0.4
+    assert snapshot['MISSING'].maxalw == 2000
+
+    assert columns.symbols == symbols and len(columns) == 4
+    assert set(columns.columns) == set(METRIC_COLUMNS)
+    assert columns.dos_grup == ['heldff', 'heldkuponlu', 'heldff', None]
+    for name in METRIC_COLUMNS:
+        for symbol, value in zip(symbols, columns[name]):
+            legacy = getattr(snapshot[symbol], name)
+            assert (math.isnan(value) if legacy is None else value == legacy), (symbol, name)
+    assert columns['bid'][columns.index['BBB']] == 21.0
+
+
+def test_bulk_snapshot_is_consistent_while_sources_update(api):
+    snapshot_api, store = api
+    overlay = snapshot_api.pricing_overlay_engine.overlay_cache
+
+    class MutatingStatic(FakeStaticStore):
+        def get_static_data(self, symbol):  # pragma: no cover - bulk reads the dict
+            raise AssertionError("bulk snapshot must not do per-symbol static lookups")
+
+    snapshot_api.static_store = MutatingStatic(snapshot_api.static_store.data)
+    sources = snapshot_api._bulk_sources()
+    overlay['AAA'] = {'status': 'OK', 'Bid_buy_ucuzluk_skoru': 9.9}  # Written mid-cycle
+    store.current_snapshots['IBKR_GUN'].pop('NORW')
+    metrics = snapshot_api._build_symbol_metrics('AAA', TS, sources)
+    assert metrics.bid_buy_ucuzluk == -0.05
+    assert snapshot_api._build_symbol_metrics('NORW', TS, sources).bid == 19.0
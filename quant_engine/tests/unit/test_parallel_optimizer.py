@@ -0,0 +1,110 @@
+"""tests/unit/test_parallel_optimizer.py
+
+Unit test for the shared-data, process-pool parameter optimizer.
+"""
+
+import pickle
+
+import numpy as np
+import pandas as pd
+
+import app.engine.engine_loop  # noqa: F401 - must precede strategy_base (circular import)
+from app.backtest.backtest_engine import BacktestEngine
+from app.backtest.data_reader import DataReader
+from app.backtest.shared_market_data import SharedMarketData
+from app.optimization.parameter_optimizer import DrawdownGuard, ParameterOptimizer, ScoringMetric
+from app.strategy.strategy_base import StrategyBase
+
+
+class IdleStrategy(StrategyBase):
+    """Never trades; module level so the process pool can pickle it"""
+
+    def __init__(self, window=10, threshold=0.5):
+        super().__init__(name="IdleStrategy")
+        self.window = window
+        self.threshold = threshold
+
+    def on_market_data(self, symbol, price, tick, position, candle_data, completed_candle):
+        return None
+
+
+def write_ticks(data_dir, symbol='AAA', rows=600):
+    ts = pd.date_range('2024-01-01 20:00', periods=rows, freq='min')
+    price = 20 + np.sin(np.arange(rows) / 25.0)
+    pd.DataFrame({
+        'timestamp': ts,
+        'symbol': symbol,
+        'last': price.round(2),
+        'bid': (price - 0.01).round(2),
+        'ask': (price + 0.01).round(2),
+        'volume': 300,
+    }).to_csv(data_dir / f"{symbol}.csv", index=False)
+
+
+def test_shared_data_matches_data_reader_ticks(tmp_path):
+    write_ticks(tmp_path)
+    reader = DataReader(str(tmp_path))
+    legacy = list(reader.convert_to_ticks(reader.read_data('AAA', 'auto', '2024-01-01', '2024-01-02')))
+
+    with SharedMarketData.load(str(tmp_path), ['AAA', 'MISSING']) as data:
+        assert data.symbols == ['AAA']
+        ticks = data.ticks('AAA', '2024-01-01', '2024-01-02')
+        assert data.ticks('AAA', '2024-01-03', None) == []
+
+        copy = pickle.loads(pickle.dumps(data))  # What a pool worker receives
+        assert copy.ticks('AAA', '2024-01-01', '2024-01-02') == ticks
+        copy.close()  # Not the owner: files stay
+        assert data.ticks('AAA') != []
+
+    key = lambda t: (t['ts'], float(t['last']), float(t['bid']), float(t['ask']), t['volume'])
+    assert len(ticks) == len(legacy) == 241  # end date is inclusive (midnight)
+    assert [key(t) for t in ticks] == [key(t) for t in legacy]
+
+
+def test_parallel_run_matches_sequential_and_streams(tmp_path):
+    write_ticks(tmp_path, rows=120)
+    space = {'window': [5, 10, 20], 'threshold': [0.5, 1.0]}
+    streamed = []
+
+    sequential = ParameterOptimizer(scoring_metric=ScoringMetric.PNL).optimize(
+        IdleStrategy, space, ['AAA'], '2024-01-01', '2024-01-02', data_dir=str(tmp_path)
+    )
+    parallel = ParameterOptimizer(scoring_metric=ScoringMetric.PNL, n_jobs=2).optimize(
+        IdleStrategy, space, ['AAA'], '2024-01-01', '2024-01-02', data_dir=str(tmp_path),
+        on_result=streamed.append
+    )
+
+    assert len(streamed) == parallel.num_evaluations == 6
+    assert [r['index'] for r in parallel.all_results] == list(range(6))
+    assert [(r['params'], r['score']) for r in parallel.all_results] == \
+        [(r['params'], r['score']) for r in sequential.all_results]
+    assert parallel.best_params == sequential.best_params == {'window': 5, 'threshold': 0.5}
+
+
+def test_equity_guard_abandons_backtest(tmp_path):
+    write_ticks(tmp_path, rows=200)
+    calls = []
+
+    def guard(equity):
+        calls.append(equity)
+        return len(calls) >= 50
+
+    engine = BacktestEngine(IdleStrategy(), data_dir=str(tmp_path), save_reports=False, equity_guard=guard)
+    with SharedMarketData.load(str(tmp_path), ['AAA']) as data:
+        engine.run(['AAA'], market_data=data)
+
+    assert engine.abandoned
+    assert engine.tick_count == 50
+
+
+def test_drawdown_pruning_bounds():
+    guard = DrawdownGuard(0.10)
+    assert not any(guard(e) for e in (100.0, 110.0, 100.0))  # 9.1% off the 110 peak
+    assert guard(98.0)
+
+    optimizer = ParameterOptimizer(scoring_metric=ScoringMetric.DRAWDOWN)
+    assert optimizer._drawdown_limit({}) is None
+    assert optimizer._drawdown_limit({'score': -0.05, 'metrics': {'max_drawdown': -0.05}}) == 0.05
+
+    capped = ParameterOptimizer(scoring_metric=ScoringMetric.SHARPE, max_drawdown_limit=0.3)
+    assert capped._drawdown_limit({'score': 2.0, 'metrics': {'max_drawdown': -0.05}}) == 0.3
@@ -0,0 +1,132 @@
+"""tests/unit/test_streaming_metrics.py
+
+Unit test for streaming backtest metrics (StreamingMetrics) against the
+legacy end-of-run DataFrame / list formulas.
+"""
+
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import app.engine.engine_loop  # noqa: F401 - must precede strategy_base (circular import)
+from app.backtest.backtest_report import BacktestReport
+from app.backtest.metrics_calculator import MetricsCalculator
+from app.backtest.streaming_metrics import StreamingMetrics
+
+
+def equity_path(n=500, seed=7):
+    rng = np.random.default_rng(seed)
+    equity = 100000.0 * np.cumprod(1 + rng.normal(0.0002, 0.004, n))
+    timestamps = 1704067200.0 + np.arange(n) * 3600.0
+    return list(zip(timestamps.tolist(), equity.tolist()))
+
+
+def trade_list(n=40, seed=3):
+    rng = np.random.default_rng(seed)
+    trades = []
+    for i in range(n):
+        entry = 1704067200.0 + i * 7200.0
+        pnl = 0.0 if i == 5 else float(rng.normal(20, 150))
+        trades.append({
+            'symbol': 'AAA', 'side': 'BUY', 'qty': 100,
+            'entry_time': entry, 'exit_time': entry + float(rng.integers(60, 5400)),
+            'entry_price': 20.0, 'exit_price': 20.0 + pnl / 100,
+            'pnl': pnl, 'commission': 1.0,
+        })
+    return trades
+
+
+def test_report_stream_matches_dataframe_metrics():
+    report = BacktestReport()
+    for ts, equity in equity_path():
+        report.add_equity_point(ts, equity)
+    for t in trade_list():
+        report.add_trade(
+            symbol=t['symbol'], side=t['side'], qty=t['qty'],
+            entry_price=t['entry_price'], exit_price=t['exit_price'],
+            entry_time=t['entry_time'], exit_time=t['exit_time'], pnl=t['pnl'],
+            duration_s=t['exit_time'] - t['entry_time'],
+        )
+
+    legacy = report.compute_metrics(pd.DataFrame(report.equity_curve))
+    streamed = report.stream.equity_metrics()
+    assert streamed.keys() == legacy.keys()
+    for key in legacy:
+        assert streamed[key] == pytest.approx(legacy[key], rel=1e-9)
+
+    legacy_trades = report.compute_trade_metrics()
+    streamed_trades = report.stream.trade_metrics()
+    assert streamed_trades.keys() == legacy_trades.keys()
+    for key in legacy_trades:
+        assert streamed_trades[key] == pytest.approx(legacy_trades[key], rel=1e-9)
+
+
+def legacy_calculator_metrics(trades, curve):
+    """The list-based MetricsCalculator formulas this module replaced"""
+    equities = [e for _, e in curve]
+    returns = [(b - a) / a for a, b in zip(equities, equities[1:]) if a > 0]
+    mean = sum(returns) / len(returns)
+    std = math.sqrt(sum((r - mean) ** 2 for r in returns) / len(returns))
+    downside = [r for r in returns if r < 0]
+    downside_std = math.sqrt(sum(r ** 2 for r in downside) / len(downside))
+
+    peak, max_dd, max_dd_pct = equities[0], 0.0, 0.0
+    for e in equities:
+        peak = max(peak, e)
+        if peak - e > max_dd:
+            max_dd, max_dd_pct = peak - e, (peak - e) / peak * 100
+
+    wins = [t['pnl'] for t in trades if t['pnl'] > 0]
+    losses = [t['pnl'] for t in trades if t['pnl'] < 0]
+    held = sum(t['exit_time'] - t['entry_time'] for t in trades)
+    return {
+        'total_pnl': sum(t['pnl'] for t in trades),
+        'winning_trades': len(wins),
+        'losing_trades': len(losses),
+        'largest_win': max(wins),
+        'largest_loss': min(losses),
+        'profit_factor': sum(wins) / abs(sum(losses)),
+        'avg_trade_length_hours': held / len(trades) / 3600,
+        'sharpe_ratio': mean / std * math.sqrt(252),
+        'sortino_ratio': mean / downside_std * math.sqrt(252),
+        'max_drawdown': max_dd,
+        'max_drawdown_pct': max_dd_pct,
+        'exposure_time_pct': held / (curve[-1][0] - curve[0][0]) * 100,
+    }
+
+
+def test_metrics_calculator_matches_list_formulas_without_history():
+    trades, curve = trade_list(), equity_path()
+    calc = MetricsCalculator(keep_history=False)
+    for ts, equity in curve:
+        calc.add_equity_point(ts, equity)
+    for t in trades:
+        calc.add_trade(t)
+
+    assert calc.trades == [] and calc.equity_curve == []
+    metrics = calc.calculate_metrics()
+    for key, expected in legacy_calculator_metrics(trades, curve).items():
+        assert metrics[key] == pytest.approx(expected, rel=1e-9), key
+    assert metrics['total_trades'] == 40
+    assert metrics['total_commission'] == pytest.approx(40.0)
+    assert MetricsCalculator().calculate_metrics()['profit_factor'] == 0.0
+
+
+def test_snapshot_is_available_mid_run():
+    stream = StreamingMetrics(1000.0)
+    assert stream.equity_metrics() == {} and stream.trade_metrics() == {}
+
+    for ts, equity in ((0.0, 1000.0), (60.0, 1100.0), (120.0, 990.0), (180.0, 1050.0)):
+        stream.add_equity_point(ts, equity)
+    snap = stream.snapshot()
+    assert snap['points'] == 4 and snap['equity'] == 1050.0
+    assert snap['max_drawdown'] == pytest.approx(110.0)
+    assert snap['max_drawdown_pct'] == pytest.approx(10.0)
+    assert snap['drawdown'] == pytest.approx(50.0)
+    assert snap['equity_metrics']['max_drawdown'] == pytest.approx(-0.1)
+
+    stream.add_trade(25.0, entry_time=0.0, exit_time=90.0)
+    assert stream.trade_metrics()['profit_factor'] == float('inf')
+    assert stream.exposure_time_pct() == pytest.approx(50.0)
@@ -0,0 +1,83 @@
+"""tests/unit/test_tick_persister.py
+
+Unit test for incremental TruthTicksEngine persistence.
+"""
+
+import json
+
+import pytest
+
+from app.market_data.truth_ticks_engine import TruthTicksEngine
+
+
+@pytest.fixture
+def redis(fake_redis):
+    fake_redis.forbid('get', "restore must not issue per-key GETs")
+    return fake_redis
+
+
+def _engine(monkeypatch, redis):
+    monkeypatch.setattr(TruthTicksEngine, '_get_redis_sync', lambda self: redis)
+    engine = TruthTicksEngine()
+    engine._persist_interval = 10 ** 9
+    return engine
+
+
+def _tick(i, price=25.0):
+    return {'ts': 1.7e9 + i, 'price': price, 'size': 100, 'exch': 'NYSE'}
+
+
+class TestTickPersister:
+    """Test append-only flushes and pipelined restore"""
+
+    def test_only_new_ticks_are_appended(self, monkeypatch, redis):
+        """Each flush RPUSHes just the ticks added since the previous one"""
+        engine = _engine(monkeypatch, redis)
+        for i in range(3):
+            engine.add_tick('PS PRA', _tick(i))
+        assert engine.persist_to_redis() == 1
+
+        for i in range(3, 5):
+            engine.add_tick('PS PRA', _tick(i))
+        engine._persister.flush()
+        assert engine._persister.flush() == 0  # Nothing new
+
+        assert redis.pushed == [('tt:ticks:log:PS PRA', 3), ('tt:ticks:log:PS PRA', 2)]
+        assert len(redis.lists['tt:ticks:log:PS PRA']) == 5
+        # Canonical blob is rate limited; forced by persist_to_redis
+        assert len(json.loads(redis.strings['tt:ticks:PS PRA'])) == 3
+        engine.persist_to_redis()
+        blob = json.loads(redis.strings['tt:ticks:PS PRA'])
+        assert blob[-1] == {'ts': 1.7e9 + 4, 'price': 25.0, 'size': 100.0, 'exch': 'NYSE'}
+        assert redis.strings['tt:ver:PS PRA'] == '2'  # One bump per blob rewrite
+
+    def test_failed_flush_keeps_offsets(self, monkeypatch, redis):
+        """Ticks are re-sent after a failed pipeline"""
+        engine = _engine(monkeypatch, redis)
+        engine.add_tick('PS PRB', _tick(0))
+        redis.fail = True
+        assert engine._persister.flush() == 0
+        redis.fail = False
+        assert engine._persister.flush() == 1
+        assert redis.pushed == [('tt:ticks:log:PS PRB', 1)]
+
+    def test_restore_from_log_and_legacy_migration(self, monkeypatch, redis):
+        """Restore reads the log with one pipeline; legacy blobs migrate on next flush"""
+        redis.strings['tt:ticks:OLD PRC'] = json.dumps([_tick(0, 20.0), _tick(1, 20.1)])
+        engine = _engine(monkeypatch, redis)  # No log yet → legacy blob restore
+        assert len(engine.tick_store['OLD PRC']) == 2
+        engine._persister.flush()
+        assert len(redis.lists['tt:ticks:log:OLD PRC']) == 2
+
+        engine.add_tick('PS PRD', _tick(5, 30.0))
+        engine._persister.flush()
+
+        pipelines = len(redis.pipelines)
+        restored = _engine(monkeypatch, redis)
+        assert len(redis.pipelines) == pipelines + 1
+        assert set(restored.tick_store) == {'OLD PRC', 'PS PRD'}
+        assert list(restored.tick_store['PS PRD'])[0]['price'] == 30.0
+
+        # Restored ticks are neither re-flushed nor accepted again as duplicates
+        restored.add_tick('PS PRD', _tick(5, 30.0))
+        assert restored._persister.flush() == 0
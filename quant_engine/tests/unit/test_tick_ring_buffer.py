@@ -0,0 +1,97 @@
+"""tests/unit/test_tick_ring_buffer.py
+
+Unit test for the TruthTicksEngine ring-buffer tick store and dedup index.
+"""
+
+import time
+
+import pytest
+
+from app.market_data.tick_ring_buffer import TickRingBuffer, TickDedupIndex, venue_code
+from app.market_data.truth_ticks_engine import TruthTicksEngine
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    monkeypatch.setattr(TruthTicksEngine, '_get_redis_sync', lambda self: None)
+    engine = TruthTicksEngine()
+    engine._persist_interval = 10 ** 9
+    return engine
+
+
+class TestTickRingBuffer:
+    """Test ring semantics and dict compatibility"""
+
+    def test_wraps_like_bounded_deque(self):
+        """Grows up to capacity, then overwrites the oldest tick"""
+        buf = TickRingBuffer(capacity=100)
+        for i in range(250):
+            buf.append_tick({'ts': float(i), 'price': 20.0 + i / 100, 'size': 100, 'exch': 'NYSE'})
+
+        assert len(buf) == 100
+        arr = buf.arrays()
+        assert arr['ts'].tolist() == [float(i) for i in range(150, 250)]
+        ticks = list(buf)
+        assert ticks[0] == {'ts': 150.0, 'price': 21.5, 'size': 100.0, 'exch': 'NYSE'}
+        assert buf.last_ts() == 249.0
+
+    def test_dedup_evicts_by_age(self):
+        """Keys expire individually after the window, never wholesale"""
+        index = TickDedupIndex(window_sec=60, max_entries=3)
+        assert index.check_and_add(1, now=0.0)
+        assert not index.check_and_add(1, now=30.0)
+        assert index.check_and_add(2, now=50.0)
+        # Key 1 aged out, key 2 still deduped
+        assert index.check_and_add(1, now=70.0)
+        assert not index.check_and_add(2, now=70.0)
+
+        index.check_and_add(3, now=71.0)
+        index.check_and_add(4, now=72.0)  # Full → oldest (key 2) evicted
+        assert len(index) == 3
+        assert index.check_and_add(2, now=73.0)
+
+
+class TestTruthTicksEngineStore:
+    """Test add_tick / compute_metrics on top of the ring buffer"""
+
+    def test_add_tick_dedups_and_filters(self, engine):
+        """Duplicate prints and non-truth prints never reach the store"""
+        ts = time.time() - 60
+        engine.add_tick('RB PRA', {'ts': ts * 1000, 'price': 25.0, 'size': 100, 'exch': 'NYSE'})
+        engine.add_tick('RB PRA', {'ts': ts * 1000, 'price': 25.0, 'size': 100, 'exch': 'NYSE'})
+        engine.add_tick('RB PRA', {'ts': ts, 'price': 25.0, 'size': 300, 'exch': 'FNRA'})
+        engine.add_tick('RB PRA', {'ts': ts, 'price': 25.0, 'size': 5, 'exch': 'ARCA'})
+        # Same print on another symbol is not a duplicate
+        engine.add_tick('RB PRB', {'ts': ts, 'price': 25.0, 'size': 100, 'exch': 'NYSE'})
+
+        assert list(engine.tick_store['RB PRA']) == [
+            {'ts': pytest.approx(ts), 'price': 25.0, 'size': 100.0, 'exch': 'NYSE'}
+        ]
+        assert len(engine.tick_store['RB PRB']) == 1
+
+    def test_metrics_match_dict_path(self, engine):
+        """Array slices give the same TruthTicks / VWAP as the dict path"""
+        now = time.time()
+        venues = ['NYSE', 'ARCA', 'FNRA', 'EDGX']
+        for i in range(150):
+            engine.add_tick('RB PRC', {
+                'ts': now - 3600 + (i * 7) % 150 * 10,  # out-of-order arrival
+                'price': 24.0 + (i % 11) * 0.01,
+                'size': 100 if i % 3 else 40 + i,
+                'exch': venues[i % 4],
+            })
+        # Restored (legacy) ticks may contain non-truth prints
+        engine.tick_store['RB PRC'].append(now - 10, 24.5, 150.0, venue_code('FNRA'))
+
+        expected = engine.filter_truth_ticks(list(engine.tick_store['RB PRC']))
+        truth_arr = engine.get_truth_tick_array('RB PRC')
+        assert TickRingBuffer.to_dicts(truth_arr) == expected
+
+        recent = expected[-engine.REQUIRED_TRUTH_TICKS:]
+        volume = sum(t['size'] for t in recent)
+        vwap = sum(t['price'] * t['size'] for t in recent) / volume
+
+        metrics = engine.compute_metrics('RB PRC', avg_adv=5000.0)
+        assert metrics['truth_tick_count_100'] == len(recent)
+        assert metrics['truth_vwap_100'] == pytest.approx(vwap, abs=1e-9)
+        assert metrics['volav_levels'] == engine.compute_volav_levels(recent, top_n=4, avg_adv=5000.0)[0]
@@ -0,0 +1,67 @@
+"""tests/unit/test_trade_print.py
+
+Unit test for the parse-once trade print record (TradePrintRouter → GRPAN / RWVAP / TruthTicks).
+"""
+
+import sys
+from datetime import datetime
+
+import pytest
+
+import app.market_data.trade_print as trade_print_module
+from app.market_data.trade_print import parse_print_time, print_time
+from app.market_data.trade_print_router import TradePrintRouter
+from app.market_data.truth_ticks_engine import TruthTicksEngine
+
+T = 1_704_103_200.0  # 2024-01-01 10:00:00 UTC
+
+
+class RecordingGrpan:
+    def __init__(self):
+        self.prints = []
+
+    def add_trade_print(self, symbol, print_data):
+        self.prints.append((symbol, print_data))
+
+
+def test_parse_print_time_formats():
+    local = datetime(2024, 1, 5, 9, 3, 1).timestamp()
+    assert parse_print_time('2024-01-01T10:00:00Z') == T
+    assert parse_print_time('2024-01-01T10:00:00.250+00:00') == T + 0.25
+    assert parse_print_time('2024-01-05 09:03:01') == local
+    assert parse_print_time('2024-1-5 9:3:1') == local  # Legacy strptime fallback
+    assert parse_print_time(str(T)) == T
+    assert parse_print_time(T * 1000) == T  # Epoch ms
+    assert parse_print_time('1704103200000') == T
+    assert parse_print_time('10:00:00.123', 42.0) == 42.0  # Time of day only: unparseable
+    assert parse_print_time(None, 7.0) == 7.0
+
+
+def test_router_parses_once_and_consumers_reuse_ts(monkeypatch):
+    grpan = RecordingGrpan()
+    router = TradePrintRouter(grpan)
+    record = router.route_trade_print(
+        {'timeStamp': '2024-01-01T10:00:00Z', 'price': '25.10', 'size': '200', 'MMID': 'fnra'}, 'CIM-B'
+    )
+    assert record['ts'] == T and record['price'] == 25.10 and record['size'] == 200.0
+    assert record['venue'] is sys.intern('FNRA')
+    assert grpan.prints == [(record['symbol'], record)]
+    assert router.route_trade_print('2024-01-01T10:00:01Z,25.2,100,NSDQ', 'CIM-B')['ts'] == T + 1
+    assert router.route_trade_print({'price': 'x'}, 'CIM-B') is None
+
+    # Downstream consumers must not parse again
+    def fail(*args, **kwargs):
+        raise AssertionError("timestamp parsed twice")
+    monkeypatch.setattr(trade_print_module, 'parse_print_time', fail)
+    assert print_time(record) == T
+    assert print_time({'ts': None, 'time': 'garbage'}, 5.0) == 5.0
+
+
+def test_truth_ticks_normalize_uses_shared_parser():
+    engine = TruthTicksEngine.__new__(TruthTicksEngine)
+    tick = engine._normalize_tick({'ts': '1704103200.5', 'price': 25.0, 'size': 100, 'exch': 'nsdq'})
+    assert tick == {'ts': T + 0.5, 'price': 25.0, 'size': 100.0, 'exch': 'NSDQ'}
+    assert engine._normalize_tick({'ts': T * 1000, 'price': 25.0, 'size': 100})['ts'] == T
+    assert engine._normalize_tick({'ts': 'garbage', 'price': 25.0, 'size': 100})['ts'] == pytest.approx(
+        datetime.now().timestamp(), abs=5
+    )
@@ -0,0 +1,101 @@
+"""tests/unit/test_truth_tick_read_model.py
+
+Unit test for the shared, version-gated TruthTickReadModel.
+"""
+
+import json
+
+import pytest
+
+from app.market_data.truth_tick_read_model import (
+    SOURCE_INSPECT,
+    SOURCE_RAW,
+    TruthTickReadModel,
+)
+
+NOW = 1_700_000_000.0
+
+
+def write_raw(redis, symbol, ticks, versioned=True):
+    redis.strings[f"tt:ticks:{symbol}"] = json.dumps(ticks)
+    if versioned:
+        redis.incr(f"tt:ver:{symbol}")
+
+
+def write_inspect(redis, symbol, path, **extra):
+    data = {'path_dataset': path, **extra}
+    redis.strings[f"truth_ticks:inspect:{symbol}"] = json.dumps({'success': True, 'symbol': symbol, 'data': data})
+    redis.incr(f"truth_ticks:inspect:ver:{symbol}")
+
+
+@pytest.fixture
+def redis(fake_redis):
+    return fake_redis
+
+
+@pytest.fixture
+def model(redis):
+    m = TruthTickReadModel(redis)
+    m.CHECK_INTERVAL_SEC = 0.0  # Every get() re-checks the version
+    return m
+
+
+def _tick(ts, price, size, exch):
+    return {'ts': ts, 'price': price, 'size': size, 'exch': exch}
+
+
+def test_unchanged_version_is_not_refetched(model, redis):
+    write_raw(redis, 'AAA', [_tick(NOW, 25.0, 100, 'NYSE')])
+    write_raw(redis, 'BBB', [_tick(NOW, 30.0, 200, 'ARCA')])
+
+    assert set(model.get_many(['AAA', 'BBB', 'MISSING'], SOURCE_RAW)) == {'AAA', 'BBB'}
+    assert model.get_stats()['blobs_fetched'] == 3
+    first = model.get('AAA', SOURCE_RAW)
+
+    redis.mgets.clear()
+    assert model.get('AAA', SOURCE_RAW) is first  # Version check only, no blob read
+    assert redis.mgets == [['tt:ver:AAA']]
+
+    write_raw(redis, 'AAA', [_tick(NOW, 25.0, 100, 'NYSE'), _tick(NOW + 1, 25.1, 300, 'NYSE')])
+    assert model.refresh(['AAA', 'BBB'], SOURCE_RAW) == 1
+    series = model.get('AAA', SOURCE_RAW)
+    assert series is not first and series.version == 2
+    assert series.last_tick() == {'ts': NOW + 1, 'price': 25.1, 'size': 300.0, 'exch': 'NYSE'}
+
+
+def test_truth_view_and_latest_filters(model, redis):
+    write_inspect(redis, 'AAA', [  # Arrival order, not ts order
+        {'timestamp': NOW - 90000, 'price': 24.90, 'size': 500, 'venue': 'ARCA'},
+        {'timestamp': NOW - 30, 'price': 25.00, 'size': 150, 'venue': 'FNRA'},  # FNRA odd size
+        {'timestamp': NOW - 10, 'price': 25.02, 'size': 100, 'venue': 'FNRA'},
+        {'timestamp': NOW - 20, 'price': 25.01, 'size': 15, 'venue': 'NSDQ'},
+        {'timestamp': NOW - 5, 'price': 25.03, 'size': 14, 'venue': 'NSDQ'},  # < 15 lot
+        {'timestamp': NOW - 1, 'price': 0.0, 'size': 200, 'venue': 'FNRA'},  # No price
+    ], temporal_analysis={'1h': 0.02})
+
+    series = model.get('AAA', SOURCE_INSPECT)
+    assert series.data['temporal_analysis'] == {'1h': 0.02}
+    assert len(series) == 6
+    truth = series.to_dicts(truth_only=True)
+    assert [(t['price'], t['exch']) for t in truth] == [(24.90, 'ARCA'), (25.01, 'NSDQ'), (25.02, 'FNRA')]
+
+    newest = series.latest(3, now=NOW)
+    assert [t['price'] for t in newest] == [25.03, 25.01, 25.02]
+    assert [t['price'] for t in series.latest(5, max_age_sec=86400, size_above=20, now=NOW)] == [25.02, 25.00]
+    assert series.latest(0) == []
+
+
+def test_unversioned_blob_is_refreshed_on_interval(model, redis):
+    write_raw(redis, 'OLD', [_tick(NOW, 20.0, 100, 'NYSE')], versioned=False)
+    model.UNVERSIONED_REFRESH_SEC = 3600.0
+    first = model.get('OLD', SOURCE_RAW)
+    assert first.version is None and first.last_tick()['price'] == 20.0
+
+    write_raw(redis, 'OLD', [_tick(NOW + 1, 20.5, 100, 'NYSE')], versioned=False)
+    assert model.get('OLD', SOURCE_RAW) is first  # Within the refresh interval
+
+    model.UNVERSIONED_REFRESH_SEC = 0.0
+    assert model.get('OLD', SOURCE_RAW).last_tick()['price'] == 20.5
+
+    redis.incr('tt:ver:OLD')  # Writer upgraded: switches to version gating
+    assert model.get('OLD', SOURCE_RAW).version == 1
@@ -0,0 +1,99 @@
+"""tests/unit/test_vectorized_score_parity.py
+
+Parity test: vectorized FAST score batch == scalar per-symbol path.
+"""
+
+import math
+import random
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.data_fabric import DataFabric
+import app.core.data_fabric as data_fabric_module
+from app.core.fast_score_calculator import FastScoreCalculator
+
+
+GROUPS = ['heldff', 'heldsolidbig', 'heldkuponlu', 'heldnff']
+CGRUPS = ['c400', 'c450', 'c525', None]
+
+
+def _same(a, b) -> bool:
+    if isinstance(a, float) and isinstance(b, float) and math.isnan(a) and math.isnan(b):
+        return True
+    return a == b
+
+
+def _build_universe(fabric: DataFabric, seed: int, columnar: bool) -> None:
+    rng = random.Random(seed)
+    fabric._static_data = {}
+    for i in range(120):
+        symbol = f"VTS{seed}P{i}"
+        prev_close = round(rng.uniform(15, 26), 2) if i % 17 else None
+        fabric._static_data[symbol] = {
+            'PREF IBKR': symbol,
+            'GROUP': GROUPS[i % len(GROUPS)],
+            'CGRUP': CGRUPS[i % len(CGRUPS)],
+            'prev_close': prev_close,
+            'FINAL_THG': round(rng.uniform(500, 1500), 2) if i % 11 else None,
+            'SHORT_FINAL': round(rng.uniform(-50, 900), 2),
+            'SMA63 chg': round(rng.uniform(-3, 3), 3) if i % 13 else None,
+            'SMA246 chg': round(rng.uniform(-6, 6), 3),
+        }
+
+    if columnar:
+        fabric.enable_columnar_l1()
+
+    for i, symbol in enumerate(fabric._static_data):
+        if i % 19 == 0:
+            continue  # no live data
+        base = rng.uniform(15, 26)
+        spread = rng.choice([0.01, 0.03, 0.05, 0.2, 0.45])
+        fabric.update_live(symbol, {
+            'bid': round(base, 2),
+            'ask': round(base + spread, 2),
+            'last': round(base + rng.uniform(0, spread), 2) if i % 23 else None,
+        })
+
+    fabric._etf_live = {}
+    fabric._etf_prev_close = {}
+    for etf, (prev, last) in {'PFF': (31.2, 31.35), 'TLT': (88.0, 87.1), 'IEF': (94.5, 94.62)}.items():
+        fabric.set_etf_prev_close(etf, prev)
+        fabric.update_etf_live(etf, {'last': last})
+
+
+@pytest.fixture(params=[False, True], ids=['dict_l1', 'columnar_l1'])
+def fabric(request, monkeypatch):
+    DataFabric._instance = None
+    FastScoreCalculator._instance = None
+    fabric = DataFabric()
+    monkeypatch.setattr(data_fabric_module, '_data_fabric', fabric)
+    monkeypatch.setattr(sys.modules['app.core.redis_client'], 'get_redis_client',
+                        lambda: SimpleNamespace(sync=None))  # no Redis fallback
+    _build_universe(fabric, seed=7, columnar=request.param)
+    yield fabric
+    DataFabric._instance = None
+    FastScoreCalculator._instance = None
+
+
+@pytest.mark.parametrize('include_group_metrics', [False, True])
+def test_vectorized_matches_scalar(fabric, include_group_metrics):
+    """Every key of every symbol must match the scalar path exactly"""
+    calc = FastScoreCalculator()
+    scalar = calc.compute_all_fast_scores(include_group_metrics, vectorized=False)
+    vector = calc.compute_all_fast_scores(include_group_metrics, vectorized=True)
+
+    assert scalar, "scalar path produced no scores"
+    assert set(vector) == set(scalar)
+    for symbol, expected in scalar.items():
+        got = vector[symbol]
+        assert set(got) == set(expected), symbol
+        for key, value in expected.items():
+            if key == '_computed_at':
+                continue
+            assert _same(got[key], value), f"{symbol}.{key}: vector={got[key]!r} scalar={value!r}"
+
+    if include_group_metrics:
+        assert any(s.get('Fbtot') is not None for s in vector.values())
+        assert any(s.get('GORT') is not None for s in vector.values())
@@ -0,0 +1,89 @@
+"""tests/unit/test_volav_vectorized.py
+
+Unit test for the vectorized Volav level computation.
+"""
+
+import random
+
+import pytest
+
+from app.market_data.tick_ring_buffer import TickRingBuffer
+from app.market_data.truth_ticks_engine import TruthTicksEngine
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    monkeypatch.setattr(TruthTicksEngine, '_get_redis_sync', lambda self: None)
+    return TruthTicksEngine()
+
+
+def _random_ticks(seed, n):
+    rng = random.Random(seed)
+    centers = [24.0, 24.04, 24.3, 24.75]
+    return [
+        {
+            'ts': 1.7e9 + rng.uniform(0, 3 * 86400),
+            'price': round(rng.choice(centers) + rng.gauss(0, 0.02), 3),
+            'size': rng.choice([100, 200, 20, 50, 300, 7, 150]),
+            'exch': rng.choice(['NYSE', 'ARCA', 'FNRA', 'EDGX']),
+        }
+        for _ in range(n)
+    ]
+
+
+def _reference_range(engine, ticks, range_min, range_max):
+    """Former list-scan implementation of a Volav range query"""
+    in_range = [t for t in ticks if range_min <= t['price'] <= range_max]
+    volume = 0.0
+    price_sum = 0.0
+    filtered = []
+    for t in in_range:
+        weighted = t['size'] * engine.calculate_print_weight(t['size'], t['exch'])
+        if weighted > 0:
+            volume += weighted
+            price_sum += t['price'] * weighted
+            filtered.append(t)
+    return volume, price_sum, len(filtered), max(t['ts'] for t in filtered) if filtered else None
+
+
+class TestVolavVectorized:
+    """Test range index and Volav levels"""
+
+    def test_range_query_matches_list_scan(self, engine):
+        """searchsorted range stats are bit-identical to the sequential loop"""
+        ticks = _random_ticks(1, 500)
+        index = engine._build_price_index(ticks)
+        for range_min, range_max in [(23.9, 24.1), (24.02, 24.06), (24.28, 24.33), (25.0, 26.0)]:
+            stats = index.query(range_min, range_max)
+            expected = _reference_range(engine, ticks, range_min, range_max)
+            if stats is None:
+                assert expected == (0.0, 0.0, 0, None)
+            else:
+                assert stats[:4] == expected
+
+    def test_levels_list_and_array_inputs_agree(self, engine):
+        """Tick dicts and ring-buffer array slices give the same levels"""
+        ticks = sorted(_random_ticks(2, 800), key=lambda t: t['ts'])
+        buf = TickRingBuffer()
+        for t in ticks:
+            buf.append_tick(t)
+
+        for avg_adv in (0.0, 5000.0, 60000.0):
+            from_list = engine.compute_volav_levels(ticks, top_n=4, avg_adv=avg_adv)
+            from_array = engine.compute_volav_levels(buf.arrays(), top_n=4, avg_adv=avg_adv)
+            assert from_list == from_array
+
+    def test_separated_clusters(self, engine):
+        """Two clusters far apart → two ranked levels with exact volumes"""
+        ticks = [{'ts': float(i), 'price': 20.00, 'size': 200, 'exch': 'NYSE'} for i in range(6)]
+        ticks += [{'ts': 10.0 + i, 'price': 20.50, 'size': 100, 'exch': 'ARCA'} for i in range(4)]
+        ticks.append({'ts': 20.0, 'price': 20.50, 'size': 300, 'exch': 'FNRA'})  # rejected print
+
+        levels, buckets = engine.compute_volav_levels(ticks, top_n=4, avg_adv=5000.0)
+        assert [(lv['rank'], lv['price'], lv['volume'], lv['tick_count']) for lv in levels] == [
+            (1, 20.0, 1200.0, 6),
+            (2, 20.5, 400.0, 4),
+        ]
+        assert levels[1]['last_print_ts'] == 13.0
+        assert sum(b['volume'] for b in buckets) == 1600.0
+        assert engine.compute_volav_levels([], top_n=4) == ([], [])
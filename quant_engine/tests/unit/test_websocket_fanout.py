@@ -0,0 +1,186 @@
+"""tests/unit/test_websocket_fanout.py
+
+Unit test for the batched WebSocket market data fan-out.
+"""
+
+import asyncio
+import json
+
+from app.config.settings import settings
+from app.api.websocket_fanout import ClientSession, MarketDataFanout
+from app.api.websocket_routes import ConnectionManager
+
+
+class FakeWebSocket:
+    def __init__(self, block: bool = False):
+        self.sent = []
+        self.block = block
+        self._release = asyncio.Event()
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text):
+        if self.block:
+            await self._release.wait()
+        self.sent.append(json.loads(text))
+
+
+def _frames(client):
+    frames = []
+    while not client.queue.empty():
+        frames.append(client.queue.get_nowait().message)
+    return frames
+
+
+def _row(bid, ask=25.2, last=25.1):
+    return {'bid': bid, 'ask': ask, 'last': last, 'volume': float('nan')}
+
+
+class TestMarketDataFanout:
+    """Test coalescing, deltas, subscriptions and backpressure"""
+
+    def test_coalesced_delta_frames(self):
+        """Dirty symbols become one frame; only changed fields are resent"""
+        async def scenario():
+            fanout = MarketDataFanout()
+            client = ClientSession(FakeWebSocket(), max_frames=8)
+            fanout.publish('AAA PRA', _row(25.0))
+            fanout.publish('AAA PRA', _row(25.05))
+            fanout.publish('BBB PRB', _row(19.5))
+            fanout.dispatch([client])
+            fanout.publish('AAA PRA', _row(25.06))
+            fanout.publish('BBB PRB', _row(19.5))  # Unchanged → not resent
+            fanout.dispatch([client])
+            fanout.dispatch([client])  # Nothing dirty → no frame
+            return fanout, _frames(client)
+
+        fanout, frames = asyncio.run(scenario())
+        assert len(frames) == 2
+        assert frames[0]['data'] == [
+            {'bid': 25.05, 'ask': 25.2, 'last': 25.1, 'volume': None, 'PREF_IBKR': 'AAA PRA'},
+            {'bid': 19.5, 'ask': 25.2, 'last': 25.1, 'volume': None, 'PREF_IBKR': 'BBB PRB'},
+        ]
+        assert frames[1]['data'] == [{'bid': 25.06, 'PREF_IBKR': 'AAA PRA'}]
+        assert fanout.stats['coalesced'] == 1 and fanout.stats['frames'] == 2
+
+    def test_subscriptions_and_dropped_frames_resync(self):
+        """Filtered clients get their symbols; dropped frames resend full rows"""
+        async def scenario():
+            fanout = MarketDataFanout()
+            everything = ClientSession(FakeWebSocket(), max_frames=1)
+            only_b = ClientSession(FakeWebSocket(), max_frames=8)
+            only_b.apply_subscription({'symbols': ['BBB PRB']}, subscribe=True)
+            no_market = ClientSession(FakeWebSocket(), max_frames=8)
+            no_market.apply_subscription({'panels': ['etf']}, subscribe=True)
+            clients = [everything, only_b, no_market]
+
+            fanout.publish('AAA PRA', _row(25.0))
+            fanout.publish('BBB PRB', _row(19.5))
+            fanout.dispatch(clients)
+            fanout.publish('AAA PRA', _row(25.01))
+            fanout.dispatch(clients)  # everything's queue is full → first frame dropped
+
+            only_b.resync.update(only_b.apply_subscription({'symbols': ['AAA PRA']}, subscribe=True))
+            fanout.dispatch(clients)
+            return everything, only_b, no_market
+
+        everything, only_b, no_market = asyncio.run(scenario())
+        # Frame 1 dropped → its symbols come back as full rows; that frame then displaces frame 2
+        assert everything.frames_dropped == 2
+        frames = _frames(everything)
+        assert len(frames) == 1
+        assert {r['PREF_IBKR']: r['bid'] for r in frames[0]['data']} == {'AAA PRA': 25.01, 'BBB PRB': 19.5}
+        assert all(len(r) == 5 for r in frames[0]['data'])
+
+        b_frames = _frames(only_b)
+        assert [[r['PREF_IBKR'] for r in f['data']] for f in b_frames] == [['BBB PRB'], ['AAA PRA']]
+        assert b_frames[1]['data'][0]['bid'] == 25.01  # Full latest row for new subscription
+        assert _frames(no_market) == []
+
+    def test_slow_client_does_not_stall_others(self, monkeypatch):
+        """ConnectionManager sends through per-client tasks"""
+        async def scenario():
+            manager = ConnectionManager()
+            manager.frame_interval = 0.01
+            monkeypatch.setattr(manager, '_broadcast_loop', lambda: asyncio.sleep(0))
+            fast, slow = FakeWebSocket(), FakeWebSocket(block=True)
+            await manager.connect(fast)
+            await manager.connect(slow)
+            await manager.handle_client_message(fast, json.dumps({'type': 'ping'}))
+
+            for i in range(20):
+                manager.publish_market_data('AAA PRA', {'PREF_IBKR': 'AAA PRA', 'bid': 25.0 + i / 100})
+                await asyncio.sleep(0.02)
+            await manager.broadcast({'type': 'etf_update', 'data': [{'symbol': 'TLT', 'last': float('inf')}]})
+            await asyncio.sleep(0.05)
+
+            stats = manager.get_stats()
+            for ws in (fast, slow):
+                manager.disconnect(ws)
+            await asyncio.sleep(0)
+            return fast, slow, stats
+
+        fast, slow, stats = asyncio.run(scenario())
+        assert fast.sent[0] == {'type': 'pong'}
+        assert fast.sent[-2]['data'] == [{'bid': 25.19, 'PREF_IBKR': 'AAA PRA'}]
+        assert fast.sent[-1] == {'type': 'etf_update', 'data': [{'symbol': 'TLT', 'last': None}]}
+        assert slow.sent == []
+        slow_stats = stats['clients'][1]
+        assert slow_stats['frames_dropped'] > 0
+        assert slow_stats['queued'] <= settings.WS_CLIENT_QUEUE_FRAMES
+
+    def test_late_joining_client_gets_full_rows(self, monkeypatch):
+        """A client connecting after warm-up starts from full rows, not bare deltas"""
+        async def scenario():
+            manager = ConnectionManager()
+            manager.frame_interval = 0.01
+            monkeypatch.setattr(manager, '_broadcast_loop', lambda: asyncio.sleep(0))
+            early = FakeWebSocket()
+            await manager.connect(early)
+            manager.publish_market_data('AAA PRA', _row(25.0))
+            manager.publish_market_data('BBB PRB', _row(19.5))
+            await asyncio.sleep(0.03)
+
+            late = FakeWebSocket()
+            await manager.connect(late)
+            manager.publish_market_data('AAA PRA', _row(25.02))
+            await asyncio.sleep(0.03)
+            manager.publish_market_data('AAA PRA', _row(25.03))
+            await asyncio.sleep(0.03)
+            for ws in (early, late):
+                manager.disconnect(ws)
+            await asyncio.sleep(0)
+            return early, late
+
+        early, late = asyncio.run(scenario())
+        assert early.sent[-2]['data'] == [{'bid': 25.02, 'PREF_IBKR': 'AAA PRA'}]
+        first = {r['PREF_IBKR']: r for r in late.sent[0]['data']}
+        assert set(first) == {'AAA PRA', 'BBB PRB'}
+        assert first['AAA PRA'] == {'bid': 25.02, 'ask': 25.2, 'last': 25.1, 'volume': None, 'PREF_IBKR': 'AAA PRA'}
+        assert first['BBB PRB']['bid'] == 19.5 and len(first['BBB PRB']) == 5
+        assert late.sent[-1]['data'] == [{'bid': 25.03, 'PREF_IBKR': 'AAA PRA'}]  # Then deltas
+
+    def test_unserializable_frame_is_skipped_not_disconnected(self, monkeypatch):
+        """An encode error drops that frame only; every client stays connected"""
+        async def scenario():
+            manager = ConnectionManager()
+            manager.frame_interval = 0.01
+            monkeypatch.setattr(manager, '_broadcast_loop', lambda: asyncio.sleep(0))
+            clients = [FakeWebSocket(), FakeWebSocket()]
+            for ws in clients:
+                await manager.connect(ws)
+            manager.publish_market_data('AAA PRA', {'bid': 25.0, 'ts': object()})
+            await asyncio.sleep(0.03)
+            manager.publish_market_data('AAA PRA', {'bid': 25.01, 'ts': 1})
+            await asyncio.sleep(0.03)
+            connected = len(manager.active_connections)
+            for ws in clients:
+                manager.disconnect(ws)
+            await asyncio.sleep(0)
+            return clients, connected
+
+        clients, connected = asyncio.run(scenario())
+        assert connected == 2
+        for ws in clients:
+            assert ws.sent == [{'type': 'market_data_update', 'data': [{'bid': 25.01, 'ts': 1, 'PREF_IBKR': 'AAA PRA'}]}]